@@ -0,0 +1,7 @@
+# NetMagic Command Line Entry
+
+# Local Modules
+from netmagic.cli import main
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,22 @@
+"""
+NetMagic Analysis
+
+Analysis of collected results, such as the changes between successive polls,
+the LLDP topology of a fleet and the health of its optics.
+"""
+
+from netmagic.analysis.changes import Change, ChangeTracker, diff_results
+from netmagic.analysis.optics import OpticHealth, OpticsHistory, classify_optics
+from netmagic.analysis.topology import Link, Neighbor, Topology
+
+__all__ = [
+    "Change",
+    "ChangeTracker",
+    "Link",
+    "Neighbor",
+    "OpticHealth",
+    "OpticsHistory",
+    "Topology",
+    "classify_optics",
+    "diff_results",
+]
@@ -0,0 +1,265 @@
+# NetMagic Change Detection
+
+# Python Modules
+from collections.abc import Callable, Hashable, Iterable, Mapping
+from threading import Lock
+from typing import Any
+
+# Third-Party Modules
+from pydantic import BaseModel
+
+# Local Modules
+from netmagic.common.classes.interface import InterfaceStatus
+from netmagic.common.classes.status import MACTableEntry
+from netmagic.handlers.exporters import export_value, model_columns
+from netmagic.storage.state import DOWN_STATES
+
+type Values = tuple[Any, ...]
+# The model class, hash and flattened values of a row
+type Entry = tuple[type[BaseModel], int, Values]
+
+
+def row_values(model: BaseModel, ignore: frozenset[str] = frozenset()) -> Values:
+    """Returns the flattened column values of a model, without ignored columns"""
+    return tuple(
+        export_value(getter(model))
+        for name, getter in model_columns(type(model))
+        if name not in ignore
+    )
+
+
+def column_names(
+    model_class: type[BaseModel], ignore: frozenset[str] = frozenset()
+) -> tuple[str, ...]:
+    return tuple(name for name, _ in model_columns(model_class) if name not in ignore)
+
+
+def is_down(state: Any) -> bool:
+    return isinstance(state, str) and state.lower() in DOWN_STATES
+
+
+def interface_events(change: "Change") -> tuple[str, ...]:
+    events = []
+    if "state" in change.fields:
+        old, new = change.fields["state"]
+        if is_down(old) != is_down(new):
+            events.append("link_down" if is_down(new) else "link_up")
+        else:
+            events.append("state")
+    events.extend(
+        field
+        for field in ("speed", "duplex", "vlan", "desc", "media")
+        if field in change.fields
+    )
+    return tuple(events)
+
+
+def mac_events(change: "Change") -> tuple[str, ...]:
+    if change.kind == "added":
+        return ("mac_learned",)
+    if change.kind == "removed":
+        return ("mac_aged",)
+    if "interface" in change.fields or "vlan" in change.fields:
+        return ("mac_move",)
+    return ()
+
+
+# Rules naming the events of a change by the model class of its row
+EVENT_RULES: dict[type[BaseModel], Callable[["Change"], tuple[str, ...]]] = {
+    InterfaceStatus: interface_events,
+    MACTableEntry: mac_events,
+}
+
+
+class Change:
+    """
+    One row added, removed or changed between two results of a host, with
+    `(old, new)` values of its changed `fields` and the `events` it means,
+    such as `link_down` or `mac_move`
+    """
+
+    __slots__ = (
+        "columns",
+        "events",
+        "fields",
+        "host",
+        "key",
+        "kind",
+        "model",
+        "new",
+        "old",
+    )
+
+    def __init__(
+        self,
+        kind: str,
+        host: str,
+        key: Hashable,
+        model: type[BaseModel],
+        columns: tuple[str, ...],
+        old: Values | None = None,
+        new: Values | None = None,
+    ) -> None:
+        self.kind = kind
+        self.host = host
+        self.key = key
+        self.model = model
+        self.columns = columns
+        self.old = old
+        self.new = new
+        self.fields: dict[str, tuple[Any, Any]] = (
+            {
+                name: (before, after)
+                for name, before, after in zip(columns, old, new, strict=True)
+                if before != after
+            }
+            if old is not None and new is not None
+            else {}
+        )
+        rule = EVENT_RULES.get(model)
+        self.events = rule(self) if rule else ()
+
+    def __repr__(self) -> str:
+        detail = ", ".join(self.events) or ", ".join(self.fields)
+        return f"Change({self.kind}, {self.host}, {self.key}{f', {detail}' if detail else ''})"
+
+    @property
+    def before(self) -> dict[str, Any] | None:
+        """The row before the change as a dict, `None` when added"""
+        return (
+            None if self.old is None else dict(zip(self.columns, self.old, strict=True))
+        )
+
+    @property
+    def after(self) -> dict[str, Any] | None:
+        """The row after the change as a dict, `None` when removed"""
+        return (
+            None if self.new is None else dict(zip(self.columns, self.new, strict=True))
+        )
+
+
+def result_models(result: Any) -> Mapping[Hashable, BaseModel]:
+    """The keyed models of a response with a dict `fsm_output`, or a dict"""
+    output = getattr(result, "fsm_output", result)
+    if not isinstance(output, Mapping):
+        raise TypeError(
+            f"Changes are found between dicts of models, not {type(output).__name__}"
+        )
+    return {key: model for key, model in output.items() if isinstance(model, BaseModel)}
+
+
+def index_models(
+    models: Mapping[Hashable, BaseModel], ignore: frozenset[str] = frozenset()
+) -> dict[Hashable, Entry]:
+    entries: dict[Hashable, Entry] = {}
+    for key, model in models.items():
+        values = row_values(model, ignore)
+        entries[key] = (type(model), hash(values), values)
+    return entries
+
+
+def compare(
+    host: str,
+    previous: Mapping[Hashable, Entry],
+    current: Mapping[Hashable, Entry],
+    ignore: frozenset[str] = frozenset(),
+) -> list[Change]:
+    """
+    Changes between two indexed results.  An unchanged row costs one
+    comparison of its hash; values are only compared field by field for rows
+    whose hash differs.
+    """
+    changes: list[Change] = []
+    for key, (model_class, row_hash, values) in current.items():
+        old = previous.get(key)
+        if old is not None and old[0] is model_class:
+            if old[1] != row_hash:
+                columns = column_names(model_class, ignore)
+                changes.append(
+                    Change("changed", host, key, model_class, columns, old[2], values)
+                )
+            continue
+        columns = column_names(model_class, ignore)
+        changes.append(Change("added", host, key, model_class, columns, new=values))
+
+    for key, (model_class, _, values) in previous.items():
+        new = current.get(key)
+        if new is None or new[0] is not model_class:
+            columns = column_names(model_class, ignore)
+            changes.append(
+                Change("removed", host, key, model_class, columns, old=values)
+            )
+    return changes
+
+
+def host_of(models: Mapping[Hashable, BaseModel]) -> str | None:
+    return next((getattr(model, "host", None) for model in models.values()), None)
+
+
+def diff_results(
+    previous: Any,
+    current: Any,
+    host: str | None = None,
+    ignore: Iterable[str] = (),
+) -> list[Change]:
+    """
+    Changes between two results of one host, such as successive
+    `get_interface_status` or `get_mac_table` responses or their dicts
+    """
+    ignore = frozenset(ignore)
+    old_models = result_models(previous)
+    new_models = result_models(current)
+    host = host or host_of(new_models) or host_of(old_models) or ""
+    return compare(
+        host, index_models(old_models, ignore), index_models(new_models, ignore), ignore
+    )
+
+
+class ChangeTracker:
+    """
+    Keeps the last result of each host for one kind of poll, returning only
+    what changed in each new result, so work after a poll scales with the
+    number of changes rather than the size of the tables.
+
+    Use one tracker per getter (such as one for `get_interface_status` and
+    one for `get_mac_table`).  Rows are kept as flattened values, not models.
+    Columns in `ignore`, such as counters, are left out of the comparison.
+    The tracker is safe to use from many threads.
+    """
+
+    def __init__(self, ignore: Iterable[str] = ()) -> None:
+        self.ignore = frozenset(ignore)
+        self.results: dict[str, dict[Hashable, Entry]] = {}
+        self._lock = Lock()
+
+    def __repr__(self) -> str:
+        return f"ChangeTracker({len(self.results)} hosts)"
+
+    def __contains__(self, host: str) -> bool:
+        return host in self.results
+
+    def update(self, result: Any, host: str | None = None) -> list[Change]:
+        """
+        Records a new result of a host and returns its changes from the last
+        one.  The first result of a host is a baseline with no changes.
+        `host` defaults to the host of the models and must be given for
+        results which may be empty.
+        """
+        models = result_models(result)
+        host = host or host_of(models)
+        if host is None:
+            raise ValueError("`host` is required for a result without models")
+
+        # Flattening and hashing happens outside the lock
+        current = index_models(models, self.ignore)
+        with self._lock:
+            previous = self.results.get(host)
+            self.results[host] = current
+        if previous is None:
+            return []
+        return compare(host, previous, current, self.ignore)
+
+    def forget(self, host: str) -> None:
+        """Drops the last result of a host, so its next result is a baseline"""
+        with self._lock:
+            self.results.pop(host, None)
@@ -0,0 +1,331 @@
+# NetMagic Optics Health
+
+# Python Modules
+from bisect import bisect_right
+from collections import deque
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from heapq import nsmallest
+from math import inf, isnan
+from statistics import StatisticsError, linear_regression
+from threading import Lock
+from time import time
+from typing import TYPE_CHECKING, Any
+
+# Local Modules
+from netmagic.common.classes.interface import InterfaceOptics, OpticStatus
+from netmagic.common.types import FSMOutputT, SFPAlert
+
+if TYPE_CHECKING:
+    from netmagic.devices.network_device import NetworkDevice
+
+# `(low_alarm, low_warning, high_warning, high_alarm)`
+type Thresholds = tuple[float, float, float, float]
+type OpticKey = tuple[str, str]
+
+OPTIC_METRICS = ("temperature", "voltage", "current", "transmit_power", "receive_power")
+THRESHOLD_NAMES = ("low_alarm", "low_warning", "high_warning", "high_alarm")
+
+# Status of a reading by its position among the sorted thresholds, each band
+# including its lower threshold
+BANDS = (
+    SFPAlert.LOW_ALARM,
+    SFPAlert.LOW_WARN,
+    SFPAlert.NORMAL,
+    SFPAlert.HIGH_WARN,
+    SFPAlert.HIGH_ALARM,
+)
+
+SEVERITY = {
+    SFPAlert.HIGH_ALARM: 3,
+    SFPAlert.LOW_ALARM: 3,
+    SFPAlert.HIGH_WARN: 2,
+    SFPAlert.LOW_WARN: 2,
+}
+
+# Samples kept per optic, a day of polls every 15 minutes
+HISTORY_SAMPLES = 96
+
+SECONDS_PER_DAY = 86_400
+
+
+def classify_unordered(value: float, thresholds: Thresholds) -> SFPAlert | None:
+    """
+    Status of a reading against thresholds which are not in order, as some
+    transceivers report, checking each band in turn with the last match kept
+    """
+    low_alarm, low_warning, high_warning, high_alarm = thresholds
+    status = None
+    for band, low, high in (
+        (SFPAlert.NORMAL, low_warning, high_warning),
+        (SFPAlert.LOW_WARN, low_alarm, low_warning),
+        (SFPAlert.HIGH_WARN, high_warning, high_alarm),
+        (SFPAlert.LOW_ALARM, -inf, low_alarm),
+        (SFPAlert.HIGH_ALARM, high_alarm, inf),
+    ):
+        if low <= value < high:
+            status = band
+    return status
+
+
+def classify_batch(
+    values: Sequence[float], thresholds: Sequence[Thresholds]
+) -> list[SFPAlert | None]:
+    """
+    Statuses of many readings against their thresholds at once, by a binary
+    search of each reading among its thresholds.  NaN and `inf` readings have
+    no status.
+    """
+    statuses: list[SFPAlert | None] = []
+    append = statuses.append
+    for value, limits in zip(values, thresholds, strict=True):
+        # Beyond every band, as each excludes its upper bound
+        if isnan(value) or value == inf:
+            append(None)
+        elif limits[0] <= limits[1] <= limits[2] <= limits[3]:
+            append(BANDS[bisect_right(limits, value)])
+        else:
+            append(classify_unordered(value, limits))
+    return statuses
+
+
+def classify_optics(rows: FSMOutputT) -> list[dict[str, OpticStatus]]:
+    """
+    Classifies the readings of parsed optics rows with their own thresholds,
+    such as those of Cisco's `show interface transceiver detail`, one metric
+    column at a time.  Returns the `OpticStatus` of each metric, per row.
+    """
+    classified: list[dict[str, OpticStatus]] = [{} for _ in rows]
+    for metric in OPTIC_METRICS:
+        values = [float(row[metric]) for row in rows]
+        names = [f"{metric}_{name}" for name in THRESHOLD_NAMES]
+        thresholds = [
+            (
+                float(row[names[0]]),
+                float(row[names[1]]),
+                float(row[names[2]]),
+                float(row[names[3]]),
+            )
+            for row in rows
+        ]
+        for statuses, value, status in zip(
+            classified, values, classify_batch(values, thresholds), strict=True
+        ):
+            if status is not None:
+                statuses[metric] = OpticStatus(reading=value, status=status)
+    return classified
+
+
+class OpticHealth:
+    """
+    The latest state of one optic: its worst status, the metric at that
+    status and the trend of its receive power in dBm per day
+    """
+
+    __slots__ = (
+        "host",
+        "interface",
+        "metric",
+        "receive_power",
+        "samples",
+        "slope",
+        "status",
+    )
+
+    def __init__(
+        self,
+        host: str,
+        interface: str,
+        status: SFPAlert | None,
+        metric: str | None,
+        receive_power: float | None,
+        slope: float | None,
+        samples: int,
+    ) -> None:
+        self.host = host
+        self.interface = interface
+        self.status = status
+        self.metric = metric
+        self.receive_power = receive_power
+        self.slope = slope
+        self.samples = samples
+
+    def __repr__(self) -> str:
+        status = self.status.value if self.status else "unknown"
+        slope = f", {self.slope:+.3f} dBm/day" if self.slope is not None else ""
+        return f"OpticHealth({self.host} {self.interface}, {status}{slope})"
+
+    @property
+    def severity(self) -> int:
+        return SEVERITY.get(self.status, 0)
+
+
+class OpticsHistory:
+    """
+    Readings of every optic across polls, for finding optics which are out
+    of range or degrading before they alarm.
+
+    Each optic keeps its last `max_samples` polls of the five DOM readings
+    and the statuses the device (or `classify_optics`) gave them.  Brocade
+    devices are polled one `show optic` per port, so polling them is slower
+    than Cisco's single `show interface transceiver detail`.  The history is
+    safe to use from many threads.
+    """
+
+    def __init__(self, max_samples: int = HISTORY_SAMPLES) -> None:
+        self.max_samples = max_samples
+        # optic -> samples of (time, readings by metric)
+        self.samples: dict[OpticKey, deque[tuple[float, tuple[float | None, ...]]]] = {}
+        self.statuses: dict[OpticKey, dict[str, SFPAlert | None]] = {}
+        self._lock = Lock()
+
+    def __repr__(self) -> str:
+        return f"OpticsHistory({len(self.samples)} optics)"
+
+    def __len__(self) -> int:
+        return len(self.samples)
+
+    def record(self, result: Any, at: float | None = None) -> int:
+        """
+        Records a `get_optics` result (or a dict of `InterfaceOptics`) taken at
+        POSIX time `at`, returning the number of optics recorded
+        """
+        at = time() if at is None else at
+        output = getattr(result, "fsm_output", result)
+        optics = [
+            optic for optic in output.values() if isinstance(optic, InterfaceOptics)
+        ]
+        rows = [
+            (
+                (optic.host, optic.interface),
+                tuple(getattr(optic, metric).reading for metric in OPTIC_METRICS),
+                {metric: getattr(optic, metric).status for metric in OPTIC_METRICS},
+            )
+            for optic in optics
+        ]
+        with self._lock:
+            for key, readings, statuses in rows:
+                samples = self.samples.get(key)
+                if samples is None:
+                    samples = self.samples[key] = deque(maxlen=self.max_samples)
+                samples.append((at, readings))
+                self.statuses[key] = statuses
+        return len(rows)
+
+    def poll(
+        self, devices: Iterable["NetworkDevice"], workers: int = 16
+    ) -> list[int | Exception]:
+        """
+        Collects `get_optics` from many devices concurrently, recording each
+        as it returns.  Returns the number of optics, or the error raised, for
+        each device in order.
+        """
+
+        def poll(device: "NetworkDevice") -> int | Exception:
+            try:
+                return self.record(device.get_optics())
+            # One unreachable device does not stop the fleet
+            except Exception as error:  # noqa: BLE001
+                return error
+
+        with ThreadPoolExecutor(workers) as executor:
+            return list(executor.map(poll, devices))
+
+    def forget(self, host: str) -> None:
+        """Drops the history of a host's optics"""
+        with self._lock:
+            for key in [key for key in self.samples if key[0] == host]:
+                del self.samples[key]
+                del self.statuses[key]
+
+    # TRENDS
+
+    def readings(
+        self, host: str, interface: str, metric: str = "receive_power"
+    ) -> list[tuple[float, float]]:
+        """`(time, reading)` of one metric of an optic, oldest first"""
+        index = OPTIC_METRICS.index(metric)
+        with self._lock:
+            samples = list(self.samples.get((host, interface), ()))
+        return [
+            (at, readings[index])
+            for at, readings in samples
+            if readings[index] is not None
+        ]
+
+    def slope(
+        self,
+        host: str,
+        interface: str,
+        metric: str = "receive_power",
+        min_samples: int = 3,
+    ) -> float | None:
+        """
+        Least-squares trend of a metric in units per day, `None` with fewer
+        than `min_samples` readings
+        """
+        readings = self.readings(host, interface, metric)
+        if len(readings) < max(min_samples, 2):
+            return None
+        start = readings[0][0]
+        try:
+            slope, _ = linear_regression(
+                [(at - start) / SECONDS_PER_DAY for at, _ in readings],
+                [value for _, value in readings],
+            )
+        except StatisticsError:
+            return None
+        return slope
+
+    def health(self, host: str, interface: str) -> OpticHealth:
+        key = (host, interface)
+        with self._lock:
+            statuses = dict(self.statuses[key])
+            _, latest = self.samples[key][-1]
+            samples = len(self.samples[key])
+        metric = max(OPTIC_METRICS, key=lambda name: SEVERITY.get(statuses[name], 0))
+        status = statuses[metric]
+        return OpticHealth(
+            host,
+            interface,
+            status,
+            metric if SEVERITY.get(status, 0) else None,
+            latest[OPTIC_METRICS.index("receive_power")],
+            self.slope(host, interface),
+            samples,
+        )
+
+    def report(self) -> list[OpticHealth]:
+        """The health of every optic"""
+        with self._lock:
+            keys = sorted(self.samples)
+        return [self.health(*key) for key in keys]
+
+    def degrading(self, slope: float = -0.5, min_samples: int = 3) -> list[OpticHealth]:
+        """
+        Optics whose receive power falls by more than `slope` dBm per day,
+        steepest first
+        """
+        found = [
+            health
+            for health in self.report()
+            if health.samples >= min_samples
+            and health.slope is not None
+            and health.slope <= slope
+        ]
+        return sorted(found, key=lambda health: health.slope)
+
+    def worst(self, count: int = 10) -> list[OpticHealth]:
+        """
+        The `count` worst optics across the fleet: alarms before warnings,
+        then the fastest falling receive power, then the lowest
+        """
+        return nsmallest(
+            count,
+            self.report(),
+            key=lambda health: (
+                -health.severity,
+                health.slope if health.slope is not None else 0.0,
+                health.receive_power if health.receive_power is not None else inf,
+            ),
+        )
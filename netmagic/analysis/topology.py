@@ -0,0 +1,495 @@
+# NetMagic LLDP Topology
+
+# Python Modules
+from collections import deque
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from ipaddress import ip_address
+from re import search
+from threading import RLock
+from typing import TYPE_CHECKING, Any
+
+# Third-Party Modules
+from mactools import MacAddress
+
+# Local Modules
+from netmagic.analysis.changes import host_of, result_models
+from netmagic.common.classes.interface import InterfaceLLDP
+from netmagic.common.utils import abbreviate_interface
+
+if TYPE_CHECKING:
+    from netmagic.devices.network_device import NetworkDevice
+
+type EntryKey = tuple[str, str]
+type PairKey = tuple[str, str]
+
+# Link states
+SYMMETRIC = "symmetric"  # Both devices see each other on matching ports
+ASYMMETRIC = "asymmetric"  # Both see each other, but disagree on the ports
+ONE_SIDED = "one_sided"  # Only one of two polled devices sees the link
+UNPOLLED = "unpolled"  # The neighbor is not a polled device
+
+
+def normalize_name(name: str) -> str:
+    """System names without their domain, `SW1.corp.example` -> `sw1`"""
+    name = name.strip().lower()
+    try:
+        ip_address(name)
+    except ValueError:
+        return name.split(".", 1)[0]
+    return name
+
+
+def port_key(port: str | None) -> tuple[str, str] | None:
+    """
+    The `(prefix, numbers)` of an interface name, such as `("gi", "1/0/1")`,
+    or `None` for port descriptions which are not interface names
+    """
+    if not port:
+        return None
+    match = search(
+        r"^([a-zA-Z]*)\s*(\d+(?:/\d+)*)$", abbreviate_interface(port.strip())
+    )
+    if match is None:
+        return None
+    return match.group(1)[:2].lower(), match.group(2)
+
+
+def same_port(port: str | None, interface: str) -> bool:
+    """
+    Whether a neighbor's port description names `interface`, in long or short
+    form, or by numbers only as Brocade does
+    """
+    hint, local = port_key(port), port_key(interface)
+    if hint is None or local is None or hint[1] != local[1]:
+        return False
+    return not hint[0] or not local[0] or hint[0] == local[0]
+
+
+class Neighbor:
+    """
+    An LLDP neighbor seen on an interface of a polled host.  `remote` is the
+    polled host it was resolved to by chassis MAC, system name or management
+    address, `None` when it is not one.
+    """
+
+    __slots__ = ("addresses", "host", "interface", "mac", "name", "port", "remote")
+
+    def __init__(self, entry: InterfaceLLDP) -> None:
+        self.host = entry.host
+        self.interface = entry.interface
+        self.mac = str(entry.chassis_mac) if entry.chassis_mac else None
+        self.name = normalize_name(entry.system_name) if entry.system_name else None
+        self.addresses = tuple(
+            str(address)
+            for address in (entry.management_ipv4, entry.management_ipv6)
+            if address
+        )
+        self.port = entry.port_desc
+        self.remote: str | None = None
+
+    def __repr__(self) -> str:
+        return (
+            f"Neighbor({self.host} {self.interface} -> {self.node} {self.port or ''})"
+        )
+
+    @property
+    def identifiers(self) -> tuple[str, ...]:
+        """Identity keys of the neighbor, in the order they are trusted"""
+        return (
+            *((f"mac:{self.mac}",) if self.mac else ()),
+            *((f"name:{self.name}",) if self.name else ()),
+            *(f"ip:{address}" for address in self.addresses),
+        )
+
+    @property
+    def node(self) -> str:
+        """The graph node of the neighbor, its host when it was resolved"""
+        return (
+            self.remote
+            or self.name
+            or self.mac
+            or next(iter(self.addresses), None)
+            or f"{self.host}:{self.interface}"
+        )
+
+
+class Link:
+    """
+    A link between a polled host's interface and a neighbor, with the
+    neighbor's interface when it is known and the `state` of the link
+    """
+
+    __slots__ = ("host", "interface", "neighbor", "neighbor_interface", "state")
+
+    def __init__(
+        self,
+        host: str,
+        interface: str,
+        neighbor: str,
+        neighbor_interface: str | None,
+        state: str,
+    ) -> None:
+        self.host = host
+        self.interface = interface
+        self.neighbor = neighbor
+        self.neighbor_interface = neighbor_interface
+        self.state = state
+
+    def __repr__(self) -> str:
+        return (
+            f"Link({self.host} {self.interface} - {self.neighbor} "
+            f"{self.neighbor_interface or '?'}, {self.state})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Link):
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
+
+    def __hash__(self) -> int:
+        return hash(tuple(getattr(self, name) for name in self.__slots__))
+
+
+class Topology:
+    """
+    Fleet topology from LLDP, built from `get_lldp` results of many devices.
+
+    Neighbors are resolved to polled hosts by chassis MAC, system name or
+    management address, from the host names of results and any identities
+    added with `add_identity` or `add_device`.  Links are found per pair of
+    nodes, so re-polling one device with `update` only recomputes the links
+    of that device rather than the whole graph.  The topology is safe to
+    update from many threads.
+    """
+
+    def __init__(self) -> None:
+        # host -> interface -> neighbor seen there
+        self.entries: dict[str, dict[str, Neighbor]] = {}
+        # identifier (`mac:`, `name:` or `ip:`) -> polled host
+        self.identities: dict[str, str] = {}
+        # identifier -> entries whose neighbor carries it
+        self.referrers: dict[str, set[EntryKey]] = {}
+        # node -> entries whose neighbor is that node
+        self.incoming: dict[str, set[EntryKey]] = {}
+        self._links: dict[PairKey, list[Link]] = {}
+        self._dirty: set[PairKey] = set()
+        self._lock = RLock()
+
+    def __repr__(self) -> str:
+        neighbors = sum(len(entries) for entries in self.entries.values())
+        return f"Topology({len(self.entries)} hosts, {neighbors} neighbors)"
+
+    def __contains__(self, host: str) -> bool:
+        return host in self.entries
+
+    # IDENTITIES
+
+    def add_identity(
+        self,
+        host: str,
+        names: Iterable[str] = (),
+        macs: Iterable[Any] = (),
+        addresses: Iterable[Any] = (),
+    ) -> None:
+        """
+        Records other names, chassis MACs and management addresses of a host,
+        re-resolving neighbors already seen with them
+        """
+        with self._lock:
+            self._register(host, f"name:{normalize_name(host)}")
+            for name in names:
+                self._register(host, f"name:{normalize_name(name)}")
+            for mac in macs:
+                self._register(host, f"mac:{MacAddress(mac)}")
+            for address in addresses:
+                self._register(host, f"ip:{ip_address(address)}")
+
+    def add_device(self, device: "NetworkDevice") -> None:
+        """Records the hostname, MAC and management address of a device"""
+        session = getattr(device, "cli_session", None)
+        address = getattr(session, "host", None)
+        try:
+            addresses = [ip_address(address)] if address else []
+        except ValueError:
+            addresses = []
+        self.add_identity(
+            device.hostname,
+            macs=[device.mac] if device.mac else [],
+            addresses=addresses,
+        )
+
+    def _register(self, host: str, identifier: str) -> None:
+        if self.identities.get(identifier) == host:
+            return
+        self.identities[identifier] = host
+        for key in list(self.referrers.get(identifier, ())):
+            self._resolve(self.entries[key[0]][key[1]])
+
+    def _unregister(self, host: str) -> None:
+        identifiers = [i for i, known in self.identities.items() if known == host]
+        for identifier in identifiers:
+            del self.identities[identifier]
+        for identifier in identifiers:
+            for key in list(self.referrers.get(identifier, ())):
+                self._resolve(self.entries[key[0]][key[1]])
+
+    def _resolve(self, neighbor: Neighbor, new: bool = False) -> None:
+        """Resolves a neighbor to a polled host, moving it in the indexes"""
+        remote = next(
+            (
+                self.identities[identifier]
+                for identifier in neighbor.identifiers
+                if identifier in self.identities
+            ),
+            None,
+        )
+        if not new:
+            if remote == neighbor.remote:
+                return
+            self._unlink(neighbor)
+        neighbor.remote = remote
+        self._link(neighbor)
+
+    def _link(self, neighbor: Neighbor) -> None:
+        key = (neighbor.host, neighbor.interface)
+        self.incoming.setdefault(neighbor.node, set()).add(key)
+        self._dirty.add(pair_key(neighbor.host, neighbor.node))
+
+    def _unlink(self, neighbor: Neighbor) -> None:
+        key = (neighbor.host, neighbor.interface)
+        node = neighbor.node
+        if (incoming := self.incoming.get(node)) is not None:
+            incoming.discard(key)
+            if not incoming:
+                del self.incoming[node]
+        self._dirty.add(pair_key(neighbor.host, node))
+
+    # UPDATES
+
+    def update(self, result: Any, host: str | None = None) -> list[Neighbor]:
+        """
+        Replaces the neighbors of a host with those of a new `get_lldp`
+        result, recomputing only the links of that host.  `host` defaults to
+        the host of the models and must be given for results which may be
+        empty.
+        """
+        models = result_models(result)
+        host = host or host_of(models)
+        if host is None:
+            raise ValueError("`host` is required for a result without models")
+
+        neighbors = [
+            Neighbor(model)
+            for model in models.values()
+            if isinstance(model, InterfaceLLDP)
+        ]
+        with self._lock:
+            self._remove_entries(host)
+            self.entries[host] = {}
+            self._register(host, f"name:{normalize_name(host)}")
+            for neighbor in neighbors:
+                neighbor.host = host
+                key = (host, neighbor.interface)
+                self.entries[host][neighbor.interface] = neighbor
+                for identifier in neighbor.identifiers:
+                    self.referrers.setdefault(identifier, set()).add(key)
+                self._resolve(neighbor, new=True)
+            # Links others reported towards this host may now have both ends
+            for other, _ in self.incoming.get(host, ()):
+                self._dirty.add(pair_key(other, host))
+        return neighbors
+
+    def ingest(self, results: Iterable[Any]) -> None:
+        """Updates the topology with many `get_lldp` results"""
+        for result in results:
+            self.update(result)
+
+    def remove(self, host: str) -> None:
+        """
+        Drops the neighbors a host reported and the identities it was known
+        by, so neighbors of other hosts no longer resolve to it
+        """
+        with self._lock:
+            self._remove_entries(host)
+            for other, _ in self.incoming.get(host, ()):
+                self._dirty.add(pair_key(other, host))
+            self._unregister(host)
+
+    def _remove_entries(self, host: str) -> None:
+        for neighbor in self.entries.pop(host, {}).values():
+            key = (host, neighbor.interface)
+            for identifier in neighbor.identifiers:
+                if (referrers := self.referrers.get(identifier)) is not None:
+                    referrers.discard(key)
+                    if not referrers:
+                        del self.referrers[identifier]
+            self._unlink(neighbor)
+
+    def poll(
+        self, devices: Iterable["NetworkDevice"], workers: int = 16
+    ) -> list[int | Exception]:
+        """
+        Collects `get_lldp` from many devices concurrently, updating the
+        topology as each returns.  Returns the number of neighbors, or the
+        error raised, for each device in order.
+        """
+
+        def poll(device: "NetworkDevice") -> int | Exception:
+            try:
+                self.add_device(device)
+                return len(self.update(device.get_lldp(), device.hostname))
+            # One unreachable device does not stop the fleet
+            except Exception as error:  # noqa: BLE001
+                return error
+
+        with ThreadPoolExecutor(workers) as executor:
+            return list(executor.map(poll, devices))
+
+    # LINKS
+
+    def _pair_links(self, first: str, second: str) -> list[Link]:
+        """The links between two nodes, from whichever of them were polled"""
+        if first == second:
+            return self._loop_links(first)
+        if first not in self.entries or second not in self.entries:
+            host, remote = (first, second) if first in self.entries else (second, first)
+            return [
+                Link(host, interface, remote, None, UNPOLLED)
+                for other, interface in sorted(self.incoming.get(remote, ()))
+                if other == host
+            ]
+
+        ours = [
+            self.entries[first][interface]
+            for host, interface in sorted(self.incoming.get(second, ()))
+            if host == first
+        ]
+        theirs = [
+            self.entries[second][interface]
+            for host, interface in sorted(self.incoming.get(first, ()))
+            if host == second
+        ]
+
+        # Pair by either side naming the other's port, then any single pair left
+        pairs: list[tuple[Neighbor, Neighbor, str]] = []
+        for near in list(ours):
+            far = next(
+                (
+                    far
+                    for far in theirs
+                    if same_port(near.port, far.interface)
+                    or same_port(far.port, near.interface)
+                ),
+                None,
+            )
+            if far is not None:
+                ours.remove(near)
+                theirs.remove(far)
+                pairs.append((near, far, SYMMETRIC))
+        if len(ours) == 1 and len(theirs) == 1:
+            near, far = ours.pop(), theirs.pop()
+            named = port_key(near.port) or port_key(far.port)
+            pairs.append((near, far, ASYMMETRIC if named else SYMMETRIC))
+
+        links = [
+            Link(first, near.interface, second, far.interface, state)
+            for near, far, state in pairs
+        ]
+        links.extend(
+            Link(first, near.interface, second, None, ONE_SIDED) for near in ours
+        )
+        links.extend(
+            Link(second, far.interface, first, None, ONE_SIDED) for far in theirs
+        )
+        return links
+
+    def _loop_links(self, host: str) -> list[Link]:
+        """Links of a host seeing itself, cabled between two of its own ports"""
+        ends = [
+            self.entries[host][interface]
+            for other, interface in sorted(self.incoming.get(host, ()))
+            if other == host and interface in self.entries.get(host, {})
+        ]
+        links = []
+        for near in ends:
+            far = next(
+                (
+                    far
+                    for far in ends
+                    if far is not near and same_port(near.port, far.interface)
+                ),
+                None,
+            )
+            links.append(
+                Link(
+                    host,
+                    near.interface,
+                    host,
+                    far.interface if far else None,
+                    SYMMETRIC if far else ONE_SIDED,
+                )
+            )
+        return links
+
+    def links(self, state: str | None = None) -> list[Link]:
+        """Links of the topology, recomputing those of changed hosts first"""
+        with self._lock:
+            for pair in self._dirty:
+                links = self._pair_links(*pair)
+                if links:
+                    self._links[pair] = links
+                else:
+                    self._links.pop(pair, None)
+            self._dirty.clear()
+            links = [link for pair in sorted(self._links) for link in self._links[pair]]
+        return [link for link in links if state is None or link.state == state]
+
+    def asymmetric_links(self) -> list[Link]:
+        """Links seen from only one side, or with the two sides disagreeing"""
+        return [link for link in self.links() if link.state in (ASYMMETRIC, ONE_SIDED)]
+
+    # GRAPH
+
+    def neighbors(self, host: str) -> list[Neighbor]:
+        """The neighbors a host reported, by interface"""
+        with self._lock:
+            return list(self.entries.get(host, {}).values())
+
+    def seen_by(self, node: str) -> list[tuple[str, str]]:
+        """`(host, interface)` of every polled host seeing a node"""
+        with self._lock:
+            return sorted(self.incoming.get(node, ()))
+
+    def graph(self) -> dict[str, set[str]]:
+        """Adjacency sets of every node, in both directions"""
+        graph: dict[str, set[str]] = {}
+        for link in self.links():
+            graph.setdefault(link.host, set()).add(link.neighbor)
+            graph.setdefault(link.neighbor, set()).add(link.host)
+        return graph
+
+    def path(self, source: str, target: str) -> list[str] | None:
+        """A shortest path of nodes between two nodes, `None` when unconnected"""
+        graph = self.graph()
+        previous: dict[str, str | None] = {source: None}
+        queue = deque([source])
+        while queue:
+            node = queue.popleft()
+            if node == target:
+                path = []
+                while node is not None:
+                    path.append(node)
+                    node = previous[node]
+                return path[::-1]
+            for neighbor in sorted(graph.get(node, ())):
+                if neighbor not in previous:
+                    previous[neighbor] = node
+                    queue.append(neighbor)
+        return None
+
+
+def pair_key(first: str, second: str) -> PairKey:
+    return (first, second) if first <= second else (second, first)
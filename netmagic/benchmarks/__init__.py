@@ -0,0 +1,6 @@
+"""
+NetMagic Benchmarks
+
+Offline benchmarks for measuring throughput and memory of NetMagic handlers.
+Each module is runnable with `python -m netmagic.benchmarks.<module>`.
+"""
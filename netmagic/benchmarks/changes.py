@@ -0,0 +1,80 @@
+# NetMagic Change Detection Benchmark
+
+# Python Modules
+from argparse import ArgumentParser
+from json import dump, dumps
+from time import perf_counter
+
+# Local Modules
+from netmagic.analysis.changes import ChangeTracker
+from netmagic.benchmarks.parsers import environment
+from netmagic.common.classes.interface import InterfaceStatus
+
+
+def make_status(host: str, ports: int, down: set[int]) -> dict[str, InterfaceStatus]:
+    return {
+        f"Gi1/0/{port}": InterfaceStatus(
+            host=host,
+            interface=f"Gi1/0/{port}",
+            desc=f"desk {port}",
+            state="notconnect" if port in down else "connected",
+            vlan="10",
+            speed=1000,
+            duplex="a-full",
+        )
+        for port in range(1, ports + 1)
+    }
+
+
+def run_case(hosts: int, ports: int, changed: int) -> dict:
+    """
+    Measures a poll of a fleet's interface status against the previous one,
+    where `changed` ports of each host went down since
+    """
+    names = [f"switch-{host:05}" for host in range(hosts)]
+    baseline = [make_status(name, ports, set()) for name in names]
+    polled = [make_status(name, ports, set(range(1, changed + 1))) for name in names]
+
+    tracker = ChangeTracker()
+    for result in baseline:
+        tracker.update(result)
+
+    started = perf_counter()
+    changes = [change for result in polled for change in tracker.update(result)]
+    seconds = perf_counter() - started
+
+    rows = hosts * ports
+    return {
+        "benchmark": "changes",
+        "hosts": hosts,
+        "rows": rows,
+        "changes": len(changes),
+        "rows_per_second": round(rows / seconds),
+        "poll_ms": round(seconds * 1000, 3),
+    }
+
+
+def main(argv: list[str] | None = None) -> list[dict]:
+    parser = ArgumentParser(
+        description="Benchmark finding changes between successive polls"
+    )
+    parser.add_argument("--hosts", type=int, nargs="+", default=[1_000])
+    parser.add_argument("--ports", type=int, default=48)
+    parser.add_argument("--changed", type=int, default=1, help="changed ports per host")
+    parser.add_argument("--output", help="also write all results as one JSON file")
+    args = parser.parse_args(argv)
+
+    results = []
+    for hosts in args.hosts:
+        result = run_case(hosts, args.ports, args.changed)
+        print(dumps(result))
+        results.append(result)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            dump({**environment(), "results": results}, file, indent=2)
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# NetMagic Excel Writer Benchmark
+
+# Python Modules
+from argparse import ArgumentParser
+from collections.abc import Iterator
+from json import dumps
+from os import path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from tracemalloc import get_traced_memory, start, stop
+
+# Local Modules
+from netmagic.handlers.excel_writer import (
+    CellEntry,
+    RowEntry,
+    Section,
+    SheetEntry,
+    prepare_workbook,
+    shared_fill,
+    shared_font,
+)
+
+HEADER = ["Host", "MAC", "VLAN", "Interface", "Type"]
+
+
+def generate_mac_rows(count: int) -> Iterator[RowEntry]:
+    """
+    Yields synthetic MAC table report rows, with a shared style on every
+    tenth row to exercise style handling
+    """
+    font = shared_font(bold=True)
+    fill = shared_fill(fill_type="solid", fgColor="FFFF00")
+    yield RowEntry([CellEntry(title, font=font) for title in HEADER])
+
+    for i in range(count):
+        mac = f"{i >> 32 & 0xFFFF:04x}.{i >> 16 & 0xFFFF:04x}.{i & 0xFFFF:04x}"
+        values = [f"switch-{i % 3000:04d}", mac, i % 4094 + 1]
+        values.extend([f"Gi{i % 8 + 1}/0/{i % 48 + 1}", "dynamic"])
+        if i % 10:
+            yield RowEntry(values)
+        else:
+            yield RowEntry([CellEntry(value, fill=fill) for value in values])
+
+
+def run_case(
+    rows: int, write_only: bool, directory: str, trace_memory: bool = False
+) -> dict:
+    """
+    Writes one report and returns its timing.  `trace_memory` adds the
+    `tracemalloc` peak, which is exact but slows the run several times over.
+    """
+    filename = path.join(directory, f"mac_{rows}_{int(write_only)}.xlsx")
+    sheet = SheetEntry("MAC Table", [Section(generate_mac_rows(rows))])
+
+    if trace_memory:
+        start()
+    started = perf_counter()
+    prepare_workbook(filename, [sheet], write_only=write_only)
+    elapsed = perf_counter() - started
+
+    result = {
+        "benchmark": "excel_writer",
+        "mode": "write_only" if write_only else "standard",
+        "rows": rows,
+        "seconds": round(elapsed, 3),
+        "rows_per_second": round(rows / elapsed),
+        "file_bytes": path.getsize(filename),
+    }
+    if trace_memory:
+        result["peak_memory_bytes"] = get_traced_memory()[1]
+        stop()
+    return result
+
+
+def main(argv: list[str] | None = None) -> list[dict]:
+    parser = ArgumentParser(description="Benchmark the NetMagic Excel writer")
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument(
+        "--standard",
+        action="store_true",
+        help="also run the in-memory workbook for comparison",
+    )
+    parser.add_argument(
+        "--memory", action="store_true", help="trace peak Python memory usage"
+    )
+    args = parser.parse_args(argv)
+
+    results = []
+    with TemporaryDirectory() as directory:
+        for rows in args.rows:
+            modes = [True, False] if args.standard else [True]
+            for write_only in modes:
+                result = run_case(rows, write_only, directory, args.memory)
+                print(dumps(result))
+                results.append(result)
+    return results
+
+
+if __name__ == "__main__":
+    main()
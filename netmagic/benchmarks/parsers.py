@@ -0,0 +1,529 @@
+# NetMagic Parser Benchmark
+
+# Python Modules
+from argparse import ArgumentParser
+from collections.abc import Callable
+from datetime import UTC, datetime
+from importlib.metadata import PackageNotFoundError, version
+from json import dump, dumps
+from platform import platform, python_version
+from re import purge
+from time import perf_counter
+from tracemalloc import get_traced_memory, start, stop
+from typing import Any
+
+# Local Modules
+from netmagic.devices.offline import TEMPLATES, OfflineTemplate, Rows
+from netmagic.handlers.parse import clear_parsers, get_parser
+
+HOST = "bench-switch"
+
+
+# SYNTHETIC OUTPUT
+
+
+def cisco_interface(i: int) -> str:
+    return f"Gi{i // 480 % 9 + 1}/{i // 48 % 10}/{i % 48 + 1}"
+
+
+def brocade_interface(i: int) -> str:
+    return f"{i // 480 % 9 + 1}/{i // 48 % 10 + 1}/{i % 48 + 1}"
+
+
+def xr_interface(i: int) -> str:
+    return f"GigabitEthernet0/0/{i // 48}/{i % 48}"
+
+
+def mac(i: int, separator: str = ".") -> str:
+    value = f"0024{i:08x}"
+    return separator.join(value[j : j + 4] for j in range(0, 12, 4))
+
+
+def cisco_int_status(count: int) -> str:
+    lines = ["Port      Name               Status       Vlan       Duplex  Speed Type"]
+    for i in range(count):
+        state = ("connected", "notconnect", "disabled")[i % 3]
+        lines.append(
+            f"{cisco_interface(i):<9} user-port-{i % 1000:<8} {state:<12} "
+            f"{i % 4094 + 1:<10} a-full  a-1000 10/100/1000BaseTX"
+        )
+    return "\n".join(lines)
+
+
+def cisco_int_desc(count: int) -> str:
+    lines = ["Interface                      Status         Protocol Description"]
+    for i in range(count):
+        status, protocol = (("up", "up"), ("down", "down"), ("admin down", "down"))[
+            i % 3
+        ]
+        lines.append(
+            f"{cisco_interface(i):<30} {status:<14} {protocol:<8} "
+            f"Floor {i % 40} desk {i} user port"
+        )
+    return "\n".join(lines)
+
+
+def cisco_int_trans_det(count: int) -> str:
+    sections = [
+        ("Temperature", "(Celsius)", False, (32.5, 90.0, 85.0, -5.0, -10.0)),
+        ("Voltage", "(Volts)", False, (3.28, 3.63, 3.46, 3.13, 2.97)),
+        ("Current", "(milliamperes)", True, (6.4, 12.0, 11.5, 2.0, 1.0)),
+        ("Transmit Power", "(dBm)", True, (-5.4, 1.0, -1.0, -9.5, -11.5)),
+        ("Receive Power", "(dBm)", True, (-6.1, 1.0, -1.0, -14.0, -16.0)),
+    ]
+    lines = ["ITU Channel not available (Wavelength not available),"]
+    for name, unit, lanes, values in sections:
+        lines.append("")
+        lines.append(
+            "                                High Alarm  High Warn  Low Warn   Low Alarm"
+        )
+        lines.append(
+            f"           {name:<20} Threshold   Threshold  Threshold  Threshold"
+        )
+        lines.append(f"Port       {unit:<20} {unit:<11} {unit:<10} {unit:<10} {unit}")
+        lines.append(
+            "---------  ------------------   ----------  ---------  ---------  ---------"
+        )
+        for i in range(count):
+            reading = values[0] + (i % 10) / 10
+            lane = "N/A  " if lanes else ""
+            thresholds = "  ".join(f"{value:<9}" for value in values[1:])
+            lines.append(
+                f"{cisco_interface(i):<10} {lane}{reading:<20.1f} {thresholds}"
+            )
+    return "\n".join(lines)
+
+
+def cisco_lldp(count: int) -> str:
+    entries = ["Capability codes:\n    (R) Router, (B) Bridge, (T) Telephone\n"]
+    for i in range(count):
+        entries.append(
+            "------------------------------------------------\n"
+            f"Local Intf: {cisco_interface(i)}\n"
+            f"Chassis id: {mac(i)}\n"
+            "Port id: Gi0/1\n"
+            f"Port Description: uplink-{i}\n"
+            f"System Name: access-{i:05d}\n"
+            "\n"
+            "System Description: \n"
+            "Cisco IOS Software, C2960X Software (C2960X-UNIVERSALK9-M), Version 15.2(7)E4\n"
+            "Technical Support: http://www.cisco.com/techsupport\n"
+            "\n"
+            "Time remaining: 98 seconds\n"
+            "System Capabilities: B\n"
+            "Enabled Capabilities: B\n"
+            "Management Addresses:\n"
+            f"    IP: 10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}\n"
+            "Auto Negotiation - supported, enabled\n"
+            "Physical media capabilities:\n"
+            "    1000baseT(FD)\n"
+            "Media Attachment Unit type: 30\n"
+            f"Vlan ID: {i % 4094 + 1}\n"
+        )
+    entries.append("\nTotal entries displayed: {count}")
+    return "\n".join(entries)
+
+
+def cisco_mac_table(count: int) -> str:
+    lines = [
+        "          Mac Address Table",
+        "-------------------------------------------",
+        "",
+        "Vlan    Mac Address       Type        Ports",
+        "----    -----------       --------    -----",
+    ]
+    for i in range(count):
+        lines.append(
+            f" {i % 4094 + 1:<4}   {mac(i)}    DYNAMIC     {cisco_interface(i % 432)}"
+        )
+    lines.append(f"Total Mac Addresses for this criterion: {count}")
+    return "\n".join(lines)
+
+
+def cisco_poe(count: int) -> str:
+    lines = [
+        "Module   Available     Used     Remaining",
+        "          (Watts)     (Watts)    (Watts)",
+        "------   ---------   --------   ---------",
+        f"1        {count * 30.0:>9.1f}   {count * 15.4:>8.1f}   {count * 14.6:>9.1f}",
+        "Interface Admin  Oper       Power   Device              Class Max",
+        "                            (Watts)",
+        "--------- ------ ---------- ------- ------------------- ----- ----",
+    ]
+    for i in range(count):
+        lines.append(
+            f"{cisco_interface(i):<9} auto   on         15.4    Ieee PD             4     30.0"
+        )
+    return "\n".join(lines)
+
+
+def cisco_run_vlans(count: int) -> str:
+    blocks = ["Building configuration...", "", "Current configuration : 1 bytes", "!"]
+    for i in range(count):
+        name = f"GigabitEthernet{cisco_interface(i)[2:]}"
+        if i % 4:
+            blocks.append(
+                f"interface {name}\n description access-{i}\n"
+                f" switchport access vlan {i % 4094 + 1}\n switchport mode access\n!"
+            )
+        else:
+            blocks.append(
+                f"interface {name}\n description trunk-{i}\n"
+                " switchport trunk native vlan 999\n"
+                " switchport trunk allowed vlan 10,20,30-40\n switchport mode trunk\n!"
+            )
+    blocks.append("interface Vlan1\n ip address 192.0.2.2 255.255.255.0\n!\nend")
+    return "\n".join(blocks)
+
+
+def cisco_tdr(count: int) -> str:
+    lines = [
+        "TDR test last run on: March 01 00:00:00",
+        "",
+        "Interface Speed Local pair Pair length        Remote pair Pair status",
+        "--------- ----- ---------- ------------------ ----------- --------------------",
+    ]
+    for i in range(count):
+        for pair in "ABCD":
+            prefix = f"{cisco_interface(i):<9} 1000M" if pair == "A" else " " * 15
+            lines.append(
+                f"{prefix} Pair {pair}     {i % 90 + 1:<4} +/- 5  meters Pair {pair}      Normal"
+            )
+    return "\n".join(lines)
+
+
+def xr_interface_stats(count: int) -> str:
+    blocks = []
+    for i in range(count):
+        blocks.append(
+            f"{xr_interface(i)} is up, line protocol is up\n"
+            "  Interface state transitions: 1\n"
+            f"  Hardware is GigabitEthernet, address is {mac(i)}\n"
+            "  Internet address is Unknown\n"
+            "  MTU 1514 bytes, BW 1000000 Kbit (Max: 1000000 Kbit)\n"
+            "     reliability 255/255, txload 0/255, rxload 0/255\n"
+            "  Last input 00:00:00, output 00:00:00\n"
+            '  Last clearing of "show interface" counters never\n'
+            f"  5 minute input rate {i * 1000} bits/sec, {i} packets/sec\n"
+            f"  5 minute output rate {i * 2000} bits/sec, {i * 2} packets/sec\n"
+            f"     {i * 100} packets input, {i * 6400} bytes, {i % 7} total input drops\n"
+            "     0 drops for unrecognized upper-level protocol\n"
+            f"     Received {i % 50} broadcast packets, {i % 90} multicast packets\n"
+            "              0 runts, 0 giants, 0 throttles, 0 parity\n"
+            f"     {i % 3} input errors, {i % 2} CRC, 0 frame, 0 overrun, 0 ignored, 0 abort\n"
+            f"     {i * 200} packets output, {i * 12800} bytes, {i % 5} total output drops\n"
+            f"     Output {i % 20} broadcast packets, {i % 30} multicast packets\n"
+            "     0 output errors, 0 underruns, 0 applique, 0 resets\n"
+            "     0 output buffer failures, 0 output buffers swapped out\n"
+            "     1 carrier transitions\n"
+        )
+    return "\n".join(blocks)
+
+
+def brocade_int(count: int) -> str:
+    lines = [
+        "Port       Link    State   Dupl Speed Trunk Tag Pvid Pri MAC             Name"
+    ]
+    for i in range(count):
+        link = ("Up", "Down", "Disabled")[i % 3]
+        state = "Forward" if link == "Up" else "None"
+        lines.append(
+            f"{brocade_interface(i):<10} {link:<7} {state:<7} Full 1G    None  No  "
+            f"{i % 4094 + 1:<4} 0   {mac(i)}  user-port-{i}"
+        )
+    return "\n".join(lines)
+
+
+def brocade_lldp(count: int) -> str:
+    entries = []
+    for i in range(count):
+        entries.append(
+            f"Local port: {brocade_interface(i)}\n"
+            f"  Neighbor: {mac(i)}, TTL 101 seconds\n"
+            f"    + Chassis ID (MAC address): {mac(i)}\n"
+            f"    + Port ID (MAC address): {mac(i + 1)}\n"
+            "    + Time to live: 120 seconds\n"
+            f'    + System name         : "access-{i:05d}"\n'
+            '    + Port description    : "GigabitEthernet0/1"\n'
+            '    + System description  : "Cisco IOS Software, C2960X Software, \\\n'
+            '                             Version 15.2(7)E4"\n'
+            f"    + Port VLAN ID: {i % 4094 + 1}\n"
+            f"    + Management address (IPv4): 10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}\n"
+            "    Operational MAU type         : 1000BaseTFD"
+        )
+    return "\n\n".join(entries)
+
+
+def brocade_mac_table(count: int) -> str:
+    lines = [
+        f"Total active entries from all ports = {count}",
+        "MAC-Address     Port           Type          VLAN",
+    ]
+    for i in range(count):
+        lines.append(
+            f"{mac(i)}  {brocade_interface(i % 432):<14} Dynamic       {i % 4094 + 1}"
+        )
+    return "\n".join(lines)
+
+
+def brocade_media(count: int) -> str:
+    return "\n".join(
+        f"Port {brocade_interface(i)}: Type  : 1G M-SX (SFP)"
+        if i % 2
+        else f"Port {brocade_interface(i)}: Type  : 1G M-C (Gig-Copper)"
+        for i in range(count)
+    )
+
+
+def brocade_optic(count: int) -> list[str]:
+    return [
+        " Port  Temperature  Voltage  Tx Power  Rx Power  Tx Bias Current\n"
+        "+----+-----------+---------+----------+----------+----------------+\n"
+        f" {brocade_interface(i)}  {30 + i % 10:.4f} C  3.2800 volts  -5.4000 dBm  "
+        f"-{6 + i % 5}.1000 dBm  6.500 mA\n"
+        "        Normal      Normal        Normal       Low-Alarm    Normal"
+        for i in range(count)
+    ]
+
+
+def brocade_poe(count: int) -> str:
+    lines = [
+        f"Power Capacity:        Total is {count * 30000} mW. "
+        + f"Current Free is {count * 15000} mW.",
+        "",
+        " Port   Admin    Oper    ---Power(mWatts)---  PD Type  PD Class  Pri  Fault/",
+        "        State    State   Consumed  Allocated                          Error",
+        " --------------------------------------------------------------------------",
+    ]
+    for i in range(count):
+        lines.append(
+            f"  {brocade_interface(i):<6} On       On      4200      30000    802.3at  Class 4   3    n/a"
+        )
+    return "\n".join(lines)
+
+
+def brocade_run_vlans(count: int) -> str:
+    blocks = ["ver 08.0.30tT213", "!"]
+    for i in range(count):
+        unit = f"{i // 480 % 9 + 1}/{i // 48 % 10 + 1}"
+        blocks.append(
+            f"vlan {i % 4094 + 1} name VLAN-{i} by port\n"
+            f" tagged ethe {unit}/1 to {unit}/2\n"
+            f" untagged ethe {unit}/{i % 46 + 3}\n!"
+        )
+    return "\n".join(blocks)
+
+
+def brocade_single_int(count: int) -> list[str]:
+    # The template anchors on a port name of at most two letters
+    return [
+        f"{brocade_interface(i)} is up, line protocol is up\n"
+        "  Port up for 10 day(s) 2 hour(s)\n"
+        f"  Hardware is GigabitEthernet, address is {mac(i)}\n"
+        "  Configured speed auto, actual 1Gbit, configured duplex fdx, actual fdx\n"
+        "  300 second input rate: 1000 bits/sec, 2 packets/sec, 0.00% utilization\n"
+        "  300 second output rate: 2000 bits/sec, 3 packets/sec, 0.00% utilization\n"
+        "  MTU 1500 bytes, encapsulation ethernet\n"
+        for i in range(count)
+    ]
+
+
+def brocade_tdr(count: int) -> str:
+    lines = [
+        " Port    Speed Local pair Pair Length Remote pair Pair status",
+        " --------- ----- ---------- ----------- ----------- -----------",
+    ]
+    for i in range(count):
+        for pair in "ABCD":
+            prefix = f"{brocade_interface(i):<8} 1000M" if pair == "A" else " " * 14
+            lines.append(
+                f"{prefix}  Pair {pair}  {i % 90 + 1:<6} Pair {pair}  terminated"
+            )
+    return "\n".join(lines)
+
+
+# CASES
+
+
+class TemplateCase:
+    """
+    A built-in template with a generator of synthetic output for `records`
+    entries.
+
+    Generators returning a list produce one output per command, for templates
+    which only record once per output.
+    """
+
+    def __init__(
+        self, template: OfflineTemplate, generate: Callable[[int], str | list[str]]
+    ) -> None:
+        self.template = template
+        self.generate = generate
+
+    def __repr__(self) -> str:
+        return f"TemplateCase({self.name})"
+
+    @property
+    def name(self) -> str:
+        return self.template.name
+
+    def outputs(self, records: int) -> list[str]:
+        outputs = self.generate(records)
+        return [outputs] if isinstance(outputs, str) else outputs
+
+    def parse(self, outputs: list[str]) -> Rows:
+        rows = []
+        for output in outputs:
+            rows.extend(self.template.parse(output))
+        return rows
+
+
+GENERATORS: dict[str, Callable[[int], str | list[str]]] = {
+    "cisco/show_int_status": cisco_int_status,
+    "cisco/show_int_desc": cisco_int_desc,
+    "cisco/show_int_trans_det": cisco_int_trans_det,
+    "cisco/show_lldp_nei_det": cisco_lldp,
+    "cisco/show_mac_table": cisco_mac_table,
+    "cisco/show_poe": cisco_poe,
+    "cisco/show_run_vlans": cisco_run_vlans,
+    "cisco/show_tdr": cisco_tdr,
+    "cisco/show_xr_interface_stats": xr_interface_stats,
+    "brocade/show_int": brocade_int,
+    "brocade/show_lldp_nei_det": brocade_lldp,
+    "brocade/show_mac_table": brocade_mac_table,
+    "brocade/show_media": brocade_media,
+    "brocade/show_optic": brocade_optic,
+    "brocade/show_poe": brocade_poe,
+    "brocade/show_run_vlans": brocade_run_vlans,
+    "brocade/show_single_int": brocade_single_int,
+    "brocade/show_tdr": brocade_tdr,
+}
+
+CASES = [
+    TemplateCase(TEMPLATES[name], generate) for name, generate in GENERATORS.items()
+]
+
+
+# MEASUREMENT
+
+
+def timed(func: Callable, repeat: int) -> tuple[float, Any]:
+    """Returns the best time of `repeat` runs and the last result"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = perf_counter()
+        result = func()
+        best = min(best, perf_counter() - started)
+    return best, result
+
+
+def run_case(
+    case: TemplateCase, records: int, repeat: int = 3, trace_memory: bool = False
+) -> dict:
+    """
+    Measures one template: compile time with cold and warm caches, parse
+    throughput and model construction throughput, best of `repeat` runs
+    """
+    template = case.template
+    outputs = case.outputs(records)
+
+    # Cold compile reads the template file and compiles every regex
+    clear_parsers()
+    purge()
+    started = perf_counter()
+    get_parser(template.template, template.vendor)
+    compile_cold = perf_counter() - started
+    compile_warm, _ = timed(
+        lambda: get_parser(template.template, template.vendor), repeat
+    )
+
+    parse_seconds, rows = timed(lambda: case.parse(outputs), repeat)
+    result = {
+        "benchmark": "parser",
+        "template": case.name,
+        "records": records,
+        "input_bytes": sum(len(output) for output in outputs),
+        "rows": len(rows),
+        "compile_cold_ms": round(compile_cold * 1000, 3),
+        "compile_ms": round(compile_warm * 1000, 3),
+        "parse_seconds": round(parse_seconds, 4),
+        "parse_rows_per_second": round(len(rows) / parse_seconds) if rows else 0,
+    }
+
+    if template.build is not None and rows:
+        output = "\n".join(outputs)
+        best = float("inf")
+        for _ in range(repeat):
+            # Getters consume their rows, so each run gets a fresh copy
+            copies = [dict(row) for row in rows]
+            started = perf_counter()
+            models = len(template.models(copies, output, HOST))
+            best = min(best, perf_counter() - started)
+        result.update(
+            models=models,
+            model_seconds=round(best, 4),
+            model_rows_per_second=round(len(rows) / best),
+        )
+
+    if trace_memory:
+        start()
+        parsed = case.parse(outputs)
+        if parsed:
+            template.models(parsed, "\n".join(outputs), HOST)
+        result["peak_memory_bytes"] = get_traced_memory()[1]
+        stop()
+
+    return result
+
+
+def environment() -> dict[str, str]:
+    try:
+        package_version = version("netmagic")
+    except PackageNotFoundError:
+        package_version = "unknown"
+    return {
+        "netmagic": package_version,
+        "python": python_version(),
+        "platform": platform(),
+        "timestamp": datetime.now(UTC).isoformat(),
+    }
+
+
+def main(argv: list[str] | None = None) -> list[dict]:
+    parser = ArgumentParser(description="Benchmark the NetMagic TextFSM templates")
+    parser.add_argument("--records", type=int, nargs="+", default=[1_000, 10_000])
+    parser.add_argument(
+        "--templates",
+        nargs="+",
+        help="only run these templates, as `vendor/template` or `template`",
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--memory", action="store_true", help="trace peak Python memory usage"
+    )
+    parser.add_argument("--output", help="also write all results as one JSON file")
+    args = parser.parse_args(argv)
+
+    cases = [
+        case
+        for case in CASES
+        if not args.templates
+        or case.name in args.templates
+        or case.template.template in args.templates
+    ]
+
+    results = []
+    for records in args.records:
+        for case in cases:
+            result = run_case(case, records, args.repeat, args.memory)
+            print(dumps(result))
+            results.append(result)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            dump({**environment(), "results": results}, file, indent=2)
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# NetMagic Response Memory Benchmark
+
+# Python Modules
+from argparse import ArgumentParser
+from gc import collect
+from json import dump, dumps
+from time import monotonic, perf_counter
+from tracemalloc import get_traced_memory, start, stop
+
+# Local Modules
+from netmagic.benchmarks.parsers import environment
+from netmagic.common.classes import CommandResponse, ResponseGroup
+
+OUTPUT = "Gi1/0/1   connected    1    a-full  a-1000 10/100/1000BaseTX"
+COMMAND = "show interface status"
+
+
+def make_responses(count: int) -> list[CommandResponse]:
+    return [
+        CommandResponse(OUTPUT, COMMAND, monotonic(), None, "#") for _ in range(count)
+    ]
+
+
+def run_case(count: int) -> dict:
+    """
+    Measures the memory each `CommandResponse` holds beyond its (shared) output
+    and command strings, how fast they are created and how long a
+    `ResponseGroup` of all of them takes to build and to report its time delta
+    """
+    collect()
+    start()
+    baseline = get_traced_memory()[0]
+    responses = make_responses(count)
+    allocated = get_traced_memory()[0] - baseline
+    stop()
+    del responses
+
+    collect()
+    started = perf_counter()
+    responses = make_responses(count)
+    create_seconds = perf_counter() - started
+
+    started = perf_counter()
+    group = ResponseGroup(responses, description="benchmark")
+    group_seconds = perf_counter() - started
+
+    started = perf_counter()
+    _ = group.time_delta
+    delta_seconds = perf_counter() - started
+
+    return {
+        "benchmark": "responses",
+        "responses": count,
+        # The list holding the responses is included, 8 bytes per response
+        "bytes_per_response": round(allocated / count, 1),
+        "responses_per_second": round(count / create_seconds),
+        "group_ms": round(group_seconds * 1000, 3),
+        "time_delta_ms": round(delta_seconds * 1000, 3),
+    }
+
+
+def main(argv: list[str] | None = None) -> list[dict]:
+    parser = ArgumentParser(
+        description="Benchmark the memory and creation cost of NetMagic responses"
+    )
+    parser.add_argument("--responses", type=int, nargs="+", default=[100_000])
+    parser.add_argument("--output", help="also write all results as one JSON file")
+    args = parser.parse_args(argv)
+
+    results = []
+    for count in args.responses:
+        result = run_case(count)
+        print(dumps(result))
+        results.append(result)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            dump({**environment(), "results": results}, file, indent=2)
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+# NetMagic Session Load Benchmark
+
+# Python Modules
+from argparse import ArgumentParser
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from json import dump, dumps
+from statistics import quantiles
+from time import perf_counter
+
+# Local Modules
+from netmagic.benchmarks.parsers import environment
+from netmagic.devices import BrocadeSwitch, CiscoIOSSwitch, CiscoIOSXRRouter
+from netmagic.devices.network_device import NetworkDevice
+from netmagic.sessions import TerminalSession
+from netmagic.simulator import PROFILES, DeviceSimulator, OutputSizes
+from netmagic.simulator.server import SimulatedDevice
+
+# Device class and the getters each simulated session runs per round
+WORKLOADS: dict[str, tuple[type[NetworkDevice], tuple[str, ...]]] = {
+    "cisco_ios": (
+        CiscoIOSSwitch,
+        ("get_interface_status", "get_mac_table", "get_lldp"),
+    ),
+    "brocade_fastiron": (
+        BrocadeSwitch,
+        ("get_interface_status", "get_mac_table", "get_lldp"),
+    ),
+    "cisco_xr": (CiscoIOSXRRouter, ("get_interface_statistics",)),
+}
+
+
+def percentiles(values: list[float]) -> dict[str, float]:
+    """Median and 95th percentile in milliseconds"""
+    if len(values) < 2:
+        value = round(values[0] * 1000, 3) if values else 0.0
+        return {"p50_ms": value, "p95_ms": value}
+    cuts = quantiles(values, n=20)
+    return {"p50_ms": round(cuts[9] * 1000, 3), "p95_ms": round(cuts[18] * 1000, 3)}
+
+
+def run_session(
+    device: SimulatedDevice,
+    device_class: type[NetworkDevice],
+    getters: tuple[str, ...],
+    rounds: int,
+    username: str,
+    password: str,
+) -> TerminalSession:
+    """Connects to one simulated device, runs the getters and disconnects"""
+    session = TerminalSession(
+        device.host, username, password, port=device.port, ssh_strict=False
+    )
+    try:
+        if not session.connect():
+            return session
+        network_device = device_class(session)
+        for _ in range(rounds):
+            for getter in getters:
+                getattr(network_device, getter)()
+    finally:
+        if session.connection:
+            session.disconnect()
+    return session
+
+
+def run_case(
+    profile: str,
+    devices: int,
+    concurrency: int,
+    rounds: int = 1,
+    sizes: OutputSizes | None = None,
+    latency: float = 0.0,
+    jitter: float = 0.0,
+) -> dict:
+    """
+    Runs full sessions against `devices` simulated devices, `concurrency` at
+    a time, and returns session and command throughput with latencies
+    """
+    device_class, getters = WORKLOADS[profile]
+    with DeviceSimulator() as simulator:
+        simulated = simulator.add_devices(
+            PROFILES[profile], devices, sizes=sizes, latency=latency, jitter=jitter
+        )
+        errors: Counter[str] = Counter()
+        sessions: list[TerminalSession] = []
+        started = perf_counter()
+        with ThreadPoolExecutor(concurrency) as executor:
+            futures = [
+                executor.submit(
+                    run_session,
+                    device,
+                    device_class,
+                    getters,
+                    rounds,
+                    simulator.username,
+                    simulator.password,
+                )
+                for device in simulated
+            ]
+            for future in futures:
+                try:
+                    sessions.append(future.result())
+                # A failed session is counted, not fatal to the run
+                except Exception as error:  # noqa: BLE001
+                    errors[type(error).__name__] += 1
+        elapsed = perf_counter() - started
+
+    connects = [
+        session.connect_response
+        for session in sessions
+        if session.connect_response and session.connect_response.success
+    ]
+    for session in sessions:
+        if session.connect_response and not session.connect_response.success:
+            errors[type(session.connect_response.response).__name__] += 1
+    commands = [response for session in sessions for response in session.command_log]
+
+    return {
+        "benchmark": "sessions",
+        "profile": profile,
+        "devices": devices,
+        "concurrency": concurrency,
+        "rounds": rounds,
+        "latency": latency,
+        "seconds": round(elapsed, 3),
+        "sessions": len(connects),
+        "sessions_per_second": round(len(connects) / elapsed, 2),
+        "commands": len(commands),
+        "commands_per_second": round(len(commands) / elapsed, 2),
+        "connect": percentiles(
+            [sum(response.phases.values()) for response in connects]
+        ),
+        "command": percentiles([response.latency_seconds for response in commands]),
+        "errors": dict(errors),
+    }
+
+
+def main(argv: list[str] | None = None) -> list[dict]:
+    parser = ArgumentParser(
+        description="Benchmark NetMagic sessions against simulated devices"
+    )
+    parser.add_argument(
+        "--profiles", nargs="+", choices=sorted(WORKLOADS), default=["cisco_ios"]
+    )
+    parser.add_argument("--devices", type=int, nargs="+", default=[50])
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--rounds", type=int, default=1)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--interfaces", type=int, default=48)
+    parser.add_argument("--mac-addresses", type=int, default=500)
+    parser.add_argument("--neighbors", type=int, default=4)
+    parser.add_argument("--output", help="also write all results as one JSON file")
+    args = parser.parse_args(argv)
+
+    sizes = OutputSizes(args.interfaces, args.mac_addresses, args.neighbors)
+    results = []
+    for profile in args.profiles:
+        for devices in args.devices:
+            result = run_case(
+                profile,
+                devices,
+                args.concurrency,
+                args.rounds,
+                sizes,
+                args.latency,
+                args.jitter,
+            )
+            print(dumps(result))
+            results.append(result)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            dump({**environment(), "results": results}, file, indent=2)
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+# NetMagic State Store Benchmark
+
+# Python Modules
+from argparse import ArgumentParser
+from json import dump, dumps
+from time import perf_counter
+
+# Local Modules
+from netmagic.benchmarks.parsers import environment
+from netmagic.common.classes.interface import InterfaceStatus
+from netmagic.common.classes.status import MACTableEntry
+from netmagic.storage.state import StateStore
+
+
+def make_fleet(hosts: int, ports: int) -> list[dict]:
+    """
+    Interface status and MAC table results for a fleet, where one port in
+    fifty of each switch is down with a description
+    """
+    results: list[dict] = []
+    for host in range(hosts):
+        hostname = f"switch-{host:05}"
+        results.append(
+            {
+                port: InterfaceStatus(
+                    host=hostname,
+                    interface=f"Gi1/0/{port}",
+                    desc="user port" if port % 2 else None,
+                    state="notconnect" if port % 50 == 1 else "connected",
+                    vlan=str(10 + port % 4),
+                    speed=1000,
+                )
+                for port in range(1, ports + 1)
+            }
+        )
+        macs = [
+            MACTableEntry.create(
+                hostname,
+                (host << 16) + port,
+                interface=f"Gi1/0/{port}",
+                vlan=str(10 + port % 4),
+                type="dynamic",
+            )
+            for port in range(1, ports + 1)
+        ]
+        results.append({entry.mac: entry for entry in macs})
+    return results
+
+
+def run_case(hosts: int, ports: int, filename: str = ":memory:") -> dict:
+    """
+    Measures ingesting the fleet twice (the second run replacing current rows)
+    and the time of common queries on the current state
+    """
+    results = make_fleet(hosts, ports)
+    with StateStore(filename) as store:
+        started = perf_counter()
+        snapshot = store.ingest(results)
+        ingest_seconds = perf_counter() - started
+
+        started = perf_counter()
+        store.ingest(results)
+        reingest_seconds = perf_counter() - started
+
+        started = perf_counter()
+        down = store.down_ports()
+        down_seconds = perf_counter() - started
+
+        started = perf_counter()
+        store.find_mac((hosts // 2 << 16) + 1)
+        mac_seconds = perf_counter() - started
+
+        started = perf_counter()
+        store.current(InterfaceStatus, host=f"switch-{hosts // 2:05}")
+        host_seconds = perf_counter() - started
+
+    rows = sum(snapshot.rows.values())
+    return {
+        "benchmark": "state",
+        "hosts": hosts,
+        "rows": rows,
+        "ingest_rows_per_second": round(rows / ingest_seconds),
+        "reingest_rows_per_second": round(rows / reingest_seconds),
+        "down_ports": len(down),
+        "down_ports_ms": round(down_seconds * 1000, 3),
+        "find_mac_ms": round(mac_seconds * 1000, 3),
+        "host_ms": round(host_seconds * 1000, 3),
+    }
+
+
+def main(argv: list[str] | None = None) -> list[dict]:
+    parser = ArgumentParser(
+        description="Benchmark ingesting and querying the NetMagic state store"
+    )
+    parser.add_argument("--hosts", type=int, nargs="+", default=[5_000])
+    parser.add_argument("--ports", type=int, default=48)
+    parser.add_argument(
+        "--database", default=":memory:", help="SQLite file (default in memory)"
+    )
+    parser.add_argument("--output", help="also write all results as one JSON file")
+    args = parser.parse_args(argv)
+
+    results = []
+    for hosts in args.hosts:
+        result = run_case(hosts, args.ports, args.database)
+        print(dumps(result))
+        results.append(result)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            dump({**environment(), "results": results}, file, indent=2)
+    return results
+
+
+if __name__ == "__main__":
+    main()
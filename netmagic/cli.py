@@ -0,0 +1,305 @@
+# NetMagic Command Line
+
+# Python Modules
+import sys
+from argparse import ArgumentParser, Namespace
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from fnmatch import fnmatch
+from functools import partial
+from gzip import open as gzip_open
+from json import dumps
+from mmap import ACCESS_READ, mmap
+from os import cpu_count, fstat, path, walk
+from re import search, split
+from time import perf_counter
+from typing import Any, TextIO
+
+# Third-Party Modules
+from pydantic import BaseModel
+
+# Local Modules
+from netmagic.devices.offline import TEMPLATES, infer_template
+from netmagic.handlers.exporters import export_value, model_columns
+
+type Chunk = list[tuple[str, str]]
+type ChunkResult = tuple[list[str], Counter[str], list[dict[str, str]]]
+
+# Files of this size or larger are memory-mapped instead of read
+MMAP_THRESHOLD = 1 << 20
+
+# Files are grouped into tasks of about this many bytes
+CHUNK_BYTES = 4 << 20
+CHUNK_FILES = 256
+
+
+# ARCHIVE
+
+
+def iter_archive(
+    paths: Iterable[str], include: Iterable[str] = ("*",)
+) -> Iterator[tuple[str, str, int]]:
+    """
+    Yields `(filename, name, size)` of every file under `paths` matching one of
+    the `include` globs, where `name` is relative to the archive directory
+    """
+    include = tuple(include)
+    for root in paths:
+        if path.isfile(root):
+            yield root, path.basename(root), path.getsize(root)
+            continue
+        for directory, directories, filenames in walk(root):
+            directories.sort()
+            for filename in sorted(filenames):
+                if not any(fnmatch(filename, pattern) for pattern in include):
+                    continue
+                full_name = path.join(directory, filename)
+                yield (
+                    full_name,
+                    path.relpath(full_name, root),
+                    path.getsize(full_name),
+                )
+
+
+def chunk_files(
+    files: Iterable[tuple[str, str, int]],
+    chunk_bytes: int = CHUNK_BYTES,
+    max_files: int = CHUNK_FILES,
+) -> Iterator[Chunk]:
+    """
+    Groups files into chunks of about `chunk_bytes`, so many small files share
+    one task while large files get a task of their own
+    """
+    chunk: Chunk = []
+    size = 0
+    for filename, name, file_size in files:
+        chunk.append((filename, name))
+        size += file_size
+        if size >= chunk_bytes or len(chunk) >= max_files:
+            yield chunk
+            chunk, size = [], 0
+    if chunk:
+        yield chunk
+
+
+def read_output(filename: str, mmap_threshold: int = MMAP_THRESHOLD) -> str:
+    """
+    Returns the text of a saved output, decoding large files straight from a
+    memory map rather than through an intermediate read buffer
+    """
+    with open(filename, "rb") as file:
+        size = fstat(file.fileno()).st_size
+        if size and size >= mmap_threshold:
+            with mmap(file.fileno(), 0, access=ACCESS_READ) as mapped:
+                text = str(mapped, "utf-8", "replace")
+        else:
+            text = file.read().decode("utf-8", "replace")
+    return text.replace("\r\n", "\n") if "\r" in text else text
+
+
+def host_for(name: str, host_pattern: str | None = None) -> str:
+    """
+    Returns the host of a file: the `host` group (or first group, or whole
+    match for a pattern without groups) of `host_pattern` searched in its
+    relative name, otherwise its top directory, or for files at the top of the
+    archive the start of the filename
+    """
+    if host_pattern and (match := search(host_pattern, name)):
+        return match.groupdict().get("host") or match.group(1 if match.re.groups else 0)
+    parts = name.replace("\\", "/").split("/")
+    if len(parts) > 1:
+        return parts[0]
+    return split(r"[._]", parts[0], maxsplit=1)[0]
+
+
+# PARSING
+
+
+def record(model: Any) -> dict[str, Any]:
+    """Flattens a model, or a row of a template without one, to JSON values"""
+    if isinstance(model, BaseModel):
+        return {
+            "model": type(model).__name__,
+            **{
+                name: export_value(getter(model))
+                for name, getter in model_columns(type(model))
+            },
+        }
+    return {key: export_value(value) for key, value in model.items()}
+
+
+def parse_file(
+    filename: str,
+    name: str,
+    template: str | None = None,
+    vendor: str | None = None,
+    raw: bool = False,
+    mmap_threshold: int = MMAP_THRESHOLD,
+    host_pattern: str | None = None,
+) -> list[str] | None:
+    """
+    Parses one saved output into JSON Lines records, or returns `None` when
+    no template matches it
+    """
+    output = read_output(filename, mmap_threshold)
+    offline_template = (
+        TEMPLATES[template] if template else infer_template(output, vendor)
+    )
+    if offline_template is None:
+        return None
+
+    host = host_for(name, host_pattern)
+    rows = offline_template.parse(output)
+    models = rows if raw else offline_template.models(rows, output, host)
+    base = {"file": name, "host": host, "template": offline_template.name}
+    return [dumps({**base, **record(model)}) for model in models]
+
+
+def parse_chunk(chunk: Chunk, **options) -> ChunkResult:
+    """
+    Parses a chunk of files in a worker, returning the serialised records,
+    counts and the files which failed
+    """
+    lines: list[str] = []
+    counts: Counter[str] = Counter()
+    errors: list[dict[str, str]] = []
+    for filename, name in chunk:
+        counts["files"] += 1
+        try:
+            records = parse_file(filename, name, **options)
+        # One bad file is reported, not fatal to the archive
+        except Exception as error:  # noqa: BLE001
+            counts["errors"] += 1
+            errors.append({"file": name, "error": f"{type(error).__name__}: {error}"})
+            continue
+        if records is None:
+            counts["skipped"] += 1
+            continue
+        counts["parsed"] += 1
+        counts["records"] += len(records)
+        lines.extend(records)
+    return lines, counts, errors
+
+
+def parse_archive(
+    chunks: Iterable[Chunk], jobs: int | None = None, **options
+) -> Iterator[ChunkResult]:
+    """
+    Parses chunks across a process pool, yielding results as they complete.
+    Only a few chunks per worker are queued at once, so memory stays flat on
+    archives of any size.  One job parses in this process.
+    """
+    worker = partial(parse_chunk, **options)
+    jobs = jobs or cpu_count() or 1
+    if jobs == 1:
+        yield from map(worker, chunks)
+        return
+
+    with ProcessPoolExecutor(jobs) as executor:
+        pending = set()
+        for chunk in chunks:
+            pending.add(executor.submit(worker, chunk))
+            if len(pending) >= jobs * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+
+def open_output(filename: str | None) -> TextIO:
+    if not filename or filename == "-":
+        return sys.stdout
+    if filename.endswith(".gz"):
+        return gzip_open(filename, "wt", encoding="utf-8")
+    return open(filename, "w", encoding="utf-8")
+
+
+def run_parse(args: Namespace) -> int:
+    files = iter_archive(args.paths, args.include)
+    chunks = chunk_files(files, args.chunk_bytes, args.chunk_files)
+    counts: Counter[str] = Counter()
+    started = perf_counter()
+
+    output = open_output(args.output)
+    try:
+        for lines, chunk_counts, errors in parse_archive(
+            chunks,
+            args.jobs,
+            template=args.template,
+            vendor=args.vendor,
+            raw=args.raw,
+            mmap_threshold=args.mmap_threshold,
+            host_pattern=args.host_pattern,
+        ):
+            if lines:
+                output.write("\n".join(lines))
+                output.write("\n")
+            counts.update(chunk_counts)
+            for error in errors:
+                print(dumps(error), file=sys.stderr)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    elapsed = perf_counter() - started
+    summary = {
+        key: counts[key] for key in ("files", "parsed", "skipped", "errors", "records")
+    }
+    summary["seconds"] = round(elapsed, 3)
+    summary["records_per_second"] = round(counts["records"] / elapsed) if elapsed else 0
+    print(dumps(summary), file=sys.stderr)
+    return 1 if counts["errors"] else 0
+
+
+# COMMANDS
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = ArgumentParser(prog="netmagic", description="NetMagic tools")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    parse = commands.add_parser(
+        "parse",
+        help="parse archived show command outputs",
+        description="Parse directories of saved show command outputs with the "
+        "built-in templates into JSON Lines, one record per model",
+    )
+    parse.add_argument("paths", nargs="+", help="archive directories or files")
+    parse.add_argument(
+        "-o", "--output", help="JSON Lines file, gzipped for `.gz` (default stdout)"
+    )
+    parse.add_argument(
+        "-j", "--jobs", type=int, help="worker processes (default all cores)"
+    )
+    parse.add_argument(
+        "--include", nargs="+", default=["*"], help="filename globs to parse"
+    )
+    parse.add_argument(
+        "--template",
+        choices=sorted(TEMPLATES),
+        help="parse every file with one template instead of inferring it",
+    )
+    parse.add_argument(
+        "--vendor",
+        choices=sorted({template.vendor for template in TEMPLATES.values()}),
+        help="only infer templates of one vendor",
+    )
+    parse.add_argument(
+        "--raw", action="store_true", help="write parsed rows without building models"
+    )
+    parse.add_argument(
+        "--host-pattern",
+        help="regex finding the host in a file's relative path, from its `host` "
+        "or first group or whole match (default the top directory or filename prefix)",
+    )
+    parse.add_argument("--chunk-bytes", type=int, default=CHUNK_BYTES)
+    parse.add_argument("--chunk-files", type=int, default=CHUNK_FILES)
+    parse.add_argument("--mmap-threshold", type=int, default=MMAP_THRESHOLD)
+    parse.set_defaults(handler=run_parse)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
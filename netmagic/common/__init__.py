@@ -5,6 +5,8 @@ from netmagic.common.types import (
     FSMOutputT,
     HostT,
     KwDict,
+    ReplayMode,
+    ReportFormat,
     SFPAlert,
     TDRStatus,
     Transport,
@@ -19,6 +21,8 @@ __all__ = [
     "FSMOutputT",
     "HostT",
     "KwDict",
+    "ReplayMode",
+    "ReportFormat",
     "SFPAlert",
     "TDRStatus",
     "Transport",
@@ -14,9 +14,11 @@ from netmagic.common.classes.responses import (
     CommandResponse,
     ConfigResponse,
     ConnectResponse,
+    DetachedResponse,
     NETCONFResponse,
     Response,
     ResponseGroup,
+    RESTCONFResponse,
 )
 
 __all__ = [
@@ -25,6 +27,7 @@ __all__ = [
     "CommandResponse",
     "ConfigResponse",
     "ConnectResponse",
+    "DetachedResponse",
     "Interface",
     "InterfaceLLDP",
     "InterfaceOptics",
@@ -34,6 +37,7 @@ __all__ = [
     "InterfaceVLANs",
     "NETCONFResponse",
     "OpticStatus",
+    "RESTCONFResponse",
     "Response",
     "ResponseGroup",
 ]
@@ -2,44 +2,125 @@
 
 # Python Modules
 from collections.abc import Callable
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
+from enum import Enum
+from io import BytesIO
+from json import loads
+from pickle import HIGHEST_PROTOCOL, Unpickler, UnpicklingError, dumps  # nosec B403
+from time import monotonic
 from typing import TYPE_CHECKING, Any
 
+# Third-Party Modules
+from pydantic import BaseModel
+
 if TYPE_CHECKING:
     from netmagic.sessions.netconf import NETCONFSession
+    from netmagic.sessions.restconf import RESTCONFSession
     from netmagic.sessions.terminal import TerminalSession
+from netmagic.common.spool import SpilledOutput
 from netmagic.common.types import FSMDataT, HostT
 
+# A monotonic clock reading and the wall-clock time taken together, from which
+# datetimes are derived for monotonic timestamps
+CLOCK_ANCHOR = (monotonic(), datetime.now(UTC))
+
+type TimeT = datetime | float
+
+
+def to_monotonic(value: TimeT) -> float:
+    """Converts a datetime to the monotonic clock, floats are already on it"""
+    if not isinstance(value, datetime):
+        return value
+    if value.tzinfo is None:
+        value = value.astimezone(UTC)
+    clock, wall = CLOCK_ANCHOR
+    return clock + (value - wall).total_seconds()
+
+
+def to_datetime(value: float) -> datetime:
+    """Converts a monotonic clock reading to a UTC datetime"""
+    clock, wall = CLOCK_ANCHOR
+    return wall + timedelta(seconds=value - clock)
+
 
 class Response:
     """
     Response base class for `BannerResponse` and `CommandResponse`
+
+    Times are kept as monotonic clock readings in `sent_at` and `received_at`,
+    so latency is unaffected by wall-clock changes. `sent_time`,
+    `received_time` and `latency` are derived from them when read. Either form
+    is accepted when creating or updating a response.
+
+    A response may hold a `SpilledOutput` handle instead of a large output,
+    which `response` reads back from its spool file each time it is accessed.
     """
 
+    __slots__ = ("_response", "received_at", "retries", "sent_at")
+
     def __init__(
         self,
         response: str | Exception,
-        sent_time: datetime,
-        received_time: datetime | None = None,
+        sent_time: TimeT,
+        received_time: TimeT | None = None,
         attempts: int = 1,
     ) -> None:
-
-        if not received_time:
-            received_time = datetime.now(UTC)
-
         self.response = response
-        self.sent_time = sent_time
-        self.received_time = received_time
-        self.latency = self.received_time - self.sent_time
+        self.sent_at = to_monotonic(sent_time)
+        self.received_at = (
+            monotonic() if received_time is None else to_monotonic(received_time)
+        )
         self.retries = attempts
 
     def __str__(self) -> str:
         return str(self.response)
 
+    @property
+    def response(self) -> Any:
+        if isinstance(self._response, SpilledOutput):
+            return self._response.read()
+        return self._response
+
+    @response.setter
+    def response(self, value: Any) -> None:
+        self._response = value
+
+    @property
+    def spilled(self) -> SpilledOutput | None:
+        """Handle of an output kept in a spool file rather than in memory"""
+        return self._response if isinstance(self._response, SpilledOutput) else None
+
+    @property
+    def sent_time(self) -> datetime:
+        return to_datetime(self.sent_at)
+
+    @sent_time.setter
+    def sent_time(self, value: TimeT) -> None:
+        self.sent_at = to_monotonic(value)
+
+    @property
+    def received_time(self) -> datetime:
+        return to_datetime(self.received_at)
+
+    @received_time.setter
+    def received_time(self, value: TimeT) -> None:
+        self.received_at = to_monotonic(value)
+
+    @property
+    def latency(self) -> timedelta:
+        return timedelta(seconds=self.received_at - self.sent_at)
+
+    @property
+    def latency_seconds(self) -> float:
+        return self.received_at - self.sent_at
+
     def update_latency(
-        self, sent_time: datetime | None = None, received_time: datetime | None = None
+        self, sent_time: TimeT | None = None, received_time: TimeT | None = None
     ) -> None:
-        self.latency = self.received_time - self.sent_time
+        if sent_time is not None:
+            self.sent_at = to_monotonic(sent_time)
+        if received_time is not None:
+            self.received_at = to_monotonic(received_time)
 
 
 class ResponseGroup:
@@ -47,6 +128,8 @@ class ResponseGroup:
     Collection of responses
     """
 
+    __slots__ = ("description", "fsm_output", "responses")
+
     def __init__(
         self,
         responses: list[Response],
@@ -55,7 +138,6 @@ class ResponseGroup:
     ) -> None:
         self.responses = responses
         self.fsm_output = fsm_output
-        self.time_delta = self.find_time_delta()
 
         # Custom user entered field for `__repr__`
         self.description = description
@@ -63,11 +145,16 @@ class ResponseGroup:
     def __repr__(self) -> str:
         return f"Response Group({len(self.responses)} members): {self.description}"
 
-    def find_time_delta(self):
-        sent_times = [response.sent_time for response in self.responses]
-        received_times = [response.received_time for response in self.responses]
-        if sent_times and received_times:
-            return max(received_times) - min(sent_times)
+    @property
+    def time_delta(self) -> timedelta | None:
+        """Time from the first response sent to the last received, when read"""
+        return self.find_time_delta()
+
+    def find_time_delta(self) -> timedelta | None:
+        if self.responses:
+            sent = min(response.sent_at for response in self.responses)
+            received = max(response.received_at for response in self.responses)
+            return timedelta(seconds=received - sent)
 
 
 class BannerResponse(Response):
@@ -75,13 +162,15 @@ class BannerResponse(Response):
     Simple object for capturing the info from a banner grab for identifying devices.
     """
 
+    __slots__ = ("host", "port")
+
     def __init__(
         self,
         response: str,
         host: HostT,
         port: int,
-        sent_time: datetime,
-        received_time: datetime | None = None,
+        sent_time: TimeT,
+        received_time: TimeT | None = None,
         *args,
         **kwargs,
     ) -> None:
@@ -95,20 +184,50 @@ class BannerResponse(Response):
 
 class ConnectResponse(Response):
     """
-    Simple object for capturing a connection attempt and info around it
+    Simple object for capturing a connection attempt and info around it.
+
+    `phases` holds the seconds spent in each step of the connect, such as
+    `dns`, `tcp`, `key_exchange`, `authentication`, `prompt_discovery` and
+    `session_preparation`, in the order they happened.
     """
 
+    __slots__ = ("host", "method", "params", "phases", "port")
+
     def __init__(
         self,
         response: Any,
         method: Callable,
         params: Any,
-        sent_time: datetime,
-        received_time: datetime | None = None,
+        sent_time: TimeT,
+        received_time: TimeT | None = None,
+        phases: dict[str, float] | None = None,
+        attempts: int = 1,
+        host: HostT | None = None,
+        port: int | None = None,
     ) -> None:
         self.method = method
         self.params = params
-        super().__init__(response, sent_time, received_time)
+        self.phases = phases if phases is not None else {}
+        self.host = host
+        self.port = port
+        super().__init__(response, sent_time, received_time, attempts)
+
+    def __repr__(self) -> str:
+        phases = ", ".join(f"{k}={v:.3f}s" for k, v in self.phases.items())
+        return f"Connect({self.host}:{self.port}): {phases}"
+
+    @property
+    def success(self) -> bool:
+        return bool(self.response) and not isinstance(self.response, Exception)
+
+    @property
+    def slowest_phase(self) -> str | None:
+        """Name of the phase which took the longest"""
+        if self.phases:
+            return max(self.phases, key=self.phases.get)
+
+    def add_phase(self, name: str, seconds: float) -> None:
+        self.phases[name] = self.phases.get(name, 0) + seconds
 
 
 class CommandResponse(Response):
@@ -116,15 +235,17 @@ class CommandResponse(Response):
     Simple object for capturing info for various details of a Netmiko `command`
     """
 
+    __slots__ = ("command_string", "expect_string", "fsm_output", "session", "success")
+
     def __init__(
         self,
         response: str | Exception,
         command_string: str,
-        sent_time: datetime,
+        sent_time: TimeT,
         session: "TerminalSession",
         expect_string: str,
         success: bool | None = None,
-        received_time: datetime | None = None,
+        received_time: TimeT | None = None,
         attempts: int = 1,
         fsm_output: FSMDataT = None,
     ) -> None:
@@ -134,7 +255,7 @@ class CommandResponse(Response):
         self.fsm_output = fsm_output
 
         # Automatic identification based on type
-        success_map = {str: True, Exception: False}
+        success_map = {str: True, SpilledOutput: True, Exception: False}
         self.success = success_map.get(type(response)) if success is None else success
 
         super().__init__(response, sent_time, received_time, attempts)
@@ -146,15 +267,17 @@ class CommandResponse(Response):
 class NETCONFResponse(Response):
     """Response metadata for a NETCONF RPC."""
 
+    __slots__ = ("operation", "rpc_filter", "session", "success")
+
     def __init__(
         self,
         response: str | Exception,
         operation: str,
-        sent_time: datetime,
+        sent_time: TimeT,
         session: "NETCONFSession",
         rpc_filter: object | None = None,
         success: bool | None = None,
-        received_time: datetime | None = None,
+        received_time: TimeT | None = None,
         attempts: int = 1,
     ) -> None:
         self.operation = operation
@@ -167,19 +290,57 @@ class NETCONFResponse(Response):
         return f"RE({self.session.host}): NETCONF {self.operation}"
 
 
+class RESTCONFResponse(Response):
+    """Response metadata for a RESTCONF HTTP request."""
+
+    __slots__ = ("method", "path", "session", "status", "success")
+
+    def __init__(
+        self,
+        response: str | Exception,
+        method: str,
+        path: str,
+        sent_time: TimeT,
+        session: "RESTCONFSession",
+        status: int | None = None,
+        success: bool | None = None,
+        received_time: TimeT | None = None,
+        attempts: int = 1,
+    ) -> None:
+        self.method = method
+        self.path = path
+        self.status = status
+        self.session = session
+        if success is None:
+            success = isinstance(response, str) and status is not None and status < 300
+        self.success = success
+        super().__init__(response, sent_time, received_time, attempts)
+
+    def __repr__(self) -> str:
+        return f"RE({self.session.host}): RESTCONF {self.method} {self.path}"
+
+    def json(self) -> Any:
+        """Decode the JSON body, returning `None` for an empty reply."""
+        if isinstance(self.response, str) and self.response.strip():
+            return loads(self.response)
+        return None
+
+
 class ConfigResponse(Response):
     """
-    Simple objects for capturing info for a CLI configuration
+    Simple objects for capturing info for a CLI or NETCONF configuration
     """
 
+    __slots__ = ("config_sent", "session", "success")
+
     def __init__(
         self,
-        response: str,
+        response: str | Exception,
         config: str,
-        sent_time: datetime,
-        session: "TerminalSession",
+        sent_time: TimeT,
+        session: "TerminalSession | NETCONFSession",
         success: bool | None = None,
-        received_time: datetime | None = None,
+        received_time: TimeT | None = None,
         attempts: int = 1,
     ) -> None:
         super().__init__(response, sent_time, received_time, attempts)
@@ -189,3 +350,203 @@ class ConfigResponse(Response):
         # Automatic identification based on type
         success_map = {str: True, Exception: False}
         self.success = success_map.get(type(response)) if success is None else success
+
+
+# Live response types which can be detached, by `DetachedResponse.kind`
+DETACHED_KINDS: dict[str, type[Response]] = {
+    "command": CommandResponse,
+    "config": ConfigResponse,
+    "netconf": NETCONFResponse,
+}
+
+
+class DetachedResponse:
+    """
+    Session-free copy of a `CommandResponse`, `ConfigResponse` or
+    `NETCONFResponse`, for returning results from worker processes or sending
+    them between collection nodes.
+
+    Times are POSIX timestamps and errors are kept as their `Type: message`
+    text, so every field pickles compactly.  `to_bytes` and `from_bytes` are
+    the binary form.  Loading is limited to the classes of detached responses
+    and parsed output by `DetachedUnpickler`, so bytes naming anything else,
+    such as a function to call, are refused before it is looked up.
+    """
+
+    __slots__ = (
+        "attempts",
+        "command",
+        "error",
+        "fsm_output",
+        "host",
+        "kind",
+        "received_time",
+        "response",
+        "sent_time",
+        "success",
+    )
+
+    def __init__(
+        self,
+        kind: str,
+        host: HostT | None,
+        command: str,
+        response: str | None,
+        sent_time: float,
+        received_time: float,
+        success: bool | None = None,
+        error: str | None = None,
+        attempts: int = 1,
+        fsm_output: FSMDataT = None,
+    ) -> None:
+        self.kind = kind
+        self.host = host
+        self.command = command
+        self.response = response
+        self.error = error
+        self.success = success
+        self.sent_time = sent_time
+        self.received_time = received_time
+        self.attempts = attempts
+        self.fsm_output = fsm_output
+
+    def __repr__(self) -> str:
+        return f"Detached({self.host}): {self.kind} {self.command}"
+
+    def __reduce__(self) -> tuple:
+        return (
+            DetachedResponse,
+            (
+                self.kind,
+                self.host,
+                self.command,
+                self.response,
+                self.sent_time,
+                self.received_time,
+                self.success,
+                self.error,
+                self.attempts,
+                self.fsm_output,
+            ),
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DetachedResponse):
+            return NotImplemented
+        return self.__reduce__()[1] == other.__reduce__()[1]
+
+    @property
+    def latency(self) -> float:
+        """Seconds between sending and receiving"""
+        return self.received_time - self.sent_time
+
+    @classmethod
+    def from_response(
+        cls, response: "CommandResponse | ConfigResponse | NETCONFResponse"
+    ) -> "DetachedResponse":
+        kind = next(
+            (
+                kind
+                for kind, klass in DETACHED_KINDS.items()
+                if isinstance(response, klass)
+            ),
+            None,
+        )
+        if kind is None:
+            raise TypeError(f"`{type(response).__name__}` cannot be detached")
+
+        command = {
+            "command": lambda: response.command_string,
+            "config": lambda: response.config_sent,
+            "netconf": lambda: response.operation,
+        }[kind]()
+
+        output, error = response.response, None
+        if isinstance(output, Exception):
+            output, error = None, f"{type(output).__name__}: {output}"
+        elif output is not None and not isinstance(output, str):
+            output = str(output)
+
+        return cls(
+            kind,
+            getattr(response.session, "host", None),
+            command,
+            output,
+            response.sent_time.timestamp(),
+            response.received_time.timestamp(),
+            response.success,
+            error,
+            response.retries,
+            getattr(response, "fsm_output", None),
+        )
+
+    def to_response(
+        self, session: "TerminalSession | NETCONFSession | None" = None
+    ) -> "CommandResponse | ConfigResponse | NETCONFResponse":
+        """
+        Rebuilds the live response type, attached to `session` if given.
+        Errors come back as an `Exception` with the original text.
+        """
+        output = Exception(self.error) if self.error is not None else self.response
+        sent_time = datetime.fromtimestamp(self.sent_time, UTC)
+        received_time = datetime.fromtimestamp(self.received_time, UTC)
+
+        if self.kind == "command":
+            return CommandResponse(
+                output,
+                self.command,
+                sent_time,
+                session,
+                "",
+                self.success,
+                received_time,
+                self.attempts,
+                self.fsm_output,
+            )
+        return DETACHED_KINDS[self.kind](
+            output,
+            self.command,
+            sent_time,
+            session,
+            success=self.success,
+            received_time=received_time,
+            attempts=self.attempts,
+        )
+
+    def to_bytes(self) -> bytes:
+        return dumps(self, HIGHEST_PROTOCOL)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "DetachedResponse":
+        response = DetachedUnpickler(BytesIO(data)).load()  # nosec B301
+        if not isinstance(response, cls):
+            raise TypeError(f"Expected DetachedResponse, got {type(response).__name__}")
+        return response
+
+
+# Classes outside NetMagic which parsed output holds
+DETACHED_CLASSES = {
+    ("ipaddress", "IPv4Address"),
+    ("ipaddress", "IPv6Address"),
+    ("mactools.macaddress", "MacAddress"),
+    ("mactools.macaddress", "MacNotation"),
+}
+
+
+class DetachedUnpickler(Unpickler):
+    """
+    Unpickler of `DetachedResponse` bytes which only finds NetMagic's own
+    models, enums and detached responses, and the address classes in
+    `DETACHED_CLASSES`
+    """
+
+    def find_class(self, module: str, name: str) -> Any:
+        if (module, name) in DETACHED_CLASSES:
+            return super().find_class(module, name)
+        if module.startswith("netmagic."):
+            found = super().find_class(module, name)
+            if found is DetachedResponse or (
+                isinstance(found, type) and issubclass(found, BaseModel | Enum)
+            ):
+                return found
+        raise UnpicklingError(f"`{module}.{name}` is not part of a detached response")
@@ -0,0 +1,319 @@
+# NetMagic Metrics Module
+
+"""
+In-process counters and histograms of session activity.
+
+Each thread records into its own shard without locking; shards are only
+merged when a snapshot or Prometheus dump is taken.  The shards of threads
+which have exited are folded into one retired shard, so pools replacing
+their workers do not grow the registry.  Sessions record every
+command and RPC into `REGISTRY` while `REGISTRY.enabled` is true.
+"""
+
+# Python Modules
+from bisect import bisect_left
+from collections.abc import Iterable
+from functools import lru_cache
+from math import inf
+from re import sub
+from threading import Lock, Thread, current_thread, local
+from typing import TYPE_CHECKING, Any
+
+# Local Modules
+from netmagic.handlers.parse import IPV4_PATTERN
+
+if TYPE_CHECKING:
+    from netmagic.common.classes.responses import Response
+
+type LabelValues = tuple[str, ...]
+
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# Interface names of any platform, e.g. `Gi1/0/1`, `GigabitEthernet0/0/0/1.100`
+INTERFACE_PATTERN = r"\b[A-Za-z-]*\d+(?:/\d+)+(?:[.:]\d+)?\b"
+
+
+@lru_cache(maxsize=2048)
+def command_template(command: str) -> str:
+    """
+    Reduces a command to a low-cardinality label by replacing interfaces,
+    addresses and numbers, e.g. `show interfaces Gi1/0/1` becomes
+    `show interfaces <interface>`.
+    """
+    command = sub(INTERFACE_PATTERN, "<interface>", command)
+    command = sub(IPV4_PATTERN, "<address>", command)
+    command = sub(r"\b\d+\b", "<n>", command)
+    return " ".join(command.split())
+
+
+def escape_label(value: str) -> str:
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def format_labels(names: Iterable[str], values: Iterable[str]) -> str:
+    pairs = ",".join(
+        f'{name}="{escape_label(value)}"'
+        for name, value in zip(names, values, strict=True)
+    )
+    return f"{{{pairs}}}" if pairs else ""
+
+
+def merge_values(merged: dict, shard: dict) -> None:
+    """Adds the values of a shard into `merged`"""
+    for key, value in shard.items():
+        if isinstance(value, list):
+            value = list(value)
+            if current := merged.get(key):
+                value = [a + b for a, b in zip(current, value, strict=True)]
+        else:
+            value += merged.get(key, 0)
+        merged[key] = value
+
+
+def format_number(value: float) -> str:
+    if value == inf:
+        return "+Inf"
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Metric:
+    """
+    Base for a named metric with a fixed set of label names
+    """
+
+    kind = ""
+
+    def __init__(
+        self,
+        registry: "MetricsRegistry",
+        name: str,
+        description: str,
+        label_names: tuple[str, ...] = (),
+    ) -> None:
+        self.registry = registry
+        self.name = name
+        self.description = description
+        self.label_names = label_names
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.name})"
+
+
+class Counter(Metric):
+    """
+    Monotonically increasing total
+    """
+
+    kind = "counter"
+
+    def inc(self, labels: LabelValues = (), amount: float = 1) -> None:
+        values = self.registry.shard()
+        key = (self.name, labels)
+        values[key] = values.get(key, 0) + amount
+
+
+class Histogram(Metric):
+    """
+    Distribution of observations over fixed upper bounds, in seconds by default
+    """
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        registry: "MetricsRegistry",
+        name: str,
+        description: str,
+        label_names: tuple[str, ...] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(registry, name, description, label_names)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, labels: LabelValues = ()) -> None:
+        values = self.registry.shard()
+        key = (self.name, labels)
+        # Per-bucket counts, then the sum and count of observations
+        if (counts := values.get(key)) is None:
+            counts = values[key] = [0] * (len(self.buckets) + 3)
+        counts[bisect_left(self.buckets, value)] += 1
+        counts[-2] += value
+        counts[-1] += 1
+
+
+class MetricsRegistry:
+    """
+    Registry of metrics with per-thread shards of their values
+    """
+
+    def __init__(self, enabled: bool = True) -> None:
+        self.enabled = enabled
+        self.metrics: dict[str, Metric] = {}
+        # The values of each live thread, and those of exited threads
+        self._shards: list[tuple[Thread, dict]] = []
+        self._retired: dict = {}
+        self._local = local()
+        self._lock = Lock()
+
+    def __repr__(self) -> str:
+        return f"MetricsRegistry({len(self.metrics)} metrics)"
+
+    def shard(self) -> dict:
+        """Returns the calling thread's values, registering it on first use"""
+        try:
+            return self._local.values
+        except AttributeError:
+            values = self._local.values = {}
+            with self._lock:
+                self.retire_shards()
+                self._shards.append((current_thread(), values))
+            return values
+
+    def retire_shards(self) -> None:
+        """
+        Folds the shards of exited threads into the retired shard, which is
+        safe without their threads as nothing writes to them again.
+        Called with the lock held.
+        """
+        live = []
+        for thread, values in self._shards:
+            if thread.is_alive():
+                live.append((thread, values))
+            else:
+                merge_values(self._retired, values)
+        self._shards = live
+
+    def register(self, metric: Metric) -> Metric:
+        if existing := self.metrics.get(metric.name):
+            if type(existing) is not type(metric):
+                raise ValueError(f"`{metric.name}` is already a {existing.kind}")
+            return existing
+        self.metrics[metric.name] = metric
+        return metric
+
+    def counter(
+        self, name: str, description: str, label_names: tuple[str, ...] = ()
+    ) -> Counter:
+        return self.register(Counter(self, name, description, label_names))
+
+    def histogram(
+        self,
+        name: str,
+        description: str,
+        label_names: tuple[str, ...] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self.register(Histogram(self, name, description, label_names, buckets))
+
+    def merged(self) -> dict[tuple[str, LabelValues], Any]:
+        """Sums the shards of every thread"""
+        with self._lock:
+            self.retire_shards()
+            shards = [self._retired.copy()]
+            shards.extend(values.copy() for _, values in self._shards)
+
+        merged: dict[tuple[str, LabelValues], Any] = {}
+        for shard in shards:
+            merge_values(merged, shard)
+        return merged
+
+    def snapshot(self) -> dict[str, list[dict[str, Any]]]:
+        """
+        Returns the current samples of each metric by name.
+        Histogram samples carry cumulative `buckets` keyed by upper bound.
+        """
+        samples: dict[str, list[dict[str, Any]]] = {name: [] for name in self.metrics}
+        for (name, labels), value in sorted(self.merged().items()):
+            metric = self.metrics[name]
+            sample: dict[str, Any] = {
+                "labels": dict(zip(metric.label_names, labels, strict=True))
+            }
+            if isinstance(metric, Histogram):
+                cumulative = 0
+                buckets = {}
+                for bound, count in zip(
+                    (*metric.buckets, inf), value[:-2], strict=True
+                ):
+                    cumulative += count
+                    buckets[bound] = cumulative
+                sample.update(buckets=buckets, sum=value[-2], count=value[-1])
+            else:
+                sample["value"] = value
+            samples[name].append(sample)
+        return samples
+
+    def to_prometheus(self) -> str:
+        """Renders every metric in the Prometheus text exposition format"""
+        lines = []
+        for name, samples in self.snapshot().items():
+            metric = self.metrics[name]
+            lines.append(f"# HELP {name} {metric.description}")
+            lines.append(f"# TYPE {name} {metric.kind}")
+
+            for sample in samples:
+                names = tuple(sample["labels"])
+                values = tuple(sample["labels"].values())
+                if "value" in sample:
+                    labels = format_labels(names, values)
+                    lines.append(f"{name}{labels} {format_number(sample['value'])}")
+                    continue
+
+                for bound, count in sample["buckets"].items():
+                    labels = format_labels(
+                        (*names, "le"), (*values, format_number(bound))
+                    )
+                    lines.append(f"{name}_bucket{labels} {count}")
+                labels = format_labels(names, values)
+                lines.append(f"{name}_sum{labels} {format_number(sample['sum'])}")
+                lines.append(f"{name}_count{labels} {sample['count']}")
+
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Clears the values of every thread"""
+        with self._lock:
+            self._retired.clear()
+            for _, values in self._shards:
+                values.clear()
+
+
+REGISTRY = MetricsRegistry()
+
+REQUEST_LABELS = ("host", "transport", "command", "outcome")
+REQUESTS = REGISTRY.counter(
+    "netmagic_requests_total", "Commands and RPCs sent", REQUEST_LABELS
+)
+RETRIES = REGISTRY.counter(
+    "netmagic_retries_total", "Additional attempts beyond the first", REQUEST_LABELS
+)
+LATENCY = REGISTRY.histogram(
+    "netmagic_request_seconds", "Latency of commands and RPCs", REQUEST_LABELS
+)
+
+
+def record_response(
+    response: "Response",
+    host: Any,
+    transport: str,
+    command: str,
+    outcome: str | None = None,
+) -> None:
+    """
+    Records a finished command or RPC, labelled by host, transport,
+    command template and outcome (`success` or the exception name, unless
+    the transport gives its own `outcome`)
+    """
+    if not REGISTRY.enabled:
+        return
+
+    if outcome is None:
+        # Spilled outputs are always successful, and are not read back to tell
+        result = None if response.spilled is not None else response.response
+        success = not isinstance(result, Exception)
+        outcome = "success" if success else type(result).__name__
+    labels = (str(host), transport, command_template(command), outcome)
+
+    REQUESTS.inc(labels)
+    if response.retries > 1:
+        RETRIES.inc(labels, response.retries - 1)
+    LATENCY.observe(response.latency_seconds, labels)
@@ -0,0 +1,97 @@
+# NetMagic Output Spool
+
+# Python Modules
+from mmap import ACCESS_READ, mmap
+from os import SEEK_END
+from tempfile import TemporaryFile
+from threading import Lock
+from typing import Self
+
+# Outputs of this many characters or more are spilled by default
+SPILL_THRESHOLD = 1 << 20
+
+
+class OutputSpool:
+    """
+    Append-only file holding large raw command outputs, read back through one
+    shared memory map, so responses only keep a small `SpilledOutput` handle.
+
+    With no `filename` the spool is an anonymous temporary file, removed when
+    closed.  A `filename` keeps the outputs as an archive after the run.
+    A spool may be shared between sessions.
+    """
+
+    def __init__(
+        self, filename: str | None = None, threshold: int = SPILL_THRESHOLD
+    ) -> None:
+        self.filename = filename
+        self.threshold = threshold
+        # The file stays open for the life of the spool
+        if filename:
+            self.file = open(filename, "a+b")  # noqa: SIM115
+        else:
+            self.file = TemporaryFile("w+b")  # noqa: SIM115
+        self.size = self.file.seek(0, SEEK_END)
+        self._map: mmap | None = None
+        self._lock = Lock()
+
+    def __repr__(self) -> str:
+        return f"OutputSpool({self.filename or '<temporary>'}, {self.size} bytes)"
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def spill(self, output: str) -> "str | SpilledOutput":
+        """Returns a handle for outputs over the threshold, others unchanged"""
+        return self.write(output) if len(output) >= self.threshold else output
+
+    def write(self, output: str) -> "SpilledOutput":
+        data = output.encode()
+        with self._lock:
+            offset = self.size
+            self.file.seek(offset)
+            self.file.write(data)
+            self.file.flush()
+            self.size += len(data)
+        return SpilledOutput(self, offset, len(data))
+
+    def read(self, offset: int, length: int) -> str:
+        with self._lock:
+            # Remapped only when reading past what the current map covers
+            if self._map is None or offset + length > len(self._map):
+                if self._map is not None:
+                    self._map.close()
+                self._map = mmap(self.file.fileno(), 0, access=ACCESS_READ)
+            return str(self._map[offset : offset + length], "utf-8")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+            self.file.close()
+
+
+class SpilledOutput:
+    """
+    Handle to a raw output in an `OutputSpool`, materialised by `read`
+    """
+
+    __slots__ = ("length", "offset", "spool")
+
+    def __init__(self, spool: OutputSpool, offset: int, length: int) -> None:
+        self.spool = spool
+        self.offset = offset
+        self.length = length
+
+    def __repr__(self) -> str:
+        return f"SpilledOutput({self.length} bytes at {self.offset})"
+
+    def __len__(self) -> int:
+        return self.length
+
+    def read(self) -> str:
+        return self.spool.read(self.offset, self.length)
@@ -0,0 +1,358 @@
+# NetMagic Tracing Module
+
+"""
+Lightweight span hooks for finding where time goes in a collection.
+
+Tracing is disabled by default and `span()` then returns a shared no-op
+context manager.  Install a `Tracer` with `set_tracer` to record spans, for
+example to a `FileSpanExporter` writing OpenTelemetry (OTLP/JSON) lines:
+
+    set_tracer(Tracer(FileSpanExporter("spans.jsonl")))
+"""
+
+# Python Modules
+from collections.abc import Callable, Iterable
+from contextvars import ContextVar
+from functools import wraps
+from json import dumps
+from os import getpid
+from secrets import token_hex
+from threading import Lock
+from time import time_ns
+from typing import Any, Self
+
+# OTLP status and span kind codes
+STATUS_UNSET = 0
+STATUS_OK = 1
+STATUS_ERROR = 2
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_CLIENT = 3
+
+
+class Span:
+    """
+    A timed operation with attributes, nested under the span active when it
+    was entered.  Use as a context manager; exceptions mark it as an error.
+    """
+
+    __slots__ = (
+        "_token",
+        "attributes",
+        "end_time",
+        "events",
+        "kind",
+        "name",
+        "parent_id",
+        "span_id",
+        "start_time",
+        "status",
+        "status_message",
+        "trace_id",
+        "tracer",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        tracer: "Tracer",
+        attributes: dict[str, Any] | None = None,
+        kind: int = SPAN_KIND_INTERNAL,
+    ) -> None:
+        self.name = name
+        self.tracer = tracer
+        self.kind = kind
+        self.attributes = attributes or {}
+        self.events: list[tuple[str, int, dict[str, Any]]] = []
+        self.trace_id = ""
+        self.span_id = token_hex(8)
+        self.parent_id: str | None = None
+        self.start_time = 0
+        self.end_time = 0
+        self.status = STATUS_UNSET
+        self.status_message = ""
+        self._token = None
+
+    def __repr__(self) -> str:
+        return f"Span({self.name}: {self.duration / 1e6:.3f}ms)"
+
+    def __enter__(self) -> Self:
+        parent = _current_span.get()
+        if parent is None:
+            self.trace_id = token_hex(16)
+        else:
+            self.trace_id = parent.trace_id
+            self.parent_id = parent.span_id
+        self._token = _current_span.set(self)
+        self.start_time = time_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.end_time = time_ns()
+        _current_span.reset(self._token)
+        if exc_value is not None:
+            self.record_exception(exc_value)
+        elif self.status == STATUS_UNSET:
+            self.status = STATUS_OK
+        self.tracer.end_span(self)
+
+    @property
+    def duration(self) -> int:
+        """Duration in nanoseconds"""
+        return self.end_time - self.start_time
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def add_event(self, name: str, **attributes: Any) -> None:
+        self.events.append((name, time_ns(), attributes))
+
+    def record_exception(self, error: BaseException) -> None:
+        self.status = STATUS_ERROR
+        self.status_message = f"{type(error).__name__}: {error}"
+        self.add_event(
+            "exception",
+            **{
+                "exception.type": type(error).__name__,
+                "exception.message": str(error),
+            },
+        )
+
+    def to_otlp(self) -> dict[str, Any]:
+        """Returns the span in the OTLP/JSON encoding"""
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_time),
+            "endTimeUnixNano": str(self.end_time),
+            "attributes": otlp_attributes(self.attributes),
+            "status": {"code": self.status},
+        }
+        if self.parent_id:
+            span["parentSpanId"] = self.parent_id
+        if self.status_message:
+            span["status"]["message"] = self.status_message
+        if self.events:
+            span["events"] = [
+                {
+                    "name": name,
+                    "timeUnixNano": str(timestamp),
+                    "attributes": otlp_attributes(attributes),
+                }
+                for name, timestamp, attributes in self.events
+            ]
+        return span
+
+
+class NoOpSpan:
+    """
+    Shared stand-in returned while tracing is disabled
+    """
+
+    __slots__ = ()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args) -> None:
+        return None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        return None
+
+    def add_event(self, name: str, **attributes: Any) -> None:
+        return None
+
+    def record_exception(self, error: BaseException) -> None:
+        return None
+
+
+NOOP_SPAN = NoOpSpan()
+_current_span: ContextVar[Span | None] = ContextVar("netmagic_span", default=None)
+
+
+def otlp_attributes(attributes: dict[str, Any]) -> list[dict[str, Any]]:
+    """Encodes attributes as OTLP `KeyValue` entries"""
+
+    def encode(value: Any) -> dict[str, Any]:
+        if isinstance(value, bool):
+            return {"boolValue": value}
+        if isinstance(value, int):
+            return {"intValue": str(value)}
+        if isinstance(value, float):
+            return {"doubleValue": value}
+        if isinstance(value, (list, tuple)):
+            return {"arrayValue": {"values": [encode(i) for i in value]}}
+        return {"stringValue": str(value)}
+
+    return [
+        {"key": key, "value": encode(value)}
+        for key, value in attributes.items()
+        if value is not None
+    ]
+
+
+class SpanExporter:
+    """
+    Base exporter, receives every finished span
+    """
+
+    def export(self, spans: Iterable[Span]) -> None:
+        raise NotImplementedError
+
+    def shutdown(self) -> None:
+        return None
+
+
+class MemorySpanExporter(SpanExporter):
+    """
+    Keeps finished spans in `spans`, mostly useful for tests and notebooks
+    """
+
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+
+    def export(self, spans: Iterable[Span]) -> None:
+        self.spans.extend(spans)
+
+
+class FileSpanExporter(SpanExporter):
+    """
+    Appends batches of spans to `filename` as OTLP/JSON lines, the format of
+    the OpenTelemetry Collector file exporter, one `resourceSpans` per line.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        service_name: str = "netmagic",
+        batch_size: int = 512,
+    ) -> None:
+        self.filename = filename
+        self.service_name = service_name
+        self.batch_size = batch_size
+        self._pending: list[Span] = []
+        self._lock = Lock()
+
+    def export(self, spans: Iterable[Span]) -> None:
+        with self._lock:
+            self._pending.extend(spans)
+            if len(self._pending) < self.batch_size:
+                return
+            batch, self._pending = self._pending, []
+        self.write(batch)
+
+    def flush(self) -> None:
+        with self._lock:
+            batch, self._pending = self._pending, []
+        if batch:
+            self.write(batch)
+
+    def shutdown(self) -> None:
+        self.flush()
+
+    def write(self, spans: list[Span]) -> None:
+        resource = {
+            "attributes": otlp_attributes(
+                {"service.name": self.service_name, "process.pid": getpid()}
+            )
+        }
+        document = {
+            "resourceSpans": [
+                {
+                    "resource": resource,
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "netmagic"},
+                            "spans": [span.to_otlp() for span in spans],
+                        }
+                    ],
+                }
+            ]
+        }
+        with self._lock, open(self.filename, "a", encoding="utf-8") as file:
+            file.write(dumps(document))
+            file.write("\n")
+
+
+class Tracer:
+    """
+    Creates spans and hands each finished span to the exporter
+    """
+
+    def __init__(self, exporter: SpanExporter | None = None) -> None:
+        self.exporter = exporter or MemorySpanExporter()
+
+    def start_span(
+        self, name: str, kind: int = SPAN_KIND_INTERNAL, **attributes: Any
+    ) -> Span:
+        return Span(name, self, attributes, kind)
+
+    def end_span(self, span: Span) -> None:
+        self.exporter.export([span])
+
+    def shutdown(self) -> None:
+        self.exporter.shutdown()
+
+
+_tracer: Tracer | None = None
+
+
+def get_tracer() -> Tracer | None:
+    """Returns the installed tracer, `None` while tracing is disabled"""
+    return _tracer
+
+
+def set_tracer(tracer: Tracer | None) -> Tracer | None:
+    """
+    Installs `tracer` for the whole process, `None` disables tracing.
+    Returns the previous tracer.
+    """
+    global _tracer
+    previous, _tracer = _tracer, tracer
+    return previous
+
+
+def span(
+    name: str, kind: int = SPAN_KIND_INTERNAL, **attributes: Any
+) -> Span | NoOpSpan:
+    """
+    Returns a context manager timing `name`, a no-op unless a tracer is set
+    """
+    if _tracer is None:
+        return NOOP_SPAN
+    return _tracer.start_span(name, kind, **attributes)
+
+
+def current_span() -> Span | NoOpSpan:
+    """Returns the innermost active span, for adding attributes"""
+    return _current_span.get() or NOOP_SPAN
+
+
+def traced(name: str | None = None) -> Callable:
+    """
+    Decorator wrapping each call of a function in a span.
+    The span is named after the qualified function name by default and
+    carries the `host` of a device or session when there is one.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if _tracer is None:
+                return func(*args, **kwargs)
+            attributes = {}
+            if args and (
+                host := getattr(args[0], "hostname", None)
+                or getattr(args[0], "host", None)
+            ):
+                attributes["host"] = str(host)
+            with _tracer.start_span(span_name, **attributes):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -42,6 +42,18 @@ class Transport(Enum):
 class Engine(Enum):
     NETMIKO = "netmiko"
     SCRAPLI = "scrapli"
+    REPLAY = "replay"
+
+
+class ReplayMode(Enum):
+    RECORD = "record"
+    REPLAY = "replay"
+
+
+class ReportFormat(Enum):
+    XLSX = "xlsx"
+    CSV = "csv"
+    JSONL = "jsonl"
 
 
 class Vendors(Enum):
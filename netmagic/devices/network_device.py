@@ -1,9 +1,8 @@
 # Project NetMagic Networking Device Library
 
 # Python Module
-from datetime import UTC, datetime
 from re import search
-from time import sleep
+from time import monotonic, perf_counter, sleep
 
 # Third-Party Modules
 from mactools import MacAddress
@@ -18,6 +17,7 @@ from netmagic.common.classes import (
     ResponseGroup,
 )
 from netmagic.common.classes.status import MACTableEntry
+from netmagic.common.tracing import span, traced
 from netmagic.common.types import ConfigSet, Engine, Transport
 from netmagic.common.utils import unquote, validate_max_tries
 from netmagic.devices.universal import Device
@@ -96,6 +96,22 @@ class NetworkDevice(Device):
             device_type = "network device"
         super().not_implemented_error_generic(device_type)
 
+    @traced("device.session_preparation")
+    def prepare_session(self) -> None:
+        """
+        Runs `session_preparation` and records its duration as the
+        `session_preparation` phase of the CLI session's latest connect
+        """
+        start = perf_counter()
+        try:
+            self.session_preparation()
+        finally:
+            connect_response = getattr(self.cli_session, "connect_response", None)
+            if connect_response is not None:
+                connect_response.add_phase(
+                    "session_preparation", perf_counter() - start
+                )
+
     def session_preparation(self, dispatch: str = "generic_termserver"):
         """
         CLI session preparation either for SSH jumping or serial connections
@@ -137,6 +153,7 @@ class NetworkDevice(Device):
         exit: bool = True,
         save: bool = True,
         *args,
+        session: TerminalSession | None = None,
         **kwargs,
     ) -> ConfigResponse:
         """
@@ -146,12 +163,14 @@ class NetworkDevice(Device):
         *max_tries: How many total tries to send if not originally successful
         *exit: bool whether the code should exit global config mode when done
         *save: bool whether the code should save the config after changes
+        *session: terminal session to send on, the device's CLI session by default
         """
+        session = session or self.cli_session
         for i in range(max_tries):
-            sent_time = datetime.now(UTC)
+            sent_time = monotonic()
 
             try:
-                output = self.cli_session.connection.send_config_set(
+                output = session.connection.send_config_set(
                     config, exit_config_mode=exit
                 )
             except (ReadTimeout, OSError) as e:
@@ -160,26 +179,27 @@ class NetworkDevice(Device):
                 break
 
         success = not isinstance(output, Exception)
-        received_time = datetime.now(UTC)
+        received_time = monotonic()
 
         if save and success:
-            self.write_memory()
+            self.write_memory(session)
 
         return ConfigResponse(
             output,
             config,
             sent_time,
-            self.cli_session,
+            session,
             success,
             received_time,
             attempts=i + 1,
         )
 
-    def write_memory(self):
+    def write_memory(self, session: TerminalSession | None = None):
         """
         Command to save the running configuration
         """
-        return self.cli_session.connection.send_command("write memory")
+        session = session or self.cli_session
+        return session.connection.send_command("write memory")
 
     # IDENTITY AND STATUS
 
@@ -292,6 +312,7 @@ class NetworkDevice(Device):
         if responses:
             return ResponseGroup(responses, fsm_output, "TDR Data")
 
+    @traced()
     def get_mac_table(
         self,
         show_command: str,
@@ -310,17 +331,18 @@ class NetworkDevice(Device):
             fsm_data = self.fsm_parse(mac_table.response, template)
             fsm_dict: dict[MacAddress, MACTableEntry] = {}
 
-            for item in fsm_data:
-                mac = MacAddress(item.pop("mac"))
-                # Create the MAC entries or increment a new occurrence
-                if mac_entry := fsm_dict.get(mac):
-                    port = item["interface"]
-                    vlan = int(item["vlan"])
-                    mac_entry.interface.add(port)
-                    mac_entry.vlan[vlan] = port
-                else:
-                    mac_entry = MACTableEntry.create(self.hostname, mac, **item)
-                    fsm_dict[mac] = mac_entry
+            with span("model.build", model="MACTableEntry", rows=len(fsm_data)):
+                for item in fsm_data:
+                    mac = MacAddress(item.pop("mac"))
+                    # Create the MAC entries or increment a new occurrence
+                    if mac_entry := fsm_dict.get(mac):
+                        port = item["interface"]
+                        vlan = int(item["vlan"])
+                        mac_entry.interface.add(port)
+                        mac_entry.vlan[vlan] = port
+                    else:
+                        mac_entry = MACTableEntry.create(self.hostname, mac, **item)
+                        fsm_dict[mac] = mac_entry
 
             mac_table.fsm_output = fsm_dict
 
@@ -0,0 +1,283 @@
+# NetMagic Offline Parsing
+
+# Python Modules
+from collections.abc import Callable, Mapping
+from functools import cache
+from re import MULTILINE, Pattern, compile, sub
+from time import monotonic
+from types import SimpleNamespace
+from typing import Any
+
+# Local Modules
+from netmagic.common.classes import InterfaceOptics, InterfaceTDR
+from netmagic.common.classes.responses import CommandResponse
+from netmagic.common.classes.status import POEHost, POEPort
+from netmagic.devices.vendors.brocade import BrocadeSwitch
+from netmagic.devices.vendors.cisco import CiscoIOSSwitch
+from netmagic.devices.vendors.cisco_xr import CiscoIOSXRRouter
+from netmagic.handlers.parse import get_fsm_data
+
+type Rows = list[dict[str, Any]]
+type ModelBuilder = Callable[["OfflineTemplate", Rows, str, str], list[Any]]
+
+# Only the start of an output is searched when inferring its template
+SIGNATURE_BYTES = 16_384
+
+
+def brocade_lldp_preparation(output: str) -> str:
+    """Same pre-processing as `BrocadeSwitch.get_lldp`"""
+    return sub(r"\\\n\s+", "", output).replace("\n\n", "\nEND\n")
+
+
+# MODEL CONSTRUCTION
+
+
+class OfflineDevice:
+    """
+    Mixin for a device with no session, whose commands return one saved
+    output and whose parsing of its template returns the already parsed rows
+    """
+
+    def __init__(
+        self, template: "OfflineTemplate", rows: Rows, output: str, host: str
+    ) -> None:
+        super().__init__([])
+        self.hostname = host
+        self.offline_template = template
+        self.offline_rows = rows
+        self.offline_output = output
+        self.offline_sent_time = monotonic()
+
+    def command(self, command: str, *args, **kwargs) -> CommandResponse:
+        return CommandResponse(
+            self.offline_output, command, self.offline_sent_time, None, ""
+        )
+
+    def fsm_parse(self, input: str, template: str, flatten_key: str | None = None):
+        return self.offline_rows if template == self.offline_template.template else []
+
+
+@cache
+def offline_device(device_class: type) -> type:
+    """The `OfflineDevice` subclass of a device class"""
+    return type(f"Offline{device_class.__name__}", (OfflineDevice, device_class), {})
+
+
+def via_getter(device_class: type, method: str, **kwargs) -> ModelBuilder:
+    """
+    Builds models by running a real getter on an `OfflineDevice` of
+    `device_class`, so offline models match the ones collected live
+    """
+
+    def build(
+        template: "OfflineTemplate", rows: Rows, output: str, host: str
+    ) -> list[Any]:
+        device = offline_device(device_class)(template, rows, output, host)
+        result = getattr(device, method)(**kwargs)
+        models = getattr(result, "fsm_output", result)
+        return list(models.values() if isinstance(models, Mapping) else models)
+
+    return build
+
+
+def build_xr_statistics(
+    template: "OfflineTemplate", rows: Rows, output: str, host: str
+) -> list[Any]:
+    router = offline_device(CiscoIOSXRRouter)(template, rows, output, host)
+    session = SimpleNamespace(host=host, command=router.command)
+    return list(router._get_interface_statistics_cli(session, ()).fsm_output.values())
+
+
+def build_poe(
+    template: "OfflineTemplate", rows: Rows, output: str, host: str
+) -> list[Any]:
+    models: list[Any] = [POEPort.create(host, **row) for row in rows]
+    models.append(POEHost.create(host, **rows[-1]))
+    return models
+
+
+def build_brocade_optics(
+    template: "OfflineTemplate", rows: Rows, output: str, host: str
+) -> list[Any]:
+    return [InterfaceOptics.create(host, **row) for row in rows]
+
+
+def build_tdr(
+    template: "OfflineTemplate", rows: Rows, output: str, host: str
+) -> list[Any]:
+    groups: list[Rows] = []
+    for row in rows:
+        if row["interface"]:
+            groups.append([])
+        groups[-1].append(row)
+    return [InterfaceTDR.create(host, group) for group in groups]
+
+
+# TEMPLATES
+
+
+class OfflineTemplate:
+    """
+    A built-in template with what is needed to use it away from a device: a
+    `signature` regex recognising its command output, any pre-processing the
+    getter does before parsing, and a way to build the getter's models.
+
+    Templates without a `build` have no model, their rows are used as parsed.
+    """
+
+    def __init__(
+        self,
+        vendor: str,
+        template: str,
+        signature: str,
+        build: ModelBuilder | None = None,
+        flatten_key: str | None = None,
+        prepare: Callable[[str], str] | None = None,
+    ) -> None:
+        self.vendor = vendor
+        self.template = template
+        self.signature: Pattern = compile(signature, MULTILINE)
+        self.build = build
+        self.flatten_key = flatten_key
+        self.prepare = prepare
+
+    def __repr__(self) -> str:
+        return f"OfflineTemplate({self.name})"
+
+    @property
+    def name(self) -> str:
+        return f"{self.vendor}/{self.template}"
+
+    def matches(self, output: str) -> bool:
+        return self.signature.search(output, 0, SIGNATURE_BYTES) is not None
+
+    def parse(self, output: str) -> Rows:
+        if self.prepare:
+            output = self.prepare(output)
+        return get_fsm_data(output, self.template, self.vendor, self.flatten_key)
+
+    def models(self, rows: Rows, output: str, host: str) -> list[Any]:
+        """
+        Returns the models a getter would build from `rows`, or the rows
+        themselves for templates without a model
+        """
+        if self.build is None or not rows:
+            return rows
+        return self.build(self, rows, output, host)
+
+
+# Ordered so that the first matching signature is the right template
+TEMPLATES: dict[str, OfflineTemplate] = {
+    template.name: template
+    for template in (
+        OfflineTemplate(
+            "cisco",
+            "show_int_status",
+            r"^Port\s+Name\s+Status\s+Vlan\s+Duplex\s+Speed",
+            via_getter(CiscoIOSSwitch, "get_interface_status"),
+        ),
+        OfflineTemplate(
+            "cisco", "show_int_desc", r"^Interface\s+Status\s+Protocol\s+Description"
+        ),
+        OfflineTemplate(
+            "cisco",
+            "show_int_trans_det",
+            r"High Alarm\s+High Warn\s+Low Warn\s+Low Alarm",
+            via_getter(CiscoIOSSwitch, "get_optics"),
+            flatten_key="interface",
+        ),
+        OfflineTemplate(
+            "cisco",
+            "show_lldp_nei_det",
+            r"^Local Intf:",
+            via_getter(CiscoIOSSwitch, "get_lldp"),
+        ),
+        OfflineTemplate(
+            "cisco",
+            "show_mac_table",
+            r"^\s*Vlan\s+Mac Address\s+Type\s+Ports",
+            via_getter(CiscoIOSSwitch, "get_mac_table"),
+        ),
+        OfflineTemplate(
+            "cisco", "show_poe", r"^Interface\s+Admin\s+Oper\s+Power", build_poe
+        ),
+        OfflineTemplate(
+            "cisco",
+            "show_tdr",
+            r"^Interface\s+Speed\s+Local pair\s+Pair length",
+            build_tdr,
+        ),
+        OfflineTemplate(
+            "cisco",
+            "show_xr_interface_stats",
+            r"line protocol is \S+\n\s+Interface state transitions",
+            build_xr_statistics,
+        ),
+        OfflineTemplate(
+            "cisco",
+            "show_run_vlans",
+            r"^(?:Building configuration|Current configuration :)(?![\s\S]*IOS XR)",
+            via_getter(CiscoIOSSwitch, "get_interface_vlans"),
+        ),
+        OfflineTemplate(
+            "brocade",
+            "show_int",
+            r"^Port\s+Link\s+State\s+Dupl\s+Speed",
+            via_getter(BrocadeSwitch, "get_interface_status"),
+        ),
+        OfflineTemplate(
+            "brocade",
+            "show_lldp_nei_det",
+            r"^Local port:",
+            via_getter(BrocadeSwitch, "get_lldp"),
+            prepare=brocade_lldp_preparation,
+        ),
+        OfflineTemplate(
+            "brocade",
+            "show_mac_table",
+            r"^MAC-Address\s+Port\s+Type",
+            via_getter(BrocadeSwitch, "get_mac_table"),
+        ),
+        OfflineTemplate("brocade", "show_media", r"^Port \S+: Type\s*:"),
+        OfflineTemplate(
+            "brocade",
+            "show_optic",
+            r"Rx Power\s+Tx Bias Current",
+            build_brocade_optics,
+        ),
+        OfflineTemplate(
+            "brocade", "show_poe", r"^Power Capacity:|PD Type\s+PD Class", build_poe
+        ),
+        OfflineTemplate(
+            "brocade",
+            "show_run_vlans",
+            r"^vlan \d+ .*by port",
+            via_getter(BrocadeSwitch, "get_interface_vlans"),
+        ),
+        OfflineTemplate(
+            "brocade",
+            "show_single_int",
+            r"^\s*Configured speed \S+, actual",
+            via_getter(BrocadeSwitch, "get_interface_status", interface="1/1/1"),
+        ),
+        OfflineTemplate(
+            "brocade",
+            "show_tdr",
+            r"^\s*Port\s+Speed\s+Local pair\s+Pair Length",
+            build_tdr,
+        ),
+    )
+}
+
+
+def infer_template(output: str, vendor: str | None = None) -> OfflineTemplate | None:
+    """
+    Returns the built-in template whose signature matches the start of a saved
+    command output, optionally only among the templates of one `vendor`
+    """
+    for template in TEMPLATES.values():
+        if vendor and template.vendor != vendor:
+            continue
+        if template.matches(output):
+            return template
+    return None
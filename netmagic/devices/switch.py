@@ -18,7 +18,7 @@ class Switch(NetworkDevice):
     def __init__(self, session: Session) -> None:
         super().__init__(session)
         if isinstance(session, TerminalSession):
-            self.session_preparation()
+            self.prepare_session()
         self.mac: MacAddress = None  # GET CHASSIS/MANAGEMENT MAC
 
     def not_implemented_error_generic(self):
@@ -6,8 +6,12 @@
 from mactools import MacAddress
 
 # Local Modules
+from netmagic.common.tracing import span
 from netmagic.common.types import FSMOutputT, Vendors
 from netmagic.handlers import get_fsm_data
+from netmagic.handlers.parse import template_name
+from netmagic.handlers.parse_cache import ParseCache
+from netmagic.handlers.parse_pool import ParsePool
 from netmagic.sessions import TerminalSession
 
 
@@ -16,6 +20,11 @@ class Device:
     Base class for automation and programmability
     """
 
+    # Shared process pool for parsing, set on the class to use it for every device
+    parse_pool: ParsePool | None = None
+    # Cache of parsed outputs, skipping the parse of outputs seen unchanged
+    parse_cache: ParseCache | None = None
+
     def __init__(self, session: TerminalSession = None) -> None:
         self.mac: MacAddress = None
         self.hostname = None
@@ -56,4 +65,18 @@ class Device:
         """
         Wrapper method for `TextFSM` and `Parse` handler
         """
-        return get_fsm_data(input, template, self.vendor.value, flatten_key)
+        with span(
+            "device.fsm_parse", host=self.hostname, template=template_name(template)
+        ):
+            if self.parse_cache is not None:
+                return self.parse_cache.parse(
+                    self.hostname,
+                    input,
+                    template,
+                    self.vendor.value,
+                    flatten_key,
+                    self.parse_pool,
+                )
+            return get_fsm_data(
+                input, template, self.vendor.value, flatten_key, self.parse_pool
+            )
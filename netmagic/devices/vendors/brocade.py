@@ -15,6 +15,7 @@ from netmagic.common.classes import (
 )
 
 # Local Modules
+from netmagic.common.tracing import span, traced
 from netmagic.common.types import Vendors
 from netmagic.common.utils import brocade_text_to_range, get_param_names
 from netmagic.devices.switch import Switch
@@ -42,6 +43,7 @@ class BrocadeSwitch(Switch):
         """
         return super().get_running_config()
 
+    @traced()
     def get_interface_status(
         self, interface: str | None = None, template: str | bool | None = None
     ) -> CommandResponse:
@@ -61,9 +63,11 @@ class BrocadeSwitch(Switch):
 
         template = "show_int" if interface is None else "show_single_int"
         fsm_data = self.fsm_parse(int_status.response, template)
-        int_status.fsm_output = {
-            i["interface"]: InterfaceStatus(host=self.hostname, **i) for i in fsm_data
-        }
+        with span("model.build", model="InterfaceStatus", rows=len(fsm_data)):
+            int_status.fsm_output = {
+                i["interface"]: InterfaceStatus(host=self.hostname, **i)
+                for i in fsm_data
+            }
 
         return int_status
 
@@ -88,6 +92,7 @@ class BrocadeSwitch(Switch):
 
         return media
 
+    @traced()
     def get_optics(self, template: str | bool | None = None) -> ResponseGroup:
         """
         Returns information about optical transceivers.
@@ -108,13 +113,15 @@ class BrocadeSwitch(Switch):
                 optics_response.response for optics_response in optics.responses
             ]
             fsm_data = [self.fsm_parse(i, template) for i in optics_data]
-            optics.fsm_output = {
-                i["interface"]: InterfaceOptics.create(self.hostname, **i)
-                for i in chain(*fsm_data)
-            }
+            with span("model.build", model="InterfaceOptics"):
+                optics.fsm_output = {
+                    i["interface"]: InterfaceOptics.create(self.hostname, **i)
+                    for i in chain(*fsm_data)
+                }
 
         return optics
 
+    @traced()
     def get_lldp(self, template: str | bool | None = None) -> CommandResponse:
         """
         Returns LLDP neighbor details information.
@@ -131,9 +138,10 @@ class BrocadeSwitch(Switch):
         # The built-in template REQUIRES the above pre-processing to work correctly
         template = "show_lldp_nei_det" if not template else template
         fsm_data = self.fsm_parse(lldp.response, template)
-        lldp.fsm_output = {
-            i["interface"]: InterfaceLLDP(host=self.hostname, **i) for i in fsm_data
-        }
+        with span("model.build", model="InterfaceLLDP", rows=len(fsm_data)):
+            lldp.fsm_output = {
+                i["interface"]: InterfaceLLDP(host=self.hostname, **i) for i in fsm_data
+            }
 
         return lldp
 
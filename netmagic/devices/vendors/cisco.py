@@ -1,6 +1,7 @@
 # NetMagic Cisco Device Library
 
 # Local Modules
+from netmagic.analysis.optics import classify_optics
 from netmagic.common.classes import (
     SVI,
     CommandResponse,
@@ -8,10 +9,10 @@ from netmagic.common.classes import (
     InterfaceOptics,
     InterfaceStatus,
     InterfaceVLANs,
-    OpticStatus,
     ResponseGroup,
 )
-from netmagic.common.types import SFPAlert, Vendors
+from netmagic.common.tracing import span, traced
+from netmagic.common.types import Vendors
 from netmagic.common.utils import abbreviate_interface, get_param_names, sort_interfaces
 from netmagic.devices.switch import Switch
 from netmagic.sessions import Session
@@ -36,6 +37,7 @@ class CiscoIOSSwitch(Switch):
         """
         return super().get_running_config()
 
+    @traced()
     def get_interface_status(
         self,
         interface: str | None = None,
@@ -59,10 +61,11 @@ class CiscoIOSSwitch(Switch):
         fsm_desc_data = self.fsm_parse(int_desc.response, desc_template)
 
         # Parse and combine for full-length interface descriptions
-        fsm_output = {
-            i["interface"]: InterfaceStatus(host=self.hostname, **i)
-            for i in fsm_status_data
-        }
+        with span("model.build", model="InterfaceStatus", rows=len(fsm_status_data)):
+            fsm_output = {
+                i["interface"]: InterfaceStatus(host=self.hostname, **i)
+                for i in fsm_status_data
+            }
         for entry in fsm_desc_data:
             if not fsm_output.get(entry["interface"]):
                 continue
@@ -72,6 +75,7 @@ class CiscoIOSSwitch(Switch):
             [int_status, int_desc], fsm_output, "Cisco Interface Status"
         )
 
+    @traced()
     def get_optics(self, template: str | bool | None = None) -> CommandResponse:
         """
         Returns information about optical transceivers.
@@ -84,56 +88,17 @@ class CiscoIOSSwitch(Switch):
         optics.fsm_output = {}
         template = "show_int_trans_det" if template is None else template
         fsm_data = self.fsm_parse(optics.response, template, flatten_key="interface")
-        root_key_list = [
-            "temperature",
-            "voltage",
-            "current",
-            "transmit_power",
-            "receive_power",
-        ]
-
-        def create_values(entry, root_key, low_value, high_value):
-            if isinstance(low_value, str):
-                low_value = float(entry[f"{root_key}_{low_value}"])
-            if isinstance(high_value, str):
-                high_value = float(entry[f"{root_key}_{high_value}"])
-            return (low_value, high_value)
-
-        for entry in fsm_data:
-            port = entry["interface"]
-            port_dict = {"interface": port}
-
-            for root_key in root_key_list:
-                primary_value = float(entry[root_key])
-
-                ranges_dict = {
-                    SFPAlert.NORMAL: create_values(
-                        entry, root_key, "low_warning", "high_warning"
-                    ),
-                    SFPAlert.LOW_WARN: create_values(
-                        entry, root_key, "low_alarm", "low_warning"
-                    ),
-                    SFPAlert.HIGH_WARN: create_values(
-                        entry, root_key, "high_warning", "high_alarm"
-                    ),
-                    SFPAlert.LOW_ALARM: create_values(
-                        entry, root_key, float("-inf"), "low_alarm"
-                    ),
-                    SFPAlert.HIGH_ALARM: create_values(
-                        entry, root_key, "high_alarm", float("inf")
-                    ),
-                }
-                # Prepare the ranges for analysis
-                for status, values in ranges_dict.items():
-                    if values[0] <= primary_value < values[1]:
-                        port_dict[root_key] = OpticStatus(
-                            reading=primary_value, status=status
-                        )
 
-            optics.fsm_output[port] = InterfaceOptics(host=self.hostname, **port_dict)
+        # Every reading is classified against its thresholds in one batch
+        for entry, statuses in zip(fsm_data, classify_optics(fsm_data), strict=True):
+            port = entry["interface"]
+            optics.fsm_output[port] = InterfaceOptics(
+                host=self.hostname, interface=port, **statuses
+            )
 
         return optics
 
+    @traced()
     def get_lldp(self, template: str | bool | None = None) -> CommandResponse:
         """
         Returns LLDP neighbor details information.
@@ -143,9 +108,11 @@ class CiscoIOSSwitch(Switch):
         if template is not False:
             template = "show_lldp_nei_det" if template is None else template
             fsm_data = self.fsm_parse(lldp.response, template)
-            raw_output = {
-                i["interface"]: InterfaceLLDP(host=self.hostname, **i) for i in fsm_data
-            }
+            with span("model.build", model="InterfaceLLDP", rows=len(fsm_data)):
+                raw_output = {
+                    i["interface"]: InterfaceLLDP(host=self.hostname, **i)
+                    for i in fsm_data
+                }
             lldp.fsm_output = {i: raw_output[i] for i in sort_interfaces(raw_output)}
 
         return lldp
@@ -1,18 +1,55 @@
 # NetMagic Cisco IOS-XR Device Library
 
 # Python Modules
+from collections.abc import Iterable, Iterator
 from re import fullmatch
+from time import monotonic
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from xml.etree.ElementTree import Element  # nosec B405
 
 # Third-Party Modules
-from defusedxml.ElementTree import fromstring
+from ncclient.transport.errors import TransportError
 
 # Local Modules
-from netmagic.common.classes import InterfaceStatistics, ResponseGroup
-from netmagic.common.types import Vendors
+from netmagic.common.classes import (
+    ConfigResponse,
+    InterfaceStatistics,
+    NETCONFResponse,
+    ResponseGroup,
+)
+from netmagic.common.tracing import traced
+from netmagic.common.types import ConfigSet, Vendors
+from netmagic.common.utils import validate_max_tries
 from netmagic.devices.router import Router
 from netmagic.sessions import NETCONFSession, Session, TerminalSession
 
 XR_STATS_NAMESPACE = "http://cisco.com/ns/yang/Cisco-IOS-XR-infra-statsd-oper"
+XR_STATS_FIELD_MAP = {
+    "packets-received": "input_packets",
+    "bytes-received": "input_bytes",
+    "packets-sent": "output_packets",
+    "bytes-sent": "output_bytes",
+    "broadcast-packets-received": "input_broadcast_packets",
+    "multicast-packets-received": "input_multicast_packets",
+    "broadcast-packets-sent": "output_broadcast_packets",
+    "multicast-packets-sent": "output_multicast_packets",
+    "input-drops": "input_drops",
+    "output-drops": "output_drops",
+    "input-errors": "input_errors",
+    "crc-errors": "crc_errors",
+    "framing-errors-received": "framing_errors",
+    "input-overruns": "input_overruns",
+    "input-ignored-packets": "input_ignored_packets",
+    "input-aborts": "input_aborts",
+    "output-errors": "output_errors",
+    "output-underruns": "output_underruns",
+    "input-data-rate": "input_rate_bps",
+    "input-packet-rate": "input_rate_pps",
+    "output-data-rate": "output_rate_bps",
+    "output-packet-rate": "output_rate_pps",
+}
 
 
 class CiscoIOSXRRouter(Router):
@@ -22,7 +59,7 @@ class CiscoIOSXRRouter(Router):
         super().__init__(session)
         self.vendor = Vendors.CISCO
         if self.cli_session:
-            self.session_preparation()
+            self.prepare_session()
 
     def enable(self, password: str | None = None) -> None:
         """IOS-XR has no IOS-style enable mode."""
@@ -32,27 +69,154 @@ class CiscoIOSXRRouter(Router):
         super().session_preparation(dispatch)
         self.command("terminal length 0")
 
+    @staticmethod
+    def _validate_interfaces(interface: str | Iterable[str] | None) -> tuple[str, ...]:
+        """
+        Normalize one, many or no interface names into a sorted, de-duplicated
+        tuple, where an empty tuple selects every interface.
+        """
+        if not interface:
+            return ()
+        interfaces = (interface,) if isinstance(interface, str) else tuple(interface)
+        for name in interfaces:
+            if not fullmatch(r"[A-Za-z][A-Za-z0-9./-]*", name):
+                raise ValueError(f"Invalid IOS-XR interface name: {name}")
+        return tuple(sorted(set(interfaces)))
+
+    # CONFIG HANDLING
+
+    def send_config(
+        self,
+        config: ConfigSet,
+        max_tries: int = 3,
+        exit: bool = True,
+        save: bool = True,
+        *args,
+        session: Session | None = None,
+        confirmed: bool = False,
+        confirm_timeout: int | None = None,
+        **kwargs,
+    ) -> ConfigResponse:
+        """
+        Send device configuration over NETCONF or the CLI.
+
+        XML change sets prefer the NETCONF session and are pushed as a single
+        candidate transaction (lock, edit, validate, commit); CLI lines use the
+        terminal session.  `confirmed` issues a confirmed commit which rolls back
+        after `confirm_timeout` seconds unless confirmed by a later commit.
+        """
+        xml_config = isinstance(config, str) and config.lstrip().startswith("<")
+        selected_session = session or (
+            self.netconf_session if xml_config else self.cli_session
+        )
+        if isinstance(selected_session, NETCONFSession):
+            if not xml_config:
+                raise ValueError("NETCONF configuration must be an XML string")
+            return self._send_config_netconf(
+                selected_session, config, max_tries, confirmed, confirm_timeout
+            )
+        return super().send_config(
+            config, max_tries, exit, save, *args, session=selected_session, **kwargs
+        )
+
+    @validate_max_tries
+    def _send_config_netconf(
+        self,
+        session: NETCONFSession,
+        config: str,
+        max_tries: int = 3,
+        confirmed: bool = False,
+        confirm_timeout: int | None = None,
+    ) -> ConfigResponse:
+        sent_time = monotonic()
+        for attempt in range(max_tries):
+            responses = session.apply_config(config, confirmed, confirm_timeout)
+            failed = next((i for i in responses if not i.success), None)
+            # Only transport-level failures are worth another transaction
+            if failed is None or not isinstance(failed.response, TransportError):
+                break
+            # Once a commit is sent it may have applied, so the change is not
+            # sent again over it and the failure is returned
+            if any(i.operation.startswith("commit") for i in responses):
+                break
+
+        result = failed or responses[-1]
+        return ConfigResponse(
+            result.response,
+            config,
+            sent_time,
+            session,
+            failed is None,
+            monotonic(),
+            attempts=attempt + 1,
+        )
+
+    @traced()
     def get_interface_statistics(
         self,
-        interface: str | None = None,
+        interface: str | Iterable[str] | None = None,
         session: Session | None = None,
     ) -> ResponseGroup:
-        """Return counters and load-interval rates through either transport."""
-        if interface and not fullmatch(r"[A-Za-z][A-Za-z0-9./-]*", interface):
-            raise ValueError(f"Invalid IOS-XR interface name: {interface}")
+        """
+        Return counters and load-interval rates through either transport.
+
+        `interface` may be a single name or a list of names; over NETCONF every
+        requested interface is fetched by one RPC.
+        """
+        interfaces = self._validate_interfaces(interface)
 
         selected_session = session or self.netconf_session or self.cli_session
         if isinstance(selected_session, NETCONFSession):
-            return self._get_interface_statistics_netconf(selected_session, interface)
+            return self._get_interface_statistics_netconf(selected_session, interfaces)
         if isinstance(selected_session, TerminalSession):
-            return self._get_interface_statistics_cli(selected_session, interface)
+            return self._get_interface_statistics_cli(selected_session, interfaces)
         raise AttributeError("An IOS-XR NETCONF or terminal session is required")
 
+    def iter_interface_statistics(
+        self,
+        interface: str | Iterable[str] | None = None,
+        session: NETCONFSession | None = None,
+    ) -> Iterator[InterfaceStatistics]:
+        """
+        Yield NETCONF interface statistics one interface at a time.
+
+        The reply is parsed incrementally and each interface element is released
+        after its model is built, so memory is bounded by a single interface
+        rather than the full table.  The names are validated and the reply
+        fetched on the call, so a bad name or a failed RPC raises before any
+        iteration rather than yielding nothing.
+        """
+        interfaces = self._validate_interfaces(interface)
+
+        selected_session = session or self.netconf_session
+        if isinstance(selected_session, NETCONFSession):
+            response = self._get_netconf_statistics_reply(selected_session, interfaces)
+            if isinstance(response.response, Exception):
+                raise response.response
+            if not response.success or not isinstance(response.response, str):
+                raise RuntimeError(
+                    f"IOS-XR interface statistics failed: {response.response!r}"
+                )
+            return self._iter_netconf_statistics(response.response, selected_session)
+        raise AttributeError("An IOS-XR NETCONF session is required")
+
     def _get_interface_statistics_netconf(
         self,
         session: NETCONFSession,
-        interface: str | None,
+        interfaces: tuple[str, ...],
     ) -> ResponseGroup:
+        response = self._get_netconf_statistics_reply(session, interfaces)
+
+        output: dict[str, InterfaceStatistics] = {}
+        if response.success and isinstance(response.response, str):
+            output = self._parse_netconf_statistics(response.response, session)
+        return ResponseGroup([response], output, "Cisco IOS-XR Interface Statistics")
+
+    def _get_netconf_statistics_reply(
+        self,
+        session: NETCONFSession,
+        interfaces: tuple[str, ...],
+    ) -> NETCONFResponse:
         if not session.check_session() and not session.connect():
             raise AttributeError("Unable to connect the IOS-XR NETCONF session")
 
@@ -62,107 +226,98 @@ class CiscoIOSXRRouter(Router):
                 "IOS-XR interface statistics YANG model is not advertised"
             )
 
-        interface_filter = (
-            f"<interface-name>{interface}</interface-name>" if interface else ""
-        )
-        filter_xml = (
-            f'<infra-statistics xmlns="{XR_STATS_NAMESPACE}"><interfaces><interface>'
-            f"{interface_filter}<latest><generic-counters/><data-rate/></latest>"
-            "</interface></interfaces></infra-statistics>"
-        )
-        rpc_filter = ("subtree", filter_xml)
-        response = session.get(rpc_filter)
+        def build_filter() -> tuple[str, str]:
+            selection = "<latest><generic-counters/><data-rate/></latest>"
+            interface_filters = (
+                "".join(
+                    f"<interface><interface-name>{name}</interface-name>"
+                    f"{selection}</interface>"
+                    for name in interfaces
+                )
+                or f"<interface>{selection}</interface>"
+            )
+            filter_xml = (
+                f'<infra-statistics xmlns="{XR_STATS_NAMESPACE}"><interfaces>'
+                f"{interface_filters}</interfaces></infra-statistics>"
+            )
+            return ("subtree", filter_xml)
 
-        output: dict[str, InterfaceStatistics] = {}
-        if response.success and isinstance(response.response, str):
-            output = self._parse_netconf_statistics(response.response, session)
-        return ResponseGroup([response], output, "Cisco IOS-XR Interface Statistics")
+        rpc_filter = session.get_filter(("xr-statistics", interfaces), build_filter)
+        return session.get(rpc_filter)
 
     def _parse_netconf_statistics(
         self,
         xml: str,
         session: NETCONFSession,
     ) -> dict[str, InterfaceStatistics]:
-        field_map = {
-            "packets-received": "input_packets",
-            "bytes-received": "input_bytes",
-            "packets-sent": "output_packets",
-            "bytes-sent": "output_bytes",
-            "broadcast-packets-received": "input_broadcast_packets",
-            "multicast-packets-received": "input_multicast_packets",
-            "broadcast-packets-sent": "output_broadcast_packets",
-            "multicast-packets-sent": "output_multicast_packets",
-            "input-drops": "input_drops",
-            "output-drops": "output_drops",
-            "input-errors": "input_errors",
-            "crc-errors": "crc_errors",
-            "framing-errors-received": "framing_errors",
-            "input-overruns": "input_overruns",
-            "input-ignored-packets": "input_ignored_packets",
-            "input-aborts": "input_aborts",
-            "output-errors": "output_errors",
-            "output-underruns": "output_underruns",
-            "input-data-rate": "input_rate_bps",
-            "input-packet-rate": "input_rate_pps",
-            "output-data-rate": "output_rate_bps",
-            "output-packet-rate": "output_rate_pps",
+        return {
+            statistics.interface: statistics
+            for statistics in self._iter_netconf_statistics(xml, session)
         }
 
+    def _iter_netconf_statistics(
+        self,
+        xml: str,
+        session: NETCONFSession,
+    ) -> Iterator[InterfaceStatistics]:
+        host = self.hostname or str(session.host)
+        for interface_element in NETCONFSession.iterparse(xml, "interface"):
+            if statistics := self._parse_netconf_interface(interface_element, host):
+                yield statistics
+
+    @staticmethod
+    def _parse_netconf_interface(
+        interface_element: "Element",
+        host: str,
+    ) -> InterfaceStatistics | None:
         def local_name(element) -> str:
             return element.tag.rpartition("}")[2]
 
         def direct_child(element, name: str):
             return next((child for child in element if local_name(child) == name), None)
 
-        output = {}
-        document = fromstring(xml)
-        for interface_element in document.iter():
-            if local_name(interface_element) != "interface":
-                continue
-            name_element = direct_child(interface_element, "interface-name")
-            latest = direct_child(interface_element, "latest")
-            if name_element is None or not name_element.text or latest is None:
+        name_element = direct_child(interface_element, "interface-name")
+        latest = direct_child(interface_element, "latest")
+        if name_element is None or not name_element.text or latest is None:
+            return None
+
+        values = {}
+        for container_name in ("generic-counters", "data-rate"):
+            container = direct_child(latest, container_name)
+            if container is None:
                 continue
+            for leaf in container:
+                leaf_name = local_name(leaf)
+                if leaf.text is not None and (
+                    field := XR_STATS_FIELD_MAP.get(leaf_name)
+                ):
+                    value = int(leaf.text)
+                    if leaf_name in ("input-data-rate", "output-data-rate"):
+                        value *= 1000
+                    values[field] = value
 
-            values = {}
-            for container_name in ("generic-counters", "data-rate"):
-                container = direct_child(latest, container_name)
-                if container is None:
-                    continue
-                for leaf in container:
-                    leaf_name = local_name(leaf)
-                    if leaf.text is not None and (field := field_map.get(leaf_name)):
-                        value = int(leaf.text)
-                        if leaf_name in ("input-data-rate", "output-data-rate"):
-                            value *= 1000
-                        values[field] = value
-
-            data_rate = direct_child(latest, "data-rate")
-            interval = (
-                direct_child(data_rate, "load-interval")
-                if data_rate is not None
-                else None
-            )
-            if interval is not None and interval.text is not None:
-                values["load_interval_seconds"] = (int(interval.text) + 1) * 30
+        data_rate = direct_child(latest, "data-rate")
+        interval = (
+            direct_child(data_rate, "load-interval") if data_rate is not None else None
+        )
+        if interval is not None and interval.text is not None:
+            values["load_interval_seconds"] = (int(interval.text) + 1) * 30
 
-            name = name_element.text
-            output[name] = InterfaceStatistics(
-                host=self.hostname or str(session.host), interface=name, **values
-            )
-        return output
+        return InterfaceStatistics(host=host, interface=name_element.text, **values)
 
     def _get_interface_statistics_cli(
         self,
         session: TerminalSession,
-        interface: str | None,
+        interfaces: tuple[str, ...],
     ) -> ResponseGroup:
-        command = "show interfaces"
-        if interface:
-            command = f"{command} {interface}"
-        response = session.command(command)
+        commands = [f"show interfaces {name}" for name in interfaces]
+        responses = [
+            session.command(command) for command in commands or ["show interfaces"]
+        ]
         output = {}
-        if response.success and isinstance(response.response, str):
+        for response in responses:
+            if not response.success or not isinstance(response.response, str):
+                continue
             for entry in self.fsm_parse(response.response, "show_xr_interface_stats"):
                 values = {key: value for key, value in entry.items() if value != ""}
                 name = values["interface"]
@@ -176,4 +331,4 @@ class CiscoIOSXRRouter(Router):
                     **values,
                     load_interval_seconds=interval_seconds,
                 )
-        return ResponseGroup([response], output, "Cisco IOS-XR Interface Statistics")
+        return ResponseGroup(responses, output, "Cisco IOS-XR Interface Statistics")
@@ -1,19 +1,31 @@
 # Project NetMagic Connection Handler Module
 
 # Python Modules
-from datetime import UTC, datetime
+from collections.abc import Callable
+from contextlib import suppress
+from functools import wraps
 from re import search
 from socket import SOCK_STREAM, gaierror, getaddrinfo, socket
+from time import monotonic, perf_counter
 
 # Third-Party Modules
-from netmiko import BaseConnection, ConnectHandler
+from netmiko import BaseConnection, ConnectHandler, NetmikoTimeoutException
 
 # Local Modules
 from netmagic.common.classes import BannerResponse
-from netmagic.common.types import HostT
+from netmagic.common.types import HostT, KwDict
 
 successful_credentials: list[tuple[str, str]] = []
 
+# The steps of Netmiko's private `_open` wrapped to time the SSH phases, as
+# found in the Netmiko releases allowed by the project's dependencies
+NETMIKO_PHASE_STEPS = (
+    "_open",
+    "_build_ssh_client",
+    "establish_connection",
+    "_try_session_preparation",
+)
+
 
 def get_device_type(host: HostT, port: int = 22, timeout: int = 10) -> BannerResponse:
     """
@@ -23,7 +35,7 @@ def get_device_type(host: HostT, port: int = 22, timeout: int = 10) -> BannerRes
     Returns a custom object `BannerResponse` with details about the connection.
     """
     host = str(host)
-    sent_time = datetime.now(UTC)
+    sent_time = monotonic()
     banner_kwargs = {**locals()}
     try:
         addr_info = getaddrinfo(host, port, type=SOCK_STREAM)
@@ -42,6 +54,53 @@ def get_device_type(host: HostT, port: int = 22, timeout: int = 10) -> BannerRes
         return BannerResponse(banner, **banner_kwargs)
 
 
+def timed(phases: dict[str, float], name: str, func: Callable) -> Callable:
+    """
+    Wraps `func` to add its duration in seconds to `phases[name]`
+    """
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        start = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            phases[name] = phases.get(name, 0) + perf_counter() - start
+
+    return wrapper
+
+
+def open_socket(
+    host: str, port: int, timeout: float | None, phases: dict[str, float]
+) -> socket:
+    """
+    Resolves and connects a TCP socket, recording the `dns` and `tcp` phases.
+    Each resolved address is tried in order until one connects.
+    """
+    start = perf_counter()
+    try:
+        addr_info = getaddrinfo(host, port, type=SOCK_STREAM)
+    finally:
+        phases["dns"] = perf_counter() - start
+
+    start = perf_counter()
+    error: OSError | None = None
+    try:
+        for family, socket_type, protocol, _, address in addr_info:
+            tcp_socket = socket(family, socket_type, protocol)
+            tcp_socket.settimeout(timeout)
+            try:
+                tcp_socket.connect(address)
+            except OSError as connect_error:
+                tcp_socket.close()
+                error = connect_error
+                continue
+            return tcp_socket
+    finally:
+        phases["tcp"] = perf_counter() - start
+    raise error or OSError(f"No addresses found for {host}:{port}")
+
+
 def netmiko_connect(
     host: HostT,
     port: int,
@@ -49,6 +108,7 @@ def netmiko_connect(
     password: str,
     device_type: str,
     ssh_strict: bool = True,
+    phases: dict[str, float] | None = None,
     *args,
     **kwargs,
 ) -> BaseConnection | Exception:
@@ -56,13 +116,97 @@ def netmiko_connect(
     Standard Netmiko connection variables and environment, mostly used as part of a larger connection scheme.
 
     Take in the Profile as keyword arguments and returns a Netmiko Base Connection or Netmiko Timeout/Auth Exceptions.
+
+    `phases` is filled with the seconds spent resolving (`dns`), connecting
+    (`tcp`), negotiating SSH (`key_exchange`), logging in (`authentication`)
+    and in Netmiko's prompt discovery (`prompt_discovery`).  The TCP socket is
+    opened here unless a socket, proxy or SSH config file is supplied.
     """
     # Collect input the default named input parameters and exclude *args, **kwargs
     host = str(host)
-    connect_kwargs = {k: v for k, v in locals().items() if not search(r"args", k)}
+    connect_kwargs = {
+        k: v for k, v in locals().items() if not search(r"args", k) and k != "phases"
+    }
 
     # Collect the additional user optional parameters
     for key, value in kwargs.items():
         connect_kwargs[key] = value
 
-    return ConnectHandler(**connect_kwargs)
+    if phases is None:
+        phases = {}
+
+    tcp_socket = None
+    if not (
+        search(r"_(telnet|serial)$", device_type)
+        or {"sock", "sock_telnet", "ssh_config_file"} & kwargs.keys()
+    ):
+        try:
+            tcp_socket = open_socket(
+                host, int(port), kwargs.get("conn_timeout", 10), phases
+            )
+        except OSError as error:
+            raise NetmikoTimeoutException(
+                f"TCP connection to device failed: {host}:{port}: {error}"
+            ) from error
+        connect_kwargs["sock"] = tcp_socket
+
+    try:
+        return open_timed(connect_kwargs, phases)
+    except Exception:
+        if tcp_socket is not None:
+            tcp_socket.close()
+        raise
+
+
+def open_timed(connect_kwargs: KwDict, phases: dict[str, float]) -> BaseConnection:
+    """
+    Connects with Netmiko, adding the `key_exchange`, `authentication` and
+    `prompt_discovery` phases to `phases`.
+
+    The phases are timed by wrapping the private steps of Netmiko's `_open`
+    on this connection only.  Should a Netmiko release lack any of them, the
+    connection is made by `ConnectHandler` unwrapped and timed as a whole as
+    `authentication`.
+    """
+    if not all(hasattr(BaseConnection, step) for step in NETMIKO_PHASE_STEPS):
+        return timed(phases, "authentication", ConnectHandler)(**connect_kwargs)
+
+    connection = ConnectHandler(**connect_kwargs, auto_connect=False)
+    build_ssh_client = connection._build_ssh_client
+
+    def build_timed_ssh_client():
+        client = build_ssh_client()
+        # Paramiko's login step, without which SSH setup is timed as a whole
+        if hasattr(client, "_auth"):
+            client._auth = timed(phases, "authentication", client._auth)
+        return client
+
+    connection._build_ssh_client = build_timed_ssh_client
+    connection.establish_connection = timed(
+        phases, "establish", connection.establish_connection
+    )
+    connection._try_session_preparation = timed(
+        phases, "prompt_discovery", connection._try_session_preparation
+    )
+
+    try:
+        connection._open()
+    except Exception:
+        # Mirror Netmiko's own cleanup when it connects automatically
+        with suppress(Exception):
+            connection.disconnect()
+        raise
+    finally:
+        # Split the SSH setup around login, telnet and serial only log in
+        establish = phases.pop("establish", 0)
+        authentication = phases.pop("authentication", None)
+        prompt_discovery = phases.pop("prompt_discovery", None)
+        if authentication is not None:
+            phases["key_exchange"] = establish - authentication
+            phases["authentication"] = authentication
+        elif establish:
+            phases["authentication"] = establish
+        if prompt_discovery is not None:
+            phases["prompt_discovery"] = prompt_discovery
+
+    return connection
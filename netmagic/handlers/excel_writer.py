@@ -7,13 +7,30 @@ using Microsoft Excel (which OpenOffice (freeware) can also read)
 
 """
 
+from collections.abc import Iterable, Iterator
+from datetime import date, time
+from functools import cache
 from re import search
 
 from openpyxl import Workbook
-from openpyxl.cell import Cell
+from openpyxl.cell import Cell, WriteOnlyCell
 from openpyxl.styles import Font, PatternFill
+from openpyxl.styles.cell_style import StyleArray
 from openpyxl.worksheet.worksheet import Worksheet
 
+# Values openpyxl stores as they are, others are written as their text
+CELL_TYPES = (str, int, float, bool, date, time)
+
+
+def excel_value(value):
+    """
+    Returns a value as openpyxl can store it, converting anything other than
+    text, numbers, dates and `None` (such as a `MacAddress` or set) to text
+    """
+    if value is None or isinstance(value, CELL_TYPES):
+        return value
+    return str(value)
+
 
 class CellEntry:
     def __init__(
@@ -26,28 +43,50 @@ class CellEntry:
 
 
 class RowEntry:
-    def __init__(self, entries: list[CellEntry]) -> None:
+    def __init__(self, entries: Iterable[CellEntry]) -> None:
         self.entries = entries
 
     def __repr__(self) -> str:
-        return f"RowEntry (Len: {len(self.entries)})"
+        length = len(self.entries) if hasattr(self.entries, "__len__") else "?"
+        return f"RowEntry (Len: {length})"
 
     def __iter__(self):
         yield from self.entries
 
 
 class Section:
-    def __init__(self, rows: list[RowEntry], style=None) -> None:
+    """
+    Group of rows on a sheet.  `rows` may be a generator, in which case it is
+    consumed once when the sheet is written.
+
+    `header` is an optional row of column names written before the rows; flat
+    file backends also use it to name fields.
+    """
+
+    def __init__(
+        self,
+        rows: Iterable[RowEntry],
+        style=None,
+        header: RowEntry | Iterable | None = None,
+    ) -> None:
         self.rows = rows
         self.style = style
+        self.header = header
 
     def __repr__(self) -> str:
-        return f"Section (Len: {len(self.rows)})"
+        length = len(self.rows) if hasattr(self.rows, "__len__") else "?"
+        return f"Section (Len: {length})"
 
     def apply_row_font(self, font: Font, row_number: int):
         for cell in self.rows[row_number]:
             cell.font = font
 
+    def iter_rows(self) -> Iterator[RowEntry | Iterable]:
+        """Yields the header, when present, followed by every row"""
+        if self.header is not None:
+            yield self.header
+        yield from self.rows
+
 
 class SheetEntry:
     def __init__(self, name: str, sections: list[Section]) -> None:
@@ -58,50 +97,160 @@ class SheetEntry:
         return f"SheetEntry (Len: {len(self.sections)})"
 
 
-def handle_cell(cell: Cell, cell_entry: CellEntry):
+@cache
+def shared_font(**kwargs) -> Font:
+    """
+    Returns one shared `Font` per distinct set of arguments so repeated cells
+    reuse the same object (and hit the `StyleCache`)
+    """
+    return Font(**kwargs)
+
+
+@cache
+def shared_fill(**kwargs) -> PatternFill:
     """
-    Set value and apply formatting of a cell with `CellEntry` instance
+    Returns one shared `PatternFill` per distinct set of arguments
     """
-    # Aux to cover strings not enrolled in cel objects
-    if isinstance(cell_entry, str):
+    return PatternFill(**kwargs)
+
+
+class StyleCache:
+    """
+    Per-workbook cache of resolved cell styles.
+
+    openpyxl hashes and registers a `Font`/`PatternFill` on every assignment;
+    this resolves each distinct font and fill pair once and copies the
+    resulting font and fill indices onto later cells, leaving the rest of
+    their style (such as the number format of a date) alone.  Keys are object
+    identities, so share style objects (see `shared_font`/`shared_fill`) to
+    benefit.
+    """
+
+    def __init__(self) -> None:
+        self.styles: dict[tuple[int, int], tuple] = {}
+
+    def apply(self, cell: Cell, font: Font | None, fill: PatternFill | None):
+        key = (id(font), id(fill))
+        if cached := self.styles.get(key):
+            font_id, fill_id = cached[:2]
+            if cell._style is None:
+                cell._style = StyleArray()
+            if font:
+                cell._style.fontId = font_id
+            if fill:
+                cell._style.fillId = fill_id
+            return
+
+        if font:
+            cell.font = font
+        if fill:
+            cell.fill = fill
+        # The style objects are held so their identities stay unique
+        self.styles[key] = (cell._style.fontId, cell._style.fillId, font, fill)
+
+
+def cell_value(cell_entry: CellEntry | object):
+    """
+    Returns the raw value of an entry, whether wrapped in `CellEntry` or not
+    """
+    return cell_entry.value if isinstance(cell_entry, CellEntry) else cell_entry
+
+
+def handle_cell(cell: Cell, cell_entry: CellEntry, styles: StyleCache | None = None):
+    """
+    Set value and apply formatting of a cell with `CellEntry` instance.
+    Values are written as `excel_value` gives them, so numbers and dates are
+    stored as such and `None` leaves the cell empty, rather than all as text.
+    """
+    # Aux to cover values not enrolled in cell objects
+    if not isinstance(cell_entry, CellEntry):
         cell_entry = CellEntry(cell_entry)
 
-    cell.value = str(cell_entry.value)
+    cell.value = excel_value(cell_entry.value)
 
+    if not cell_entry.font and not cell_entry.fill:
+        return
+    if styles is not None:
+        styles.apply(cell, cell_entry.font, cell_entry.fill)
+        return
     if cell_entry.font:
         cell.font = cell_entry.font
     if cell_entry.fill:
         cell.fill = cell_entry.fill
 
 
-def prepare_sheet(sheet: Worksheet, sections: list[Section]):
+def prepare_sheet(
+    sheet: Worksheet, sections: list[Section], styles: StyleCache | None = None
+):
     """
     This collects info a type and prepares a sheet to be added to a workbork
     """
     x = 0
 
     for section in sections:
-        for row in section.rows:
+        for row in section.iter_rows():
             x += 1
             y = 1
             for cell_entry in row:
-                handle_cell(sheet.cell(x, y), cell_entry)
+                handle_cell(sheet.cell(x, y), cell_entry, styles)
                 y += 1
 
 
-def prepare_workbook(filename: str, sheet_entries: list[SheetEntry]):
+def prepare_stream_sheet(
+    sheet: Worksheet, sections: Iterable[Section], styles: StyleCache
+):
     """
-    Prepare and save an Excel file from a series of pre-defined entries
+    Append rows to a write-only sheet as they are produced.
+
+    Unstyled entries are written as plain values, so numbers stay numeric;
+    only styled entries allocate a `WriteOnlyCell`.
+    """
+    for section in sections:
+        for row in section.iter_rows():
+            values = []
+            for cell_entry in row:
+                if not isinstance(cell_entry, CellEntry):
+                    values.append(excel_value(cell_entry))
+                    continue
+                if not cell_entry.font and not cell_entry.fill:
+                    values.append(excel_value(cell_entry.value))
+                    continue
+                cell = WriteOnlyCell(sheet, excel_value(cell_entry.value))
+                styles.apply(cell, cell_entry.font, cell_entry.fill)
+                values.append(cell)
+            sheet.append(values)
+
+
+def prepare_workbook(
+    filename: str, sheet_entries: Iterable[SheetEntry], write_only: bool = False
+):
+    """
+    Prepare and save an Excel file from a series of pre-defined entries.
+
+    `write_only` streams rows straight to the file with openpyxl's write-only
+    worksheets, keeping memory flat for very large reports; sections may then
+    be fed by generators of `RowEntry`.  Both modes store values the same way,
+    see `excel_value`.
     """
     if not search(r"\.xlsx$", filename):
         filename = f"{filename}.xlsx"
 
+    styles = StyleCache()
+
+    if write_only:
+        workbook = Workbook(write_only=True)
+        for sheet_entry in sheet_entries:
+            sheet = workbook.create_sheet(sheet_entry.name)
+            prepare_stream_sheet(sheet, sheet_entry.sections, styles)
+        workbook.save(filename)
+        return
+
     workbook = Workbook()
     default_sheet = workbook.active
 
     for sheet_entry in sheet_entries:
         sheet = workbook.create_sheet(sheet_entry.name)
-        prepare_sheet(sheet, sheet_entry.sections)
+        prepare_sheet(sheet, sheet_entry.sections, styles)
 
     if default_sheet.title in workbook.sheetnames:
         workbook.remove(default_sheet)
@@ -0,0 +1,171 @@
+# NetMagic Model Exporters
+
+# Python Modules
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from enum import Enum
+from functools import cache
+from itertools import chain
+from typing import Any
+
+# Third-Party Modules
+from pydantic import BaseModel
+
+# Local Modules
+from netmagic.handlers.excel_writer import Section, SheetEntry
+
+type Column = tuple[str, Callable[[BaseModel], Any]]
+type ModelSource = Mapping[Any, BaseModel] | Iterable[BaseModel]
+
+
+def export_value(value: Any) -> str | int | float | bool | None:
+    """
+    Converts a model attribute into a scalar suitable for any report backend
+    """
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (set, frozenset)):
+        return ",".join(sorted(str(i) for i in value))
+    if isinstance(value, Mapping):
+        return ",".join(f"{k}:{v}" for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return ",".join(str(i) for i in value)
+    return str(value)
+
+
+@cache
+def model_columns(model_class: type[BaseModel]) -> tuple[Column, ...]:
+    """
+    Returns `(name, getter)` pairs for every field of a model class.
+
+    Fields which are themselves models (like `OpticStatus`) are expanded into
+    `<field>_<subfield>` columns.
+    """
+    columns: list[Column] = []
+
+    for name, field in model_class.model_fields.items():
+        nested = next(
+            (
+                annotation
+                for annotation in (
+                    field.annotation,
+                    *getattr(field.annotation, "__args__", ()),
+                )
+                if isinstance(annotation, type) and issubclass(annotation, BaseModel)
+            ),
+            None,
+        )
+        if nested is None:
+            columns.append((name, lambda model, name=name: getattr(model, name)))
+            continue
+
+        for sub_name, getter in model_columns(nested):
+            columns.append(
+                (
+                    f"{name}_{sub_name}",
+                    lambda model, name=name, getter=getter: (
+                        getter(value)
+                        if (value := getattr(model, name)) is not None
+                        else None
+                    ),
+                )
+            )
+
+    return tuple(columns)
+
+
+def iter_models(source: ModelSource) -> Iterator[BaseModel]:
+    """
+    Yields the models from a dict of models (such as `fsm_output`) or any
+    iterable of models
+    """
+    if isinstance(source, Mapping):
+        yield from source.values()
+    else:
+        yield from source
+
+
+def iter_result_models(results: Iterable[Any]) -> Iterator[BaseModel]:
+    """
+    Yields every model from an iterator of per-device results, which may be
+    responses with a dict `fsm_output` or dicts of models directly
+    """
+    for result in results:
+        output = getattr(result, "fsm_output", result)
+        if isinstance(output, (Mapping, list, tuple)):
+            yield from (i for i in iter_models(output) if isinstance(i, BaseModel))
+
+
+def iter_model_rows(
+    models: Iterable[BaseModel],
+    columns: Iterable[Column],
+) -> Iterator[list[Any]]:
+    """
+    Yields plain-value rows for `models`, with no intermediate cell objects
+    """
+    getters = [getter for _, getter in columns]
+    for model in models:
+        yield [export_value(getter(model)) for getter in getters]
+
+
+def model_section(
+    source: ModelSource,
+    model_class: type[BaseModel] | None = None,
+    fields: Iterable[str] | None = None,
+) -> Section:
+    """
+    Builds a `Section` with a header and lazily generated rows from models.
+
+    `model_class` defaults to the class of the first model; models of any other
+    class (such as the `POEHost` entry in POE output) are skipped.  `fields`
+    selects and orders columns by name.  With no models and no `model_class`
+    the columns are unknown, so the section has no header and writes nothing.
+    """
+    models = iter_models(source)
+    if model_class is None:
+        first = next(models, None)
+        if first is None:
+            return Section([])
+        model_class = type(first)
+        models = chain([first], models)
+
+    columns = model_columns(model_class)
+    if fields is not None:
+        column_map = dict(columns)
+        try:
+            columns = tuple((name, column_map[name]) for name in fields)
+        except KeyError as error:
+            raise ValueError(
+                f"`{error.args[0]}` is not a column of {model_class.__name__}"
+            ) from error
+
+    rows = iter_model_rows(
+        (model for model in models if isinstance(model, model_class)), columns
+    )
+    return Section(rows, header=[name for name, _ in columns])
+
+
+def model_sheet(
+    name: str,
+    source: ModelSource,
+    model_class: type[BaseModel] | None = None,
+    fields: Iterable[str] | None = None,
+) -> SheetEntry:
+    """
+    Builds a single-section `SheetEntry` from models, see `model_section`
+    """
+    return SheetEntry(name, [model_section(source, model_class, fields)])
+
+
+def results_sheet(
+    name: str,
+    results: Iterable[Any],
+    model_class: type[BaseModel] | None = None,
+    fields: Iterable[str] | None = None,
+) -> SheetEntry:
+    """
+    Builds a `SheetEntry` streaming the models of many device results, such as
+    a generator of `get_interface_status()` responses across a fleet
+    """
+    return model_sheet(name, iter_result_models(results), model_class, fields)
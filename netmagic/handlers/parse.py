@@ -6,13 +6,19 @@ from importlib.resources import files
 from io import StringIO
 from os import path
 from re import escape, match, search
+from threading import local
+from typing import TYPE_CHECKING
 
 # Third-Party Modules
 from textfsm import TextFSM
 
 # Local Modules
+from netmagic.common.tracing import span
 from netmagic.common.types import FSMOutputT
 
+if TYPE_CHECKING:
+    from netmagic.handlers.parse_pool import ParsePool
+
 # Regex patterns
 
 # Universal
@@ -58,6 +64,10 @@ INTERFACE_PATTERN = r"[A-Za-z]{0,2}\d\/\d\/\d{1,2}"
 INTERFACE_PATTERN_GROUPS = r"(\w+)?(\d)\/(\d)\/(\d+)"
 INTERFACE_ABBRIEV = r"(((SFP\+?)|([Pp]ort))\s?\d+?\s(o[fn])?\s)"
 
+# Compiled parsers by template and vendor, per thread as a `TextFSM` holds the
+# state of the parse it is running
+compiled_parsers = local()
+
 
 def escape_string(string: str, exclude_list: list[str] | None = None) -> str:
     """
@@ -108,7 +118,7 @@ def swap(input_string: str, template: str):
 
 
 @cache
-def parser_preparation(template: str, vendor: str):
+def parser_preparation(template: str, vendor: str) -> str:
     """
     Memoized wrapper for getting the text file and preparing it
     """
@@ -130,14 +140,47 @@ def parser_preparation(template: str, vendor: str):
             raise ValueError(
                 "`template` must either be a file path, internal template, or template passed directly as a string"
             )
-    return StringIO(swap(raw_template_string, template))
+    return swap(raw_template_string, template)
 
 
 def get_parser(template: str, vendor: str):
     """
-    Gets a TextFSM parser with specified inputs
+    Gets a TextFSM parser with specified inputs, compiled once per thread and
+    reset to its start state on each later call
     """
-    return TextFSM(parser_preparation(template, vendor))
+    try:
+        parsers = compiled_parsers.parsers
+    except AttributeError:
+        parsers = compiled_parsers.parsers = {}
+
+    parser = parsers.get((template, vendor))
+    with span(
+        "parse.compile",
+        template=template_name(template),
+        vendor=vendor,
+        cached=parser is not None,
+    ):
+        if parser is None:
+            template_string = parser_preparation(template, vendor)
+            parser = parsers[template, vendor] = TextFSM(StringIO(template_string))
+        else:
+            parser.Reset()
+    return parser
+
+
+def clear_parsers() -> None:
+    """Clears the template cache and the calling thread's compiled parsers"""
+    parser_preparation.cache_clear()
+    vars(compiled_parsers).clear()
+
+
+def template_name(template: str) -> str:
+    """
+    Short name of a template for logs and traces, inline templates are not repeated
+    """
+    if "\n" in template:
+        return "<inline>"
+    return path.basename(template)
 
 
 def flatten_fsm_output(prime_key: str, fsm_output: FSMOutputT) -> FSMOutputT:
@@ -164,7 +207,11 @@ def flatten_fsm_output(prime_key: str, fsm_output: FSMOutputT) -> FSMOutputT:
 
 
 def get_fsm_data(
-    input: str, template: str, vendor: str | None = None, flatten_key: str | None = None
+    input: str,
+    template: str,
+    vendor: str | None = None,
+    flatten_key: str | None = None,
+    pool: "ParsePool | None" = None,
 ) -> FSMOutputT:
     """
     Function for handling TextFSM parsing and situational variables.
@@ -173,10 +220,16 @@ def get_fsm_data(
     `template` is either a path to the template or the template directly as a string
     `vendor` is the name of the vendor for fetching the internal template
     `flatten_key` is the string to flatten the dicts around
+    `pool` is an optional `ParsePool` to parse in a worker process
     """
+    if pool is not None:
+        return pool.parse(input, template, vendor, flatten_key)
+
     parser = get_parser(template, vendor)
 
-    output = parser.ParseTextToDicts(input)
+    with span("parse.textfsm", template=template_name(template)) as parse_span:
+        output = parser.ParseTextToDicts(input)
+        parse_span.set_attribute("rows", len(output))
 
     if flatten_key is not None:
         output = flatten_fsm_output(flatten_key, output)
@@ -0,0 +1,148 @@
+# NetMagic Parse Cache
+
+# Python Modules
+from collections import OrderedDict
+from hashlib import blake2b
+from threading import Lock
+from typing import TYPE_CHECKING
+
+# Local Modules
+from netmagic.common.types import FSMOutputT
+from netmagic.handlers.parse import get_fsm_data
+
+if TYPE_CHECKING:
+    from netmagic.handlers.parse_pool import ParsePool
+
+type CacheKey = tuple[str | None, str, str | None, str | None]
+
+# Parsed outputs kept per host and template, the last few distinct outputs
+ENTRIES_PER_KEY = 2
+
+# Hosts and templates cached before the least recently used is evicted
+MAX_KEYS = 50_000
+
+
+def output_digest(input: str | list[str]) -> bytes:
+    """Digest of a raw output, identical outputs having identical digests"""
+    digest = blake2b(digest_size=16)
+    for part in [input] if isinstance(input, str) else input:
+        digest.update(part.encode())
+        digest.update(b"\0")
+    return digest.digest()
+
+
+def copy_output(output: FSMOutputT) -> FSMOutputT:
+    """Copies rows and their list values, so callers may change what they get"""
+    return [
+        {
+            key: value.copy() if isinstance(value, list) else value
+            for key, value in row.items()
+        }
+        for row in output
+    ]
+
+
+class ParseCache:
+    """
+    Cache of parsed outputs by host and template, so an output identical to
+    an earlier one of the same host (as `show lldp neighbor detail` usually
+    is between polls) is not parsed again.
+
+    Each `(host, template)` keeps the parsed rows of its last
+    `entries_per_key` distinct outputs by digest, and the least recently used
+    `(host, template)` is evicted beyond `max_keys`.  Hits return a copy.
+    Set as the `parse_cache` of a `Device` (or of the `Device` class, for
+    every device).  The cache is safe to use from many threads.
+    """
+
+    def __init__(
+        self, entries_per_key: int = ENTRIES_PER_KEY, max_keys: int = MAX_KEYS
+    ) -> None:
+        if entries_per_key < 1 or max_keys < 1:
+            raise ValueError("`entries_per_key` and `max_keys` must be at least 1")
+        self.entries_per_key = entries_per_key
+        self.max_keys = max_keys
+        self.entries: OrderedDict[CacheKey, OrderedDict[bytes, FSMOutputT]] = (
+            OrderedDict()
+        )
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = Lock()
+
+    def __repr__(self) -> str:
+        return (
+            f"ParseCache({len(self.entries)} keys, {self.hits} hits, "
+            f"{self.misses} misses, {self.evictions} evictions)"
+        )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(outputs) for outputs in self.entries.values())
+
+    def stats(self) -> dict[str, int | float]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "keys": len(self.entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self.entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def get(self, key: CacheKey, digest: bytes) -> FSMOutputT | None:
+        """The cached rows of an output, counting the hit or miss"""
+        with self._lock:
+            outputs = self.entries.get(key)
+            output = outputs.get(digest) if outputs is not None else None
+            if output is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.entries.move_to_end(key)
+            outputs.move_to_end(digest)
+        return copy_output(output)
+
+    def put(self, key: CacheKey, digest: bytes, output: FSMOutputT) -> None:
+        output = copy_output(output)
+        with self._lock:
+            outputs = self.entries.get(key)
+            if outputs is None:
+                outputs = self.entries[key] = OrderedDict()
+            self.entries.move_to_end(key)
+            outputs[digest] = output
+            outputs.move_to_end(digest)
+            while len(outputs) > self.entries_per_key:
+                outputs.popitem(last=False)
+                self.evictions += 1
+            while len(self.entries) > self.max_keys:
+                _, evicted = self.entries.popitem(last=False)
+                self.evictions += len(evicted)
+
+    def parse(
+        self,
+        host: str | None,
+        input: str | list[str],
+        template: str,
+        vendor: str | None = None,
+        flatten_key: str | None = None,
+        pool: "ParsePool | None" = None,
+    ) -> FSMOutputT:
+        """
+        Returns the parsed rows of an output, parsing it with `get_fsm_data`
+        only when this host's output for the template has not been seen
+        """
+        key = (host, template, vendor, flatten_key)
+        digest = output_digest(input)
+        output = self.get(key, digest)
+        if output is None:
+            # Parsed outside the lock, as parsing is the slow part
+            output = get_fsm_data(input, template, vendor, flatten_key, pool)
+            self.put(key, digest, output)
+        return output
@@ -0,0 +1,153 @@
+# NetMagic Parse Pool
+
+# Python Modules
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from importlib.resources import files
+from multiprocessing import get_all_start_methods, get_context
+from multiprocessing.shared_memory import SharedMemory
+from os import cpu_count
+from threading import Lock
+from typing import Self
+
+# Local Modules
+from netmagic.common.tracing import span
+from netmagic.common.types import FSMOutputT
+from netmagic.handlers.parse import get_fsm_data, get_parser, template_name
+
+# Outputs smaller than this are parsed in the calling thread, as sending them to
+# a worker costs more than parsing them
+INLINE_SIZE = 4_096
+
+# Outputs of this size or larger reach workers through shared memory instead of
+# being pickled down the pool's pipe
+SHARED_MEMORY_SIZE = 1 << 20
+
+
+def builtin_templates() -> list[tuple[str, str]]:
+    """Returns `(template, vendor)` of every template shipped with NetMagic"""
+    return sorted(
+        (template.name.removesuffix(".textfsm"), vendor.name)
+        for vendor in files("netmagic.templates").iterdir()
+        if vendor.is_dir()
+        for template in vendor.iterdir()
+        if template.name.endswith(".textfsm")
+    )
+
+
+def warm_templates(templates: Iterable[tuple[str, str]]) -> None:
+    """
+    Pool worker initializer, reading and compiling every template up front.
+    Workers keep the compiled parsers, so no parse in a worker compiles its
+    template again.
+    """
+    for template, vendor in templates:
+        get_parser(template, vendor)
+
+
+def parse_shared(
+    name: str,
+    size: int,
+    template: str,
+    vendor: str | None,
+    flatten_key: str | None,
+) -> FSMOutputT:
+    """
+    Pool worker task parsing an output from shared memory, which the caller
+    created and will unlink
+    """
+    memory = SharedMemory(name, track=False)
+    try:
+        input = str(memory.buf[:size], "utf-8")
+    finally:
+        memory.close()
+    return get_fsm_data(input, template, vendor, flatten_key)
+
+
+class ParsePool:
+    """
+    Process pool for TextFSM parsing, so threads collecting from many devices
+    are not serialised on one core by the GIL while they parse.
+
+    The pool is shared: pass it to `get_fsm_data(pool=...)` or set it as the
+    `parse_pool` of a `Device` (or of the `Device` class, for every device).
+    Workers start on first use with every built-in template compiled.
+    Parsing returns the same output as `get_fsm_data` without a pool.
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        templates: Iterable[tuple[str, str]] | None = None,
+        inline_size: int = INLINE_SIZE,
+        shared_memory_size: int = SHARED_MEMORY_SIZE,
+    ) -> None:
+        self.workers = workers or cpu_count() or 1
+        self.templates = builtin_templates() if templates is None else list(templates)
+        self.inline_size = inline_size
+        self.shared_memory_size = shared_memory_size
+        self.executor: ProcessPoolExecutor | None = None
+        self._lock = Lock()
+
+    def __repr__(self) -> str:
+        state = "running" if self.executor else "stopped"
+        return f"ParsePool(workers={self.workers}, {state})"
+
+    def __enter__(self) -> Self:
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.shutdown()
+
+    def start(self) -> Self:
+        with self._lock:
+            if self.executor is None:
+                # Forking a process with running collection threads is unsafe
+                method = (
+                    "forkserver" if "forkserver" in get_all_start_methods() else "spawn"
+                )
+                self.executor = ProcessPoolExecutor(
+                    self.workers,
+                    mp_context=get_context(method),
+                    initializer=warm_templates,
+                    initargs=(self.templates,),
+                )
+        return self
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            executor, self.executor = self.executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    def parse(
+        self,
+        input: str,
+        template: str,
+        vendor: str | None = None,
+        flatten_key: str | None = None,
+    ) -> FSMOutputT:
+        """
+        Parses in a worker process and blocks the calling thread, without the
+        GIL, until the rows are back
+        """
+        if len(input) < self.inline_size:
+            return get_fsm_data(input, template, vendor, flatten_key)
+
+        executor = self.executor or self.start().executor
+        with span("parse.pool", template=template_name(template), bytes=len(input)):
+            if len(input) < self.shared_memory_size:
+                return executor.submit(
+                    get_fsm_data, input, template, vendor, flatten_key
+                ).result()
+
+            data = input.encode()
+            memory = SharedMemory(create=True, size=len(data))
+            try:
+                memory.buf[: len(data)] = data
+                return executor.submit(
+                    parse_shared, memory.name, len(data), template, vendor, flatten_key
+                ).result()
+            finally:
+                memory.close()
+                memory.unlink()
@@ -0,0 +1,157 @@
+# NetMagic Report Writer
+
+# Python Modules
+from collections.abc import Callable, Iterable
+from csv import writer
+from gzip import open as gzip_open
+from json import dumps
+from os import makedirs, path
+from re import search, sub
+from typing import IO
+
+# Local Modules
+from netmagic.common.types import ReportFormat
+from netmagic.handlers.excel_writer import SheetEntry, cell_value, prepare_workbook
+
+type ReportWriter = Callable[..., list[str]]
+
+
+def sheet_filename(
+    directory: str,
+    name: str,
+    extension: str,
+    compress: bool,
+    taken: set[str] | None = None,
+) -> str:
+    """
+    Returns a filesystem-safe path for a sheet's flat file.
+
+    Names already in `taken` (compared case-insensitively) get a numbered
+    suffix, so sheets such as `Ports A` and `Ports_A` do not overwrite each
+    other; the chosen name is added to `taken`.
+    """
+    safe_name = sub(r"[^\w.-]+", "_", name).strip("_") or "sheet"
+    suffix = f".{extension}{'.gz' if compress else ''}"
+    filename = f"{safe_name}{suffix}"
+    if taken is not None:
+        count = 1
+        while filename.lower() in taken:
+            count += 1
+            filename = f"{safe_name}_{count}{suffix}"
+        taken.add(filename.lower())
+    return path.join(directory, filename)
+
+
+def open_report(filename: str, compress: bool) -> IO[str]:
+    if compress:
+        return gzip_open(filename, "wt", encoding="utf-8", newline="")
+    return open(filename, "w", encoding="utf-8", newline="")
+
+
+def write_csv(
+    directory: str, sheet_entries: Iterable[SheetEntry], compress: bool = False
+) -> list[str]:
+    """
+    Write each sheet to its own CSV file, one row at a time.
+    Section headers are written as rows, like they are on a worksheet.
+    """
+    makedirs(directory, exist_ok=True)
+    filenames = []
+    taken: set[str] = set()
+
+    for sheet_entry in sheet_entries:
+        filename = sheet_filename(directory, sheet_entry.name, "csv", compress, taken)
+        with open_report(filename, compress) as file:
+            csv_writer = writer(file)
+            for section in sheet_entry.sections:
+                csv_writer.writerows(
+                    [cell_value(entry) for entry in row] for row in section.iter_rows()
+                )
+        filenames.append(filename)
+
+    return filenames
+
+
+def write_jsonl(
+    directory: str, sheet_entries: Iterable[SheetEntry], compress: bool = False
+) -> list[str]:
+    """
+    Write each sheet to its own JSON Lines file, one row per line.
+
+    Rows of a section with a `header` become objects keyed by the header,
+    other rows become arrays.  Values JSON can not encode are written as text.
+    """
+    makedirs(directory, exist_ok=True)
+    filenames = []
+    taken: set[str] = set()
+
+    for sheet_entry in sheet_entries:
+        filename = sheet_filename(directory, sheet_entry.name, "jsonl", compress, taken)
+        with open_report(filename, compress) as file:
+            for section in sheet_entry.sections:
+                keys = None
+                if section.header is not None:
+                    keys = [str(cell_value(entry)) for entry in section.header]
+
+                for row in section.rows:
+                    values = [cell_value(entry) for entry in row]
+                    record = dict(zip(keys, values, strict=False)) if keys else values
+                    file.write(dumps(record, default=str))
+                    file.write("\n")
+        filenames.append(filename)
+
+    return filenames
+
+
+def write_xlsx(
+    filename: str,
+    sheet_entries: Iterable[SheetEntry],
+    compress: bool = False,
+    write_only: bool = True,
+) -> list[str]:
+    """
+    Write all sheets into one workbook, streaming by default.
+    XLSX is already compressed, so `compress` has no effect.
+    """
+    if not search(r"\.xlsx$", filename):
+        filename = f"{filename}.xlsx"
+    prepare_workbook(filename, sheet_entries, write_only=write_only)
+    return [filename]
+
+
+# Backends by format name, extendable with `register_report_writer`
+REPORT_WRITERS: dict[str, ReportWriter] = {
+    ReportFormat.XLSX.value: write_xlsx,
+    ReportFormat.CSV.value: write_csv,
+    ReportFormat.JSONL.value: write_jsonl,
+}
+
+
+def register_report_writer(name: str, report_writer: ReportWriter) -> None:
+    """
+    Add or replace a backend.  Writers take a destination, the sheet entries
+    and a `compress` flag, and return the paths they wrote.
+    """
+    REPORT_WRITERS[name] = report_writer
+
+
+def prepare_report(
+    destination: str,
+    sheet_entries: Iterable[SheetEntry],
+    report_format: ReportFormat | str = ReportFormat.XLSX,
+    compress: bool = False,
+) -> list[str]:
+    """
+    Render sheet entries with the selected backend and return the written paths.
+
+    `destination` is the workbook filename for XLSX and a directory for the
+    flat file formats, which write one file per sheet.
+    """
+    name = (
+        report_format.value
+        if isinstance(report_format, ReportFormat)
+        else report_format
+    )
+    if not (report_writer := REPORT_WRITERS.get(name)):
+        raise ValueError(f"Unknown report format `{name}`")
+    return report_writer(destination, sheet_entries, compress=compress)
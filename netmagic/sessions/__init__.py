@@ -1,10 +1,18 @@
 from netmagic.sessions.netconf import NETCONFSession
+from netmagic.sessions.replay import (
+    ReplayArchive,
+    ReplayNETCONFSession,
+    ReplayTerminalSession,
+)
 from netmagic.sessions.restconf import RESTCONFSession
 from netmagic.sessions.terminal import Session, TerminalSession
 
 __all__ = [
     "NETCONFSession",
     "RESTCONFSession",
+    "ReplayArchive",
+    "ReplayNETCONFSession",
+    "ReplayTerminalSession",
     "Session",
     "TerminalSession",
 ]
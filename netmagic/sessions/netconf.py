@@ -1,22 +1,42 @@
 # NetMagic NETCONF Session
 
 # Python Modules
-from datetime import UTC, datetime
-from time import sleep
-from typing import Any
+from collections.abc import Callable, Hashable, Iterator
+from io import StringIO
+from time import monotonic, perf_counter, sleep
+from typing import TYPE_CHECKING, Any
 
 # Third-Party Modules
+from defusedxml.ElementTree import iterparse
 from ncclient import manager
 from ncclient.operations.errors import TimeoutExpiredError
 from ncclient.operations.rpc import RPCError
-from ncclient.transport.errors import AuthenticationError, TransportError
+from ncclient.transport.errors import AuthenticationError, SSHError, TransportError
+from ncclient.xml_ import to_ele
 
 # Local Modules
 from netmagic.common import HostT, KwDict, Transport, validate_max_tries
 from netmagic.common.classes import NETCONFResponse
+from netmagic.common.metrics import record_response
+from netmagic.common.tracing import SPAN_KIND_CLIENT, span
+from netmagic.handlers.connect import open_socket
 
 # Local Modules
 from netmagic.sessions.session import Session
+from netmagic.sessions.subscription import (
+    NOTIFICATION_CAPABILITY,
+    YANG_PUSH_NAMESPACE,
+    NETCONFNotification,
+    NETCONFSubscription,
+    build_establish_subscription,
+)
+
+if TYPE_CHECKING:
+    from xml.etree.ElementTree import Element  # nosec B405
+
+NETCONF_BASE_NAMESPACE = "urn:ietf:params:xml:ns:netconf:base:1.0"
+CANDIDATE_CAPABILITY = "urn:ietf:params:netconf:capability:candidate"
+VALIDATE_CAPABILITY = "urn:ietf:params:netconf:capability:validate"
 
 
 class NETCONFSession(Session):
@@ -32,12 +52,17 @@ class NETCONFSession(Session):
         port: int = 830,
         connection: Any | None = None,
         transport: Transport = Transport.NETCONF,
+        filter_cache_size: int = 128,
         **kwargs,
     ) -> None:
         super().__init__(host, username, password, port, connection, transport)
         self.connection_kwargs = {**kwargs}
         self.rpc_log: list[NETCONFResponse] = []
 
+        # Built RPC filters keyed by the caller, reused across repeated polls
+        self.filter_cache: dict[Hashable, object] = {}
+        self.filter_cache_size = filter_cache_size
+
     @validate_max_tries
     def connect(
         self,
@@ -62,15 +87,69 @@ class NETCONFSession(Session):
 
         self.connection = None
         for attempt in range(max_tries):
-            try:
-                self.connection = manager.connect(**local_connection_kwargs)
+            phases: dict[str, float] = {}
+            sent_time = monotonic()
+            with span(
+                "netconf.connect",
+                SPAN_KIND_CLIENT,
+                host=str(self.host),
+                port=self.port,
+                attempt=attempt + 1,
+            ) as connect_span:
+                try:
+                    self.connection = self.open_manager(local_connection_kwargs, phases)
+                    result = self.connection
+                except (AuthenticationError, TransportError) as error:
+                    connect_span.record_exception(error)
+                    self.connection = None
+                    result = error
+                for phase, seconds in phases.items():
+                    connect_span.set_attribute(f"phase.{phase}", seconds)
+
+            self.log_connect(
+                result,
+                manager.connect,
+                local_connection_kwargs,
+                sent_time,
+                phases,
+                attempt + 1,
+            )
+            if self.connection is not None:
                 return True
-            except (AuthenticationError, TransportError):
-                self.connection = None
-                if attempt + 1 < max_tries:
-                    sleep(5)
+            if attempt + 1 < max_tries:
+                sleep(5)
         return False
 
+    def open_manager(
+        self, connect_kwargs: dict[str, Any], phases: dict[str, float]
+    ) -> manager.Manager:
+        """
+        Open the TCP socket for ncclient to record the `dns` and `tcp` phases,
+        unless a socket or SSH config is given.  ncclient negotiates SSH,
+        authenticates and exchanges hellos in one call, recorded as `ssh`.
+        """
+        connect_kwargs = dict(connect_kwargs)
+        tcp_socket = None
+        if not {"sock", "sock_fd", "ssh_config"} & connect_kwargs.keys():
+            host, port = str(connect_kwargs["host"]), int(connect_kwargs["port"])
+            try:
+                tcp_socket = open_socket(
+                    host, port, connect_kwargs.get("timeout"), phases
+                )
+            except OSError as error:
+                raise SSHError(f"Could not open socket to {host}:{port}") from error
+            connect_kwargs["sock"] = tcp_socket
+
+        start = perf_counter()
+        try:
+            return manager.connect(**connect_kwargs)
+        except Exception:
+            if tcp_socket is not None:
+                tcp_socket.close()
+            raise
+        finally:
+            phases["ssh"] = perf_counter() - start
+
     def check_session(self) -> bool:
         """Return whether the current manager reports an active connection."""
         return bool(self.connection and getattr(self.connection, "connected", False))
@@ -84,6 +163,18 @@ class NETCONFSession(Session):
         finally:
             super().disconnect()
 
+    def get_filter(self, key: Hashable, builder: Callable[[], object]) -> object:
+        """
+        Return the RPC filter cached under `key`, building it on first use.
+        The oldest entry is evicted once `filter_cache_size` is exceeded.
+        """
+        if (rpc_filter := self.filter_cache.get(key)) is None:
+            rpc_filter = builder()
+            self.filter_cache[key] = rpc_filter
+            if len(self.filter_cache) > self.filter_cache_size:
+                del self.filter_cache[next(iter(self.filter_cache))]
+        return rpc_filter
+
     @validate_max_tries
     def get(
         self,
@@ -91,38 +182,284 @@ class NETCONFSession(Session):
         max_tries: int = 3,
     ) -> NETCONFResponse:
         """Run an idempotent NETCONF get operation."""
-        no_session_string = "Unable to connect a NETCONF session for get"
+        return self.rpc(
+            "get",
+            lambda connection: connection.get(filter=rpc_filter).data_xml,
+            rpc_filter=rpc_filter,
+            max_tries=max_tries,
+        )
+
+    @validate_max_tries
+    def rpc(
+        self,
+        operation: str,
+        request: Callable[[Any], str],
+        rpc_filter: object | None = None,
+        max_tries: int = 1,
+    ) -> NETCONFResponse:
+        """
+        Run `request` against the manager and log it as a `NETCONFResponse`.
+
+        `request` receives the connected manager and returns the reply text.
+        Timeouts and transport failures are retried up to `max_tries`, so only
+        pass more than one try for operations that are safe to repeat.
+        """
+        no_session_string = f"Unable to connect a NETCONF session for {operation}"
         if not self.check_session() and not self.connect():
             raise AttributeError(no_session_string)
 
         response: str | Exception
-        sent_time = datetime.now(UTC)
-        for attempt in range(max_tries):
-            connection = self.connection
-            if connection is None:
-                raise AttributeError(no_session_string)
-            try:
-                reply = connection.get(filter=rpc_filter)
-                response = reply.data_xml
-                break
-            except TimeoutExpiredError as error:
-                response = error
-            except TransportError as error:
-                response = error
-                self.connection = None
-                if attempt + 1 < max_tries and not self.connect():
-                    raise AttributeError(no_session_string) from error
-            except RPCError as error:
-                response = error
-                break
+        sent_time = monotonic()
+        with span(
+            "netconf.rpc", SPAN_KIND_CLIENT, host=str(self.host), operation=operation
+        ) as rpc_span:
+            for attempt in range(max_tries):
+                connection = self.connection
+                if connection is None:
+                    raise AttributeError(no_session_string)
+                try:
+                    response = request(connection)
+                    break
+                except TimeoutExpiredError as error:
+                    response = error
+                except TransportError as error:
+                    response = error
+                    self.connection = None
+                    if attempt + 1 < max_tries and not self.connect():
+                        raise AttributeError(no_session_string) from error
+                except RPCError as error:
+                    response = error
+                    break
+
+            rpc_span.set_attribute("attempts", attempt + 1)
+            if isinstance(response, Exception):
+                rpc_span.record_exception(response)
+            else:
+                rpc_span.set_attribute("reply.length", len(response))
 
         result = NETCONFResponse(
             response=response,
-            operation="get",
+            operation=operation,
             rpc_filter=rpc_filter,
             sent_time=sent_time,
             session=self,
             attempts=attempt + 1,
         )
         self.rpc_log.append(result)
+        record_response(result, self.host, self.transport.value, operation)
         return result
+
+    # CONFIGURATION
+
+    def edit_config(
+        self,
+        config: str,
+        target: str = "candidate",
+        default_operation: str | None = None,
+        max_tries: int = 1,
+    ) -> NETCONFResponse:
+        """
+        Send `config` to the `target` datastore with `edit-config`.
+        A bare payload is wrapped in the NETCONF `<config>` element.
+        """
+        if not config.lstrip().startswith("<config"):
+            config = f'<config xmlns="{NETCONF_BASE_NAMESPACE}">{config}</config>'
+        return self.rpc(
+            "edit-config",
+            lambda connection: (
+                connection.edit_config(
+                    config=config, target=target, default_operation=default_operation
+                ).xml
+            ),
+            max_tries=max_tries,
+        )
+
+    def lock(self, target: str = "candidate") -> NETCONFResponse:
+        """Lock a datastore against other sessions."""
+        return self.rpc("lock", lambda connection: connection.lock(target=target).xml)
+
+    def unlock(self, target: str = "candidate") -> NETCONFResponse:
+        """Release a datastore lock."""
+        return self.rpc(
+            "unlock", lambda connection: connection.unlock(target=target).xml
+        )
+
+    def validate(self, source: str = "candidate") -> NETCONFResponse:
+        """Validate the contents of a datastore without applying them."""
+        return self.rpc(
+            "validate", lambda connection: connection.validate(source=source).xml
+        )
+
+    def commit(
+        self,
+        confirmed: bool = False,
+        confirm_timeout: int | None = None,
+    ) -> NETCONFResponse:
+        """
+        Commit the candidate datastore.  With `confirmed` the change is rolled
+        back unless a second commit follows within `confirm_timeout` seconds.
+        """
+        timeout = str(int(confirm_timeout)) if confirm_timeout is not None else None
+        return self.rpc(
+            "commit confirmed" if confirmed else "commit",
+            lambda connection: (
+                connection.commit(confirmed=confirmed, timeout=timeout).xml
+            ),
+        )
+
+    def discard_changes(self) -> NETCONFResponse:
+        """Revert the candidate datastore to the running configuration."""
+        return self.rpc(
+            "discard-changes", lambda connection: connection.discard_changes().xml
+        )
+
+    def apply_config(
+        self,
+        config: str,
+        confirmed: bool = False,
+        confirm_timeout: int | None = None,
+        default_operation: str | None = None,
+    ) -> list[NETCONFResponse]:
+        """
+        Apply a whole change set as one transaction and return every RPC made.
+
+        With the candidate capability this locks the candidate, edits it,
+        validates when supported and commits, discarding the candidate if any
+        step fails.  Without it the running datastore is edited directly.
+        """
+        if not self.check_session() and not self.connect():
+            raise AttributeError("Unable to connect a NETCONF session for config")
+
+        if not self.check_capability(CANDIDATE_CAPABILITY):
+            return [
+                self.edit_config(
+                    config, target="running", default_operation=default_operation
+                )
+            ]
+
+        responses = [self.lock()]
+        if not responses[-1].success:
+            return responses
+
+        steps = [lambda: self.edit_config(config, default_operation=default_operation)]
+        if self.check_capability(VALIDATE_CAPABILITY):
+            steps.append(self.validate)
+        steps.append(lambda: self.commit(confirmed, confirm_timeout))
+
+        try:
+            for step in steps:
+                responses.append(step())
+                if not responses[-1].success:
+                    if self.check_session():
+                        responses.append(self.discard_changes())
+                    break
+        finally:
+            if self.check_session():
+                responses.append(self.unlock())
+        return responses
+
+    def check_capability(self, capability: str) -> bool:
+        """Return whether the server advertises a capability containing `capability`."""
+        capabilities = getattr(self.connection, "server_capabilities", ())
+        return any(capability in str(item) for item in capabilities)
+
+    def subscribe(
+        self,
+        callback: Callable[[NETCONFNotification], None] | None = None,
+        stream: str | None = None,
+        rpc_filter: object | None = None,
+        start_time: str | None = None,
+        stop_time: str | None = None,
+        xpath: str | None = None,
+        period: int | None = None,
+        on_change: bool = False,
+        datastore: str = "ds:operational",
+        namespaces: dict[str, str] | None = None,
+    ) -> NETCONFSubscription:
+        """
+        Subscribe to server-pushed notifications and start a background reader.
+
+        Without `period` or `on_change` this is an RFC 5277 `create-subscription`
+        on `stream` (optionally filtered and replayed from `start_time`).
+        With them it is a YANG-push `establish-subscription` of `xpath` in
+        `datastore`, either every `period` centiseconds or on change; prefixes
+        of `xpath` beyond the usual IETF ones need their `namespaces`.
+
+        Notifications go to `callback` if given, otherwise they are queued for
+        iteration (`for` or `async for`) over the returned subscription.
+        """
+        if not self.check_session() and not self.connect():
+            raise AttributeError("Unable to connect a NETCONF session for subscribe")
+
+        if period is None and not on_change:
+            if not self.check_capability(NOTIFICATION_CAPABILITY):
+                raise NotImplementedError("NETCONF notifications are not advertised")
+            response = self.rpc(
+                "create-subscription",
+                lambda connection: (
+                    connection.create_subscription(
+                        filter=rpc_filter,
+                        stream_name=stream,
+                        start_time=start_time,
+                        stop_time=stop_time,
+                    ).xml
+                ),
+                rpc_filter=rpc_filter,
+            )
+        else:
+            if not self.check_capability(YANG_PUSH_NAMESPACE):
+                raise NotImplementedError("YANG-push subscriptions are not advertised")
+            if xpath is None:
+                raise ValueError("YANG-push subscriptions require an `xpath` filter")
+            rpc = build_establish_subscription(
+                xpath, datastore, period, on_change, namespaces
+            )
+            response = self.rpc(
+                "establish-subscription",
+                lambda connection: connection.dispatch(to_ele(rpc)).xml,
+                rpc_filter=xpath,
+            )
+
+        if not response.success:
+            raise ConnectionError(
+                f"Subscription was rejected by {self.host}: {response.response}"
+            )
+        return NETCONFSubscription(self, response, callback).start()
+
+    @staticmethod
+    def iterparse(
+        reply: str | NETCONFResponse,
+        element_name: str,
+    ) -> Iterator["Element"]:
+        """
+        Incrementally parse a reply and yield each element matching `element_name`.
+
+        Yielded elements are cleared and detached from their parent once the
+        consumer moves on, so only one matching subtree is held at a time.
+        Matching is on the local name, ignoring namespaces.  The error of a
+        failed reply is raised on the call, before any iteration.
+        """
+        if isinstance(reply, NETCONFResponse):
+            reply = reply.response
+        if isinstance(reply, Exception):
+            raise reply
+        if not isinstance(reply, str):
+            raise TypeError("`reply` must be XML text or a successful NETCONFResponse")
+        return NETCONFSession._iterparse(reply, element_name)
+
+    @staticmethod
+    def _iterparse(reply: str, element_name: str) -> Iterator["Element"]:
+        parents = []
+        for event, element in iterparse(StringIO(reply), events=("start", "end")):
+            if event == "start":
+                parents.append(element)
+                continue
+
+            parents.pop()
+            if element.tag.rpartition("}")[2] != element_name:
+                continue
+
+            yield element
+            element.clear()
+            if parents:
+                parents[-1].remove(element)
@@ -0,0 +1,468 @@
+# NetMagic Replay Sessions
+
+"""
+Record real device interactions once and replay them offline.
+
+A session in `ReplayMode.RECORD` behaves like its parent and records every
+command, prompt, config set or RPC with its timing.  Saved as an archive, it
+can be replayed by a session in `ReplayMode.REPLAY`, which answers from the
+archive without a network, optionally with the recorded latency:
+
+    session = ReplayTerminalSession("sw1", "user", "pass", "sw1.replay.gz",
+                                    mode=ReplayMode.RECORD)
+    CiscoIOSSwitch(session).get_interface_status()
+    session.disconnect()  # saves the archive
+
+    session = ReplayTerminalSession.from_archive("sw1.replay.gz")
+    CiscoIOSSwitch(session).get_interface_status()
+"""
+
+# Python Modules
+from collections.abc import Callable
+from datetime import UTC, datetime
+from functools import wraps
+from gzip import open as gzip_open
+from json import dumps, loads
+from time import monotonic, perf_counter, sleep
+from typing import Any, Self
+
+# Third-Party Modules
+from ncclient.operations.errors import TimeoutExpiredError
+from ncclient.operations.rpc import RPCError
+from ncclient.transport.errors import SSHError, TransportError
+from ncclient.xml_ import to_ele, to_xml
+from netmiko import ReadTimeout
+
+# Local Modules
+from netmagic.common import ConfigSet, Engine, HostT, ReplayMode
+from netmagic.common.classes import NETCONFResponse
+from netmagic.sessions.netconf import NETCONFSession
+from netmagic.sessions.terminal import REDACTED_COMMAND, TerminalSession
+
+ARCHIVE_VERSION = 1
+REDACTED_REQUEST = REDACTED_COMMAND
+
+# Recorded errors which are raised again on replay, others become `RuntimeError`
+REPLAY_ERRORS: dict[str, type[Exception]] = {
+    error.__name__: error
+    for error in (ReadTimeout, OSError, TimeoutExpiredError, TransportError, SSHError)
+}
+
+type ReplayEntry = dict[str, Any]
+
+
+class ReplayArchive:
+    """
+    Requests and responses of one session in recorded order.
+
+    Saved as gzip-compressed JSON Lines: a header with the host, port and
+    connect phases, then one object per interaction with its `kind`
+    (`command`, `prompt`, `config` or `rpc`), `request`, `response`, `error`
+    and `seconds`.
+    """
+
+    def __init__(
+        self,
+        header: dict[str, Any] | None = None,
+        entries: list[ReplayEntry] | None = None,
+    ) -> None:
+        self.header = header or {}
+        self.entries = entries or []
+        self._index: dict[tuple[str, str], list[ReplayEntry]] | None = None
+        self._positions: dict[tuple[str, str], int] = {}
+
+    def __repr__(self) -> str:
+        return f"ReplayArchive({self.header.get('host')}: {len(self.entries)} entries)"
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def record(
+        self, kind: str, request: str, response: Any, seconds: float
+    ) -> ReplayEntry:
+        entry: ReplayEntry = {
+            "kind": kind,
+            "request": request,
+            "seconds": round(seconds, 6),
+        }
+        if isinstance(response, RPCError):
+            entry.update(error="RPCError", response=to_xml(response.xml))
+        elif isinstance(response, Exception):
+            entry.update(error=type(response).__name__, response=str(response))
+        else:
+            entry["response"] = response
+        self.entries.append(entry)
+        self._index = None
+        return entry
+
+    def save(self, filename: str) -> str:
+        with gzip_open(filename, "wt", encoding="utf-8") as file:
+            file.write(dumps({"netmagic_replay": ARCHIVE_VERSION, **self.header}))
+            file.write("\n")
+            for entry in self.entries:
+                file.write(dumps(entry))
+                file.write("\n")
+        return filename
+
+    @classmethod
+    def load(cls, filename: str) -> Self:
+        with gzip_open(filename, "rt", encoding="utf-8") as file:
+            header = loads(file.readline() or "{}")
+            if header.pop("netmagic_replay", None) != ARCHIVE_VERSION:
+                raise ValueError(f"`{filename}` is not a NetMagic replay archive")
+            entries = [loads(line) for line in file if line.strip()]
+        return cls(header, entries)
+
+    def next(self, kind: str, request: str) -> ReplayEntry:
+        """
+        Returns the next recorded entry for a request.  Repeated requests get
+        their recordings in order, then the last one again, so getters can be
+        replayed in a loop.
+        """
+        if self._index is None:
+            self._index = {}
+            for entry in self.entries:
+                key = (entry["kind"], entry["request"])
+                self._index.setdefault(key, []).append(entry)
+
+        key = (kind, request)
+        if not (entries := self._index.get(key)):
+            raise KeyError(f"No recorded {kind} for `{request}`")
+        position = self._positions.get(key, 0)
+        self._positions[key] = position + 1
+        return entries[min(position, len(entries) - 1)]
+
+    def rewind(self) -> None:
+        """Replays every request from its first recording again"""
+        self._positions = {}
+
+
+def open_archive(archive: ReplayArchive | str | None, mode: ReplayMode):
+    """Returns the archive and its filename, loading it when replaying"""
+    if isinstance(archive, str):
+        if mode == ReplayMode.REPLAY:
+            return ReplayArchive.load(archive), archive
+        return ReplayArchive(), archive
+    return archive if archive is not None else ReplayArchive(), None
+
+
+def replay(entry: ReplayEntry, latency_scale: float = 0.0) -> str:
+    """
+    Returns a recorded response, or raises its recorded error, after the
+    recorded time multiplied by `latency_scale`
+    """
+    if latency_scale:
+        sleep(entry["seconds"] * latency_scale)
+    if (error := entry.get("error")) is None:
+        return entry["response"]
+    if error == "RPCError":
+        raise RPCError(to_ele(entry["response"]))
+    raise REPLAY_ERRORS.get(error, RuntimeError)(entry["response"])
+
+
+def recorded(
+    archive: ReplayArchive,
+    kind: str,
+    func: Callable[..., Any],
+    request: Callable[..., str],
+) -> Callable[..., Any]:
+    """Wraps `func` to record each call, keyed by `request(*args, **kwargs)`"""
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        key = request(*args, **kwargs)
+        start = perf_counter()
+        try:
+            response = func(*args, **kwargs)
+        except Exception as error:
+            archive.record(kind, key, error, perf_counter() - start)
+            raise
+        archive.record(kind, key, response, perf_counter() - start)
+        return response
+
+    return wrapper
+
+
+def config_request(config_commands: ConfigSet | None = None, *args, **kwargs) -> str:
+    if config_commands is None or isinstance(config_commands, str):
+        return config_commands or ""
+    return "\n".join(config_commands)
+
+
+# TERMINAL
+
+
+class ReplayConnection:
+    """
+    Stand-in for a Netmiko connection answering from a `ReplayArchive`
+    """
+
+    def __init__(self, session: "ReplayTerminalSession") -> None:
+        self.session = session
+        self.device_type = session.archive.header.get(
+            "device_type", session.device_type
+        )
+
+    def __repr__(self) -> str:
+        return f"ReplayConnection({self.session.host})"
+
+    def find_prompt(self, *args, **kwargs) -> str:
+        return self.session.replay_entry("prompt", "")
+
+    def send_command(self, *args, **kwargs) -> str:
+        request = self.session.command_request(*args, **kwargs)
+        return self.session.replay_entry("command", request)
+
+    def send_config_set(self, *args, **kwargs) -> str:
+        return self.session.replay_entry("config", config_request(*args, **kwargs))
+
+    def write_channel(self, out_data: str) -> None:
+        return None
+
+    def is_alive(self) -> bool:
+        return True
+
+    def disconnect(self) -> None:
+        return None
+
+
+class ReplayTerminalSession(TerminalSession):
+    """
+    Terminal session recording to, or replaying from, a `ReplayArchive`.
+
+    `archive` is an archive or a filename, loaded when replaying and saved on
+    `disconnect` when recording.  Replays wait for the recorded latency
+    multiplied by `latency_scale`, so `0` answers immediately.
+    Passwords sent as commands, like the enable secret, are never recorded.
+    """
+
+    def __init__(
+        self,
+        host: HostT,
+        username: str = "",
+        password: str | None = None,
+        archive: ReplayArchive | str | None = None,
+        mode: ReplayMode = ReplayMode.REPLAY,
+        latency_scale: float = 0.0,
+        *args,
+        **kwargs,
+    ) -> None:
+        self.archive, self.filename = open_archive(archive, mode)
+        self.mode = mode
+        self.latency_scale = latency_scale
+        if mode == ReplayMode.REPLAY:
+            kwargs["engine"] = Engine.REPLAY
+            kwargs.setdefault("port", self.archive.header.get("port", 22))
+        super().__init__(host, username, password or "", *args, **kwargs)
+
+    @classmethod
+    def from_archive(
+        cls, archive: ReplayArchive | str, latency_scale: float = 0.0
+    ) -> Self:
+        """Replay session for the host the archive was recorded from"""
+        archive, filename = open_archive(archive, ReplayMode.REPLAY)
+        session = cls(archive.header.get("host", ""), archive=archive)
+        session.filename = filename
+        session.latency_scale = latency_scale
+        return session
+
+    def command_request(self, *args, **kwargs) -> str:
+        """Archive key of a `send_command` call, with secrets redacted"""
+        command = kwargs.get("command_string", args[0] if args else None)
+        if command is None:
+            return REDACTED_REQUEST
+        return self.command_label(command)
+
+    def replay_entry(self, kind: str, request: str) -> str:
+        return replay(self.archive.next(kind, request), self.latency_scale)
+
+    def connect(self, *args, **kwargs) -> bool:
+        if self.mode == ReplayMode.RECORD:
+            connected = super().connect(*args, **kwargs)
+            if connected:
+                self.record_connection()
+            return connected
+
+        if isinstance(self.connection, ReplayConnection):
+            return True
+        sent_time = monotonic()
+        phases = dict(self.archive.header.get("phases", {}))
+        if self.latency_scale:
+            sleep(sum(phases.values()) * self.latency_scale)
+        self.connection = ReplayConnection(self)
+        self.log_connect(
+            self.connection,
+            ReplayTerminalSession.connect,
+            {"host": self.host, "port": self.port, "archive": self.filename},
+            sent_time,
+            phases,
+        )
+        return True
+
+    def record_connection(self) -> None:
+        """Wraps the methods of a new Netmiko connection to record them"""
+        connection = self.connection
+        if getattr(connection, "_netmagic_recorded", False):
+            return
+        connection.send_command = recorded(
+            self.archive, "command", connection.send_command, self.command_request
+        )
+        connection.find_prompt = recorded(
+            self.archive, "prompt", connection.find_prompt, lambda *a, **k: ""
+        )
+        connection.send_config_set = recorded(
+            self.archive, "config", connection.send_config_set, config_request
+        )
+        connection._netmagic_recorded = True
+
+        connect_response = self.connect_response
+        self.archive.header.update(
+            host=str(self.host),
+            port=self.port,
+            transport=self.transport.value,
+            recorded=datetime.now(UTC).isoformat(),
+            phases=connect_response.phases if connect_response else {},
+        )
+
+    def save(self, filename: str | None = None) -> str:
+        """Writes the archive, to the session's filename by default"""
+        filename = filename or self.filename
+        if not filename:
+            raise ValueError("No filename to save the replay archive to")
+        if self.mode == ReplayMode.RECORD and self.connection is not None:
+            self.archive.header["device_type"] = self.connection.device_type
+        return self.archive.save(filename)
+
+    def disconnect(self) -> None:
+        if self.mode == ReplayMode.RECORD and self.filename and self.archive.entries:
+            self.save()
+        super().disconnect()
+
+
+# NETCONF
+
+
+class ReplayManager:
+    """
+    Stand-in for an `ncclient` manager answering from a `ReplayArchive`
+    """
+
+    def __init__(self, session: "ReplayNETCONFSession") -> None:
+        self.session = session
+        self.connected = True
+        self.server_capabilities = session.archive.header.get("capabilities", [])
+
+    def __repr__(self) -> str:
+        return f"ReplayManager({self.session.host})"
+
+    def close_session(self) -> None:
+        self.connected = False
+
+
+def rpc_request(operation: str, rpc_filter: object | None) -> str:
+    """Archive key of an RPC: the operation and its filter as text"""
+    if rpc_filter is None:
+        return operation
+    if isinstance(rpc_filter, (tuple, list)):
+        text = " ".join(str(part) for part in rpc_filter)
+    elif hasattr(rpc_filter, "tag"):
+        text = to_xml(rpc_filter)
+    else:
+        text = str(rpc_filter)
+    return f"{operation} {text}"
+
+
+class ReplayNETCONFSession(NETCONFSession):
+    """
+    NETCONF session recording to, or replaying from, a `ReplayArchive`.
+    Every RPC is keyed by its operation and filter, see `ReplayTerminalSession`.
+    """
+
+    def __init__(
+        self,
+        host: HostT,
+        username: str = "",
+        password: str | None = None,
+        archive: ReplayArchive | str | None = None,
+        mode: ReplayMode = ReplayMode.REPLAY,
+        latency_scale: float = 0.0,
+        *args,
+        **kwargs,
+    ) -> None:
+        self.archive, self.filename = open_archive(archive, mode)
+        self.mode = mode
+        self.latency_scale = latency_scale
+        if mode == ReplayMode.REPLAY:
+            kwargs.setdefault("port", self.archive.header.get("port", 830))
+        super().__init__(host, username, password or "", *args, **kwargs)
+
+    @classmethod
+    def from_archive(
+        cls, archive: ReplayArchive | str, latency_scale: float = 0.0
+    ) -> Self:
+        """Replay session for the host the archive was recorded from"""
+        archive, filename = open_archive(archive, ReplayMode.REPLAY)
+        session = cls(archive.header.get("host", ""), archive=archive)
+        session.filename = filename
+        session.latency_scale = latency_scale
+        return session
+
+    def connect(self, *args, **kwargs) -> bool:
+        if self.mode == ReplayMode.RECORD:
+            connected = super().connect(*args, **kwargs)
+            if connected:
+                connect_response = self.connect_response
+                self.archive.header.update(
+                    host=str(self.host),
+                    port=self.port,
+                    transport=self.transport.value,
+                    recorded=datetime.now(UTC).isoformat(),
+                    phases=connect_response.phases if connect_response else {},
+                    capabilities=[str(i) for i in self.connection.server_capabilities],
+                )
+            return connected
+
+        if self.check_session():
+            return True
+        sent_time = monotonic()
+        phases = dict(self.archive.header.get("phases", {}))
+        if self.latency_scale:
+            sleep(sum(phases.values()) * self.latency_scale)
+        self.connection = ReplayManager(self)
+        self.log_connect(
+            self.connection,
+            ReplayNETCONFSession.connect,
+            {"host": self.host, "port": self.port, "archive": self.filename},
+            sent_time,
+            phases,
+        )
+        return True
+
+    def rpc(
+        self,
+        operation: str,
+        request: Callable[[Any], str],
+        rpc_filter: object | None = None,
+        max_tries: int = 1,
+    ) -> NETCONFResponse:
+        key = rpc_request(operation, rpc_filter)
+        if self.mode == ReplayMode.RECORD:
+            request = recorded(self.archive, "rpc", request, lambda *a, **k: key)
+            return super().rpc(operation, request, rpc_filter, max_tries)
+
+        def replay_request(connection: ReplayManager) -> str:
+            return replay(self.archive.next("rpc", key), self.latency_scale)
+
+        return super().rpc(operation, replay_request, rpc_filter, max_tries)
+
+    def save(self, filename: str | None = None) -> str:
+        """Writes the archive, to the session's filename by default"""
+        filename = filename or self.filename
+        if not filename:
+            raise ValueError("No filename to save the replay archive to")
+        return self.archive.save(filename)
+
+    def disconnect(self) -> None:
+        if self.mode == ReplayMode.RECORD and self.filename and self.archive.entries:
+            self.save()
+        super().disconnect()
@@ -1,22 +1,348 @@
 # NetMagic RESTCONF Session
 
+# Python Modules
+from base64 import b64encode
+from codecs import getincrementaldecoder
+from collections.abc import Iterator
+from contextlib import contextmanager
+from http.client import HTTPConnection, HTTPException, HTTPSConnection
+from json import JSONDecodeError, JSONDecoder, dumps
+from queue import Empty, LifoQueue
+from re import compile, escape
+from ssl import CERT_NONE, create_default_context
+from time import monotonic
+from typing import Any
+from urllib.parse import quote, urlencode
+
 # Local Modules
+from netmagic.common import HostT, Transport, validate_max_tries
+from netmagic.common.classes import RESTCONFResponse
+from netmagic.common.metrics import record_response
 from netmagic.sessions.session import Session
 
+YANG_JSON = "application/yang-data+json"
+
+# Failures of a reused keep-alive socket, safe to retry on a fresh connection
+RETRY_ERRORS = (ConnectionError, TimeoutError, HTTPException)
+
+
+class HTTPConnectionPool:
+    """
+    Pool of persistent HTTP/1.1 connections to a single host.
+
+    Idle connections are reused most-recent first so keep-alive sockets stay
+    warm; at most `size` idle connections are retained.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        scheme: str = "https",
+        size: int = 4,
+        timeout: float = 30,
+        verify: bool = True,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.scheme = scheme
+        self.size = size
+        self.timeout = timeout
+        self.verify = verify
+        self.created = 0
+        self._idle: LifoQueue[HTTPConnection] = LifoQueue()
+
+        self.ssl_context = None
+        if scheme == "https":
+            self.ssl_context = create_default_context()
+            if not verify:
+                self.ssl_context.check_hostname = False
+                self.ssl_context.verify_mode = CERT_NONE
+
+    def __repr__(self) -> str:
+        return f"HTTPConnectionPool({self.scheme}://{self.host}:{self.port})"
+
+    @property
+    def idle(self) -> int:
+        return self._idle.qsize()
+
+    def new_connection(self) -> HTTPConnection:
+        self.created += 1
+        if self.scheme == "https":
+            return HTTPSConnection(
+                self.host, self.port, timeout=self.timeout, context=self.ssl_context
+            )
+        return HTTPConnection(self.host, self.port, timeout=self.timeout)
+
+    @contextmanager
+    def connection(self) -> Iterator[HTTPConnection]:
+        """
+        Borrow a connection, returning it to the pool unless it failed or
+        the server asked for it to be closed.
+        """
+        try:
+            connection = self._idle.get_nowait()
+        except Empty:
+            connection = self.new_connection()
+
+        try:
+            yield connection
+        except BaseException:
+            connection.close()
+            raise
+
+        if getattr(connection, "sock", None) is None or self.idle >= self.size:
+            connection.close()
+        else:
+            self._idle.put(connection)
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except Empty:
+                return
+
+
+def iter_json_array(chunks: Iterator[str], key: str) -> Iterator[Any]:
+    """
+    Incrementally decode the members of the first JSON array named `key`
+    (with or without a YANG module prefix) from a stream of text chunks.
+
+    Only the member currently being decoded is buffered, so large datastore
+    lists can be consumed without holding the whole document.
+    """
+    decoder = JSONDecoder()
+    key_pattern = compile(rf'"(?:[\w.-]+:)?{escape(key)}"\s*:\s*\[')
+    buffer = ""
+    exhausted = False
+
+    def read() -> bool:
+        nonlocal buffer, exhausted
+        chunk = next(chunks, None)
+        if chunk is None:
+            exhausted = True
+            return False
+        buffer += chunk
+        return True
+
+    # Locate the start of the array
+    while not (match := key_pattern.search(buffer)):
+        # Keep enough of the tail to match a key split across chunks
+        buffer = buffer[-(len(key) + 256) :]
+        if not read():
+            return
+    buffer = buffer[match.end() :]
+
+    while True:
+        position = 0
+        while position < len(buffer) and buffer[position] in " \t\r\n,":
+            position += 1
+        if position == len(buffer):
+            buffer = ""
+            if not read():
+                raise ValueError(f"Unterminated JSON array `{key}`")
+            continue
+        if buffer[position] == "]":
+            return
+
+        try:
+            item, end = decoder.raw_decode(buffer, position)
+        except JSONDecodeError:
+            if not read():
+                raise
+            continue
+
+        # A value ending exactly at the buffer edge may continue in the next chunk
+        if end == len(buffer) and not exhausted and read():
+            continue
+
+        yield item
+        buffer = buffer[end:]
+
 
 class RESTCONFSession(Session):
     """
-    Container for RESTCONF Session
+    Container for RESTCONF Session over pooled HTTP/1.1 keep-alive connections
     """
 
-    def __init__(self) -> None:
-        raise NotImplementedError("Feature is not yet implemented.")
-        # super().__init__()
+    def __init__(
+        self,
+        host: HostT,
+        username: str,
+        password: str,
+        port: int = 443,
+        connection: HTTPConnectionPool | None = None,
+        transport: Transport = Transport.RESTCONF,
+        scheme: str = "https",
+        root: str = "/restconf",
+        verify: bool = True,
+        timeout: float = 30,
+        pool_size: int = 4,
+        *args,
+        **kwargs,
+    ) -> None:
+        super().__init__(host, username, password, port, connection, transport)
+        self.scheme = scheme
+        self.root = root.rstrip("/")
+        self.verify = verify
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self.request_log: list[RESTCONFResponse] = []
+
+    def connect(self) -> bool:
+        """
+        Create the connection pool and confirm the RESTCONF root is reachable
+        with the session credentials.
+        """
+        if self.connection is None:
+            self.connection = HTTPConnectionPool(
+                str(self.host),
+                int(self.port),
+                self.scheme,
+                self.pool_size,
+                self.timeout,
+                self.verify,
+            )
+        response = self.request("GET", "", max_tries=1)
+        return bool(response.success)
 
-    def connect(self) -> None:
-        """Connect the RESTCONF session."""
-        super().connect()
+    def check_session(self) -> bool:
+        return isinstance(self.connection, HTTPConnectionPool)
 
     def disconnect(self) -> None:
-        """Disconnect the RESTCONF session."""
+        """Close every pooled connection; repeated calls are safe."""
+        if isinstance(self.connection, HTTPConnectionPool):
+            self.connection.close()
         super().disconnect()
+
+    def build_url(self, path: str, params: dict[str, Any] | None = None) -> str:
+        """
+        Build the request target for a path relative to the RESTCONF root,
+        such as `data/ietf-interfaces:interfaces`.
+        """
+        path = quote(path.strip("/"), safe="/:=,@-_.~")
+        url = f"{self.root}/{path}" if path else self.root
+        if params:
+            url = f"{url}?{urlencode(params)}"
+        return url
+
+    def headers(self, body: bool = False) -> dict[str, str]:
+        credentials = b64encode(f"{self.username}:{self.password}".encode()).decode()
+        headers = {
+            "Accept": YANG_JSON,
+            "Authorization": f"Basic {credentials}",
+            "Connection": "keep-alive",
+        }
+        if body:
+            headers["Content-Type"] = YANG_JSON
+        return headers
+
+    @validate_max_tries
+    def request(
+        self,
+        method: str,
+        path: str,
+        data: Any = None,
+        params: dict[str, Any] | None = None,
+        max_tries: int = 3,
+    ) -> RESTCONFResponse:
+        """
+        Send a RESTCONF request with a JSON body and return the response text.
+
+        Failures of a pooled keep-alive socket are retried on a new connection
+        up to `max_tries`; HTTP error statuses are returned, not retried.
+        """
+        if not self.check_session() and not self.connect():
+            raise AttributeError("Unable to connect a RESTCONF session")
+
+        url = self.build_url(path, params)
+        body = dumps(data) if data is not None else None
+        headers = self.headers(body is not None)
+
+        response: str | Exception
+        status = None
+        sent_time = monotonic()
+        for attempt in range(max_tries):
+            try:
+                with self.connection.connection() as connection:
+                    connection.request(method, url, body, headers)
+                    reply = connection.getresponse()
+                    response = reply.read().decode("utf-8")
+                    status = reply.status
+                break
+            except RETRY_ERRORS as error:
+                response = error
+
+        result = RESTCONFResponse(
+            response=response,
+            method=method,
+            path=url,
+            status=status,
+            sent_time=sent_time,
+            session=self,
+            attempts=attempt + 1,
+        )
+        self.request_log.append(result)
+        # HTTP error statuses are replies, not exceptions, so label them apart
+        outcome = f"http_{status}" if status is not None and status >= 300 else None
+        record_response(
+            result, self.host, self.transport.value, f"{method} {path}", outcome
+        )
+        return result
+
+    def get(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        max_tries: int = 3,
+    ) -> RESTCONFResponse:
+        """Read a datastore resource, e.g. `data/ietf-interfaces:interfaces`."""
+        return self.request("GET", path, params=params, max_tries=max_tries)
+
+    def put(self, path: str, data: Any, max_tries: int = 1) -> RESTCONFResponse:
+        """Create or replace the target resource."""
+        return self.request("PUT", path, data, max_tries=max_tries)
+
+    def patch(self, path: str, data: Any, max_tries: int = 1) -> RESTCONFResponse:
+        """Merge `data` into the target resource."""
+        return self.request("PATCH", path, data, max_tries=max_tries)
+
+    def stream(
+        self,
+        path: str,
+        key: str,
+        params: dict[str, Any] | None = None,
+        chunk_size: int = 65536,
+    ) -> Iterator[Any]:
+        """
+        Yield the members of list `key` from a GET of `path` as they are
+        decoded, without reading the whole reply into memory.
+
+        Streamed reads are not added to `request_log`.
+        """
+        if not self.check_session() and not self.connect():
+            raise AttributeError("Unable to connect a RESTCONF session")
+
+        with self.connection.connection() as connection:
+            connection.request(
+                "GET", self.build_url(path, params), None, self.headers()
+            )
+            reply = connection.getresponse()
+            if reply.status >= 300:
+                message = reply.read().decode("utf-8", errors="replace")
+                raise ConnectionError(
+                    f"RESTCONF GET {path} failed with {reply.status}: {message}"
+                )
+
+            decoder = getincrementaldecoder("utf-8")()
+
+            def chunks() -> Iterator[str]:
+                while data := reply.read(chunk_size):
+                    yield decoder.decode(data)
+                yield decoder.decode(b"", final=True)
+
+            yield from iter_json_array(chunks(), key)
+            # Drain the remainder so the connection can be reused
+            while reply.read(chunk_size):
+                pass
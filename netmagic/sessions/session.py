@@ -1,10 +1,17 @@
 # Project NetMagic Base Session Module
 
 # Python Modules
+from collections.abc import Callable
+from time import monotonic
 from typing import Any
 
 # Local Modules
 from netmagic.common import HostT, Transport
+from netmagic.common.classes import ConnectResponse
+from netmagic.common.classes.responses import TimeT
+
+# Connection parameters which are never kept on a `ConnectResponse`
+SECRET_PARAMS = ("password", "secret", "passphrase", "pkey")
 
 
 class Session:
@@ -29,6 +36,38 @@ class Session:
         self.host = host
         self.port = port
         self.transport = transport
+        self.connect_log: list[ConnectResponse] = []
+
+    @property
+    def connect_response(self) -> ConnectResponse | None:
+        """The most recent connection attempt"""
+        return self.connect_log[-1] if self.connect_log else None
+
+    def log_connect(
+        self,
+        response: Any,
+        method: Callable,
+        params: dict[str, Any],
+        sent_time: TimeT,
+        phases: dict[str, float] | None = None,
+        attempts: int = 1,
+    ) -> ConnectResponse:
+        """
+        Record a connection attempt, leaving credentials out of its params
+        """
+        connect_response = ConnectResponse(
+            response,
+            method,
+            {k: v for k, v in params.items() if k not in SECRET_PARAMS},
+            sent_time,
+            monotonic(),
+            phases,
+            attempts,
+            self.host,
+            self.port,
+        )
+        self.connect_log.append(connect_response)
+        return connect_response
 
     def connect(self) -> None:
         pass
@@ -0,0 +1,289 @@
+# NetMagic NETCONF Notification Subscriptions
+
+# Python Modules
+from asyncio import to_thread
+from collections.abc import AsyncIterator, Callable, Iterator
+from datetime import UTC, datetime
+from queue import Empty, Queue
+from re import findall, sub
+from threading import Event, Thread
+from typing import TYPE_CHECKING, Any, Self
+
+# Third-Party Modules
+from defusedxml.ElementTree import fromstring
+from ncclient.xml_ import to_ele
+
+# Local Modules
+from netmagic.common.classes import NETCONFResponse
+
+if TYPE_CHECKING:
+    from xml.etree.ElementTree import Element  # nosec B405
+
+    from netmagic.sessions.netconf import NETCONFSession
+
+NOTIFICATION_CAPABILITY = "urn:ietf:params:netconf:capability:notification:1.0"
+SUBSCRIBED_NOTIFICATIONS_NAMESPACE = (
+    "urn:ietf:params:xml:ns:yang:ietf-subscribed-notifications"
+)
+YANG_PUSH_NAMESPACE = "urn:ietf:params:xml:ns:yang:ietf-yang-push"
+DATASTORES_NAMESPACE = "urn:ietf:params:xml:ns:yang:ietf-datastores"
+
+# Namespaces of the usual prefixes of IETF modules in subscription xpaths
+XPATH_NAMESPACES = {
+    "if": "urn:ietf:params:xml:ns:yang:ietf-interfaces",
+    "ip": "urn:ietf:params:xml:ns:yang:ietf-ip",
+    "rt": "urn:ietf:params:xml:ns:yang:ietf-routing",
+    "sys": "urn:ietf:params:xml:ns:yang:ietf-system",
+    "hw": "urn:ietf:params:xml:ns:yang:ietf-hardware",
+}
+
+
+def local_name(element: "Element") -> str:
+    return element.tag.rpartition("}")[2]
+
+
+def xpath_prefixes(xpath: str) -> list[str]:
+    """The namespace prefixes of an xpath's node names, in order of use"""
+    # Quoted literals may hold colons which are not prefixes
+    names = sub(r"'[^']*'|\"[^\"]*\"", "", xpath)
+    prefixes = findall(r"(?<![\w.-])([A-Za-z_][\w.-]*):(?!:)", names)
+    return list(dict.fromkeys(prefixes))
+
+
+def build_establish_subscription(
+    xpath: str,
+    datastore: str = "ds:operational",
+    period: int | None = None,
+    on_change: bool = False,
+    namespaces: dict[str, str] | None = None,
+) -> str:
+    """
+    Build a YANG-push `establish-subscription` RPC body (RFC 8639/8641).
+    `period` is in centiseconds and takes precedence over `on_change`.
+    Each prefix of the xpath is declared with its namespace from
+    `namespaces`, or from `XPATH_NAMESPACES` for the usual IETF prefixes.
+    """
+    namespaces = {**XPATH_NAMESPACES, **(namespaces or {})}
+    for value in (xpath, datastore):
+        if any(char in value for char in "<>&"):
+            raise ValueError(f"Invalid characters in subscription value: {value}")
+    # Namespaces are attribute values, so quotes are not allowed either
+    for value in namespaces.values():
+        if any(char in value for char in '<>&"'):
+            raise ValueError(f"Invalid characters in subscription value: {value}")
+
+    declarations = ""
+    for prefix in xpath_prefixes(xpath):
+        if prefix not in namespaces:
+            raise ValueError(
+                f"Unknown namespace of xpath prefix `{prefix}`, pass it in `namespaces`"
+            )
+        declarations += f' xmlns:{prefix}="{namespaces[prefix]}"'
+
+    if period is not None:
+        trigger = f"<yp:periodic><yp:period>{int(period)}</yp:period></yp:periodic>"
+    elif on_change:
+        trigger = "<yp:on-change/>"
+    else:
+        raise ValueError("YANG-push subscriptions require `period` or `on_change`")
+
+    return (
+        f'<establish-subscription xmlns="{SUBSCRIBED_NOTIFICATIONS_NAMESPACE}" '
+        f'xmlns:yp="{YANG_PUSH_NAMESPACE}" xmlns:ds="{DATASTORES_NAMESPACE}">'
+        f"<yp:datastore>{datastore}</yp:datastore>"
+        f"<yp:datastore-xpath-filter{declarations}>{xpath}"
+        "</yp:datastore-xpath-filter>"
+        f"{trigger}</establish-subscription>"
+    )
+
+
+def build_delete_subscription(subscription_id: int) -> str:
+    """Build a `delete-subscription` RPC body for a subscription id (RFC 8639)"""
+    return (
+        f'<delete-subscription xmlns="{SUBSCRIBED_NOTIFICATIONS_NAMESPACE}">'
+        f"<id>{int(subscription_id)}</id></delete-subscription>"
+    )
+
+
+class NETCONFNotification:
+    """
+    A parsed NETCONF `<notification>` with its event time and event name
+    """
+
+    def __init__(self, xml: str, received_time: datetime | None = None) -> None:
+        self.xml = xml
+        self.received_time = received_time or datetime.now(UTC)
+        self.element = fromstring(xml)
+
+        self.event_time: datetime | None = None
+        self.event = None
+        for child in self.element:
+            if local_name(child) == "eventTime":
+                self.event_time = datetime.fromisoformat(child.text.strip())
+            elif self.event is None:
+                self.event = child
+
+        self.name = local_name(self.event) if self.event is not None else None
+
+        # YANG-push updates carry the id of the subscription which produced them
+        self.subscription_id: int | None = None
+        if self.event is not None:
+            for child in self.event:
+                if local_name(child) == "id" and child.text:
+                    self.subscription_id = int(child.text)
+                    break
+
+    def __repr__(self) -> str:
+        return f"Notification({self.name} @ {self.event_time})"
+
+
+class NETCONFSubscription:
+    """
+    Background reader delivering notifications from a subscribed `NETCONFSession`.
+
+    Notifications are passed to `callback` when one is provided and queued for
+    iteration otherwise.  Exceptions raised by the callback are collected in
+    `errors` so a single bad notification does not stop the reader.  An error
+    reading from the session (such as a dropped transport) ends the reader
+    and is collected in `errors` as well; iterators are always released.
+    """
+
+    _stop_marker = object()
+
+    def __init__(
+        self,
+        session: "NETCONFSession",
+        response: NETCONFResponse,
+        callback: Callable[[NETCONFNotification], None] | None = None,
+        poll_interval: float = 1.0,
+    ) -> None:
+        self.session = session
+        self.response = response
+        self.callback = callback
+        self.poll_interval = poll_interval
+        self.errors: list[Exception] = []
+        self.received = 0
+        self.delete_response: NETCONFResponse | None = None
+
+        self.subscription_id: int | None = None
+        if isinstance(response.response, str):
+            reply = fromstring(response.response)
+            for element in reply.iter():
+                if local_name(element) == "id" and element.text:
+                    self.subscription_id = int(element.text)
+                    break
+
+        self._queue: Queue[Any] = Queue()
+        self._stopped = Event()
+        self._thread = Thread(
+            target=self._read,
+            name=f"netconf-notifications-{session.host}",
+            daemon=True,
+        )
+
+    def __repr__(self) -> str:
+        return f"Subscription({self.session.host}): {self.response.operation}"
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    @property
+    def active(self) -> bool:
+        return self._thread.is_alive() and not self._stopped.is_set()
+
+    def start(self) -> Self:
+        if not self._thread.is_alive():
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: float | None = None) -> None:
+        """
+        Stop the reader, delete a YANG-push subscription on the server and
+        release any blocked iterators.
+        """
+        self._stopped.set()
+        if self._thread.is_alive():
+            self._thread.join(timeout)
+        self.delete()
+        self._queue.put(self._stop_marker)
+
+    def delete(self) -> NETCONFResponse | None:
+        """
+        Send `delete-subscription` for an established YANG-push subscription,
+        once, while its session is up.  RFC 5277 subscriptions can not be
+        deleted and end with their session.
+        """
+        if (
+            self.delete_response is not None
+            or self.subscription_id is None
+            or self.response.operation != "establish-subscription"
+            or not self.session.check_session()
+        ):
+            return self.delete_response
+
+        rpc = build_delete_subscription(self.subscription_id)
+        self.delete_response = self.session.rpc(
+            "delete-subscription",
+            lambda connection: connection.dispatch(to_ele(rpc)).xml,
+        )
+        return self.delete_response
+
+    def _read(self) -> None:
+        try:
+            while not self._stopped.is_set():
+                connection = self.session.connection
+                if connection is None or not getattr(connection, "connected", False):
+                    break
+                raw = connection.take_notification(
+                    block=True, timeout=self.poll_interval
+                )
+                if raw is None:
+                    continue
+                self._deliver(raw)
+        # The session failing ends the subscription, kept for the caller
+        except Exception as error:  # noqa: BLE001
+            self.errors.append(error)
+        finally:
+            self._queue.put(self._stop_marker)
+
+    def _deliver(self, raw: Any) -> None:
+        try:
+            notification = NETCONFNotification(raw.notification_xml)
+        except Exception as error:  # noqa: BLE001
+            self.errors.append(error)
+            return
+        self.received += 1
+
+        if self.callback is None:
+            self._queue.put(notification)
+            return
+        try:
+            self.callback(notification)
+        except Exception as error:  # noqa: BLE001
+            self.errors.append(error)
+
+    def get(self, timeout: float | None = None) -> NETCONFNotification | None:
+        """
+        Wait for the next queued notification, returning `None` on timeout
+        or once the subscription has stopped.
+        """
+        try:
+            notification = self._queue.get(timeout=timeout)
+        except Empty:
+            return None
+        if notification is self._stop_marker:
+            # Leave the marker for any other consumers
+            self._queue.put(notification)
+            return None
+        return notification
+
+    def __iter__(self) -> Iterator[NETCONFNotification]:
+        while (notification := self.get()) is not None:
+            yield notification
+
+    async def __aiter__(self) -> AsyncIterator[NETCONFNotification]:
+        while (notification := await to_thread(self.get)) is not None:
+            yield notification
@@ -1,8 +1,7 @@
 # Project NetMagic Terminal Session Module
 
 # Python Modules
-from datetime import UTC, datetime
-from time import sleep
+from time import monotonic, sleep
 
 # Third-Party Modules
 from netmiko import (
@@ -13,15 +12,24 @@ from netmiko import (
 
 from netmagic.common import Engine, HostT, KwDict, Transport, validate_max_tries
 from netmagic.common.classes import CommandResponse
+from netmagic.common.metrics import record_response
+from netmagic.common.spool import OutputSpool
+from netmagic.common.tracing import SPAN_KIND_CLIENT, span
 from netmagic.handlers import netmiko_connect, serial_connect
 
 # Local Modules
 from netmagic.sessions.session import Session
 
+# Label of a command which is the session's password or enable secret
+REDACTED_COMMAND = "<secret>"
+
 
 class TerminalSession(Session):
     """
     Container for Terminal-based CLI session on SSH, Telnet, serial, etc.
+
+    With a `spool`, command outputs over its threshold are written to the spool
+    file and responses keep a memory-mapped handle in their place.
     """
 
     def __init__(
@@ -35,11 +43,13 @@ class TerminalSession(Session):
         port: int = 22,
         engine: Engine = Engine.NETMIKO,
         transport: Transport = Transport.SSH,
+        spool: OutputSpool | None = None,
         *args,
         **kwargs,
     ) -> None:
         super().__init__(host, username, password, port, connection, transport)
         self.secret = secret
+        self.spool = spool
         self.engine = engine
         self.device_type = device_type
 
@@ -97,19 +107,66 @@ class TerminalSession(Session):
         if connect_kwargs:
             local_connection_kwargs.update(connect_kwargs)
 
+        span_attributes = {
+            "host": str(self.host),
+            "port": self.port,
+            "transport": self.transport.value,
+        }
+
         # Serial is not reconnected the same way and bypasses logic
         if self.transport == Transport.SERIAL:
-            self.connection = serial_connect(**local_connection_kwargs)
+            sent_time = monotonic()
+            with span("terminal.connect", SPAN_KIND_CLIENT, **span_attributes):
+                self.connection = serial_connect(**local_connection_kwargs)
+            self.log_connect(
+                self.connection, serial_connect, local_connection_kwargs, sent_time
+            )
             return True
 
         for attempt in range(max_tries):
-            try:
-                self.connection = netmiko_connect(**local_connection_kwargs)
+            # Filled by `netmiko_connect` with the time of each connect phase
+            phases: dict[str, float] = {}
+            sent_time = monotonic()
+            with span(
+                "terminal.connect",
+                SPAN_KIND_CLIENT,
+                attempt=attempt + 1,
+                **span_attributes,
+            ) as connect_span:
+                try:
+                    self.connection = netmiko_connect(
+                        phases=phases, **local_connection_kwargs
+                    )
+                    result = self.connection
+                except NetmikoAuthenticationException as error:
+                    connect_span.record_exception(error)
+                    self.connection = None
+                    result = error
+                except Exception as error:
+                    self.log_connect(
+                        error,
+                        netmiko_connect,
+                        local_connection_kwargs,
+                        sent_time,
+                        phases,
+                        attempt + 1,
+                    )
+                    raise
+                for phase, seconds in phases.items():
+                    connect_span.set_attribute(f"phase.{phase}", seconds)
+
+            self.log_connect(
+                result,
+                netmiko_connect,
+                local_connection_kwargs,
+                sent_time,
+                phases,
+                attempt + 1,
+            )
+            if self.connection is not None:
                 return True
-            except NetmikoAuthenticationException:
-                self.connection = None
-                if attempt + 1 < max_tries:
-                    sleep(5)
+            if attempt + 1 < max_tries:
+                sleep(5)
         return False
 
     def disconnect(self):
@@ -150,6 +207,17 @@ class TerminalSession(Session):
 
     # COMMANDS
 
+    def command_label(self, command_string: str | list[str]) -> str:
+        """
+        The command as it is recorded outside the session, in metrics, spans
+        and archives, with the session's password or secret redacted
+        """
+        if isinstance(command_string, str):
+            if command_string in {self.password, self.secret} - {"", None}:
+                return REDACTED_COMMAND
+            return command_string
+        return "\n".join(command_string)
+
     @validate_max_tries
     def command(
         self,
@@ -183,7 +251,7 @@ class TerminalSession(Session):
 
         response_kwargs = {
             **base_kwargs,
-            "sent_time": datetime.now(UTC),
+            "sent_time": monotonic(),
             "session": self,
         }
 
@@ -199,18 +267,42 @@ class TerminalSession(Session):
             return response
 
         # Begin execution
-        for i in range(max_tries):
-            try:
-                output = self.connection.send_command(*args, **command_kwargs)
-            except (OSError, ReadTimeout) as e:
-                output = e
-
-            response = CommandResponse(output, **response_kwargs, attempts=i + 1)
-            self.command_log.append(response)
-
-            if isinstance(response.response, str):
-                break
-            if isinstance(response.response, Exception) and not self.check_session():
-                raise AttributeError(no_session_string)
-
+        with span(
+            "terminal.command",
+            SPAN_KIND_CLIENT,
+            host=str(self.host),
+            command=self.command_label(command_string),
+        ) as command_span:
+            for i in range(max_tries):
+                # Netmiko writes the command and reads to the prompt in one call
+                with span("terminal.send_command", attempt=i + 1) as send_span:
+                    try:
+                        output = self.connection.send_command(*args, **command_kwargs)
+                    except (OSError, ReadTimeout) as e:
+                        output = e
+                        send_span.record_exception(e)
+
+                if isinstance(output, str):
+                    command_span.set_attribute("output.length", len(output))
+                    if self.spool is not None:
+                        output = self.spool.spill(output)
+
+                response = CommandResponse(output, **response_kwargs, attempts=i + 1)
+                self.command_log.append(response)
+
+                if response.success:
+                    break
+                if (
+                    isinstance(response.response, Exception)
+                    and not self.check_session()
+                ):
+                    raise AttributeError(no_session_string)
+            command_span.set_attribute("attempts", i + 1)
+
+        record_response(
+            response,
+            self.host,
+            self.transport.value,
+            self.command_label(command_string),
+        )
         return response
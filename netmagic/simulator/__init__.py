@@ -0,0 +1,30 @@
+"""
+NetMagic Device Simulator
+
+Local SSH stand-ins for Cisco IOS, Brocade FastIron and IOS-XR devices, for
+load testing sessions without hardware.  Run a fleet from the command line
+with `python -m netmagic.simulator`.
+"""
+
+from netmagic.simulator.profiles import (
+    BROCADE_FASTIRON,
+    CISCO_IOS,
+    CISCO_XR,
+    PROFILES,
+    Command,
+    DeviceProfile,
+    OutputSizes,
+)
+from netmagic.simulator.server import DeviceSimulator, SimulatedDevice
+
+__all__ = [
+    "BROCADE_FASTIRON",
+    "CISCO_IOS",
+    "CISCO_XR",
+    "PROFILES",
+    "Command",
+    "DeviceProfile",
+    "DeviceSimulator",
+    "OutputSizes",
+    "SimulatedDevice",
+]
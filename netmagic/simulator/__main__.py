@@ -0,0 +1,48 @@
+# NetMagic Device Simulator Entry Point
+
+# Python Modules
+from argparse import ArgumentParser
+
+# Local Modules
+from netmagic.simulator.profiles import PROFILES, OutputSizes
+from netmagic.simulator.server import DeviceSimulator
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = ArgumentParser(description="Serve simulated network devices over SSH")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="cisco_ios")
+    parser.add_argument("--count", type=int, default=1)
+    parser.add_argument(
+        "--start-port",
+        type=int,
+        default=0,
+        help="first of consecutive ports, any free ports when 0",
+    )
+    parser.add_argument("--address", default="127.0.0.1")
+    parser.add_argument("--username", default="admin")
+    parser.add_argument("--password", default="admin")
+    parser.add_argument("--enable-secret", help="start sessions in user mode")
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--interfaces", type=int, default=48)
+    parser.add_argument("--mac-addresses", type=int, default=500)
+    parser.add_argument("--neighbors", type=int, default=4)
+    args = parser.parse_args(argv)
+
+    simulator = DeviceSimulator(args.address, args.username, args.password)
+    devices = simulator.add_devices(
+        PROFILES[args.profile],
+        args.count,
+        args.start_port,
+        sizes=OutputSizes(args.interfaces, args.mac_addresses, args.neighbors),
+        enable_secret=args.enable_secret,
+        latency=args.latency,
+        jitter=args.jitter,
+    )
+    for device in devices:
+        print(f"{device.hostname} {device.host}:{device.port}")
+    simulator.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,275 @@
+# NetMagic Simulator Profiles
+
+# Python Modules
+from collections.abc import Callable
+from functools import lru_cache
+from re import IGNORECASE, Match, Pattern, compile
+
+# Local Modules
+from netmagic.benchmarks.parsers import (
+    brocade_int,
+    brocade_interface,
+    brocade_lldp,
+    brocade_mac_table,
+    brocade_media,
+    brocade_optic,
+    brocade_poe,
+    brocade_run_vlans,
+    brocade_single_int,
+    brocade_tdr,
+    cisco_int_desc,
+    cisco_int_status,
+    cisco_int_trans_det,
+    cisco_interface,
+    cisco_lldp,
+    cisco_mac_table,
+    cisco_poe,
+    cisco_run_vlans,
+    cisco_tdr,
+    xr_interface,
+    xr_interface_stats,
+)
+
+type Handler = Callable[["OutputSizes", str, Match], str]
+
+
+class OutputSizes:
+    """
+    Number of entries in the simulated command outputs
+    """
+
+    def __init__(
+        self, interfaces: int = 48, mac_addresses: int = 500, neighbors: int = 4
+    ) -> None:
+        self.interfaces = interfaces
+        self.mac_addresses = mac_addresses
+        self.neighbors = neighbors
+
+    def __repr__(self) -> str:
+        return (
+            f"OutputSizes(interfaces={self.interfaces}, "
+            f"mac_addresses={self.mac_addresses}, neighbors={self.neighbors})"
+        )
+
+
+@lru_cache(maxsize=256)
+def generated(generator: Callable[[int], str | list[str]], count: int) -> str:
+    """
+    Returns synthetic output, shared by every simulated device asking for the
+    same generator and size
+    """
+    output = generator(count)
+    return output if isinstance(output, str) else output[0]
+
+
+def sized(generator: Callable[[int], str], size: str) -> Handler:
+    """Handler returning `generator` output with one of the `OutputSizes`"""
+    return lambda sizes, hostname, match: generated(generator, getattr(sizes, size))
+
+
+def single(generator: Callable[[int], str], first_interface: str) -> Handler:
+    """Handler returning the output of one entry, renamed to the interface asked"""
+    return lambda sizes, hostname, match: generated(generator, 1).replace(
+        first_interface, match.group(1), 1
+    )
+
+
+def fixed(output: str) -> Handler:
+    """Handler returning `output`, formatted with the hostname"""
+    return lambda sizes, hostname, match: output.format(hostname=hostname)
+
+
+def running_config(generator: Callable[[int], str]) -> Handler:
+    def handler(sizes: OutputSizes, hostname: str, match: Match) -> str:
+        config = generated(generator, sizes.interfaces)
+        return config.replace("\n!\n", f"\n!\nhostname {hostname}\n!\n", 1)
+
+    return handler
+
+
+class Command:
+    """
+    Simulated command, matched against the whole line sent by the client.
+    `privileged` commands are rejected outside of enable mode.
+    """
+
+    def __init__(self, pattern: str, handler: Handler, privileged: bool = False):
+        self.pattern: Pattern = compile(pattern, IGNORECASE)
+        self.handler = handler
+        self.privileged = privileged
+
+    def __repr__(self) -> str:
+        return f"Command({self.pattern.pattern})"
+
+
+class DeviceProfile:
+    """
+    Prompts, paging behaviour, error messages and commands of one platform.
+
+    Prompt formats take the `hostname`; `page_length` is the default number of
+    lines before the `more` prompt, until paging is disabled by a command in
+    `paging_commands` (a `terminal length` of 0 on Cisco platforms).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        user_prompt: str,
+        enable_prompt: str,
+        config_prompt: str,
+        more_prompt: str,
+        invalid_input: str,
+        commands: list[Command],
+        paging_commands: tuple[str, ...] = (),
+        page_length: int = 24,
+        access_denied: str = "% Access denied",
+        banner: str = "",
+        timestamp: bool = False,
+    ) -> None:
+        self.name = name
+        self.user_prompt = user_prompt
+        self.enable_prompt = enable_prompt
+        self.config_prompt = config_prompt
+        self.more_prompt = more_prompt
+        self.invalid_input = invalid_input
+        self.commands = commands
+        self.paging_commands = paging_commands
+        self.page_length = page_length
+        self.access_denied = access_denied
+        self.banner = banner
+        self.timestamp = timestamp
+
+    def __repr__(self) -> str:
+        return f"DeviceProfile({self.name})"
+
+    def find_command(self, line: str) -> tuple[Command, Match] | None:
+        for command in self.commands:
+            if match := command.pattern.fullmatch(line):
+                return command, match
+        return None
+
+
+RUNNING_CONFIG = r"show run(?:ning-config)?"
+INCLUDE_HOSTNAME = rf"{RUNNING_CONFIG} \| i(?:nclude)? hostname"
+IOS_INVALID_INPUT = "                   ^\n% Invalid input detected at '^' marker.\n"
+
+CISCO_IOS = DeviceProfile(
+    "cisco_ios",
+    user_prompt="{hostname}>",
+    enable_prompt="{hostname}#",
+    config_prompt="{hostname}(config)#",
+    more_prompt=" --More-- ",
+    invalid_input=IOS_INVALID_INPUT,
+    paging_commands=("terminal length",),
+    banner="\nUnauthorized access is prohibited\n\n",
+    commands=[
+        Command(r"show int\S* status", sized(cisco_int_status, "interfaces")),
+        Command(r"show int\S* desc\S*", sized(cisco_int_desc, "interfaces")),
+        Command(
+            r"show int\S* transceiver detail",
+            sized(cisco_int_trans_det, "interfaces"),
+        ),
+        Command(r"show lldp nei\S* detail", sized(cisco_lldp, "neighbors")),
+        Command(r"show mac address-table.*", sized(cisco_mac_table, "mac_addresses")),
+        Command(r"show power inline.*", sized(cisco_poe, "interfaces")),
+        Command(INCLUDE_HOSTNAME, fixed("hostname {hostname}"), privileged=True),
+        Command(RUNNING_CONFIG, running_config(cisco_run_vlans), privileged=True),
+        Command(
+            r"test cable-diagnostics tdr int\S* (\S+)",
+            lambda sizes, hostname, match: (
+                f"TDR test started on interface {match.group(1)}\n"
+                "A TDR test can take a few seconds to run on an interface\n"
+                "Use 'show cable-diagnostics tdr' to read the TDR results."
+            ),
+            privileged=True,
+        ),
+        Command(
+            r"show cable-diagnostics tdr int\S* (\S+)",
+            single(cisco_tdr, cisco_interface(0)),
+        ),
+        Command(
+            r"show ver\S*",
+            fixed(
+                "Cisco IOS Software, C2960X Software (C2960X-UNIVERSALK9-M), "
+                "Version 15.2(7)E4, RELEASE SOFTWARE (fc2)\n"
+                "{hostname} uptime is 1 week, 2 days, 3 hours, 4 minutes\n"
+                'System image file is "flash:c2960x-universalk9-mz.152-7.E4.bin"'
+            ),
+        ),
+    ],
+)
+
+BROCADE_FASTIRON = DeviceProfile(
+    "brocade_fastiron",
+    user_prompt="SSH@{hostname}>",
+    enable_prompt="SSH@{hostname}#",
+    config_prompt="SSH@{hostname}(config)#",
+    more_prompt="--More--, next page: Space, next line: Return key, quit: Control-c",
+    invalid_input="Invalid input -> {command}\nType ? for a list\n",
+    paging_commands=("skip-page-display",),
+    access_denied="Error - Incorrect username or password.",
+    commands=[
+        Command(r"show int\S* br\S*(?: wide)?", sized(brocade_int, "interfaces")),
+        Command(
+            r"show int\S* e\S* (\S+)",
+            single(brocade_single_int, brocade_interface(0)),
+        ),
+        Command(r"show media.*", sized(brocade_media, "interfaces")),
+        Command(r"show optic (\S+)", single(brocade_optic, brocade_interface(0))),
+        Command(r"show lldp nei\S* detail", sized(brocade_lldp, "neighbors")),
+        Command(r"show mac-address.*", sized(brocade_mac_table, "mac_addresses")),
+        Command(r"show poe.*", sized(brocade_poe, "interfaces")),
+        Command(INCLUDE_HOSTNAME, fixed('hostname "{hostname}"'), privileged=True),
+        Command(RUNNING_CONFIG, running_config(brocade_run_vlans), privileged=True),
+        Command(r"phy cable-diagnostics tdr (\S+)", fixed(""), privileged=True),
+        Command(
+            r"show cable-diagnostics tdr (\S+)",
+            single(brocade_tdr, brocade_interface(0)),
+        ),
+        Command(
+            r"show ver\S*",
+            fixed(
+                "  Copyright (c) Ruckus Networks, Inc. All rights reserved.\n"
+                "    UNIT 1: compiled on Mar 01 2024 at 00:00:00 labeled as "
+                "SPR08095\n"
+                "  SW: Version 08.0.95T213\n"
+                "  The system uptime is 10 days 2 hours 3 minutes"
+            ),
+        ),
+    ],
+)
+
+CISCO_XR = DeviceProfile(
+    "cisco_xr",
+    user_prompt="RP/0/RSP0/CPU0:{hostname}#",
+    enable_prompt="RP/0/RSP0/CPU0:{hostname}#",
+    config_prompt="RP/0/RSP0/CPU0:{hostname}(config)#",
+    more_prompt=" --More-- ",
+    invalid_input=IOS_INVALID_INPUT,
+    paging_commands=("terminal length",),
+    timestamp=True,
+    commands=[
+        Command(r"show int\S*", sized(xr_interface_stats, "interfaces")),
+        Command(r"show int\S* (\S+)", single(xr_interface_stats, xr_interface(0))),
+        Command(INCLUDE_HOSTNAME, fixed("hostname {hostname}"), privileged=True),
+        Command(
+            RUNNING_CONFIG,
+            fixed(
+                "Building configuration...\n!! IOS XR Configuration\n"
+                "hostname {hostname}\n!\nend"
+            ),
+            privileged=True,
+        ),
+        Command(
+            r"show ver\S*",
+            fixed(
+                "Cisco IOS XR Software, Version 7.5.2\n"
+                "{hostname} uptime is 3 weeks, 1 day, 2 hours"
+            ),
+        ),
+    ],
+)
+
+PROFILES = {
+    profile.name: profile for profile in (CISCO_IOS, BROCADE_FASTIRON, CISCO_XR)
+}
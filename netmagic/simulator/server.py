@@ -0,0 +1,491 @@
+# NetMagic Device Simulator Server
+
+# Python Modules
+from asyncio import (
+    AbstractEventLoop,
+    Queue,
+    Task,
+    new_event_loop,
+    run_coroutine_threadsafe,
+    sleep,
+    wait,
+)
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
+from logging import NullHandler, getLogger
+from random import uniform
+from socket import AF_INET, SO_REUSEADDR, SOCK_STREAM, SOL_SOCKET, socket
+from threading import Event, Thread
+from typing import Self
+
+# Third-Party Modules
+from paramiko import (
+    AUTH_FAILED,
+    AUTH_SUCCESSFUL,
+    OPEN_FAILED_ADMINISTRATIVELY_PROHIBITED,
+    OPEN_SUCCEEDED,
+    Channel,
+    ECDSAKey,
+    PKey,
+    ServerInterface,
+    SSHException,
+    Transport,
+)
+
+# Local Modules
+from netmagic.simulator.profiles import DeviceProfile, OutputSizes
+
+EXIT_COMMANDS = ("exit", "quit", "logout")
+
+# Paramiko logs every client disconnect, which is routine here
+LOG_CHANNEL = "netmagic.simulator"
+getLogger(LOG_CHANNEL).addHandler(NullHandler())
+
+
+class SimulatorServer(ServerInterface):
+    """
+    Paramiko server interface accepting one username and password and a
+    single interactive shell
+    """
+
+    def __init__(self, username: str, password: str) -> None:
+        self.username = username
+        self.password = password
+        self.shell_requested = Event()
+
+    def get_allowed_auths(self, username: str) -> str:
+        return "password"
+
+    def check_auth_password(self, username: str, password: str) -> int:
+        if (username, password) == (self.username, self.password):
+            return AUTH_SUCCESSFUL
+        return AUTH_FAILED
+
+    def check_channel_request(self, kind: str, chanid: int) -> int:
+        if kind == "session":
+            return OPEN_SUCCEEDED
+        return OPEN_FAILED_ADMINISTRATIVELY_PROHIBITED
+
+    def check_channel_pty_request(self, *args) -> bool:
+        return True
+
+    def check_channel_shell_request(self, channel: Channel) -> bool:
+        self.shell_requested.set()
+        return True
+
+
+class SimulatedDevice:
+    """
+    One simulated device listening on its own port.
+
+    Without an `enable_secret` logins land in enable mode, like an account
+    with privilege 15.  Each command waits `latency` seconds plus up to
+    `jitter` seconds before answering.
+    """
+
+    def __init__(
+        self,
+        profile: DeviceProfile,
+        hostname: str,
+        listener: socket,
+        sizes: OutputSizes | None = None,
+        enable_secret: str | None = None,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+    ) -> None:
+        self.profile = profile
+        self.hostname = hostname
+        self.listener = listener
+        self.sizes = sizes or OutputSizes()
+        self.enable_secret = enable_secret
+        self.latency = latency
+        self.jitter = jitter
+        self.host, self.port = listener.getsockname()[:2]
+
+    def __repr__(self) -> str:
+        return f"SimulatedDevice({self.profile.name}: {self.hostname}@{self.port})"
+
+
+class DeviceShell:
+    """
+    Interactive CLI of a simulated device on one SSH channel
+    """
+
+    def __init__(
+        self,
+        device: SimulatedDevice,
+        channel: Channel,
+        loop: AbstractEventLoop,
+        executor: ThreadPoolExecutor,
+    ) -> None:
+        self.device = device
+        self.profile = device.profile
+        self.channel = channel
+        self.loop = loop
+        self.executor = executor
+        self.enabled = device.enable_secret is None
+        self.config_mode = False
+        self.page_length = self.profile.page_length
+        self.timestamp = self.profile.timestamp
+        self.commands = 0
+
+        self._incoming: Queue[str | None] = Queue()
+        self._pending = ""
+        self._last_char = ""
+
+    @property
+    def prompt(self) -> str:
+        if self.config_mode:
+            prompt = self.profile.config_prompt
+        elif self.enabled:
+            prompt = self.profile.enable_prompt
+        else:
+            prompt = self.profile.user_prompt
+        return prompt.format(hostname=self.device.hostname)
+
+    # CHANNEL I/O
+
+    def _on_readable(self) -> None:
+        try:
+            data = self.channel.recv(65536)
+        except TimeoutError:
+            return
+        if not data:
+            self.loop.remove_reader(self.channel.fileno())
+            self._incoming.put_nowait(None)
+        else:
+            self._incoming.put_nowait(data.decode(errors="replace"))
+
+    async def write(self, text: str) -> None:
+        data = text.replace("\r\n", "\n").replace("\n", "\r\n").encode()
+        await self.loop.run_in_executor(self.executor, self.channel.sendall, data)
+
+    async def read_char(self) -> str | None:
+        while not self._pending:
+            chunk = await self._incoming.get()
+            if chunk is None:
+                return None
+            self._pending = chunk
+        char, self._pending = self._pending[0], self._pending[1:]
+        return char
+
+    async def read_line(self, echo: bool = True) -> str | None:
+        """Reads a line ended by CR, LF or CRLF, echoing it back"""
+        line = []
+        while (char := await self.read_char()) is not None:
+            previous, self._last_char = self._last_char, char
+            if char == "\n" and previous == "\r":
+                continue
+            if char in "\r\n":
+                text = "".join(line)
+                await self.write(f"{text if echo else ''}\n")
+                return text
+            if char in "\x08\x7f":
+                if line:
+                    line.pop()
+                continue
+            line.append(char)
+        return None
+
+    # SESSION
+
+    async def run(self) -> None:
+        self.loop.add_reader(self.channel.fileno(), self._on_readable)
+        try:
+            await self.write(f"{self.profile.banner}{self.prompt}")
+            while (line := await self.read_line()) is not None:
+                line = " ".join(line.split())
+                if line in EXIT_COMMANDS and not self.config_mode:
+                    break
+                if line:
+                    await self.handle(line)
+                await self.write(self.prompt)
+        finally:
+            self.loop.remove_reader(self.channel.fileno())
+            self.channel.send_exit_status(0)
+            self.channel.close()
+
+    async def handle(self, line: str) -> None:
+        self.commands += 1
+        device = self.device
+        if device.latency or device.jitter:
+            await sleep(device.latency + uniform(0, device.jitter))  # nosec B311
+
+        if self.config_mode:
+            if line in ("end", "exit"):
+                self.config_mode = False
+            return
+
+        if line.startswith(self.profile.paging_commands):
+            length = line.split()[-1]
+            self.page_length = int(length) if length.isdigit() else 0
+            return
+        if line == "page-display":
+            self.page_length = self.profile.page_length
+            return
+        if line.startswith("terminal width"):
+            return
+        if line == "terminal exec prompt no-timestamp":
+            self.timestamp = False
+            return
+        if line == "enable":
+            await self.enable()
+            return
+        if line == "disable" and device.enable_secret is not None:
+            self.enabled = False
+            return
+        if line.startswith("conf") and self.enabled:
+            self.config_mode = True
+            return
+        if line.startswith("write mem") and self.enabled:
+            await self.write("Building configuration...\n[OK]\n")
+            return
+
+        found = self.profile.find_command(line)
+        if found is None or (found[0].privileged and not self.enabled):
+            await self.write(self.profile.invalid_input.format(command=line))
+            return
+
+        command, match = found
+        output = command.handler(device.sizes, device.hostname, match)
+        if self.timestamp:
+            output = (
+                f"{datetime.now(UTC):%a %b %d %H:%M:%S.%f}"[:-3] + " UTC\n" + output
+            )
+        await self.page(output)
+
+    async def enable(self) -> None:
+        if self.enabled:
+            return
+        for _ in range(3):
+            await self.write("Password: ")
+            password = await self.read_line(echo=False)
+            if password is None:
+                return
+            if password == self.device.enable_secret:
+                self.enabled = True
+                return
+        await self.write(f"{self.profile.access_denied}\n")
+
+    async def page(self, output: str) -> None:
+        """Writes output a page at a time while paging is enabled"""
+        if not output:
+            return
+        lines = output.splitlines()
+        if not self.page_length or len(lines) <= self.page_length:
+            await self.write(f"{output}\n")
+            return
+
+        more = self.profile.more_prompt
+        erase = "\x08" * len(more) + " " * len(more) + "\x08" * len(more)
+        position, step = 0, self.page_length
+        while position < len(lines):
+            chunk = "\n".join(lines[position : position + step])
+            position += step
+            if position >= len(lines):
+                await self.write(f"{chunk}\n")
+                return
+            await self.write(f"{chunk}\n{more}")
+            key = await self.read_char()
+            await self.write(erase)
+            if key is None or key in "qQ\x03":
+                return
+            # Return shows one more line, anything else a full page
+            step = 1 if key in "\r\n" else self.page_length
+            if key == "\r" and self._pending[:1] == "\n":
+                self._pending = self._pending[1:]
+
+
+class DeviceSimulator:
+    """
+    Hosts many simulated devices, each on its own port, from one asyncio loop
+    running in a background thread.
+
+    Devices listen as soon as they are added; connections are served once the
+    simulator is started, directly or as a context manager:
+
+        with DeviceSimulator() as simulator:
+            devices = simulator.add_devices(CISCO_IOS, 100)
+    """
+
+    def __init__(
+        self,
+        address: str = "127.0.0.1",
+        username: str = "admin",
+        # Login of the simulated devices only, never of a real device
+        password: str = "admin",  # nosec B107
+        host_key: PKey | None = None,
+        max_workers: int = 256,
+        backlog: int = 128,
+    ) -> None:
+        self.address = address
+        self.username = username
+        self.password = password
+        self.host_key = host_key or ECDSAKey.generate()
+        self.backlog = backlog
+        self.devices: list[SimulatedDevice] = []
+        self.sessions = 0
+        self.commands = 0
+
+        self._executor = ThreadPoolExecutor(max_workers, "netmagic-simulator")
+        self._loop: AbstractEventLoop | None = None
+        self._thread: Thread | None = None
+        self._tasks: set[Task] = set()
+        self._transports: set[Transport] = set()
+
+    def __repr__(self) -> str:
+        return f"DeviceSimulator({len(self.devices)} devices)"
+
+    def __enter__(self) -> Self:
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    # DEVICES
+
+    def add_device(
+        self,
+        profile: DeviceProfile,
+        hostname: str | None = None,
+        port: int = 0,
+        **kwargs,
+    ) -> SimulatedDevice:
+        """
+        Adds a device listening on `port`, any free port by default.
+        Remaining kwargs are passed to `SimulatedDevice`.
+        """
+        listener = socket(AF_INET, SOCK_STREAM)
+        listener.setsockopt(SOL_SOCKET, SO_REUSEADDR, 1)
+        try:
+            listener.bind((self.address, port))
+            listener.listen(self.backlog)
+        except OSError:
+            listener.close()
+            raise
+        listener.setblocking(False)
+
+        hostname = hostname or f"{profile.name.replace('_', '-')}-{len(self.devices)}"
+        device = SimulatedDevice(profile, hostname, listener, **kwargs)
+        self.devices.append(device)
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._serve, device)
+        return device
+
+    def add_devices(
+        self, profile: DeviceProfile, count: int, start_port: int = 0, **kwargs
+    ) -> list[SimulatedDevice]:
+        """
+        Adds `count` devices on consecutive ports from `start_port`, or on any
+        free ports when it is 0
+        """
+        return [
+            self.add_device(profile, port=start_port + i if start_port else 0, **kwargs)
+            for i in range(count)
+        ]
+
+    # LIFECYCLE
+
+    def start(self) -> Self:
+        if self._loop is not None:
+            return self
+        self._loop = new_event_loop()
+        self._thread = Thread(
+            target=self._loop.run_forever, name="netmagic-simulator", daemon=True
+        )
+        self._thread.start()
+        for device in self.devices:
+            self._loop.call_soon_threadsafe(self._serve, device)
+        return self
+
+    def stop(self) -> None:
+        if self._loop is None:
+            return
+
+        async def shutdown() -> None:
+            tasks = list(self._tasks)
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                await wait(tasks, timeout=5)
+
+        run_coroutine_threadsafe(shutdown(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._loop = None
+
+        for transport in list(self._transports):
+            transport.close()
+        for device in self.devices:
+            device.listener.close()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def serve_forever(self) -> None:
+        """Starts serving and blocks until interrupted"""
+        self.start()
+        try:
+            self._thread.join()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+
+    # CONNECTIONS
+
+    def _track(self, task: Task) -> None:
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _serve(self, device: SimulatedDevice) -> None:
+        self._track(self._loop.create_task(self._accept(device)))
+
+    async def _accept(self, device: SimulatedDevice) -> None:
+        while True:
+            connection, _ = await self._loop.sock_accept(device.listener)
+            self._track(self._loop.create_task(self._session(device, connection)))
+
+    def _open_channel(self, connection: socket) -> tuple[Transport, Channel | None]:
+        """Runs the SSH handshake and waits for the shell, in a worker thread"""
+        connection.setblocking(True)
+        transport = Transport(connection)
+        transport.set_log_channel(LOG_CHANNEL)
+        self._transports.add(transport)
+        transport.add_server_key(self.host_key)
+        server = SimulatorServer(self.username, self.password)
+        try:
+            transport.start_server(server=server)
+        except SSHException:
+            return transport, None
+        channel = transport.accept(timeout=30)
+        if channel is None or not server.shell_requested.wait(timeout=30):
+            return transport, None
+        return transport, channel
+
+    async def _session(self, device: SimulatedDevice, connection: socket) -> None:
+        transport = None
+        try:
+            transport, channel = await self._loop.run_in_executor(
+                self._executor, self._open_channel, connection
+            )
+            if channel is None:
+                return
+            self.sessions += 1
+            shell = DeviceShell(device, channel, self._loop, self._executor)
+            try:
+                await shell.run()
+            finally:
+                self.commands += shell.commands
+        except (OSError, EOFError, SSHException):
+            pass
+        finally:
+            if transport is not None:
+                # Let the client hang up first, like a device after `exit`
+                for _ in range(20):
+                    if not transport.is_active():
+                        break
+                    await sleep(0.05)
+                transport.close()
+                self._transports.discard(transport)
+            else:
+                connection.close()
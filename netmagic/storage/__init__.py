@@ -0,0 +1,16 @@
+"""
+NetMagic Storage
+
+Persistent stores for collected results, such as configuration backups and
+the state of a fleet.
+"""
+
+from netmagic.storage.backup import Backup, BackupStore
+from netmagic.storage.state import Snapshot, StateStore
+
+__all__ = [
+    "Backup",
+    "BackupStore",
+    "Snapshot",
+    "StateStore",
+]
@@ -0,0 +1,296 @@
+# NetMagic Config Backup Store
+
+# Python Modules
+import lzma
+import zlib
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
+from difflib import unified_diff
+from hashlib import sha256
+from os import makedirs, path, replace
+from re import MULTILINE, compile
+from sqlite3 import Connection, connect
+from tempfile import NamedTemporaryFile
+from threading import Lock
+from typing import TYPE_CHECKING, Self
+
+if TYPE_CHECKING:
+    from netmagic.devices.network_device import NetworkDevice
+
+# Lines which change without any change to the configuration, left out before
+# hashing so an unchanged config is stored once
+VOLATILE_LINES = compile(
+    r"^(?:Building configuration\.\.\.|Current configuration : \d+ bytes"
+    r"|! (?:Last configuration change|NVRAM config last updated) at .*"
+    r"|ntp clock-period \d+|!Time: .*)\n",
+    MULTILINE,
+)
+
+COMPRESSORS: dict[str, tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]] = {
+    "zlib": (lambda data: zlib.compress(data, 9), zlib.decompress),
+    "lzma": (lzma.compress, lzma.decompress),
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    hash TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    stored_size INTEGER NOT NULL,
+    compression TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS backups (
+    id INTEGER PRIMARY KEY,
+    host TEXT NOT NULL,
+    taken_at REAL NOT NULL,
+    hash TEXT NOT NULL REFERENCES blobs (hash)
+);
+CREATE INDEX IF NOT EXISTS backups_host ON backups (host, taken_at);
+CREATE INDEX IF NOT EXISTS backups_taken_at ON backups (taken_at);
+"""
+
+
+def normalize_config(config: str) -> str:
+    """Removes volatile lines and trailing whitespace from a configuration"""
+    config = VOLATILE_LINES.sub("", config.replace("\r\n", "\n"))
+    return "\n".join(line.rstrip() for line in config.strip().splitlines()) + "\n"
+
+
+class Backup:
+    """
+    One backup of a host's configuration, `changed` when its content differs
+    from the host's previous backup
+    """
+
+    def __init__(
+        self,
+        host: str,
+        taken_at: datetime,
+        hash: str,
+        changed: bool = True,
+        previous_hash: str | None = None,
+    ) -> None:
+        self.host = host
+        self.taken_at = taken_at
+        self.hash = hash
+        self.changed = changed
+        self.previous_hash = previous_hash
+
+    def __repr__(self) -> str:
+        state = "changed" if self.changed else "unchanged"
+        return f"Backup({self.host}, {self.taken_at:%Y-%m-%d %H:%M}, {self.hash[:12]}, {state})"
+
+
+class BackupStore:
+    """
+    Content-addressed store of configuration backups.
+
+    Configs are hashed after removing volatile lines. Each distinct config is
+    kept once, as a compressed blob under `objects/`. An SQLite index records
+    every `(host, taken_at, hash)`, so an unchanged nightly backup costs one
+    index row.  The store is safe to use from many threads.
+    """
+
+    def __init__(
+        self, directory: str, compression: str = "zlib", normalize: bool = True
+    ) -> None:
+        if compression not in COMPRESSORS:
+            raise ValueError(
+                f"`compression` must be one of {', '.join(COMPRESSORS)}, not {compression}"
+            )
+        self.directory = directory
+        self.compression = compression
+        self.normalize = normalize
+        makedirs(path.join(directory, "objects"), exist_ok=True)
+
+        self.database: Connection = connect(
+            path.join(directory, "index.sqlite"), check_same_thread=False
+        )
+        self.database.execute("PRAGMA journal_mode=WAL")
+        self.database.executescript(SCHEMA)
+        self._lock = Lock()
+
+    def __repr__(self) -> str:
+        return f"BackupStore({self.directory})"
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            self.database.close()
+
+    # BLOBS
+
+    def blob_path(self, hash: str) -> str:
+        return path.join(self.directory, "objects", hash[:2], hash[2:])
+
+    def write_blob(self, hash: str, data: bytes) -> int:
+        """Writes a compressed blob atomically, returning its stored size"""
+        stored = COMPRESSORS[self.compression][0](data)
+        filename = self.blob_path(hash)
+        makedirs(path.dirname(filename), exist_ok=True)
+        with NamedTemporaryFile(dir=path.dirname(filename), delete=False) as file:
+            file.write(stored)
+        replace(file.name, filename)
+        return len(stored)
+
+    def load(self, hash: str) -> str:
+        """Returns the configuration stored under `hash`"""
+        with self._lock:
+            row = self.database.execute(
+                "SELECT compression FROM blobs WHERE hash = ?", (hash,)
+            ).fetchone()
+        if row is None:
+            raise KeyError(hash)
+        with open(self.blob_path(hash), "rb") as file:
+            return COMPRESSORS[row[0]][1](file.read()).decode()
+
+    # BACKUPS
+
+    def save(self, host: str, config: str, taken_at: datetime | None = None) -> Backup:
+        """
+        Stores a configuration for `host`, writing a blob only for content not
+        already in the store
+        """
+        taken_at = taken_at or datetime.now(UTC)
+        if self.normalize:
+            config = normalize_config(config)
+        data = config.encode()
+        hash = sha256(data).hexdigest()
+
+        with self._lock:
+            known = self.database.execute(
+                "SELECT 1 FROM blobs WHERE hash = ?", (hash,)
+            ).fetchone()
+        # Compression happens outside the lock, so hosts store in parallel
+        stored_size = None if known else self.write_blob(hash, data)
+
+        with self._lock, self.database:
+            if stored_size is not None:
+                self.database.execute(
+                    "INSERT OR IGNORE INTO blobs VALUES (?, ?, ?, ?)",
+                    (hash, len(data), stored_size, self.compression),
+                )
+            previous = self.database.execute(
+                "SELECT hash FROM backups WHERE host = ? AND taken_at <= ? "
+                "ORDER BY taken_at DESC LIMIT 1",
+                (host, taken_at.timestamp()),
+            ).fetchone()
+            self.database.execute(
+                "INSERT INTO backups (host, taken_at, hash) VALUES (?, ?, ?)",
+                (host, taken_at.timestamp(), hash),
+            )
+
+        previous_hash = previous[0] if previous else None
+        return Backup(host, taken_at, hash, previous_hash != hash, previous_hash)
+
+    def backup(self, device: "NetworkDevice") -> Backup:
+        """Backs up the running configuration of a connected device"""
+        config = device.get_running_config().response
+        if isinstance(config, Exception):
+            raise config
+        host = device.hostname or str(device.cli_session.host)
+        return self.save(host, config)
+
+    def backup_fleet(
+        self, devices: Iterable["NetworkDevice"], workers: int = 16
+    ) -> list[Backup | Exception]:
+        """
+        Backs up many devices concurrently, returning a `Backup` or the error
+        raised for each device, in order
+        """
+
+        def backup(device: "NetworkDevice") -> Backup | Exception:
+            try:
+                return self.backup(device)
+            # One unreachable device does not stop the fleet
+            except Exception as error:  # noqa: BLE001
+                return error
+
+        with ThreadPoolExecutor(workers) as executor:
+            return list(executor.map(backup, devices))
+
+    # QUERIES
+
+    def history(self, host: str) -> list[Backup]:
+        """Every backup of a host, oldest first"""
+        with self._lock:
+            rows = self.database.execute(
+                "SELECT taken_at, hash, LAG(hash) OVER (ORDER BY taken_at) "
+                "FROM backups WHERE host = ? ORDER BY taken_at",
+                (host,),
+            ).fetchall()
+        return [
+            Backup(host, datetime.fromtimestamp(taken_at, UTC), hash, hash != lag, lag)
+            for taken_at, hash, lag in rows
+        ]
+
+    def latest(self, host: str) -> str | None:
+        """The most recent configuration of a host"""
+        with self._lock:
+            row = self.database.execute(
+                "SELECT hash FROM backups WHERE host = ? ORDER BY taken_at DESC LIMIT 1",
+                (host,),
+            ).fetchone()
+        return self.load(row[0]) if row else None
+
+    def changed_since(self, since: datetime) -> list[Backup]:
+        """
+        Backups taken after `since` whose configuration differs from the host's
+        backup before them, including first backups of new hosts
+        """
+        with self._lock:
+            rows = self.database.execute(
+                "SELECT host, taken_at, hash, previous FROM ("
+                "  SELECT host, taken_at, hash, "
+                "  LAG(hash) OVER (PARTITION BY host ORDER BY taken_at) AS previous "
+                "  FROM backups WHERE host IN "
+                "  (SELECT DISTINCT host FROM backups WHERE taken_at > ?)"
+                ") WHERE taken_at > ? AND previous IS NOT hash "
+                "ORDER BY host, taken_at",
+                (since.timestamp(), since.timestamp()),
+            ).fetchall()
+        return [
+            Backup(host, datetime.fromtimestamp(taken_at, UTC), hash, True, previous)
+            for host, taken_at, hash, previous in rows
+        ]
+
+    def diff(
+        self,
+        host: str,
+        old_hash: str | None = None,
+        new_hash: str | None = None,
+        context: int = 3,
+    ) -> list[str]:
+        """
+        Unified diff lines between two configurations of a host, by default
+        its last two distinct configurations
+        """
+        if old_hash is None or new_hash is None:
+            changes = [backup for backup in self.history(host) if backup.changed]
+            if new_hash is None:
+                new_hash = changes[-1].hash if changes else None
+            if old_hash is None:
+                old_hash = next(
+                    (i.previous_hash for i in reversed(changes) if i.hash == new_hash),
+                    None,
+                )
+        if new_hash is None:
+            return []
+
+        old = self.load(old_hash).splitlines() if old_hash else []
+        new = self.load(new_hash).splitlines()
+        return list(
+            unified_diff(
+                old,
+                new,
+                f"{host}@{old_hash[:12] if old_hash else 'empty'}",
+                f"{host}@{new_hash[:12]}",
+                n=context,
+                lineterm="",
+            )
+        )
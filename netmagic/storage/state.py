@@ -0,0 +1,428 @@
+# NetMagic Fleet State Store
+
+# Python Modules
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from datetime import UTC, datetime
+from re import fullmatch, sub
+from sqlite3 import Connection, Row, connect
+from threading import Lock
+from typing import Any, Self
+
+# Third-Party Modules
+from mactools import MacAddress
+from pydantic import BaseModel
+
+# Local Modules
+from netmagic.common.classes.status import MACTableEntry
+from netmagic.handlers.exporters import export_value, iter_result_models, model_columns
+
+# Rows are written with one `executemany` per model class per this many rows
+BATCH_SIZE = 10_000
+
+# Columns indexed (over current rows) wherever a model has them
+INDEXED_COLUMNS = ("interface", "mac", "chassis_mac", "vlan", "port_vlan")
+
+# State columns, indexed case-insensitively as vendors differ in case
+STATE_COLUMNS = ("state", "operation_state")
+
+# Interface states, lower case, which mean the port is not passing traffic
+DOWN_STATES = (
+    "down",
+    "disabled",
+    "err-disabled",
+    "notconnect",
+    "notconnected",
+    "inactive",
+    "sfpabsent",
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY,
+    taken_at REAL NOT NULL,
+    label TEXT
+);
+CREATE TABLE IF NOT EXISTS snapshot_hosts (
+    snapshot INTEGER NOT NULL REFERENCES snapshots (id),
+    model TEXT NOT NULL,
+    host TEXT NOT NULL,
+    rows INTEGER NOT NULL,
+    PRIMARY KEY (model, host, snapshot)
+);
+CREATE INDEX IF NOT EXISTS snapshot_hosts_snapshot ON snapshot_hosts (snapshot);
+"""
+
+
+def table_name(model: type[BaseModel] | str) -> str:
+    """Returns the table of a model class, `InterfaceStatus` -> `interface_status`"""
+    if isinstance(model, str):
+        return model
+    return sub(
+        r"(?<=[a-z])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])", "_", model.__name__
+    ).lower()
+
+
+def quote(name: str) -> str:
+    """
+    Quotes a table or column name for SQL.  Names are limited to word
+    characters, as those of model classes and fields are, so no name can
+    close its quotes and SQL built from quoted names stays fixed in shape.
+    """
+    if not fullmatch(r"\w+", name):
+        raise ValueError(f"Invalid table or column name: {name!r}")
+    return f'"{name}"'
+
+
+def mac_table_rows(entry: MACTableEntry) -> Iterator[dict[str, Any]]:
+    """A MAC seen on several VLANs or ports is stored as a row per VLAN"""
+    for vlan, interface in entry.vlan.items():
+        yield {"vlan": vlan, "interface": interface}
+
+
+# Models whose rows are split, each yielding the column values replacing those
+# of the model in one row
+ROW_EXPANDERS: dict[type[BaseModel], Callable[[Any], Iterable[dict[str, Any]]]] = {
+    MACTableEntry: mac_table_rows,
+}
+
+
+def model_rows(model: BaseModel) -> Iterator[list[Any]]:
+    """Yields the rows of plain values stored for a model"""
+    columns = model_columns(type(model))
+    expander = ROW_EXPANDERS.get(type(model))
+    if expander is None:
+        yield [export_value(getter(model)) for _, getter in columns]
+        return
+    for overrides in expander(model):
+        yield [
+            export_value(overrides[name] if name in overrides else getter(model))
+            for name, getter in columns
+        ]
+
+
+class Snapshot:
+    """
+    One ingest into a `StateStore`, with the number of rows stored per model
+    """
+
+    def __init__(
+        self,
+        id: int,
+        taken_at: datetime,
+        label: str | None = None,
+        rows: dict[str, int] | None = None,
+        hosts: int = 0,
+    ) -> None:
+        self.id = id
+        self.taken_at = taken_at
+        self.label = label
+        self.rows = rows or {}
+        self.hosts = hosts
+
+    def __repr__(self) -> str:
+        label = f", {self.label}" if self.label else ""
+        return (
+            f"Snapshot({self.id}, {self.taken_at:%Y-%m-%d %H:%M}{label}, "
+            f"{sum(self.rows.values())} rows, {self.hosts} hosts)"
+        )
+
+
+class StateStore:
+    """
+    SQLite store of collected models, such as the results of
+    `get_interface_status`, `get_lldp`, `get_mac_table`, `get_optics`,
+    `get_poe_status` and `get_interface_statistics` across a fleet.
+
+    Each model class has a table of its flattened columns (as in the
+    exporters), created on first ingest.  Every ingest is a snapshot and
+    history is kept; a row is `current` while it belongs to the latest
+    snapshot of its host for that model.  Indexes only cover current rows,
+    so fleet-wide queries on the present state never read the history.
+    The store is safe to use from many threads.
+    """
+
+    def __init__(
+        self, filename: str = ":memory:", batch_size: int = BATCH_SIZE
+    ) -> None:
+        self.filename = filename
+        self.batch_size = batch_size
+        self.database: Connection = connect(filename, check_same_thread=False)
+        self.database.row_factory = Row
+        self.database.execute("PRAGMA journal_mode=WAL")
+        self.database.execute("PRAGMA synchronous=NORMAL")
+        self.database.executescript(SCHEMA)
+        self._columns: dict[str, list[str]] = {}
+        self._lock = Lock()
+
+    def __repr__(self) -> str:
+        return f"StateStore({self.filename})"
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            self.database.close()
+
+    # TABLES
+
+    def tables(self) -> list[str]:
+        """Model tables in the store"""
+        with self._lock:
+            rows = self.database.execute(
+                "SELECT DISTINCT model FROM snapshot_hosts ORDER BY model"
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def ensure_table(self, model_class: type[BaseModel]) -> str:
+        """
+        Creates the table and indexes of a model class, adding columns for
+        fields new since the table was created.  Called with the lock held.
+        """
+        table = table_name(model_class)
+        columns = [name for name, _ in model_columns(model_class)]
+        known = self._columns.get(table)
+        if known is not None and set(columns) <= set(known):
+            return table
+
+        existing = [
+            row[1]
+            for row in self.database.execute(f"PRAGMA table_info({quote(table)})")
+        ]
+        if not existing:
+            definitions = ", ".join(quote(column) for column in columns)
+            self.database.execute(
+                f"CREATE TABLE {quote(table)} (snapshot INTEGER NOT NULL, "
+                f"current INTEGER NOT NULL DEFAULT 1, {definitions})"
+            )
+            existing = ["snapshot", "current", *columns]
+        for column in columns:
+            if column not in existing:
+                self.database.execute(
+                    f"ALTER TABLE {quote(table)} ADD COLUMN {quote(column)}"
+                )
+                existing.append(column)
+
+        self.database.execute(
+            f"CREATE INDEX IF NOT EXISTS {quote(f'{table}_history')} "
+            f"ON {quote(table)} (host, snapshot)"
+        )
+        for column in ("host", *INDEXED_COLUMNS, *STATE_COLUMNS):
+            if column in existing:
+                expression = (
+                    f"lower({quote(column)})"
+                    if column in STATE_COLUMNS
+                    else quote(column)
+                )
+                self.database.execute(
+                    f"CREATE INDEX IF NOT EXISTS {quote(f'{table}_{column}')} "
+                    f"ON {quote(table)} ({expression}) WHERE current"
+                )
+        self._columns[table] = existing
+        return table
+
+    # INGEST
+
+    def ingest(
+        self,
+        results: Iterable[Any],
+        taken_at: datetime | None = None,
+        label: str | None = None,
+        empty: Iterable[tuple[str, type[BaseModel]]] = (),
+    ) -> Snapshot:
+        """
+        Stores every model of `results` (responses with a dict `fsm_output`,
+        dicts of models or lists of models) as one snapshot, in a single
+        transaction.  For each model and host in the snapshot, the host's
+        earlier rows of that model stop being current.
+
+        An empty result has no models to name its host, so hosts polled with
+        no rows of a model are given in `empty` as `(host, model class)`,
+        e.g. `("sw1", InterfaceStatus)`; their earlier rows stop being
+        current too.
+        """
+        taken_at = taken_at or datetime.now(UTC)
+        rows: dict[str, int] = {}
+        hosts: dict[str, dict[str, int]] = {}
+
+        with self._lock, self.database:
+            snapshot = self.database.execute(
+                "INSERT INTO snapshots (taken_at, label) VALUES (?, ?)",
+                (taken_at.timestamp(), label),
+            ).lastrowid
+            if snapshot is None:
+                raise RuntimeError("SQLite did not return the id of the new snapshot")
+
+            buffers: dict[type[BaseModel], list[list[Any]]] = {}
+            statements: dict[type[BaseModel], str] = {}
+
+            def flush(model_class: type[BaseModel]) -> None:
+                self.database.executemany(statements[model_class], buffers[model_class])
+                buffers[model_class] = []
+
+            for model in iter_result_models(results):
+                model_class = type(model)
+                if model_class not in statements:
+                    table = self.ensure_table(model_class)
+                    columns = model_columns(model_class)
+                    names = ", ".join(quote(name) for name, _ in columns)
+                    statements[model_class] = (
+                        # Identifiers only, checked by `quote`
+                        f"INSERT INTO {quote(table)} (snapshot, {names}) "  # nosec B608
+                        f"VALUES (?{', ?' * len(columns)})"
+                    )
+                    buffers[model_class] = []
+
+                table = table_name(model_class)
+                buffer = buffers[model_class]
+                count = len(buffer)
+                buffer.extend([snapshot, *row] for row in model_rows(model))
+                host_rows = hosts.setdefault(table, {})
+                host = model.host  # type: ignore[attr-defined]
+                host_rows[host] = host_rows.get(host, 0) + len(buffer) - count
+                if len(buffer) >= self.batch_size:
+                    flush(model_class)
+
+            for model_class, buffer in buffers.items():
+                if buffer:
+                    flush(model_class)
+
+            for host, model_class in empty:
+                host_rows = hosts.setdefault(self.ensure_table(model_class), {})
+                host_rows.setdefault(host, 0)
+
+            for table, host_rows in hosts.items():
+                self.database.executemany(
+                    # The table name is checked by `quote`
+                    f"UPDATE {quote(table)} SET current = 0 "  # nosec B608
+                    "WHERE host = ? AND current AND snapshot != ?",
+                    ((host, snapshot) for host in host_rows),
+                )
+                self.database.executemany(
+                    "INSERT INTO snapshot_hosts VALUES (?, ?, ?, ?)",
+                    (
+                        (snapshot, table, host, count)
+                        for host, count in host_rows.items()
+                    ),
+                )
+                rows[table] = sum(host_rows.values())
+
+        host_count = len({host for host_rows in hosts.values() for host in host_rows})
+        return Snapshot(snapshot, taken_at, label, rows, host_count)
+
+    # QUERIES
+
+    def query(self, sql: str, params: Sequence[Any] = ()) -> list[dict[str, Any]]:
+        """Runs any read-only SQL, returning rows as dicts"""
+        with self._lock:
+            rows = self.database.execute(sql, params).fetchall()
+        return [dict(row) for row in rows]
+
+    def has_table(self, table: str) -> bool:
+        with self._lock:
+            row = self.database.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+                (table,),
+            ).fetchone()
+        return row is not None
+
+    def current(
+        self,
+        model: type[BaseModel] | str,
+        where: str | None = None,
+        params: Sequence[Any] = (),
+        **equals: Any,
+    ) -> list[dict[str, Any]]:
+        """
+        Current rows of a model, filtered by column values in `equals` and an
+        optional SQL `where` clause with its `params`
+        """
+        table = table_name(model)
+        if not self.has_table(table):
+            return []
+        clauses = ["current"]
+        values: list[Any] = []
+        for column, value in equals.items():
+            clauses.append(f"{quote(column)} = ?")
+            values.append(value)
+        if where:
+            clauses.append(f"({where})")
+            values.extend(params)
+        return self.query(
+            # Identifiers are checked by `quote`, values are parameters and
+            # `where` is the caller's own SQL, like `query`
+            f"SELECT * FROM {quote(table)} WHERE {' AND '.join(clauses)} "  # nosec B608
+            "ORDER BY host, rowid",
+            values,
+        )
+
+    def history(
+        self,
+        model: type[BaseModel] | str,
+        host: str,
+        interface: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Every stored row of a model for a host, or one of its interfaces,
+        oldest first with the `taken_at` of its snapshot
+        """
+        table = table_name(model)
+        if not self.has_table(table):
+            return []
+        sql = (
+            # The table name is checked by `quote`
+            f"SELECT t.*, s.taken_at FROM {quote(table)} t "  # nosec B608
+            "JOIN snapshots s ON s.id = t.snapshot WHERE t.host = ?"
+        )
+        params: list[Any] = [host]
+        if interface is not None:
+            sql += " AND t.interface = ?"
+            params.append(interface)
+        return self.query(sql + " ORDER BY t.snapshot, t.rowid", params)
+
+    def snapshots(self, host: str | None = None) -> list[Snapshot]:
+        """Snapshots, oldest first, optionally only those including `host`"""
+        sql = (
+            "SELECT s.id, s.taken_at, s.label, h.model, SUM(h.rows), "
+            "COUNT(DISTINCT h.host) FROM snapshots s "
+            "LEFT JOIN snapshot_hosts h ON h.snapshot = s.id"
+        )
+        params: tuple[str, ...] = ()
+        if host is not None:
+            sql += " WHERE h.host = ?"
+            params = (host,)
+        with self._lock:
+            rows = self.database.execute(
+                sql + " GROUP BY s.id, h.model ORDER BY s.id", params
+            ).fetchall()
+
+        snapshots: dict[int, Snapshot] = {}
+        for id, taken_at, label, model, count, hosts in rows:
+            snapshot = snapshots.setdefault(
+                id, Snapshot(id, datetime.fromtimestamp(taken_at, UTC), label)
+            )
+            if model is not None:
+                snapshot.rows[model] = count
+                snapshot.hosts = max(snapshot.hosts, hosts)
+        return list(snapshots.values())
+
+    def down_ports(self, with_description: bool = True) -> list[dict[str, Any]]:
+        """
+        Current interface status rows whose state is down, by default only
+        those with a description (ports expected to be in use)
+        """
+        placeholders = ", ".join("?" * len(DOWN_STATES))
+        where = f"lower(state) IN ({placeholders})"
+        if with_description:
+            where += ' AND "desc" IS NOT NULL AND "desc" != \'\''
+        return self.current("interface_status", where, DOWN_STATES)
+
+    def find_mac(self, mac: MacAddress | str) -> list[dict[str, Any]]:
+        """
+        Current MAC table rows of a MAC address, in any format, across the
+        fleet, one per VLAN and port it was learned on
+        """
+        return self.current(MACTableEntry, mac=str(MacAddress(mac)))
@@ -0,0 +1,108 @@
+# NetMagic NETCONF Test Stand-In
+
+# Python Modules
+from queue import Empty, Queue
+from types import SimpleNamespace
+
+# Third-Party Modules
+from ncclient.xml_ import to_xml
+
+from netmagic.sessions.netconf import CANDIDATE_CAPABILITY, VALIDATE_CAPABILITY
+from netmagic.sessions.subscription import (
+    NOTIFICATION_CAPABILITY,
+    SUBSCRIBED_NOTIFICATIONS_NAMESPACE,
+    YANG_PUSH_NAMESPACE,
+)
+
+NETCONF_BASE_NAMESPACE = "urn:ietf:params:xml:ns:netconf:base:1.0"
+NOTIFICATION_NAMESPACE = "urn:ietf:params:xml:ns:netconf:notification:1.0"
+
+
+def notification_xml(event: str, event_time: str = "2026-01-01T00:00:00+00:00"):
+    return (
+        f'<notification xmlns="{NOTIFICATION_NAMESPACE}">'
+        f"<eventTime>{event_time}</eventTime>{event}</notification>"
+    )
+
+
+class StandInNETCONFManager:
+    """
+    Minimal stand-in for an `ncclient` manager that answers RPCs locally and
+    delivers notifications queued with `push`
+    """
+
+    def __init__(self, capabilities: list[str] | None = None, data_xml="<data/>"):
+        if capabilities is None:
+            capabilities = [
+                NOTIFICATION_CAPABILITY,
+                YANG_PUSH_NAMESPACE,
+                f"{CANDIDATE_CAPABILITY}:1.0",
+                f"{VALIDATE_CAPABILITY}:1.1",
+            ]
+        self.server_capabilities = capabilities
+        self.connected = True
+        self.data_xml = data_xml
+        self.requests: list[tuple[str, object]] = []
+        # Operation names mapped to an exception raised when they are requested
+        self.failures: dict[str, Exception] = {}
+        self.notifications: Queue[SimpleNamespace] = Queue()
+        self.next_subscription_id = 1
+
+    def ok_reply(self, body: str = "<ok/>") -> SimpleNamespace:
+        return SimpleNamespace(
+            xml=f'<rpc-reply xmlns="{NETCONF_BASE_NAMESPACE}">{body}</rpc-reply>',
+            ok=True,
+        )
+
+    def operation(self, name: str, details: object = None) -> SimpleNamespace:
+        self.requests.append((name, details))
+        if error := self.failures.get(name):
+            raise error
+        return self.ok_reply()
+
+    def get(self, filter=None):
+        self.requests.append(("get", filter))
+        return SimpleNamespace(data_xml=self.data_xml)
+
+    def edit_config(self, config, target="candidate", **kwargs):
+        return self.operation("edit-config", (target, config))
+
+    def lock(self, target="candidate"):
+        return self.operation("lock", target)
+
+    def unlock(self, target="candidate"):
+        return self.operation("unlock", target)
+
+    def validate(self, source="candidate"):
+        return self.operation("validate", source)
+
+    def commit(self, confirmed=False, timeout=None, **kwargs):
+        return self.operation("commit", (confirmed, timeout))
+
+    def discard_changes(self):
+        return self.operation("discard-changes")
+
+    def create_subscription(self, **kwargs):
+        self.requests.append(("create-subscription", kwargs))
+        return self.ok_reply()
+
+    def dispatch(self, rpc_command, source=None, filter=None):
+        self.requests.append(("dispatch", to_xml(rpc_command)))
+        subscription_id = self.next_subscription_id
+        self.next_subscription_id += 1
+        return self.ok_reply(
+            f'<id xmlns="{SUBSCRIBED_NOTIFICATIONS_NAMESPACE}">{subscription_id}</id>'
+        )
+
+    def push(self, event: str, **kwargs) -> None:
+        xml = notification_xml(event, **kwargs)
+        self.notifications.put(SimpleNamespace(notification_xml=xml))
+
+    def take_notification(self, block=True, timeout=None):
+        try:
+            return self.notifications.get(block, timeout)
+        except Empty:
+            return None
+
+    def close_session(self):
+        self.connected = False
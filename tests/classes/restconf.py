@@ -0,0 +1,80 @@
+# NetMagic RESTCONF Test Stand-In
+
+# Python Modules
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from json import dumps, loads
+from threading import Thread
+from typing import Self
+
+
+class StandInRESTCONFHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self) -> None:
+        self.server.connections += 1
+        super().setup()
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def reply(self, status: int, data=None) -> None:
+        body = dumps(data).encode() if data is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/yang-data+json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def read_body(self):
+        length = int(self.headers.get("Content-Length", 0))
+        return loads(self.rfile.read(length)) if length else None
+
+    def do_GET(self) -> None:
+        self.server.requests.append(("GET", self.path))
+        if self.path == "/restconf":
+            self.reply(200, {"ietf-restconf:restconf": {"data": {}}})
+        elif self.path in self.server.datastore:
+            self.reply(200, self.server.datastore[self.path])
+        else:
+            self.reply(404)
+
+    def do_PUT(self) -> None:
+        self.server.requests.append(("PUT", self.path))
+        self.server.datastore[self.path] = self.read_body()
+        self.reply(204)
+
+    def do_PATCH(self) -> None:
+        self.server.requests.append(("PATCH", self.path))
+        if self.path not in self.server.datastore:
+            self.reply(404)
+            return
+        self.server.datastore[self.path].update(self.read_body())
+        self.reply(204)
+
+
+class StandInRESTCONFServer(ThreadingHTTPServer):
+    """
+    Local HTTP/1.1 keep-alive server answering RESTCONF requests from an
+    in-memory datastore keyed by request path
+    """
+
+    daemon_threads = True
+
+    def __init__(self, datastore: dict | None = None) -> None:
+        super().__init__(("127.0.0.1", 0), StandInRESTCONFHandler)
+        self.datastore = datastore or {}
+        self.requests: list[tuple[str, str]] = []
+        self.connections = 0
+        self.thread = Thread(target=self.serve_forever, daemon=True)
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    def __enter__(self) -> Self:
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.shutdown()
+        self.server_close()
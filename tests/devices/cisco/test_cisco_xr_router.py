@@ -5,11 +5,16 @@ from types import SimpleNamespace
 from unittest import TestCase
 from unittest.mock import Mock
 
-from netmagic.common.classes import InterfaceStatistics
+from ncclient.operations.rpc import RPCError
+from ncclient.transport.errors import TransportError
+from ncclient.xml_ import to_ele
+
+from netmagic.common.classes import ConfigResponse, InterfaceStatistics
 from netmagic.devices import CiscoIOSXRRouter
 from netmagic.devices.vendors.cisco_xr import XR_STATS_NAMESPACE
 from netmagic.sessions import NETCONFSession, TerminalSession
 from tests.classes.common import MockBaseConnection
+from tests.classes.netconf import StandInNETCONFManager
 
 NETCONF_KWARGS = {
     "host": "192.0.2.1",
@@ -58,6 +63,22 @@ XR_XML = f"""
 </data>
 """
 
+XR_CONFIG = """
+<interface-configurations xmlns="http://cisco.com/ns/yang/Cisco-IOS-XR-ifmgr-cfg">
+  <interface-configuration>
+    <active>act</active>
+    <interface-name>GigabitEthernet0/0/0/0</interface-name>
+    <description>uplink</description>
+  </interface-configuration>
+</interface-configurations>
+"""
+
+RPC_ERROR = """<rpc-error xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">
+<error-type>application</error-type>
+<error-tag>operation-failed</error-tag>
+<error-severity>error</error-severity>
+</rpc-error>"""
+
 XR_CLI = """
 GigabitEthernet0/0/0/0 is up, line protocol is up
   5 minute input rate 1000 bits/sec, 20 packets/sec
@@ -100,6 +121,62 @@ class TestCiscoIOSXRRouter(TestCase):
         self.assertIn("generic-counters", rpc_filter[1])
         self.assertIn("data-rate", rpc_filter[1])
 
+    def test_netconf_streaming_statistics(self):
+        second = XR_XML.split("<interfaces>")[1].split("</interfaces>")[0]
+        second = second.replace("GigabitEthernet0/0/0/0", "GigabitEthernet0/0/0/1")
+        session = self.prepare_netconf()
+        session.connection.get.return_value.data_xml = XR_XML.replace(
+            "</interfaces>", f"{second}</interfaces>"
+        )
+        router = CiscoIOSXRRouter(session)
+
+        statistics = router.iter_interface_statistics()
+        self.assertNotIsInstance(statistics, dict)
+
+        names = [stats.interface for stats in statistics]
+        self.assertEqual(names, ["GigabitEthernet0/0/0/0", "GigabitEthernet0/0/0/1"])
+        self.assertEqual(len(session.rpc_log), 1)
+
+    def test_netconf_streaming_raises_on_call(self):
+        session = self.prepare_netconf()
+        router = CiscoIOSXRRouter(session)
+
+        with self.assertRaises(ValueError):
+            router.iter_interface_statistics("Gi0/0/0/0 | include password")
+
+        session.connection.get.side_effect = RPCError(to_ele(RPC_ERROR))
+        with self.assertRaises(RPCError):
+            router.iter_interface_statistics()
+
+    def test_netconf_batches_interfaces_and_caches_filter(self):
+        session = self.prepare_netconf()
+        router = CiscoIOSXRRouter(session)
+        uplinks = ["GigabitEthernet0/0/0/1", "GigabitEthernet0/0/0/0"]
+
+        router.get_interface_statistics(uplinks)
+        router.get_interface_statistics(list(reversed(uplinks)))
+
+        self.assertEqual(session.connection.get.call_count, 2)
+        first, second = (
+            call.kwargs["filter"] for call in session.connection.get.call_args_list
+        )
+        self.assertIs(first, second)
+        self.assertEqual(first[1].count("<interface-name>"), 2)
+        for name in uplinks:
+            self.assertIn(f"<interface-name>{name}</interface-name>", first[1])
+
+        with self.assertRaises(ValueError):
+            router.get_interface_statistics(["Gi0/0/0/0", "Gi0/0/0/1 | include"])
+
+    def test_netconf_accepts_generator_of_interfaces(self):
+        session = self.prepare_netconf()
+        router = CiscoIOSXRRouter(session)
+
+        router.get_interface_statistics(name for name in ["Gi0/0/0/1", "Gi0/0/0/0"])
+
+        rpc_filter = session.connection.get.call_args.kwargs["filter"]
+        self.assertEqual(rpc_filter[1].count("<interface-name>"), 2)
+
     def test_netconf_is_preferred_and_cli_can_be_explicit(self):
         netconf = self.prepare_netconf()
         terminal = self.prepare_terminal()
@@ -145,6 +222,77 @@ class TestCiscoIOSXRRouter(TestCase):
         with self.assertRaises(NotImplementedError):
             router.get_interface_statistics()
 
+    def test_netconf_config_transaction(self):
+        manager = StandInNETCONFManager()
+        session = NETCONFSession(connection=manager, **NETCONF_KWARGS)
+        router = CiscoIOSXRRouter(session)
+
+        result = router.send_config(XR_CONFIG, confirmed=True, confirm_timeout=120)
+
+        self.assertIsInstance(result, ConfigResponse)
+        self.assertTrue(result.success)
+        self.assertEqual(result.retries, 1)
+        self.assertIs(result.session, session)
+        operations = [name for name, _ in manager.requests]
+        self.assertEqual(
+            operations, ["lock", "edit-config", "validate", "commit", "unlock"]
+        )
+        target, config = manager.requests[1][1]
+        self.assertEqual(target, "candidate")
+        self.assertTrue(config.startswith("<config"))
+        self.assertEqual(manager.requests[3][1], (True, "120"))
+
+    def test_netconf_config_failure_discards_candidate(self):
+        manager = StandInNETCONFManager()
+        manager.failures["commit"] = RPCError(to_ele(RPC_ERROR))
+        session = NETCONFSession(connection=manager, **NETCONF_KWARGS)
+        router = CiscoIOSXRRouter(session)
+
+        result = router.send_config(XR_CONFIG)
+
+        self.assertFalse(result.success)
+        self.assertIsInstance(result.response, RPCError)
+        self.assertEqual(result.retries, 1)
+        operations = [name for name, _ in manager.requests]
+        self.assertEqual(operations[-2:], ["discard-changes", "unlock"])
+
+        with self.assertRaises(ValueError):
+            router.send_config(["hostname XR"], session=session)
+
+    def test_netconf_config_is_not_resent_after_commit(self):
+        manager = StandInNETCONFManager()
+        manager.failures["commit"] = TransportError("connection dropped")
+        session = NETCONFSession(connection=manager, **NETCONF_KWARGS)
+        router = CiscoIOSXRRouter(session)
+
+        result = router.send_config(XR_CONFIG, max_tries=3)
+
+        self.assertIsInstance(result, ConfigResponse)
+        self.assertFalse(result.success)
+        self.assertIsInstance(result.response, TransportError)
+        self.assertEqual(result.retries, 1)
+        operations = [name for name, _ in manager.requests]
+        self.assertEqual(operations.count("commit"), 1)
+
+    def test_cli_config_uses_explicit_session(self):
+        router = CiscoIOSXRRouter(self.prepare_terminal())
+        connection = MockBaseConnection()
+        connection.send_config_set.return_value = "hostname XR"
+        other = TerminalSession(
+            host="192.0.2.2",
+            username="admin",
+            password="password",  # nosec B106
+            connection=connection,
+        )
+
+        result = router.send_config(["hostname XR"], 3, True, False, session=other)
+
+        self.assertTrue(result.success)
+        self.assertIs(result.session, other)
+        connection.send_config_set.assert_called_once_with(
+            ["hostname XR"], exit_config_mode=True
+        )
+
     @staticmethod
     def prepare_terminal(cli_output=XR_CLI):
         connection = MockBaseConnection()
@@ -0,0 +1,95 @@
+# NetMagic Config Backup Store Tests
+
+# Python Modules
+from datetime import UTC, datetime, timedelta
+from os import path, walk
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+from unittest.mock import Mock
+
+# Local Modules
+from netmagic.common.classes import CommandResponse
+from netmagic.storage import BackupStore
+
+NIGHT = datetime(2024, 3, 1, 2, tzinfo=UTC)
+CONFIG = (
+    "Building configuration...\n\nCurrent configuration : {size} bytes\n!\n"
+    "! Last configuration change at {time}\n!\nhostname {host}\n!\n"
+    "interface Gi1/0/1\n description {description}\n!\nend\n"
+)
+
+
+def config(host: str, description: str = "uplink", night: int = 0) -> str:
+    return CONFIG.format(
+        size=1000 + night, time=f"0{night}:00:00", host=host, description=description
+    )
+
+
+def device(host: str, output: str | Exception) -> Mock:
+    switch = Mock(hostname=host)
+    switch.get_running_config.return_value = CommandResponse(
+        output, "show run", NIGHT, None, ""
+    )
+    return switch
+
+
+class TestBackupStore(TestCase):
+    def setUp(self):
+        directory = TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def test_unchanged_configs_are_stored_once(self):
+        with BackupStore(self.directory, compression="lzma") as store:
+            for night in range(3):
+                taken_at = NIGHT + timedelta(days=night)
+                for host in ("sw1", "sw2"):
+                    backup = store.save(host, config(host, night=night), taken_at)
+                    self.assertEqual(backup.changed, night == 0)
+
+            blobs = sum(
+                len(files) for _, _, files in walk(path.join(self.directory, "objects"))
+            )
+            self.assertEqual(blobs, 2)
+            self.assertEqual(len(store.history("sw1")), 3)
+            self.assertIn("hostname sw1", store.latest("sw1"))
+            self.assertNotIn("Last configuration change", store.latest("sw1"))
+            self.assertIsNone(store.latest("sw3"))
+
+    def test_changed_since_and_diff(self):
+        with BackupStore(self.directory) as store:
+            store.save("sw1", config("sw1"), NIGHT)
+            store.save("sw2", config("sw2"), NIGHT)
+            store.save("sw1", config("sw1", "core link"), NIGHT + timedelta(days=1))
+            store.save("sw2", config("sw2"), NIGHT + timedelta(days=1))
+            store.save("sw3", config("sw3"), NIGHT + timedelta(days=1))
+
+            changes = store.changed_since(NIGHT + timedelta(hours=1))
+            self.assertEqual([i.host for i in changes], ["sw1", "sw3"])
+            self.assertIsNotNone(changes[0].previous_hash)
+            self.assertIsNone(changes[1].previous_hash)
+
+            diff = store.diff("sw1")
+            self.assertIn("- description uplink", diff)
+            self.assertIn("+ description core link", diff)
+            self.assertEqual(store.diff("sw2")[-1], "+end")
+
+    def test_backup_fleet_concurrently(self):
+        devices = [device(f"sw{i}", config(f"sw{i}")) for i in range(20)]
+        devices.append(device("down", OSError("Socket closed")))
+
+        with BackupStore(self.directory) as store:
+            results = store.backup_fleet(devices, workers=8)
+            self.assertTrue(all(i.changed for i in results[:-1]))
+            self.assertIsInstance(results[-1], OSError)
+
+        # The index persists when the store is reopened
+        with BackupStore(self.directory) as store:
+            self.assertEqual(len(store.changed_since(NIGHT - timedelta(days=1))), 20)
+
+        with self.assertRaises(ValueError):
+            BackupStore(self.directory, compression="zip")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+# NetMagic Benchmark Tests
+
+# Python Modules
+from json import load
+from os import path
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+# Local Modules
+from netmagic.benchmarks import parsers, responses
+
+TEMPLATE_DIR = Path(parsers.__file__).parents[1] / "templates"
+
+
+class TestParserBenchmark(TestCase):
+    def test_every_template_has_a_case(self):
+        templates = {
+            f"{file.parent.name}/{file.stem}"
+            for file in TEMPLATE_DIR.glob("*/*.textfsm")
+        }
+        self.assertEqual(templates, {case.name for case in parsers.CASES})
+
+    def test_generated_output_parses_and_builds(self):
+        for case in parsers.CASES:
+            with self.subTest(case.name):
+                result = parsers.run_case(case, 10, repeat=1)
+                self.assertGreaterEqual(result["rows"], 10)
+                if case.template.build is not None:
+                    self.assertGreaterEqual(result["models"], 10)
+
+    def test_main_writes_results(self):
+        with TemporaryDirectory() as directory:
+            filename = path.join(directory, "results.json")
+            results = parsers.main(
+                [
+                    "--records",
+                    "5",
+                    "--repeat",
+                    "1",
+                    "--memory",
+                    "--templates",
+                    "cisco/show_mac_table",
+                    "--output",
+                    filename,
+                ]
+            )
+            with open(filename, encoding="utf-8") as file:
+                document = load(file)
+
+        self.assertEqual(len(results), 1)
+        self.assertEqual(document["results"], results)
+        self.assertIn("python", document)
+        self.assertGreater(results[0]["peak_memory_bytes"], 0)
+
+
+class TestResponseBenchmark(TestCase):
+    def test_reports_per_response_memory(self):
+        result = responses.run_case(1_000)
+        self.assertGreater(result["bytes_per_response"], 0)
+        self.assertGreater(result["responses_per_second"], 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+# NetMagic Change Detection Tests
+
+# Python Modules
+from unittest import TestCase, main
+
+# Local Modules
+from netmagic.analysis import ChangeTracker, diff_results
+from netmagic.benchmarks import changes
+from netmagic.common.classes import CommandResponse
+from netmagic.common.classes.interface import InterfaceStatus
+from netmagic.common.classes.status import MACTableEntry
+
+
+def status(host: str = "sw1", **ports: dict) -> dict[str, InterfaceStatus]:
+    result = {}
+    for number in range(1, 5):
+        fields = {"state": "connected", "speed": 1000, "duplex": "a-full"}
+        fields.update(ports.get(f"p{number}", {}))
+        interface = f"Gi1/0/{number}"
+        result[interface] = InterfaceStatus(host=host, interface=interface, **fields)
+    return result
+
+
+def mac_table(*entries: tuple[str, str, str]) -> dict:
+    result = {}
+    for mac, interface, vlan in entries:
+        entry = MACTableEntry.create(
+            "sw1", mac, interface=interface, vlan=vlan, type="dynamic"
+        )
+        result[entry.mac] = entry
+    return result
+
+
+class TestChangeTracker(TestCase):
+    def test_first_result_is_a_baseline(self):
+        tracker = ChangeTracker()
+        self.assertEqual(tracker.update(status()), [])
+        self.assertIn("sw1", tracker)
+        self.assertEqual(tracker.update(status()), [])
+
+    def test_link_and_speed_changes(self):
+        tracker = ChangeTracker()
+        tracker.update(status())
+        found = tracker.update(
+            status(p2={"state": "notconnect"}, p3={"speed": 100, "duplex": "a-half"})
+        )
+
+        self.assertEqual([change.key for change in found], ["Gi1/0/2", "Gi1/0/3"])
+        down, slow = found
+        self.assertEqual(down.kind, "changed")
+        self.assertEqual(down.events, ("link_down",))
+        self.assertEqual(down.fields, {"state": ("connected", "notconnect")})
+        self.assertEqual(slow.events, ("speed", "duplex"))
+        self.assertEqual(slow.before["speed"], 1000)
+        self.assertEqual(slow.after["speed"], 100)
+
+        (up,) = tracker.update(status(p3={"speed": 100, "duplex": "a-half"}))
+        self.assertEqual(up.events, ("link_up",))
+
+    def test_added_and_removed_rows(self):
+        tracker = ChangeTracker()
+        tracker.update(status())
+        result = status()
+        del result["Gi1/0/4"]
+        result["Gi1/0/5"] = InterfaceStatus(host="sw1", interface="Gi1/0/5")
+
+        found = {change.key: change for change in tracker.update(result)}
+        self.assertEqual(found["Gi1/0/5"].kind, "added")
+        self.assertIsNone(found["Gi1/0/5"].before)
+        self.assertEqual(found["Gi1/0/4"].kind, "removed")
+        self.assertIsNone(found["Gi1/0/4"].after)
+
+    def test_mac_moves(self):
+        tracker = ChangeTracker()
+        tracker.update(
+            mac_table(
+                ("aaaa.bbbb.0001", "Gi1/0/1", "10"), ("aaaa.bbbb.0002", "Gi1/0/2", "10")
+            )
+        )
+        found = tracker.update(
+            mac_table(
+                ("aaaa.bbbb.0001", "Gi1/0/7", "10"), ("aaaa.bbbb.0003", "Gi1/0/3", "20")
+            )
+        )
+        events = {str(change.key): change.events for change in found}
+        self.assertEqual(
+            events,
+            {
+                "AA:AA:BB:BB:00:01": ("mac_move",),
+                "AA:AA:BB:BB:00:03": ("mac_learned",),
+                "AA:AA:BB:BB:00:02": ("mac_aged",),
+            },
+        )
+
+    def test_empty_results_need_a_host(self):
+        tracker = ChangeTracker()
+        tracker.update(status())
+        with self.assertRaises(ValueError):
+            tracker.update({})
+        removed = tracker.update({}, host="sw1")
+        self.assertEqual({change.kind for change in removed}, {"removed"})
+        self.assertEqual(len(removed), 4)
+
+    def test_ignored_columns_and_forget(self):
+        tracker = ChangeTracker(ignore=["speed"])
+        tracker.update(status())
+        self.assertEqual(tracker.update(status(p1={"speed": 10})), [])
+        tracker.forget("sw1")
+        self.assertEqual(tracker.update(status(p1={"state": "disabled"})), [])
+
+    def test_responses_and_diff_results(self):
+        old = CommandResponse("", "show int status", 0.0, None, "#")
+        old.fsm_output = status()
+        found = diff_results(old, status(p4={"state": "err-disabled"}))
+        self.assertEqual(
+            [(change.host, change.events) for change in found],
+            [("sw1", ("link_down",))],
+        )
+
+        with self.assertRaises(TypeError):
+            diff_results([], status())
+
+    def test_benchmark(self):
+        result = changes.run_case(5, 10, 2)
+        self.assertEqual(result["changes"], 10)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+# NetMagic Command Line Tests
+
+# Python Modules
+from contextlib import redirect_stderr
+from gzip import open as gzip_open
+from io import StringIO
+from json import loads
+from os import makedirs, path
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+# Local Modules
+from netmagic.benchmarks.parsers import CASES
+from netmagic.cli import chunk_files, host_for, iter_archive
+from netmagic.cli import main as cli_main
+from netmagic.devices import CiscoIOSSwitch
+from netmagic.devices.offline import (
+    TEMPLATES,
+    OfflineDevice,
+    infer_template,
+    offline_device,
+)
+
+
+class TestParseCommand(TestCase):
+    def setUp(self):
+        directory = TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.archive = path.join(directory.name, "archive")
+        self.results = path.join(directory.name, "records.jsonl.gz")
+
+        self.templates = {}
+        for number, case in enumerate(CASES):
+            host = f"sw{number}"
+            makedirs(path.join(self.archive, host))
+            filename = path.join(self.archive, host, f"{case.template.template}.txt")
+            with open(filename, "w", encoding="utf-8", newline="\r\n") as file:
+                file.write(case.outputs(5)[0])
+            self.templates[host] = case.name
+
+        with open(path.join(self.archive, "notes.txt"), "w") as file:
+            file.write("not a command output\n")
+
+    def run_parse(self, *args: str) -> tuple[int, list[dict], dict]:
+        errors = StringIO()
+        with redirect_stderr(errors):
+            code = cli_main(["parse", self.archive, "-o", self.results, *args])
+        with gzip_open(self.results, "rt", encoding="utf-8") as file:
+            records = [loads(line) for line in file]
+        return code, records, loads(errors.getvalue().splitlines()[-1])
+
+    def test_every_template_is_inferred(self):
+        for case in CASES:
+            with self.subTest(case.name):
+                template = infer_template(case.outputs(3)[0])
+                self.assertEqual(template, case.template)
+
+    def test_offline_devices_are_subclasses(self):
+        device_class = offline_device(CiscoIOSSwitch)
+        self.assertIs(offline_device(CiscoIOSSwitch), device_class)
+        self.assertTrue(issubclass(device_class, OfflineDevice))
+        self.assertTrue(issubclass(device_class, CiscoIOSSwitch))
+
+        template = TEMPLATES["cisco/show_int_status"]
+        rows = [{"interface": "Gi1/0/1"}]
+        device = device_class(template, rows, "output", "sw1")
+        self.assertNotIn("command", vars(device))
+        self.assertEqual(device.command("show int status").response, "output")
+        self.assertIs(device.fsm_parse("output", template.template), rows)
+        self.assertEqual(device.fsm_parse("output", "show_lldp_nei_det"), [])
+
+    def test_parse_archive_across_processes(self):
+        code, records, summary = self.run_parse(
+            "--jobs", "2", "--chunk-bytes", "2048", "--mmap-threshold", "1024"
+        )
+        self.assertEqual(code, 0)
+        self.assertEqual(summary["files"], len(CASES) + 1)
+        self.assertEqual(summary["parsed"], len(CASES))
+        self.assertEqual(summary["skipped"], 1)
+        self.assertEqual(summary["records"], len(records))
+
+        # Every host's file is parsed with its own template into models
+        seen = {record["host"]: record["template"] for record in records}
+        self.assertEqual(seen, self.templates)
+        status = next(i for i in records if i["template"] == "cisco/show_int_status")
+        self.assertEqual(status["model"], "InterfaceStatus")
+        self.assertEqual(status["host"], status["file"].split("/")[0])
+
+    def test_forced_template_and_raw_rows(self):
+        code, records, summary = self.run_parse(
+            "--jobs",
+            "1",
+            "--template",
+            "cisco/show_mac_table",
+            "--raw",
+            "--include",
+            "show_mac_table.*",
+        )
+        self.assertEqual(code, 0)
+        self.assertEqual(summary["files"], 2)
+        self.assertEqual(summary["parsed"], 2)
+        self.assertEqual(len(records), 5)
+        self.assertNotIn("model", records[0])
+        self.assertEqual(records[0]["mac"], "0024.0000.0000")
+
+
+class TestArchive(TestCase):
+    def test_hosts_and_chunks(self):
+        self.assertEqual(host_for("core1/show_int.txt"), "core1")
+        self.assertEqual(host_for("core1_show_int.txt"), "core1")
+        self.assertEqual(
+            host_for("2024/edge-2.show.txt", r"/(?P<host>[^/.]+)\."), "edge-2"
+        )
+        self.assertEqual(host_for("2024/edge-2.show.txt", r"edge-\d+"), "edge-2")
+
+        files = [(f"f{i}", f"f{i}", size) for i, size in enumerate((10, 10, 50, 5))]
+        chunks = list(chunk_files(files, chunk_bytes=20))
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 1, 1])
+        self.assertEqual(list(iter_archive(["does-not-exist"])), [])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+# NetMagic Connection Handler Tests
+
+# Python Modules
+from socket import create_server
+from time import sleep
+from types import SimpleNamespace
+from unittest import TestCase, main
+from unittest.mock import Mock, patch
+
+# Third-Party Modules
+from netmiko import NetmikoTimeoutException
+
+# Local Modules
+from netmagic.handlers.connect import netmiko_connect
+from netmagic.sessions import TerminalSession
+from tests.classes.common import SSH_KWARGS
+
+CONNECT_DIR = "netmagic.handlers.connect"
+
+
+class StandInConnection:
+    """
+    Follows the order of Netmiko's `_open` with short delays per step
+    """
+
+    def __init__(self, **kwargs) -> None:
+        self.kwargs = kwargs
+        self.disconnect = Mock()
+
+    def _build_ssh_client(self):
+        return SimpleNamespace(_auth=lambda: sleep(0.02))
+
+    def establish_connection(self):
+        client = self._build_ssh_client()
+        sleep(0.01)
+        client._auth()
+
+    def _try_session_preparation(self):
+        sleep(0.01)
+
+    def _open(self):
+        self.establish_connection()
+        self._try_session_preparation()
+
+
+class TestNetmikoConnect(TestCase):
+    def setUp(self) -> None:
+        self.server = create_server(("127.0.0.1", 0))
+        self.addCleanup(self.server.close)
+        self.port = self.server.getsockname()[1]
+        self.kwargs = {**SSH_KWARGS, "host": "127.0.0.1", "port": self.port}
+        self.kwargs.pop("transport")
+
+    def test_phases_are_recorded_in_order(self):
+        phases = {}
+        with patch(f"{CONNECT_DIR}.ConnectHandler", StandInConnection):
+            connection = netmiko_connect(phases=phases, **self.kwargs)
+
+        self.assertFalse(connection.kwargs["auto_connect"])
+        self.assertEqual(connection.kwargs["sock"].getpeername()[1], self.port)
+        connection.kwargs["sock"].close()
+        self.assertEqual(
+            list(phases),
+            ["dns", "tcp", "key_exchange", "authentication", "prompt_discovery"],
+        )
+        self.assertGreaterEqual(phases["authentication"], 0.02)
+        self.assertGreaterEqual(phases["key_exchange"], 0.01)
+
+    def test_falls_back_without_netmiko_steps(self):
+        phases = {}
+        with (
+            patch(f"{CONNECT_DIR}.ConnectHandler", StandInConnection),
+            patch(f"{CONNECT_DIR}.NETMIKO_PHASE_STEPS", ("_missing_step",)),
+        ):
+            connection = netmiko_connect(phases=phases, **self.kwargs)
+
+        connection.kwargs["sock"].close()
+        self.assertNotIn("auto_connect", connection.kwargs)
+        self.assertEqual(list(phases), ["dns", "tcp", "authentication"])
+
+    def test_unreachable_host_raises_timeout(self):
+        self.server.close()
+        with (
+            patch(f"{CONNECT_DIR}.ConnectHandler", StandInConnection),
+            self.assertRaises(NetmikoTimeoutException),
+        ):
+            netmiko_connect(**self.kwargs)
+
+    def test_session_keeps_connect_responses(self):
+        session = TerminalSession(**SSH_KWARGS)
+
+        def stand_in_connect(phases, **kwargs):
+            phases.update(dns=0.1, tcp=0.2)
+            return Mock()
+
+        with patch("netmagic.sessions.terminal.netmiko_connect", stand_in_connect):
+            self.assertTrue(session.connect())
+
+        response = session.connect_response
+        self.assertTrue(response.success)
+        self.assertEqual(response.slowest_phase, "tcp")
+        self.assertEqual(response.host, SSH_KWARGS["host"])
+        self.assertNotIn("password", response.params)
+        self.assertEqual(session.connect_log, [response])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+# NetMagic Excel Writer Tests
+
+from datetime import date
+from os import path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from mactools import MacAddress
+from openpyxl import Workbook, load_workbook
+
+from netmagic.handlers.excel_writer import (
+    CellEntry,
+    RowEntry,
+    Section,
+    SheetEntry,
+    StyleCache,
+    prepare_workbook,
+    shared_fill,
+    shared_font,
+)
+
+
+def generate_rows(count: int):
+    font = shared_font(bold=True)
+    fill = shared_fill(fill_type="solid", fgColor="FF0000")
+    yield RowEntry([CellEntry("Interface", font=font), CellEntry("VLAN", font=font)])
+    for i in range(count):
+        yield RowEntry([CellEntry(f"Gi1/0/{i + 1}", fill=fill), i + 1])
+
+
+def generate_mixed_rows():
+    yield from generate_rows(2)
+    yield RowEntry([MacAddress("00:11:22:33:44:55"), CellEntry({"Gi1/0/1"})])
+    yield RowEntry([None, 1.5, True])
+
+
+class TestExcelWriter(TestCase):
+    def test_shared_styles_are_reused(self):
+        self.assertIs(shared_font(bold=True), shared_font(bold=True))
+        self.assertIs(shared_fill(fill_type="solid"), shared_fill(fill_type="solid"))
+
+    def test_write_only_streams_generated_rows(self):
+        with TemporaryDirectory() as directory:
+            filename = path.join(directory, "report")
+            sheet = SheetEntry("Ports", [Section(generate_rows(100))])
+            prepare_workbook(filename, [sheet], write_only=True)
+
+            workbook = load_workbook(f"{filename}.xlsx")
+            rows = list(workbook["Ports"].iter_rows())
+
+        self.assertEqual(len(rows), 101)
+        self.assertTrue(rows[0][0].font.b)
+        self.assertEqual(rows[100][0].value, "Gi1/0/100")
+        self.assertEqual(rows[100][0].fill.fgColor.rgb, "00FF0000")
+        self.assertEqual(rows[100][1].value, 100)
+
+    def test_standard_mode_matches_write_only_values(self):
+        with TemporaryDirectory() as directory:
+            values = {}
+            for write_only in (False, True):
+                filename = path.join(directory, f"report_{write_only}.xlsx")
+                sheet = SheetEntry("Ports", [Section(generate_mixed_rows())])
+                prepare_workbook(filename, [sheet], write_only=write_only)
+                workbook = load_workbook(filename)
+                values[write_only] = [
+                    [(type(cell.value), cell.value) for cell in row]
+                    for row in workbook["Ports"].iter_rows()
+                ]
+                self.assertEqual(workbook.sheetnames, ["Ports"])
+
+        self.assertEqual(values[False], values[True])
+        self.assertEqual(values[True][1][1], (int, 1))
+        self.assertEqual(
+            values[True][3][:2],
+            [(str, str(MacAddress("00:11:22:33:44:55"))), (str, "{'Gi1/0/1'}")],
+        )
+        self.assertEqual(
+            values[True][4], [(type(None), None), (float, 1.5), (bool, True)]
+        )
+
+    def test_standard_mode_keeps_primitive_types(self):
+        rows = [RowEntry([1, 2.5, True, None, "text", MacAddress("00:11:22:33:44:55")])]
+        with TemporaryDirectory() as directory:
+            filename = path.join(directory, "types.xlsx")
+            prepare_workbook(filename, [SheetEntry("Types", [Section(rows)])])
+            values = [cell.value for cell in load_workbook(filename)["Types"][1]]
+
+        self.assertEqual(
+            values, [1, 2.5, True, None, "text", str(MacAddress("00:11:22:33:44:55"))]
+        )
+        self.assertIsInstance(values[0], int)
+
+    def test_styled_dates_keep_their_number_format(self):
+        font = shared_font(bold=True)
+        rows = [
+            RowEntry([CellEntry("Installed", font=font)]),
+            RowEntry([CellEntry(date(2026, 1, 2), font=font)]),
+            RowEntry([date(2026, 1, 3)]),
+        ]
+        with TemporaryDirectory() as directory:
+            for write_only in (False, True):
+                filename = path.join(directory, f"dates_{write_only}.xlsx")
+                prepare_workbook(
+                    filename, [SheetEntry("Dates", [Section(rows)])], write_only
+                )
+                cells = [row[0] for row in load_workbook(filename)["Dates"]]
+
+                with self.subTest(write_only=write_only):
+                    self.assertEqual(cells[1].value.date(), date(2026, 1, 2))
+                    self.assertEqual(cells[1].number_format, cells[2].number_format)
+                    self.assertNotEqual(cells[1].number_format, "General")
+                    self.assertTrue(cells[1].font.b)
+
+    def test_style_cache_resolves_each_pair_once(self):
+        styles = StyleCache()
+        font = shared_font(bold=True)
+        worksheet = Workbook().active
+
+        for row in range(1, 4):
+            styles.apply(worksheet.cell(row, 1), font, None)
+
+        self.assertEqual(len(styles.styles), 1)
+        self.assertTrue(worksheet.cell(3, 1).font.b)
@@ -0,0 +1,115 @@
+# NetMagic Model Exporter Tests
+
+from json import loads
+from os import path
+from tempfile import TemporaryDirectory
+from types import SimpleNamespace
+from unittest import TestCase
+
+from openpyxl import load_workbook
+
+from netmagic.common.classes import InterfaceOptics, InterfaceStatus, OpticStatus
+from netmagic.common.classes.status import MACTableEntry, POEHost, POEPort
+from netmagic.common.types import SFPAlert
+from netmagic.handlers.exporters import model_section, model_sheet, results_sheet
+from netmagic.handlers.report_writer import prepare_report
+
+
+def status_output(host: str, count: int = 3) -> dict[str, InterfaceStatus]:
+    return {
+        f"Gi1/0/{i}": InterfaceStatus(
+            host=host, interface=f"Gi1/0/{i}", state="connected", speed="1G"
+        )
+        for i in range(1, count + 1)
+    }
+
+
+class TestExporters(TestCase):
+    def test_columns_follow_model_fields(self):
+        section = model_section(status_output("sw1"))
+        rows = list(section.rows)
+
+        self.assertEqual(section.header, list(InterfaceStatus.model_fields))
+        self.assertEqual(rows[0][:2], ["sw1", "Gi1/0/1"])
+        self.assertEqual(rows[0][section.header.index("speed")], 1000)
+
+    def test_nested_and_collection_values(self):
+        reading = {"reading": -2.5, "status": SFPAlert.NORMAL}
+        optics = InterfaceOptics(
+            host="sw1",
+            interface="Te1/1/1",
+            **{
+                name: OpticStatus(**reading)
+                for name in (
+                    "temperature",
+                    "transmit_power",
+                    "receive_power",
+                    "voltage",
+                    "current",
+                )
+            },
+        )
+        mac = MACTableEntry.create(
+            "sw1", "0011.2233.4455", interface="Gi1/0/1", vlan="10", type="dynamic"
+        )
+
+        optics_section = model_section(
+            [optics],
+            fields=["interface", "receive_power_reading", "receive_power_status"],
+        )
+        mac_row = next(model_section({mac.mac: mac}).rows)
+
+        self.assertEqual(next(optics_section.rows), ["Te1/1/1", -2.5, "normal"])
+        self.assertIn("00:11:22:33:44:55", mac_row)
+        self.assertIn("10:Gi1/0/1", mac_row)
+        with self.assertRaises(ValueError):
+            model_section([optics], fields=["missing"])
+
+    def test_empty_source_writes_nothing(self):
+        self.assertIsNone(model_section([]).header)
+        self.assertEqual(model_section({}, POEPort).header[:2], ["host", "interface"])
+
+        with TemporaryDirectory() as directory:
+            for report_format in ("csv", "jsonl"):
+                with self.subTest(report_format):
+                    (filename,) = prepare_report(
+                        directory, [model_sheet("Empty", [])], report_format
+                    )
+                    self.assertEqual(path.getsize(filename), 0)
+
+            workbook_name = path.join(directory, "empty.xlsx")
+            prepare_report(workbook_name, [model_sheet("Empty", [])])
+            self.assertEqual(load_workbook(workbook_name)["Empty"].max_row, 1)
+            self.assertIsNone(load_workbook(workbook_name)["Empty"].cell(1, 1).value)
+
+    def test_results_skip_other_models_and_stream_to_backends(self):
+        poe = {
+            "Gi1/0/1": POEPort(host="sw1", interface="Gi1/0/1", consumed=4.2),
+            "sw1": POEHost(host="sw1", capacity=370, available=300),
+        }
+        results = (
+            SimpleNamespace(fsm_output=status_output(host)) for host in ("sw1", "sw2")
+        )
+
+        with TemporaryDirectory() as directory:
+            filenames = prepare_report(
+                directory,
+                [results_sheet("Status", results), model_sheet("POE", poe, POEPort)],
+                "jsonl",
+            )
+            with open(filenames[0]) as file:
+                status = [loads(line) for line in file]
+            with open(filenames[1]) as file:
+                poe_rows = [loads(line) for line in file]
+
+            workbook_name = path.join(directory, "status.xlsx")
+            prepare_report(workbook_name, [model_sheet("Status", status_output("sw3"))])
+            worksheet = load_workbook(workbook_name)["Status"]
+
+        self.assertEqual(len(status), 6)
+        self.assertEqual(status[5]["host"], "sw2")
+        self.assertEqual(
+            poe_rows, [{**poe_rows[0], "interface": "Gi1/0/1", "consumed": 4.2}]
+        )
+        self.assertEqual(worksheet.cell(1, 1).value, "host")
+        self.assertEqual(worksheet.max_row, 4)
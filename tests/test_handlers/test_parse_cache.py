@@ -0,0 +1,72 @@
+# NetMagic Parse Cache Tests
+
+# Python Modules
+from unittest import TestCase, main
+from unittest.mock import patch
+
+# Local Modules
+from netmagic.benchmarks.parsers import cisco_int_trans_det, cisco_mac_table
+from netmagic.devices import CiscoIOSSwitch
+from netmagic.handlers import ParseCache, get_fsm_data
+
+
+class TestParseCache(TestCase):
+    def test_unchanged_output_is_parsed_once(self):
+        cache = ParseCache()
+        output = cisco_mac_table(20)
+        with patch(
+            "netmagic.handlers.parse_cache.get_fsm_data", wraps=get_fsm_data
+        ) as parse:
+            first = cache.parse("sw1", output, "show_mac_table", "cisco")
+            second = cache.parse("sw1", output, "show_mac_table", "cisco")
+            cache.parse("sw2", output, "show_mac_table", "cisco")
+
+        self.assertEqual(parse.call_count, 2)
+        self.assertEqual(first, second)
+        self.assertEqual(first, get_fsm_data(output, "show_mac_table", "cisco"))
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertEqual(cache.stats()["misses"], 2)
+
+    def test_hits_are_copies(self):
+        cache = ParseCache()
+        output = cisco_int_trans_det(2)
+        first = cache.parse("sw1", output, "show_int_trans_det", "cisco", "interface")
+        first[0]["interface"] = "changed"
+        first.clear()
+        second = cache.parse("sw1", output, "show_int_trans_det", "cisco", "interface")
+        self.assertEqual(
+            second,
+            get_fsm_data(output, "show_int_trans_det", "cisco", "interface"),
+        )
+
+    def test_evictions(self):
+        cache = ParseCache(entries_per_key=2, max_keys=2)
+        for count in (1, 2, 3):
+            cache.parse("sw1", cisco_mac_table(count), "show_mac_table", "cisco")
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.evictions, 1)
+
+        # The least recently used host is dropped with all its outputs
+        cache.parse("sw2", cisco_mac_table(1), "show_mac_table", "cisco")
+        cache.parse("sw3", cisco_mac_table(1), "show_mac_table", "cisco")
+        self.assertEqual(cache.stats()["keys"], 2)
+        self.assertEqual(cache.evictions, 3)
+
+        cache.clear()
+        self.assertEqual(cache.stats()["hit_ratio"], 0.0)
+        with self.assertRaises(ValueError):
+            ParseCache(entries_per_key=0)
+
+    def test_device_parse_cache(self):
+        switch = CiscoIOSSwitch([])
+        switch.hostname = "sw1"
+        switch.parse_cache = ParseCache()
+        output = cisco_mac_table(10)
+        for _ in range(3):
+            self.assertEqual(len(switch.fsm_parse(output, "show_mac_table")), 10)
+        self.assertEqual(switch.parse_cache.hits, 2)
+        self.assertIsNone(CiscoIOSSwitch.parse_cache)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# NetMagic Parse Pool Tests
+
+# Python Modules
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase, main
+
+# Local Modules
+from netmagic.benchmarks.parsers import cisco_int_trans_det, cisco_mac_table
+from netmagic.devices import CiscoIOSSwitch
+from netmagic.handlers import ParsePool, get_fsm_data
+from netmagic.handlers.parse import get_parser
+from netmagic.handlers.parse_pool import builtin_templates
+
+
+class TestParsePool(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.pool = ParsePool(workers=2, inline_size=0, shared_memory_size=50_000)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.pool.shutdown()
+
+    def test_same_output_as_inline_parsing(self):
+        for count in (10, 2_000):  # piped and through shared memory
+            with self.subTest(count=count):
+                output = cisco_mac_table(count)
+                self.assertEqual(
+                    get_fsm_data(output, "show_mac_table", "cisco", pool=self.pool),
+                    get_fsm_data(output, "show_mac_table", "cisco"),
+                )
+
+        output = cisco_int_trans_det(5)
+        self.assertEqual(
+            get_fsm_data(output, "show_int_trans_det", "cisco", "interface", self.pool),
+            get_fsm_data(output, "show_int_trans_det", "cisco", "interface"),
+        )
+
+    def test_device_parse_pool(self):
+        switch = CiscoIOSSwitch([])
+        switch.parse_pool = self.pool
+        rows = switch.fsm_parse(cisco_mac_table(100), "show_mac_table")
+        self.assertEqual(len(rows), 100)
+        self.assertIsNone(CiscoIOSSwitch.parse_pool)
+
+    def test_parsers_compile_once_per_thread(self):
+        output = cisco_mac_table(5)
+        parser = get_parser("show_mac_table", "cisco")
+        rows = parser.ParseTextToDicts(output)
+
+        self.assertIs(get_parser("show_mac_table", "cisco"), parser)
+        self.assertEqual(get_fsm_data(output, "show_mac_table", "cisco"), rows)
+        with ThreadPoolExecutor(1) as executor:
+            other = executor.submit(get_parser, "show_mac_table", "cisco").result()
+        self.assertIsNot(other, parser)
+
+    def test_small_outputs_parse_inline(self):
+        pool = ParsePool(workers=1)
+        self.assertEqual(
+            len(pool.parse(cisco_mac_table(3), "show_mac_table", "cisco")), 3
+        )
+        self.assertIsNone(pool.executor)
+        self.assertIn(("show_mac_table", "brocade"), builtin_templates())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+# NetMagic Report Writer Tests
+
+from csv import reader
+from gzip import open as gzip_open
+from json import loads
+from os import path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from mactools import MacAddress
+from openpyxl import load_workbook
+
+from netmagic.common import ReportFormat
+from netmagic.handlers.excel_writer import CellEntry, RowEntry, Section, SheetEntry
+from netmagic.handlers.report_writer import (
+    REPORT_WRITERS,
+    prepare_report,
+    register_report_writer,
+)
+
+
+def inventory_sheets():
+    rows = (RowEntry([f"switch-{i}", CellEntry(i * 10)]) for i in range(3))
+    return [
+        SheetEntry("Inventory Ports", [Section(rows, header=["host", "ports"])]),
+        SheetEntry("Notes", [Section([["free text", None]])]),
+    ]
+
+
+class TestReportWriter(TestCase):
+    def test_csv_one_file_per_sheet(self):
+        with TemporaryDirectory() as directory:
+            filenames = prepare_report(directory, inventory_sheets(), "csv")
+            with open(filenames[0], newline="") as file:
+                rows = list(reader(file))
+
+        self.assertEqual(
+            [path.basename(i) for i in filenames], ["Inventory_Ports.csv", "Notes.csv"]
+        )
+        self.assertEqual(rows[0], ["host", "ports"])
+        self.assertEqual(rows[3], ["switch-2", "20"])
+
+    def test_colliding_sheet_names_get_suffixes(self):
+        sheets = [
+            SheetEntry(name, [Section([[name]])])
+            for name in ("Ports A", "Ports_A", "ports a")
+        ]
+        with TemporaryDirectory() as directory:
+            filenames = prepare_report(directory, sheets, "csv")
+            contents = []
+            for filename in filenames:
+                with open(filename, newline="") as file:
+                    contents.append(next(reader(file))[0])
+
+        self.assertEqual(
+            [path.basename(i) for i in filenames],
+            ["Ports_A.csv", "Ports_A_2.csv", "ports_a_3.csv"],
+        )
+        self.assertEqual(contents, ["Ports A", "Ports_A", "ports a"])
+
+    def test_gzip_jsonl_uses_headers(self):
+        with TemporaryDirectory() as directory:
+            filenames = prepare_report(
+                directory, inventory_sheets(), ReportFormat.JSONL, compress=True
+            )
+            with gzip_open(filenames[0], "rt") as file:
+                records = [loads(line) for line in file]
+            with gzip_open(filenames[1], "rt") as file:
+                notes = [loads(line) for line in file]
+
+        self.assertTrue(filenames[0].endswith(".jsonl.gz"))
+        self.assertEqual(records[1], {"host": "switch-1", "ports": 10})
+        self.assertEqual(notes, [["free text", None]])
+
+    def test_xlsx_and_custom_backends(self):
+        with TemporaryDirectory() as directory:
+            filenames = prepare_report(
+                path.join(directory, "report"), inventory_sheets()
+            )
+            self.assertTrue(path.exists(filenames[0]))
+
+        written = []
+
+        def memory_writer(destination, sheet_entries, compress=False):
+            written.extend(sheet_entries)
+            return [destination]
+
+        register_report_writer("memory", memory_writer)
+        self.addCleanup(REPORT_WRITERS.pop, "memory")
+        self.assertEqual(
+            prepare_report("target", inventory_sheets(), "memory"), ["target"]
+        )
+        self.assertEqual(len(written), 2)
+
+        with self.assertRaises(ValueError):
+            prepare_report("target", [], "parquet")
+
+    def test_xlsx_streams_non_primitive_fields(self):
+        mac = MacAddress("00:11:22:33:44:55")
+        rows = [RowEntry([mac, CellEntry({"Gi1/0/1"}), 1])]
+        sheets = [SheetEntry("MACs", [Section(rows, header=["mac", "ports", "vlan"])])]
+
+        with TemporaryDirectory() as directory:
+            filenames = prepare_report(path.join(directory, "report"), sheets)
+            workbook = load_workbook(filenames[0])
+            values = [cell.value for cell in workbook["MACs"][2]]
+
+        self.assertEqual(values, [str(mac), "{'Gi1/0/1'}", 1])
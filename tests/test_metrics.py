@@ -0,0 +1,143 @@
+# NetMagic Metrics Tests
+
+# Python Modules
+from concurrent.futures import ThreadPoolExecutor
+from threading import Thread
+from unittest import TestCase, main
+from unittest.mock import patch
+
+# Local Modules
+from netmagic.common.metrics import (
+    LATENCY,
+    REGISTRY,
+    REQUESTS,
+    MetricsRegistry,
+    command_template,
+)
+from netmagic.common.spool import OutputSpool, SpilledOutput
+from netmagic.devices import CiscoIOSSwitch
+from netmagic.sessions import TerminalSession
+from tests.classes.common import SSH_KWARGS, MockBaseConnection
+
+
+class TestMetrics(TestCase):
+    def test_command_template(self):
+        self.assertEqual(
+            command_template("show interfaces GigabitEthernet0/0/0/1.100"),
+            "show interfaces <interface>",
+        )
+        self.assertEqual(
+            command_template("show ip route 192.0.2.1  vrf 10"),
+            "show ip route <address> vrf <n>",
+        )
+
+    def test_threads_merge_into_one_sample(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("jobs_total", "Jobs", ("host",))
+        histogram = registry.histogram("job_seconds", "Jobs", ("host",), (0.1, 1))
+
+        def work(_):
+            counter.inc(("sw1",))
+            histogram.observe(0.5, ("sw1",))
+
+        with ThreadPoolExecutor(8) as executor:
+            list(executor.map(work, range(400)))
+
+        snapshot = registry.snapshot()
+        self.assertEqual(snapshot["jobs_total"][0]["value"], 400)
+        self.assertEqual(snapshot["job_seconds"][0]["count"], 400)
+        self.assertEqual(
+            list(snapshot["job_seconds"][0]["buckets"].values()), [0, 400, 400]
+        )
+
+        text = registry.to_prometheus()
+        self.assertIn("# TYPE job_seconds histogram", text)
+        self.assertIn('job_seconds_bucket{host="sw1",le="+Inf"} 400', text)
+        self.assertIn('jobs_total{host="sw1"} 400', text)
+
+    def test_exited_threads_are_retired(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("jobs_total", "Jobs")
+        histogram = registry.histogram("job_seconds", "Jobs", buckets=(1,))
+
+        def work():
+            counter.inc()
+            histogram.observe(0.5)
+
+        for _ in range(50):
+            thread = Thread(target=work)
+            thread.start()
+            thread.join()
+
+        snapshot = registry.snapshot()
+        self.assertLessEqual(len(registry._shards), 1)
+        self.assertEqual(snapshot["jobs_total"][0]["value"], 50)
+        self.assertEqual(snapshot["job_seconds"][0]["count"], 50)
+
+    def test_sessions_record_commands(self):
+        REGISTRY.reset()
+        self.addCleanup(REGISTRY.reset)
+        connection = MockBaseConnection()
+        connection.send_command.side_effect = [OSError("reset"), "ok", "ok"]
+        connection.is_alive.return_value = True
+        session = TerminalSession(connection=connection, **SSH_KWARGS)
+        session.check_session = lambda: True
+
+        session.command("show interfaces Gi1/0/1")
+        session.command("show interfaces Gi1/0/2")
+
+        snapshot = REGISTRY.snapshot()
+        requests = snapshot[REQUESTS.name]
+        self.assertEqual(len(requests), 1)
+        self.assertEqual(requests[0]["value"], 2)
+        self.assertEqual(
+            requests[0]["labels"],
+            {
+                "host": "::1",
+                "transport": "ssh",
+                "command": "show interfaces <interface>",
+                "outcome": "success",
+            },
+        )
+        self.assertEqual(snapshot["netmagic_retries_total"][0]["value"], 1)
+        self.assertEqual(snapshot[LATENCY.name][0]["count"], 2)
+
+    def test_spilled_outputs_are_not_read_back(self):
+        REGISTRY.reset()
+        self.addCleanup(REGISTRY.reset)
+        spool = OutputSpool(threshold=10)
+        self.addCleanup(spool.close)
+        connection = MockBaseConnection()
+        connection.send_command.return_value = "Gi1/0/1 connected\n" * 10
+        session = TerminalSession(connection=connection, spool=spool, **SSH_KWARGS)
+        session.check_session = lambda: True
+
+        with patch.object(SpilledOutput, "read") as read:
+            response = session.command("show interfaces status")
+        read.assert_not_called()
+        self.assertIsNotNone(response.spilled)
+
+        samples = REGISTRY.snapshot()[REQUESTS.name]
+        self.assertEqual(samples[0]["labels"]["outcome"], "success")
+
+    def test_enable_secret_is_redacted(self):
+        self.addCleanup(REGISTRY.reset)
+        connection = MockBaseConnection()
+        connection.send_command.return_value = "ok"
+        connection.find_prompt.return_value = "sw1>"
+        session = TerminalSession(
+            connection=connection, **{**SSH_KWARGS, "secret": "S3cretPass!"}
+        )
+        switch = CiscoIOSSwitch(session)
+        REGISTRY.reset()
+        switch.enable()
+
+        commands = {
+            sample["labels"]["command"] for sample in REGISTRY.snapshot()[REQUESTS.name]
+        }
+        self.assertEqual(commands, {"enable", "<secret>"})
+        self.assertNotIn("S3cretPass!", REGISTRY.to_prometheus())
+
+
+if __name__ == "__main__":
+    main()
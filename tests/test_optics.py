@@ -0,0 +1,138 @@
+# NetMagic Optics Health Tests
+
+# Python Modules
+from itertools import product
+from unittest import TestCase, main
+from unittest.mock import Mock, patch
+
+# Local Modules
+from netmagic.analysis.optics import (
+    OpticsHistory,
+    classify_batch,
+    classify_optics,
+    classify_unordered,
+)
+from netmagic.benchmarks.parsers import cisco_int_trans_det
+from netmagic.common.classes import CommandResponse
+from netmagic.common.classes.interface import InterfaceOptics, OpticStatus
+from netmagic.common.types import SFPAlert
+from netmagic.devices import CiscoIOSSwitch
+from netmagic.handlers import get_fsm_data
+
+HOUR = 3_600
+THRESHOLDS = (-16.0, -14.0, -1.0, 1.0)
+
+
+def optic(
+    host: str, interface: str, receive_power: float, status: SFPAlert = SFPAlert.NORMAL
+) -> InterfaceOptics:
+    normal = OpticStatus(reading=1.0, status=SFPAlert.NORMAL)
+    return InterfaceOptics(
+        host=host,
+        interface=interface,
+        temperature=normal,
+        voltage=normal,
+        current=normal,
+        transmit_power=normal,
+        receive_power=OpticStatus(reading=receive_power, status=status),
+    )
+
+
+class TestClassification(TestCase):
+    def test_batch_matches_range_checks(self):
+        values = [-20, -16, -15, -14, -5, -1, 0, 1, 5, float("inf"), float("-inf")]
+        for thresholds in (THRESHOLDS, (0.0, 0.0, 0.0, 0.0), (-3.0, -3.0, 2.0, 2.0)):
+            with self.subTest(thresholds=thresholds):
+                self.assertEqual(
+                    classify_batch(values, [thresholds] * len(values)),
+                    [classify_unordered(value, thresholds) for value in values],
+                )
+        self.assertEqual(
+            classify_batch([-15.0, -5.0, 1.0], [THRESHOLDS] * 3),
+            [SFPAlert.LOW_WARN, SFPAlert.NORMAL, SFPAlert.HIGH_ALARM],
+        )
+
+    def test_unordered_thresholds_and_nan(self):
+        grid = [float(value) for value in range(-3, 4)]
+        for thresholds in product((-2.0, 0.0, 2.0), repeat=4):
+            self.assertEqual(
+                classify_batch(grid, [thresholds] * len(grid)),
+                [classify_unordered(value, thresholds) for value in grid],
+            )
+        self.assertEqual(classify_batch([float("nan")], [THRESHOLDS]), [None])
+
+    def test_cisco_optics(self):
+        output = cisco_int_trans_det(12)
+        rows = get_fsm_data(output, "show_int_trans_det", "cisco", "interface")
+        statuses = classify_optics(rows)
+        self.assertEqual(len(statuses), 12)
+        self.assertEqual(statuses[0]["receive_power"].reading, -6.1)
+        self.assertEqual(statuses[0]["receive_power"].status, SFPAlert.NORMAL)
+
+        switch = CiscoIOSSwitch([])
+        switch.hostname = "sw1"
+        with patch.object(
+            switch,
+            "command",
+            return_value=CommandResponse(output, "show int trans det", 0.0, None, "#"),
+        ):
+            optics = switch.get_optics().fsm_output
+        self.assertEqual(len(optics), 12)
+        first = next(iter(optics.values()))
+        self.assertEqual(first.host, "sw1")
+        self.assertEqual(first.temperature.status, SFPAlert.NORMAL)
+
+
+class TestOpticsHistory(TestCase):
+    def setUp(self):
+        self.history = OpticsHistory(max_samples=4)
+        for hour in range(6):
+            self.history.record(
+                {
+                    "Te1/1/1": optic("sw1", "Te1/1/1", -5.0 - hour * 0.5),
+                    "Te1/1/2": optic("sw1", "Te1/1/2", -6.0),
+                    "Te1/1/3": optic("sw2", "Te1/1/3", -14.5, SFPAlert.LOW_WARN),
+                    "Te1/1/4": optic("sw2", "Te1/1/4", -17.0, SFPAlert.LOW_ALARM),
+                },
+                at=hour * HOUR,
+            )
+
+    def test_history_is_bounded(self):
+        self.assertEqual(len(self.history), 4)
+        readings = self.history.readings("sw1", "Te1/1/1")
+        self.assertEqual([value for _, value in readings], [-6.0, -6.5, -7.0, -7.5])
+
+    def test_receive_power_slope(self):
+        self.assertAlmostEqual(self.history.slope("sw1", "Te1/1/1"), -12.0)
+        self.assertEqual(self.history.slope("sw1", "Te1/1/2"), 0.0)
+        self.assertIsNone(self.history.slope("sw1", "Te1/1/2", min_samples=5))
+
+        degrading = self.history.degrading()
+        self.assertEqual([health.interface for health in degrading], ["Te1/1/1"])
+
+    def test_worst_optics(self):
+        worst = self.history.worst(3)
+        self.assertEqual(
+            [health.interface for health in worst], ["Te1/1/4", "Te1/1/3", "Te1/1/1"]
+        )
+        self.assertEqual(worst[0].metric, "receive_power")
+        self.assertEqual(worst[0].status, SFPAlert.LOW_ALARM)
+        self.assertIsNone(worst[2].metric)
+
+        self.history.forget("sw2")
+        self.assertEqual(len(self.history.worst(10)), 2)
+
+    def test_poll_devices(self):
+        device = Mock(hostname="sw3")
+        device.get_optics.return_value = {"Te1/1/1": optic("sw3", "Te1/1/1", -3.0)}
+        failing = Mock(hostname="sw4")
+        failing.get_optics.side_effect = ConnectionError("unreachable")
+
+        results = self.history.poll([device, failing], workers=2)
+        self.assertEqual(results[0], 1)
+        self.assertIsInstance(results[1], ConnectionError)
+        self.assertEqual(self.history.health("sw3", "Te1/1/1").receive_power, -3.0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+# NetMagic Response Tests
+
+# Python Modules
+from concurrent.futures import ProcessPoolExecutor
+from datetime import UTC, datetime, timedelta
+from ipaddress import ip_address
+from os import system
+from pickle import UnpicklingError, dumps
+from time import monotonic
+from types import SimpleNamespace
+from unittest import TestCase, main
+
+# Local Modules
+from netmagic.common.classes import (
+    CommandResponse,
+    ConfigResponse,
+    DetachedResponse,
+    InterfaceLLDP,
+    InterfaceStatus,
+    NETCONFResponse,
+    ResponseGroup,
+)
+from netmagic.common.classes.status import MACTableEntry
+from netmagic.common.metrics import command_template
+
+SENT = datetime(2024, 3, 1, tzinfo=UTC)
+SESSION = SimpleNamespace(host="sw1", connection=object())
+
+
+def collect(host: str) -> bytes:
+    """Worker task returning a detached result"""
+    response = CommandResponse(
+        "Gi1/0/1 connected",
+        "show interface status",
+        SENT,
+        SimpleNamespace(host=host),
+        "#",
+        received_time=SENT + timedelta(seconds=1),
+        fsm_output={"Gi1/0/1": InterfaceStatus(host=host, interface="Gi1/0/1")},
+    )
+    return DetachedResponse.from_response(response).to_bytes()
+
+
+class Forged:
+    """Pickles as a call of `function`, as untrusted bytes could"""
+
+    def __init__(self, function) -> None:
+        self.function = function
+
+    def __reduce__(self) -> tuple:
+        return (self.function, ("true",))
+
+
+class TestResponse(TestCase):
+    def test_monotonic_and_datetime_times(self):
+        sent = monotonic()
+        response = CommandResponse("output", "show clock", sent, SESSION, "#")
+        self.assertFalse(hasattr(response, "__dict__"))
+        self.assertEqual(response.sent_at, sent)
+        self.assertGreaterEqual(response.latency_seconds, 0)
+        self.assertLess(abs(response.received_time - datetime.now(UTC)), timedelta(1))
+
+        response.update_latency(SENT, SENT + timedelta(seconds=2))
+        self.assertEqual(response.sent_time, SENT)
+        self.assertEqual(response.latency, timedelta(seconds=2))
+
+    def test_group_time_delta_is_computed_when_read(self):
+        first = CommandResponse("", "a", SENT, SESSION, "#", received_time=SENT)
+        group = ResponseGroup([first])
+        self.assertEqual(group.time_delta, timedelta(0))
+
+        group.responses.append(
+            CommandResponse(
+                "", "b", SENT, SESSION, "#", received_time=SENT + timedelta(seconds=3)
+            )
+        )
+        self.assertEqual(group.time_delta, timedelta(seconds=3))
+        self.assertIsNone(ResponseGroup([]).time_delta)
+
+
+class TestDetachedResponse(TestCase):
+    def test_command_round_trip(self):
+        response = CommandResponse(
+            "output",
+            "show version",
+            SENT,
+            SESSION,
+            "#",
+            received_time=SENT + timedelta(milliseconds=250),
+            attempts=2,
+            fsm_output={"version": "15.2"},
+        )
+        detached = DetachedResponse.from_response(response)
+        self.assertEqual(detached.host, "sw1")
+        self.assertEqual(detached.latency, 0.25)
+        self.assertFalse(hasattr(detached, "__dict__"))
+
+        restored = DetachedResponse.from_bytes(detached.to_bytes())
+        self.assertEqual(restored, detached)
+
+        live = restored.to_response(SESSION)
+        self.assertIsInstance(live, CommandResponse)
+        self.assertEqual(live.response, "output")
+        self.assertEqual(live.command_string, "show version")
+        self.assertEqual(live.sent_time, SENT)
+        self.assertEqual(live.latency, timedelta(milliseconds=250))
+        self.assertEqual(live.retries, 2)
+        self.assertEqual(live.fsm_output, {"version": "15.2"})
+
+    def test_config_and_netconf_errors(self):
+        config = ConfigResponse("ok", "hostname sw1", SENT, SESSION)
+        self.assertEqual(
+            DetachedResponse.from_response(config).to_response().config_sent,
+            "hostname sw1",
+        )
+
+        failed = NETCONFResponse(TimeoutError("no reply"), "get", SENT, SESSION)
+        detached = DetachedResponse.from_response(failed)
+        self.assertEqual(detached.error, "TimeoutError: no reply")
+        live = detached.to_response()
+        self.assertIsInstance(live, NETCONFResponse)
+        self.assertFalse(live.success)
+        self.assertEqual(str(live.response), "TimeoutError: no reply")
+
+        with self.assertRaises(TypeError):
+            DetachedResponse.from_bytes(dumps("not a response"))
+
+    def test_models_and_addresses_round_trip(self):
+        output = {
+            "Gi1/0/1": InterfaceLLDP(
+                host="sw1",
+                interface="Gi1/0/1",
+                chassis_mac="aabb.ccdd.eeff",
+                management_ipv4="192.0.2.2",
+            ),
+            "aabb.ccdd.0001": MACTableEntry.create(
+                "sw1", "aabb.ccdd.0001", interface="Gi1/0/2", vlan=10, type="dynamic"
+            ),
+        }
+        response = CommandResponse(
+            "output",
+            "show lldp neighbors detail",
+            SENT,
+            SimpleNamespace(host=ip_address("192.0.2.1")),
+            "#",
+            fsm_output=output,
+        )
+        detached = DetachedResponse.from_response(response)
+
+        restored = DetachedResponse.from_bytes(detached.to_bytes())
+        self.assertEqual(restored, detached)
+        self.assertEqual(restored.host, ip_address("192.0.2.1"))
+        self.assertEqual(restored.fsm_output, output)
+
+    def test_untrusted_bytes_are_refused(self):
+        for function in (system, command_template):
+            forged = DetachedResponse(
+                "command", "sw1", "show clock", "", 0.0, 1.0, fsm_output={}
+            )
+            forged.fsm_output["run"] = Forged(function)
+            with self.subTest(function.__name__), self.assertRaises(UnpicklingError):
+                DetachedResponse.from_bytes(forged.to_bytes())
+
+    def test_returned_from_worker_processes(self):
+        with ProcessPoolExecutor(2) as executor:
+            results = [
+                DetachedResponse.from_bytes(data)
+                for data in executor.map(collect, ["sw1", "sw2"])
+            ]
+        self.assertEqual([i.host for i in results], ["sw1", "sw2"])
+        self.assertEqual(results[1].fsm_output["Gi1/0/1"].host, "sw2")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 # NetMagic NETCONF Session Tests
 
+from datetime import UTC, datetime
 from unittest import TestCase
 from unittest.mock import Mock, patch
 
@@ -20,6 +21,17 @@ NETCONF_KWARGS = {
 
 
 class TestNETCONFSession(TestCase):
+    def setUp(self) -> None:
+        self.socket = Mock()
+
+        def open_socket(host, port, timeout, phases):
+            phases.update(dns=0.01, tcp=0.02)
+            return self.socket
+
+        patcher = patch("netmagic.sessions.netconf.open_socket", open_socket)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
     def test_defaults_and_connection_reuse(self):
         connection = Mock(connected=True)
         session = NETCONFSession(connection=connection, **NETCONF_KWARGS)
@@ -38,7 +50,14 @@ class TestNETCONFSession(TestCase):
             "netmagic.sessions.netconf.manager.connect", return_value=connection
         ) as connect:
             self.assertTrue(session.connect())
-            connect.assert_called_once_with(port=830, **NETCONF_KWARGS)
+            connect.assert_called_once_with(
+                port=830, sock=self.socket, **NETCONF_KWARGS
+            )
+
+        connect_response = session.connect_response
+        self.assertTrue(connect_response.success)
+        self.assertEqual(list(connect_response.phases), ["dns", "tcp", "ssh"])
+        self.assertNotIn("password", connect_response.params)
 
         session.disconnect()
         session.disconnect()
@@ -96,3 +115,39 @@ class TestNETCONFSession(TestCase):
         self.assertTrue(response.success)
         self.assertEqual(response.retries, 2)
         self.assertEqual(connection.get.call_count, 2)
+
+    def test_iterparse_releases_yielded_elements(self):
+        reply = (
+            '<data xmlns="urn:ietf:params:xml:ns:netconf:base:1.0"><items>'
+            "<item><name>a</name></item><item><name>b</name></item>"
+            "</items></data>"
+        )
+
+        names = []
+        released = []
+        for element in NETCONFSession.iterparse(reply, "item"):
+            names.append(element[0].text)
+            released.append(element)
+
+        self.assertEqual(names, ["a", "b"])
+        self.assertTrue(all(len(element) == 0 for element in released))
+
+        failed = NETCONFResponse(
+            TimeoutExpiredError(), "get", datetime.now(UTC), session=None
+        )
+        with self.assertRaises(TimeoutExpiredError):
+            NETCONFSession.iterparse(failed, "item")
+        with self.assertRaises(TypeError):
+            NETCONFSession.iterparse(None, "item")
+
+    def test_filter_cache_reuses_and_evicts(self):
+        session = NETCONFSession(filter_cache_size=2, **NETCONF_KWARGS)
+        builder = Mock(side_effect=lambda: ("subtree", "<filter/>"))
+
+        first = session.get_filter("a", builder)
+        self.assertIs(session.get_filter("a", builder), first)
+        session.get_filter("b", builder)
+        session.get_filter("c", builder)
+
+        self.assertEqual(builder.call_count, 3)
+        self.assertEqual(list(session.filter_cache), ["b", "c"])
@@ -0,0 +1,123 @@
+# NetMagic Replay Session Tests
+
+# Python Modules
+from os import path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from unittest import TestCase
+from unittest.mock import Mock
+
+# Third-Party Modules
+from ncclient.operations.rpc import RPCError
+from ncclient.xml_ import to_ele
+
+# Local Modules
+from netmagic.common import Engine, ReplayMode
+from netmagic.devices import CiscoIOSSwitch
+from netmagic.sessions import (
+    ReplayArchive,
+    ReplayNETCONFSession,
+    ReplayTerminalSession,
+)
+from netmagic.simulator import CISCO_IOS, DeviceSimulator, OutputSizes
+
+RPC_ERROR = (
+    '<rpc-error xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">'
+    "<error-type>application</error-type><error-tag>lock-denied</error-tag>"
+    "<error-severity>error</error-severity>"
+    "<error-message>Lock failed</error-message></rpc-error>"
+)
+
+
+class TestReplayTerminalSession(TestCase):
+    def setUp(self):
+        directory = TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.filename = path.join(directory.name, "sw1.replay.gz")
+
+    def test_record_then_replay_offline(self):
+        with DeviceSimulator() as simulator:
+            device = simulator.add_device(
+                CISCO_IOS, "sw1", sizes=OutputSizes(interfaces=8, mac_addresses=20)
+            )
+            session = ReplayTerminalSession(
+                device.host,
+                "admin",
+                "admin",
+                self.filename,
+                mode=ReplayMode.RECORD,
+                port=device.port,
+                ssh_strict=False,
+            )
+            switch = CiscoIOSSwitch(session)
+            recorded_status = switch.get_interface_status().fsm_output
+            recorded_macs = switch.get_mac_table().fsm_output
+            session.disconnect()
+
+        replay_session = ReplayTerminalSession.from_archive(self.filename)
+        self.assertEqual(replay_session.engine, Engine.REPLAY)
+        self.assertEqual(replay_session.port, device.port)
+
+        switch = CiscoIOSSwitch(replay_session)
+        self.assertEqual(switch.get_interface_status().fsm_output, recorded_status)
+        self.assertEqual(len(switch.get_mac_table().fsm_output), len(recorded_macs))
+        self.assertEqual(
+            list(replay_session.connect_response.phases),
+            list(session.connect_log[0].phases),
+        )
+
+        # Recordings repeat once used up, so getters can run in a loop
+        self.assertEqual(switch.get_interface_status().fsm_output, recorded_status)
+
+    def test_latency_secrets_and_missing_requests(self):
+        archive = ReplayArchive({"host": "sw1"})
+        archive.record("prompt", "", "sw1#", 0.0)
+        archive.record("command", "<secret>", "", 0.0)
+        archive.record("command", "show clock", "00:00:00 UTC", 0.05)
+        archive.record("command", "show version", OSError("Socket closed"), 0.0)
+        session = ReplayTerminalSession(
+            "sw1", archive=archive, latency_scale=1.0, secret="enable-me"
+        )
+
+        start = perf_counter()
+        self.assertEqual(session.command("show clock").response, "00:00:00 UTC")
+        self.assertGreaterEqual(perf_counter() - start, 0.05)
+
+        self.assertEqual(session.command("enable-me").response, "")
+        with self.assertRaises(OSError):
+            session.connection.send_command("show version")
+        with self.assertRaises(KeyError):
+            session.command("show running-config")
+
+
+class TestReplayNETCONFSession(TestCase):
+    def test_record_then_replay(self):
+        connection = Mock(connected=True, server_capabilities=["urn:example:cap"])
+        connection.get.return_value.data_xml = "<data><interfaces/></data>"
+        connection.lock.side_effect = RPCError(to_ele(RPC_ERROR))
+
+        session = ReplayNETCONFSession(
+            "192.0.2.1",
+            "admin",
+            "admin",
+            mode=ReplayMode.RECORD,
+            connection=connection,
+        )
+        self.assertTrue(session.connect())
+        session.get(("subtree", "<interfaces/>"))
+        session.lock()
+
+        replay_session = ReplayNETCONFSession(
+            "192.0.2.1",
+            archive=ReplayArchive(session.archive.header, session.archive.entries),
+        )
+        reply = replay_session.get(("subtree", "<interfaces/>"))
+        self.assertEqual(reply.response, "<data><interfaces/></data>")
+        self.assertTrue(replay_session.check_capability("urn:example:cap"))
+
+        lock = replay_session.lock()
+        self.assertIsInstance(lock.response, RPCError)
+        self.assertEqual(lock.response.tag, "lock-denied")
+
+        replay_session.disconnect()
+        self.assertIsNone(replay_session.connection)
@@ -0,0 +1,112 @@
+# NetMagic RESTCONF Session Tests
+
+from unittest import TestCase
+
+from netmagic.common.classes import RESTCONFResponse
+from netmagic.common.metrics import REGISTRY, REQUESTS
+from netmagic.devices import NetworkDevice
+from netmagic.sessions import RESTCONFSession
+from netmagic.sessions.restconf import iter_json_array
+from tests.classes.restconf import StandInRESTCONFServer
+
+INTERFACES_PATH = "/restconf/data/ietf-interfaces:interfaces"
+INTERFACES = {
+    "ietf-interfaces:interfaces": {
+        "interface": [
+            {"name": f"GigabitEthernet1/0/{i}", "enabled": i % 2 == 0}
+            for i in range(1, 51)
+        ]
+    }
+}
+
+
+class TestRESTCONFSession(TestCase):
+    def setUp(self) -> None:
+        self.server = StandInRESTCONFServer({INTERFACES_PATH: INTERFACES})
+        self.server.__enter__()
+        self.session = RESTCONFSession(
+            host="127.0.0.1",
+            username="admin",
+            password="password",  # nosec B106
+            port=self.server.port,
+            scheme="http",
+        )
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.session.disconnect()
+        self.server.__exit__()
+        return super().tearDown()
+
+    def test_keep_alive_requests_share_a_connection(self):
+        self.assertTrue(self.session.connect())
+        for _ in range(3):
+            response = self.session.get("data/ietf-interfaces:interfaces")
+
+        self.assertIsInstance(response, RESTCONFResponse)
+        self.assertTrue(response.success)
+        self.assertEqual(response.status, 200)
+        self.assertEqual(response.json(), INTERFACES)
+        self.assertEqual(self.server.connections, 1)
+        self.assertEqual(self.session.connection.created, 1)
+        self.assertEqual(len(self.session.request_log), 4)
+
+    def test_put_and_patch(self):
+        path = "data/ietf-system:system"
+        self.assertEqual(self.session.put(path, {"hostname": "a"}).status, 204)
+        self.assertEqual(self.session.patch(path, {"contact": "noc"}).status, 204)
+
+        response = self.session.get(path)
+        self.assertEqual(response.json(), {"hostname": "a", "contact": "noc"})
+
+        missing = self.session.patch("data/missing:container", {"a": 1})
+        self.assertFalse(missing.success)
+        self.assertEqual(missing.status, 404)
+
+    def test_requests_are_recorded(self):
+        REGISTRY.reset()
+        self.addCleanup(REGISTRY.reset)
+        self.session.get("data/ietf-interfaces:interfaces")
+        self.session.get("data/ietf-interfaces:interfaces")
+        self.session.get("data/ietf-interfaces:interfaces/interface=Gi1/0/1")
+
+        samples = {
+            (sample["labels"]["command"], sample["labels"]["outcome"]): sample
+            for sample in REGISTRY.snapshot()[REQUESTS.name]
+        }
+        reads = samples[("GET data/ietf-interfaces:interfaces", "success")]
+        self.assertEqual(reads["value"], 2)
+        self.assertEqual(reads["labels"]["transport"], "restconf")
+        self.assertIn(
+            ("GET data/ietf-interfaces:interfaces/interface=<interface>", "http_404"),
+            samples,
+        )
+
+    def test_stream_decodes_list_members(self):
+        names = [
+            entry["name"]
+            for entry in self.session.stream(
+                "data/ietf-interfaces:interfaces", "interface", chunk_size=64
+            )
+        ]
+        self.assertEqual(len(names), 50)
+        self.assertEqual(names[-1], "GigabitEthernet1/0/50")
+
+        with self.assertRaises(ConnectionError):
+            list(self.session.stream("data/missing:container", "interface"))
+
+    def test_device_routes_restconf_session(self):
+        device = NetworkDevice(self.session)
+        self.assertIs(device.restconf_session, self.session)
+
+
+class TestIterJsonArray(TestCase):
+    def test_members_split_across_chunks(self):
+        text = '{"mod:items": {"item": [1, {"a": "b]"}, [2, 3], "x"]}, "item": [9]}'
+        chunks = iter([text[i : i + 3] for i in range(0, len(text), 3)])
+        self.assertEqual(
+            list(iter_json_array(chunks, "item")), [1, {"a": "b]"}, [2, 3], "x"]
+        )
+        self.assertEqual(list(iter_json_array(iter(["{}"]), "item")), [])
+        with self.assertRaises(ValueError):
+            list(iter_json_array(iter(['{"item": [1, 2']), "item"))
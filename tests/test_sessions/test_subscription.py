@@ -0,0 +1,123 @@
+# NetMagic NETCONF Subscription Tests
+
+from asyncio import run
+from threading import Event
+from unittest import TestCase
+from unittest.mock import Mock
+
+from ncclient.transport.errors import SSHError
+from ncclient.xml_ import to_ele
+
+from netmagic.sessions import NETCONFSession
+from netmagic.sessions.subscription import build_establish_subscription
+from tests.classes.netconf import StandInNETCONFManager
+
+NETCONF_KWARGS = {
+    "host": "192.0.2.1",
+    "username": "admin",
+    "password": "password",  # nosec B105
+}
+
+LINK_DOWN = '<link-down xmlns="urn:example"><name>Gi0/0/0/0</name></link-down>'
+
+
+class TestNETCONFSubscription(TestCase):
+    def setUp(self) -> None:
+        self.manager = StandInNETCONFManager()
+        self.session = NETCONFSession(connection=self.manager, **NETCONF_KWARGS)
+        return super().setUp()
+
+    def test_create_subscription_with_callback(self):
+        received = []
+        delivered = Event()
+
+        def callback(notification):
+            received.append(notification)
+            delivered.set()
+
+        with self.session.subscribe(callback, stream="NETCONF") as subscription:
+            self.manager.push(LINK_DOWN)
+            self.assertTrue(delivered.wait(5))
+
+        self.assertFalse(subscription.active)
+        self.assertEqual(received[0].name, "link-down")
+        self.assertEqual(received[0].event_time.year, 2026)
+        operation, kwargs = self.manager.requests[0]
+        self.assertEqual(operation, "create-subscription")
+        self.assertEqual(kwargs["stream_name"], "NETCONF")
+        self.assertEqual(self.session.rpc_log[-1].operation, "create-subscription")
+        self.assertIsNone(subscription.delete_response)
+
+    def test_iteration_and_async_iteration(self):
+        subscription = self.session.subscribe()
+        for _ in range(2):
+            self.manager.push(LINK_DOWN)
+
+        first = next(iter(subscription))
+        self.assertEqual(first.name, "link-down")
+
+        async def collect():
+            async for notification in subscription:
+                subscription.stop()
+                return notification
+
+        self.assertEqual(run(collect()).name, "link-down")
+        self.assertEqual(list(subscription), [])
+
+    def test_transport_error_releases_iterators(self):
+        self.manager.take_notification = Mock(side_effect=SSHError("dropped"))
+        subscription = self.session.subscribe()
+
+        self.assertEqual(list(subscription), [])
+        self.assertIsInstance(subscription.errors[0], SSHError)
+
+    def test_yang_push_periodic(self):
+        with self.session.subscribe(
+            xpath="/if:interfaces-state", period=500
+        ) as subscription:
+            self.assertEqual(subscription.subscription_id, 1)
+
+        operation, rpc = self.manager.requests[0]
+        self.assertEqual(operation, "dispatch")
+        self.assertIn("<yp:period>500</yp:period>", rpc)
+        self.assertIn("/if:interfaces-state", rpc)
+
+        operation, rpc = self.manager.requests[-1]
+        self.assertEqual(operation, "dispatch")
+        self.assertIn("delete-subscription", rpc)
+        self.assertIn("<id>1</id>", rpc)
+        self.assertTrue(subscription.delete_response.success)
+        subscription.stop()
+        self.assertEqual(len(self.manager.requests), 2)
+
+        with self.assertRaises(ValueError):
+            build_establish_subscription("/a<b", period=100)
+
+    def test_yang_push_declares_xpath_prefixes(self):
+        rpc = to_ele(
+            build_establish_subscription(
+                "/if:interfaces/if:interface[if:name='Gi0:1']/oc:state",
+                on_change=True,
+                namespaces={"oc": "http://openconfig.net/yang/interfaces"},
+            )
+        )
+        xpath_filter = next(
+            i for i in rpc.iter() if i.tag.endswith("datastore-xpath-filter")
+        )
+        self.assertEqual(
+            xpath_filter.nsmap["if"], "urn:ietf:params:xml:ns:yang:ietf-interfaces"
+        )
+        self.assertEqual(
+            xpath_filter.nsmap["oc"], "http://openconfig.net/yang/interfaces"
+        )
+        self.assertNotIn("Gi0", xpath_filter.nsmap)
+
+        with self.assertRaises(ValueError):
+            build_establish_subscription("/oc:interfaces", on_change=True)
+
+    def test_requires_advertised_capability(self):
+        self.manager.server_capabilities = []
+        with self.assertRaises(NotImplementedError):
+            self.session.subscribe()
+        with self.assertRaises(NotImplementedError):
+            self.session.subscribe(xpath="/if:interfaces-state", on_change=True)
@@ -0,0 +1,124 @@
+# NetMagic Device Simulator Tests
+
+# Python Modules
+from re import search
+from time import monotonic, sleep
+from unittest import TestCase, main
+
+# Third-Party Modules
+from paramiko import AutoAddPolicy, Channel, SSHClient
+
+# Local Modules
+from netmagic.devices import BrocadeSwitch, CiscoIOSSwitch
+from netmagic.sessions import TerminalSession
+from netmagic.simulator import (
+    BROCADE_FASTIRON,
+    CISCO_IOS,
+    DeviceSimulator,
+    OutputSizes,
+)
+
+
+def read_until(channel: Channel, pattern: str, timeout: float = 10) -> str:
+    output = ""
+    deadline = monotonic() + timeout
+    while not search(pattern, output):
+        if monotonic() > deadline:
+            raise TimeoutError(f"`{pattern}` not found in {output!r}")
+        if channel.recv_ready():
+            output += channel.recv(65536).decode()
+        else:
+            sleep(0.01)
+    return output
+
+
+class TestDeviceSimulator(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.simulator = DeviceSimulator().start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.simulator.stop()
+
+    def open_shell(self, device) -> Channel:
+        client = SSHClient()
+        client.set_missing_host_key_policy(AutoAddPolicy())  # nosec B507
+        client.connect(
+            device.host,
+            device.port,
+            "admin",
+            "admin",
+            look_for_keys=False,
+            allow_agent=False,
+        )
+        self.addCleanup(client.close)
+        return client.invoke_shell()
+
+    def test_cisco_switch_session(self):
+        device = self.simulator.add_device(
+            CISCO_IOS, "sw1", sizes=OutputSizes(interfaces=12, mac_addresses=30)
+        )
+        session = TerminalSession(
+            device.host, "admin", "admin", port=device.port, ssh_strict=False
+        )
+        self.assertTrue(session.connect())
+        self.addCleanup(session.disconnect)
+        switch = CiscoIOSSwitch(session)
+
+        self.assertEqual(len(switch.get_interface_status().fsm_output), 12)
+        self.assertEqual(len(switch.get_mac_table().fsm_output), 30)
+        switch.get_hostname()
+        self.assertEqual(switch.hostname, "sw1")
+
+    def test_brocade_switch_session(self):
+        device = self.simulator.add_device(BROCADE_FASTIRON, "icx1")
+        session = TerminalSession(
+            device.host, "admin", "admin", port=device.port, ssh_strict=False
+        )
+        self.assertTrue(session.connect())
+        switch = BrocadeSwitch(session)
+
+        self.assertEqual(len(switch.get_lldp().fsm_output), 4)
+        self.assertEqual(
+            session.command_log[-1].command_string, "show lldp neighbor detail"
+        )
+
+    def test_paging(self):
+        device = self.simulator.add_device(
+            CISCO_IOS, "pager", sizes=OutputSizes(mac_addresses=40)
+        )
+        channel = self.open_shell(device)
+        read_until(channel, r"pager#$")
+
+        channel.send(b"show mac address-table\n")
+        first_page = read_until(channel, r"--More-- $")
+        self.assertNotIn("Total Mac Addresses", first_page)
+        channel.send(b" ")
+        rest = read_until(channel, r"pager#$")
+        self.assertIn("Total Mac Addresses for this criterion: 40", rest)
+
+        channel.send(b"terminal length 0\n")
+        read_until(channel, r"pager#$")
+        channel.send(b"show mac address-table\n")
+        output = read_until(channel, r"pager#$")
+        self.assertNotIn("--More--", output)
+
+    def test_enable_mode(self):
+        device = self.simulator.add_device(CISCO_IOS, "locked", enable_secret="s3cret")
+        channel = self.open_shell(device)
+        read_until(channel, r"locked>$")
+
+        channel.send(b"show running-config\n")
+        self.assertIn("Invalid input", read_until(channel, r"locked>$"))
+
+        channel.send(b"enable\n")
+        read_until(channel, r"Password: $")
+        channel.send(b"s3cret\n")
+        read_until(channel, r"locked#$")
+        channel.send(b"show run | i hostname\n")
+        self.assertIn("hostname locked", read_until(channel, r"locked#$"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+# NetMagic Output Spool Tests
+
+# Python Modules
+from concurrent.futures import ThreadPoolExecutor
+from os import path
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+# Local Modules
+from netmagic.common.spool import OutputSpool, SpilledOutput
+from netmagic.sessions import TerminalSession
+from tests.classes.common import SSH_KWARGS, MockBaseConnection
+
+
+class TestOutputSpool(TestCase):
+    def test_large_outputs_are_spilled(self):
+        spool = OutputSpool(threshold=100)
+        self.addCleanup(spool.close)
+        connection = MockBaseConnection()
+        terminal = TerminalSession(connection=connection, spool=spool, **SSH_KWARGS)
+
+        connection.send_command.return_value = "small"
+        small = terminal.command("show clock")
+        self.assertIsNone(small.spilled)
+        self.assertEqual(small.response, "small")
+
+        large_output = "Gi1/0/1 connected ü\n" * 50
+        connection.send_command.return_value = large_output
+        large = terminal.command("show run")
+        self.assertIsInstance(large.spilled, SpilledOutput)
+        self.assertTrue(large.success)
+        self.assertEqual(large.response, large_output)
+        self.assertIs(terminal.command_log[-1], large)
+
+        # Reads after later writes see the grown file
+        connection.send_command.return_value = large_output.upper()
+        self.assertEqual(terminal.command("show tech").response, large_output.upper())
+        self.assertEqual(large.response, large_output)
+
+    def test_archive_file_shared_between_threads(self):
+        with TemporaryDirectory() as directory:
+            filename = path.join(directory, "outputs.spool")
+            with OutputSpool(filename, threshold=0) as spool:
+                with ThreadPoolExecutor(8) as executor:
+                    handles = list(
+                        executor.map(
+                            lambda i: spool.write(f"output {i}\n" * i), range(1, 65)
+                        )
+                    )
+                for i, handle in enumerate(handles, 1):
+                    self.assertEqual(handle.read(), f"output {i}\n" * i)
+
+            self.assertEqual(path.getsize(filename), spool.size)
+            with OutputSpool(filename) as reopened:
+                self.assertEqual(reopened.size, spool.size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+# NetMagic Fleet State Store Tests
+
+# Python Modules
+from datetime import UTC, datetime
+from os import path
+from tempfile import TemporaryDirectory
+from threading import Thread
+from unittest import TestCase, main
+
+# Local Modules
+from netmagic.benchmarks import state
+from netmagic.common.classes import CommandResponse
+from netmagic.common.classes.interface import InterfaceLLDP, InterfaceStatus
+from netmagic.common.classes.status import MACTableEntry, POEHost, POEPort
+from netmagic.storage import StateStore
+from netmagic.storage.state import quote, table_name
+
+MORNING = datetime(2024, 3, 1, 8, tzinfo=UTC)
+EVENING = datetime(2024, 3, 1, 20, tzinfo=UTC)
+
+
+def status(host: str, interface: str, state: str, desc: str | None = None):
+    return InterfaceStatus(
+        host=host, interface=interface, state=state, desc=desc, vlan="10"
+    )
+
+
+def switch_status(host: str, uplink_state: str = "connected") -> dict:
+    ports = [
+        status(host, "Gi1/0/1", uplink_state, "uplink"),
+        status(host, "Gi1/0/2", "notconnect"),
+        status(host, "Gi1/0/3", "Down", "printer"),
+    ]
+    return {port.interface: port for port in ports}
+
+
+class TestStateStore(TestCase):
+    def setUp(self):
+        self.store = StateStore()
+        self.addCleanup(self.store.close)
+
+    def test_table_names(self):
+        self.assertEqual(table_name(InterfaceStatus), "interface_status")
+        self.assertEqual(table_name(InterfaceLLDP), "interface_lldp")
+        self.assertEqual(table_name(MACTableEntry), "mac_table_entry")
+        self.assertEqual(table_name(POEHost), "poe_host")
+
+    def test_ingest_responses_and_dicts(self):
+        response = CommandResponse("", "show int status", MORNING, None, "#")
+        response.fsm_output = switch_status("sw1")
+        snapshot = self.store.ingest([response, switch_status("sw2")], MORNING)
+
+        self.assertEqual(snapshot.rows, {"interface_status": 6})
+        self.assertEqual(snapshot.hosts, 2)
+        self.assertEqual(len(self.store.current(InterfaceStatus)), 6)
+        self.assertEqual(self.store.tables(), ["interface_status"])
+
+    def test_down_ports_with_description(self):
+        self.store.ingest([switch_status("sw1"), switch_status("sw2", "disabled")])
+
+        down = {(row["host"], row["interface"]) for row in self.store.down_ports()}
+        self.assertEqual(
+            down,
+            {("sw1", "Gi1/0/3"), ("sw2", "Gi1/0/1"), ("sw2", "Gi1/0/3")},
+        )
+        self.assertEqual(len(self.store.down_ports(with_description=False)), 5)
+
+    def test_new_snapshot_replaces_current_rows_per_host(self):
+        self.store.ingest([switch_status("sw1"), switch_status("sw2")], MORNING)
+        self.store.ingest([switch_status("sw1", "notconnect")], EVENING, "sw1 only")
+
+        uplinks = self.store.current(InterfaceStatus, interface="Gi1/0/1")
+        self.assertEqual(
+            {row["host"]: row["state"] for row in uplinks},
+            {"sw1": "notconnect", "sw2": "connected"},
+        )
+
+        history = self.store.history(InterfaceStatus, "sw1", "Gi1/0/1")
+        self.assertEqual([row["state"] for row in history], ["connected", "notconnect"])
+        self.assertEqual([row["current"] for row in history], [0, 1])
+        self.assertEqual(history[0]["taken_at"], MORNING.timestamp())
+
+        snapshots = self.store.snapshots("sw2")
+        self.assertEqual([snapshot.taken_at for snapshot in snapshots], [MORNING])
+        latest = self.store.snapshots()[-1]
+        self.assertEqual(latest.label, "sw1 only")
+        self.assertEqual(latest.rows, {"interface_status": 3})
+
+    def test_empty_results_end_current_rows(self):
+        self.store.ingest([switch_status("sw1"), switch_status("sw2")], MORNING)
+        snapshot = self.store.ingest([{}], EVENING, empty=[("sw1", InterfaceStatus)])
+
+        self.assertEqual(snapshot.rows, {"interface_status": 0})
+        self.assertEqual(
+            {row["host"] for row in self.store.current(InterfaceStatus)}, {"sw2"}
+        )
+        self.assertNotIn("sw1", {row["host"] for row in self.store.down_ports()})
+        self.assertEqual(len(self.store.history(InterfaceStatus, "sw1", "Gi1/0/2")), 1)
+
+    def test_mac_entries_are_stored_per_vlan(self):
+        entry = MACTableEntry.create(
+            "sw1", "aabb.ccdd.eeff", interface="Gi1/0/1", vlan="10", type="dynamic"
+        )
+        entry.vlan[20] = "Gi1/0/2"
+        self.store.ingest([{entry.mac: entry}])
+
+        rows = self.store.find_mac("AA-BB-CC-DD-EE-FF")
+        self.assertEqual(
+            [(row["vlan"], row["interface"]) for row in rows],
+            [(10, "Gi1/0/1"), (20, "Gi1/0/2")],
+        )
+        self.assertEqual(len(self.store.current(MACTableEntry, vlan=20)), 1)
+
+    def test_mixed_models_in_one_result(self):
+        port = POEPort(
+            host="sw1",
+            interface="Gi1/0/1",
+            admin_state="on",
+            operation_state="On",
+            consumed=4.5,
+            allocated=15.4,
+        )
+        poe_host = POEHost(host="sw1", capacity=740, available=700.5)
+        snapshot = self.store.ingest([{"Gi1/0/1": port, "sw1": poe_host}])
+
+        self.assertEqual(snapshot.rows, {"poe_port": 1, "poe_host": 1})
+        self.assertEqual(
+            self.store.current(
+                POEPort, where="lower(operation_state) = ?", params=["on"]
+            )[0]["consumed"],
+            4.5,
+        )
+
+    def test_unknown_model_has_no_rows(self):
+        self.assertEqual(self.store.current(InterfaceLLDP), [])
+        self.assertEqual(self.store.history(InterfaceLLDP, "sw1"), [])
+
+    def test_column_names_are_checked(self):
+        self.store.ingest([switch_status("sw1")])
+        with self.assertRaises(ValueError):
+            self.store.current(InterfaceStatus, **{'port" OR 1 = 1 --': "x"})
+        self.assertEqual(len(self.store.current(InterfaceStatus, state="connected")), 1)
+        self.assertEqual(quote("interface_status"), '"interface_status"')
+        with self.assertRaises(ValueError):
+            quote('interface_status"; DROP TABLE snapshots; --')
+
+    def test_batches_and_concurrent_ingest(self):
+        store = StateStore(batch_size=2)
+        self.addCleanup(store.close)
+        threads = [
+            Thread(target=store.ingest, args=([switch_status(f"sw{i}")],))
+            for i in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(store.current(InterfaceStatus)), 24)
+        self.assertEqual(len(store.snapshots()), 8)
+
+    def test_reopens_file(self):
+        with TemporaryDirectory() as directory:
+            filename = path.join(directory, "state.sqlite")
+            with StateStore(filename) as store:
+                store.ingest([switch_status("sw1")])
+            with StateStore(filename) as store:
+                store.ingest([switch_status("sw1", "disabled")])
+                self.assertEqual(len(store.down_ports()), 2)
+                self.assertEqual(len(store.history(InterfaceStatus, "sw1")), 6)
+
+    def test_benchmark(self):
+        result = state.run_case(20, 50)
+        self.assertEqual(result["rows"], 2_000)
+        self.assertEqual(result["down_ports"], 20)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+# NetMagic LLDP Topology Tests
+
+# Python Modules
+from unittest import TestCase, main
+from unittest.mock import Mock, patch
+
+# Local Modules
+from netmagic.analysis import Link, Topology
+from netmagic.analysis.topology import (
+    ASYMMETRIC,
+    ONE_SIDED,
+    SYMMETRIC,
+    UNPOLLED,
+    same_port,
+)
+from netmagic.common.classes.interface import InterfaceLLDP
+
+
+def lldp(host: str, *neighbors: tuple[str, dict]) -> dict[str, InterfaceLLDP]:
+    return {
+        interface: InterfaceLLDP(host=host, interface=interface, **fields)
+        for interface, fields in neighbors
+    }
+
+
+def core() -> dict:
+    return lldp(
+        "core",
+        ("Gi1/0/1", {"system_name": "access1.corp.example", "port_desc": "1/2/1"}),
+        ("Gi1/0/2", {"system_name": "ACCESS2", "port_desc": "GigabitEthernet1/0/48"}),
+        ("Gi1/0/3", {"chassis_mac": "aaaa.bbbb.0003", "port_desc": "uplink"}),
+    )
+
+
+def access1() -> dict:
+    return lldp(
+        "access1",
+        ("1/2/1", {"system_name": "core", "port_desc": "GigabitEthernet1/0/1"}),
+        ("1/1/5", {"system_name": "SEP001122334455", "port_desc": "Port 1"}),
+    )
+
+
+def access2(*extra: tuple[str, dict]) -> dict:
+    return lldp(
+        "access2",
+        ("Gi1/0/48", {"management_ipv4": "10.0.0.1", "port_desc": "Gi1/0/2"}),
+        *extra,
+    )
+
+
+class TestTopology(TestCase):
+    def setUp(self):
+        self.topology = Topology()
+        self.topology.add_identity("core", addresses=["10.0.0.1"])
+        self.topology.ingest([core(), access1(), access2()])
+
+    def test_same_port(self):
+        self.assertTrue(same_port("GigabitEthernet1/0/1", "Gi1/0/1"))
+        self.assertTrue(same_port("1/1/1", "ethernet1/1/1"))
+        self.assertFalse(same_port("Gi1/0/1", "Te1/0/1"))
+        self.assertFalse(same_port("uplink", "Gi1/0/1"))
+
+    def test_links_resolved_by_name_and_address(self):
+        links = self.topology.links()
+        self.assertIn(Link("access1", "1/2/1", "core", "Gi1/0/1", SYMMETRIC), links)
+        self.assertIn(Link("access2", "Gi1/0/48", "core", "Gi1/0/2", SYMMETRIC), links)
+        self.assertIn(
+            Link("access1", "1/1/5", "sep001122334455", None, UNPOLLED), links
+        )
+        self.assertIn(
+            Link("core", "Gi1/0/3", "AA:AA:BB:BB:00:03", None, UNPOLLED), links
+        )
+        self.assertEqual(self.topology.asymmetric_links(), [])
+
+    def test_identity_resolves_known_neighbors(self):
+        self.topology.update(lldp("dist", ("Te1/1/1", {"system_name": "other"})))
+        self.topology.add_identity("dist", macs=["aa:aa:bb:bb:00:03"])
+
+        self.assertEqual(
+            self.topology.links(ONE_SIDED),
+            [Link("core", "Gi1/0/3", "dist", None, ONE_SIDED)],
+        )
+        self.assertEqual(self.topology.seen_by("dist"), [("core", "Gi1/0/3")])
+
+    def test_repoll_recomputes_only_its_pairs(self):
+        self.topology.links()
+        with patch.object(
+            Topology, "_pair_links", autospec=True, side_effect=Topology._pair_links
+        ) as pair_links:
+            self.topology.update(access2(), "access2")
+            self.topology.links()
+        self.assertEqual(
+            [call.args[1:] for call in pair_links.call_args_list],
+            [("access2", "core")],
+        )
+
+        # The link disappears from one side
+        self.topology.update({}, "access2")
+        self.assertEqual(
+            self.topology.asymmetric_links(),
+            [Link("core", "Gi1/0/2", "access2", None, ONE_SIDED)],
+        )
+        self.topology.remove("core")
+        self.assertEqual(self.topology.links(ONE_SIDED), [])
+
+    def test_removed_host_is_forgotten(self):
+        self.topology.remove("core")
+
+        self.assertNotIn("core", self.topology.identities.values())
+        self.assertIn(
+            Link("access2", "Gi1/0/48", "10.0.0.1", None, UNPOLLED),
+            self.topology.links(UNPOLLED),
+        )
+        self.assertEqual(self.topology.seen_by("core"), [("access1", "1/2/1")])
+
+    def test_disagreeing_ports_are_asymmetric(self):
+        self.topology.update(
+            lldp(
+                "access2", ("Gi1/0/47", {"system_name": "core", "port_desc": "Gi1/0/9"})
+            )
+        )
+        self.assertEqual(
+            self.topology.links(ASYMMETRIC),
+            [Link("access2", "Gi1/0/47", "core", "Gi1/0/2", ASYMMETRIC)],
+        )
+
+    def test_graph_and_path(self):
+        graph = self.topology.graph()
+        self.assertEqual(graph["core"], {"access1", "access2", "AA:AA:BB:BB:00:03"})
+        self.assertEqual(
+            self.topology.path("access2", "sep001122334455"),
+            ["access2", "core", "access1", "sep001122334455"],
+        )
+        self.assertIsNone(self.topology.path("access2", "nowhere"))
+
+    def test_poll_devices_concurrently(self):
+        devices = []
+        for hostname, result in (("core", core()), ("access1", access1())):
+            device = Mock(hostname=hostname, mac=None)
+            device.cli_session.host = "192.0.2.10" if hostname == "core" else "access1"
+            device.get_lldp.return_value = result
+            devices.append(device)
+        failing = Mock(hostname="access2", mac="aaaa.bbbb.0003")
+        failing.get_lldp.side_effect = TimeoutError("unreachable")
+        devices.append(failing)
+
+        topology = Topology()
+        results = topology.poll(devices, workers=3)
+        self.assertEqual(results[:2], [3, 2])
+        self.assertIsInstance(results[2], TimeoutError)
+        self.assertIn(
+            Link("access1", "1/2/1", "core", "Gi1/0/1", SYMMETRIC), topology.links()
+        )
+        # The failed device is known by its MAC, but has no neighbors
+        self.assertIn(
+            Link("core", "Gi1/0/3", "access2", None, UNPOLLED), topology.links()
+        )
+
+    def test_results_need_a_host(self):
+        with self.assertRaises(ValueError):
+            self.topology.update({})
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+# NetMagic Tracing Tests
+
+# Python Modules
+from json import loads
+from os import path
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+# Local Modules
+from netmagic.common.metrics import REGISTRY, REQUESTS
+from netmagic.common.tracing import (
+    NOOP_SPAN,
+    STATUS_ERROR,
+    FileSpanExporter,
+    MemorySpanExporter,
+    Tracer,
+    set_tracer,
+    span,
+)
+from netmagic.devices import CiscoIOSSwitch
+from netmagic.sessions import TerminalSession
+from tests.classes.common import SSH_KWARGS, MockBaseConnection
+
+LLDP_OUTPUT = """
+Local Intf: Gi1/0/1
+Chassis id: 0011.2233.4455
+Port id: Gi0/1
+Port Description: uplink
+System Name: core-1
+"""
+
+
+class TestTracing(TestCase):
+    def setUp(self) -> None:
+        self.exporter = MemorySpanExporter()
+        self.addCleanup(set_tracer, set_tracer(Tracer(self.exporter)))
+
+    def test_disabled_by_default(self):
+        set_tracer(None)
+        with span("anything", host="sw1") as current:
+            self.assertIs(current, NOOP_SPAN)
+
+    def test_getter_spans_nest_command_parse_and_models(self):
+        connection = MockBaseConnection()
+        connection.send_command.return_value = LLDP_OUTPUT
+        connection.find_prompt.return_value = "sw1#"
+        session = TerminalSession(connection=connection, **SSH_KWARGS)
+        switch = CiscoIOSSwitch(session)
+        switch.hostname = "sw1"
+        self.assertIn(
+            "device.session_preparation", [i.name for i in self.exporter.spans]
+        )
+        self.exporter.spans.clear()
+
+        switch.get_lldp()
+
+        spans = {i.name: i for i in self.exporter.spans}
+        getter = spans["CiscoIOSSwitch.get_lldp"]
+        self.assertEqual(getter.attributes["host"], "sw1")
+        self.assertIsNone(getter.parent_id)
+        for name in ("terminal.command", "device.fsm_parse", "model.build"):
+            self.assertEqual(spans[name].parent_id, getter.span_id)
+            self.assertEqual(spans[name].trace_id, getter.trace_id)
+        self.assertEqual(
+            spans["terminal.send_command"].parent_id,
+            spans["terminal.command"].span_id,
+        )
+        self.assertEqual(
+            spans["parse.compile"].parent_id, spans["device.fsm_parse"].span_id
+        )
+        self.assertEqual(spans["terminal.command"].attributes["attempts"], 1)
+
+    def test_enable_secret_is_redacted(self):
+        self.addCleanup(REGISTRY.reset)
+        connection = MockBaseConnection()
+        connection.send_command.return_value = "ok"
+        connection.find_prompt.return_value = "sw1>"
+        session = TerminalSession(
+            connection=connection, **{**SSH_KWARGS, "secret": "S3cretPass!"}
+        )
+        switch = CiscoIOSSwitch(session)
+        self.exporter.spans.clear()
+        REGISTRY.reset()
+
+        switch.enable()
+
+        commands = [
+            i.attributes["command"]
+            for i in self.exporter.spans
+            if i.name == "terminal.command"
+        ]
+        self.assertEqual(commands, ["enable", "<secret>"])
+        labels = [i["labels"] for i in REGISTRY.snapshot()[REQUESTS.name]]
+        self.assertIn("<secret>", [i["command"] for i in labels])
+        self.assertNotIn("S3cretPass!", str(labels))
+
+    def test_file_exporter_writes_otlp_json(self):
+        with TemporaryDirectory() as directory:
+            filename = path.join(directory, "spans.jsonl")
+            exporter = FileSpanExporter(filename, batch_size=10)
+            set_tracer(Tracer(exporter))
+
+            with self.assertRaises(ValueError), span("outer", rows=3):
+                with span("inner"):
+                    pass
+                raise ValueError("bad row")
+            exporter.flush()
+
+            with open(filename) as file:
+                document = loads(file.read())
+
+        scope = document["resourceSpans"][0]["scopeSpans"][0]
+        inner, outer = scope["spans"]
+        self.assertEqual(inner["parentSpanId"], outer["spanId"])
+        self.assertEqual(outer["status"]["code"], STATUS_ERROR)
+        self.assertEqual(outer["events"][0]["name"], "exception")
+        self.assertIn({"key": "rows", "value": {"intValue": "3"}}, outer["attributes"])
+
+
+if __name__ == "__main__":
+    main()